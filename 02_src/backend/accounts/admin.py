@@ -2,9 +2,18 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 from django.contrib.auth import get_user_model
 
+from .models import Membership, Role
+
 User = get_user_model()
 
 
+class MembershipInline(admin.TabularInline):
+    model = Membership
+    extra = 0
+    fields = ("club", "region")
+    autocomplete_fields = ("club", "region")
+
+
 @admin.register(User)
 class UserAdmin(DjangoUserAdmin):
     model = User
@@ -13,8 +22,21 @@ class UserAdmin(DjangoUserAdmin):
     search_fields = ("login_code", "username", "email")
 
     fieldsets = DjangoUserAdmin.fieldsets + (
-        ("EOI", {"fields": ("login_code",)}),
+        ("EOI", {"fields": ("login_code", "roles")}),
     )
+    filter_horizontal = DjangoUserAdmin.filter_horizontal + ("roles",)
     add_fieldsets = DjangoUserAdmin.add_fieldsets + (
         ("EOI", {"fields": ("login_code",)}),
     )
+
+    # ✅ Σε ποιους ομίλους / περιφέρειες έχει πρόσβαση
+    inlines = (MembershipInline,)
+
+
+@admin.register(Role)
+class RoleAdmin(admin.ModelAdmin):
+    list_display = ("name", "code", "updated_at")
+    search_fields = ("name", "code")
+    ordering = ("name",)
+    filter_horizontal = ("permissions",)
+    prepopulated_fields = {"code": ("name",)}
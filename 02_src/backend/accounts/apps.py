@@ -5,3 +5,6 @@ class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
     verbose_name = "Λογαριασμοί"
+
+    def ready(self):
+        from . import permissions, scoping  # noqa: F401  (signals)
@@ -0,0 +1,27 @@
+from django.contrib.auth.backends import ModelBackend
+
+from .permissions import get_permission_matrix
+
+
+class RoleBackend(ModelBackend):
+    """
+    ModelBackend με δικαιώματα από τον compiled πίνακα (accounts.permissions):
+    has_perm = lookup σε frozenset, χωρίς joins στο auth_permission ανά request.
+    Το authenticate (login_code + password) μένει όπως του ModelBackend.
+    """
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if obj is not None or not user_obj.is_active or user_obj.is_anonymous:
+            return set()
+        if user_obj.is_superuser:
+            return super().get_all_permissions(user_obj)
+        return get_permission_matrix(user_obj)
+
+    def has_perm(self, user_obj, perm, obj=None):
+        if obj is not None:
+            return False
+        return perm in self.get_all_permissions(user_obj)
+
+    def has_module_perms(self, user_obj, app_label):
+        prefix = f"{app_label}."
+        return any(p.startswith(prefix) for p in self.get_all_permissions(user_obj))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('organizations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Membership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('club', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='organizations.club', verbose_name='Όμιλος')),
+                ('region', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='organizations.region', verbose_name='Περιφέρεια')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to=settings.AUTH_USER_MODEL, verbose_name='Χρήστης')),
+            ],
+            options={
+                'verbose_name': 'Ένταξη σε Όμιλο/Περιφέρεια',
+                'verbose_name_plural': 'Εντάξεις σε Ομίλους/Περιφέρειες',
+                'permissions': [('access_all_organizations', 'Πρόσβαση σε όλους τους ομίλους και περιφέρειες')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('club__isnull', False), ('region__isnull', False), _connector='OR'), name='membership_club_or_region')],
+            },
+        ),
+    ]
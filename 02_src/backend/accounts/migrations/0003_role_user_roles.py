@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_membership'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Role',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.SlugField(unique=True, verbose_name='Κωδικός')),
+                ('name', models.CharField(max_length=120, verbose_name='Ρόλος')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Ενημερώθηκε')),
+                ('permissions', models.ManyToManyField(blank=True, related_name='eoi_roles', to='auth.permission', verbose_name='Δικαιώματα')),
+            ],
+            options={
+                'verbose_name': 'Ρόλος',
+                'verbose_name_plural': 'Ρόλοι',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='roles',
+            field=models.ManyToManyField(blank=True, related_name='users', to='accounts.role', verbose_name='Ρόλοι'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:40
+
+from django.db import migrations
+
+DEFAULT_ROLES = [
+    ("federation-admin", "Διαχειριστής ΕΟΙ"),
+    ("region-admin", "Διαχειριστής Περιφέρειας"),
+    ("club-admin", "Διαχειριστής Ομίλου"),
+    ("athlete", "Αθλητής"),
+    ("secretariat", "Γραμματεία"),
+    ("judge", "Κριτής"),
+    ("technical-committee", "Τεχνική Επιτροπή"),
+]
+
+
+def create_roles(apps, schema_editor):
+    Role = apps.get_model("accounts", "Role")
+    for code, name in DEFAULT_ROLES:
+        Role.objects.get_or_create(code=code, defaults={"name": name})
+
+
+def delete_roles(apps, schema_editor):
+    Role = apps.get_model("accounts", "Role")
+    Role.objects.filter(code__in=[code for code, _ in DEFAULT_ROLES], users__isnull=True).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_role_user_roles'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_roles, delete_roles),
+    ]
@@ -2,6 +2,30 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 
 
+class Role(models.Model):
+    """
+    Ρόλος ομοσπονδίας (διαχειριστής ΕΟΙ, περιφέρειας, ομίλου, γραμματεία, κριτής ...).
+    Τα δικαιώματα αλλάζουν από το admin. Ο έλεγχος γίνεται μέσω accounts.permissions.
+    """
+    code = models.SlugField(max_length=50, unique=True, verbose_name="Κωδικός")
+    name = models.CharField(max_length=120, verbose_name="Ρόλος")
+    permissions = models.ManyToManyField(
+        "auth.Permission",
+        blank=True,
+        related_name="eoi_roles",
+        verbose_name="Δικαιώματα",
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Ρόλος"
+        verbose_name_plural = "Ρόλοι"
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
 class User(AbstractUser):
     """
     login_code = ο κωδικός εισόδου που χρησιμοποιεί στο login (μοναδικός).
@@ -12,9 +36,60 @@ class User(AbstractUser):
         unique=True,
         verbose_name="Κωδικός εισόδου (login_code)",
     )
+    roles = models.ManyToManyField(
+        Role,
+        blank=True,
+        related_name="users",
+        verbose_name="Ρόλοι",
+    )
 
     USERNAME_FIELD = "login_code"
     REQUIRED_FIELDS = ["username", "email"]
 
     def __str__(self):
         return self.login_code
+
+
+class Membership(models.Model):
+    """
+    Σε ποιον όμιλο ή ποια περιφέρεια "ανήκει" ένας χρήστης (π.χ. διαχειριστής ομίλου).
+    Από εδώ βγαίνει τι βλέπει στο admin (accounts/scoping.py).
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="memberships",
+        verbose_name="Χρήστης",
+    )
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="memberships",
+        verbose_name="Όμιλος",
+    )
+    region = models.ForeignKey(
+        "organizations.Region",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="memberships",
+        verbose_name="Περιφέρεια",
+    )
+
+    class Meta:
+        verbose_name = "Ένταξη σε Όμιλο/Περιφέρεια"
+        verbose_name_plural = "Εντάξεις σε Ομίλους/Περιφέρειες"
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(club__isnull=False) | models.Q(region__isnull=False),
+                name="membership_club_or_region",
+            ),
+        ]
+        permissions = [
+            ("access_all_organizations", "Πρόσβαση σε όλους τους ομίλους και περιφέρειες"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} → {self.club or self.region}"
@@ -0,0 +1,122 @@
+"""
+Compiled permission matrix ανά χρήστη.
+
+Όλα τα δικαιώματα του χρήστη (άμεσα + groups + ρόλοι) μαζεύονται με 1 query
+σε ένα frozenset {"app_label.codename", ...}. Το set κρατιέται:
+- πάνω στο user object (όλο το request)
+- στο cache, με κλειδί που περιέχει την τρέχουσα "έκδοση" RBAC
+
+Αλλαγή σε ρόλο/group -> bump_version() (ακυρώνει τους πάντες αμέσως).
+Αλλαγή στους ρόλους/δικαιώματα ενός χρήστη -> invalidate_user().
+"""
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Role, User
+
+VERSION_KEY = "eoi:rbac:version"
+
+
+def current_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # add() για να μη χαθεί bump από άλλο worker στο μεταξύ
+        cache.add(VERSION_KEY, 1, None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def bump_version() -> None:
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 2, None)
+
+
+def _matrix_key(user_id, version) -> str:
+    return f"eoi:rbac:{version}:{user_id}"
+
+
+def compile_permissions(user) -> frozenset:
+    """1 query: όλα τα δικαιώματα από user_permissions, groups και roles."""
+    rows = (
+        Permission.objects.filter(
+            Q(user=user) | Q(group__user=user) | Q(eoi_roles__users=user)
+        )
+        .values_list("content_type__app_label", "codename")
+        .distinct()
+    )
+    return frozenset(f"{app_label}.{codename}" for app_label, codename in rows)
+
+
+def get_permission_matrix(user) -> frozenset:
+    if not user.is_active or user.is_anonymous:
+        return frozenset()
+
+    memo = getattr(user, "_eoi_perm_matrix", None)
+    if memo is not None:
+        return memo
+
+    key = _matrix_key(user.pk, current_version())
+    matrix = cache.get(key)
+    if matrix is None:
+        matrix = compile_permissions(user)
+        cache.set(key, matrix, getattr(settings, "EOI_RBAC_CACHE_TIMEOUT", 3600))
+
+    user._eoi_perm_matrix = matrix
+    return matrix
+
+
+def invalidate_user(user_ids) -> None:
+    version = current_version()
+    cache.delete_many([_matrix_key(uid, version) for uid in user_ids])
+    # το scope (accounts.scoping) εξαρτάται από το access_all_organizations
+    from .scoping import invalidate_scope
+
+    invalidate_scope(user_ids)
+
+
+# -----------------------------
+# Ακύρωση
+# -----------------------------
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def _role_changed(sender, **kwargs):
+    bump_version()
+
+
+@receiver(post_save, sender=User)
+def _user_saved(sender, instance, created, update_fields=None, **kwargs):
+    # is_superuser / is_active αλλάζουν και το scope
+    if not created and update_fields != frozenset({"last_login"}):
+        invalidate_user([instance.pk])
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def _role_permissions_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_version()
+
+
+@receiver(m2m_changed, sender=User.roles.through)
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def _user_assignments_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        invalidate_user([instance.pk])
+    elif pk_set:
+        invalidate_user(pk_set)
+    else:
+        # clear() από την πλευρά ρόλου/group: δεν ξέρουμε ποιοι χρήστες -> όλοι
+        bump_version()
@@ -0,0 +1,170 @@
+"""
+Row-level scoping: ο διαχειριστής ομίλου βλέπει μόνο τον όμιλό του,
+ο διαχειριστής περιφέρειας μόνο τους ομίλους της περιφέρειάς του.
+
+Το Scope ενός χρήστη υπολογίζεται μία φορά (1 query) και κρατιέται:
+- στο request (για όλο το request)
+- στο cache (για τα επόμενα requests), μέχρι να αλλάξει κάποιο Membership
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from organizations.models import Club, Region
+
+from .models import Membership
+from .permissions import current_version
+
+GLOBAL_PERMISSION = "accounts.access_all_organizations"
+
+
+@dataclass(frozen=True)
+class Scope:
+    is_global: bool
+    club_ids: frozenset = frozenset()
+    region_ids: frozenset = frozenset()
+    # περιφέρειες των ομίλων του χρήστη (για να βλέπει τη δική του Περιφέρεια)
+    club_region_ids: frozenset = frozenset()
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.is_global or self.club_ids or self.region_ids)
+
+    def q(self, club_field: str = "club") -> Q:
+        """
+        Q για μοντέλα με FK σε Club, π.χ. club_field="club" (Athlete),
+        "athlete__club" (έγγραφα αθλητή). club_field="" σημαίνει το ίδιο το Club.
+        """
+        if club_field:
+            club_lookup, region_lookup = club_field, f"{club_field}__region_id"
+        else:
+            club_lookup, region_lookup = "pk", "region_id"
+
+        q = Q()
+        if self.club_ids:
+            q |= Q(**{f"{club_lookup}__in": self.club_ids})
+        if self.region_ids:
+            q |= Q(**{f"{region_lookup}__in": self.region_ids})
+        return q
+
+    def filter(self, queryset, club_field: str = "club"):
+        if self.is_global:
+            return queryset
+        if self.is_empty:
+            return queryset.none()
+        if queryset.model is Region:
+            return queryset.filter(pk__in=self.region_ids | self.club_region_ids)
+        return queryset.filter(self.q(club_field))
+
+
+GLOBAL_SCOPE = Scope(is_global=True)
+EMPTY_SCOPE = Scope(is_global=False)
+
+
+def _cache_key(user_id) -> str:
+    # η έκδοση RBAC μπαίνει στο κλειδί: αλλαγή ρόλων ακυρώνει και το is_global
+    return f"eoi:scope:{current_version()}:{user_id}"
+
+
+def resolve_scope(user) -> Scope:
+    """Υπολογίζει το Scope χωρίς cache (1 query για τα memberships)."""
+    if not user or not user.is_authenticated or not user.is_active:
+        return EMPTY_SCOPE
+    if user.is_superuser or user.has_perm(GLOBAL_PERMISSION):
+        return GLOBAL_SCOPE
+
+    club_ids, region_ids, club_region_ids = set(), set(), set()
+    for club_id, region_id, club_region_id in Membership.objects.filter(user=user).values_list(
+        "club_id", "region_id", "club__region_id"
+    ):
+        if club_id:
+            club_ids.add(club_id)
+            club_region_ids.add(club_region_id)
+        if region_id:
+            region_ids.add(region_id)
+
+    return Scope(
+        is_global=False,
+        club_ids=frozenset(club_ids),
+        region_ids=frozenset(region_ids),
+        club_region_ids=frozenset(club_region_ids),
+    )
+
+
+def get_scope(request) -> Scope:
+    scope = getattr(request, "_eoi_scope", None)
+    if scope is not None:
+        return scope
+
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        scope = EMPTY_SCOPE
+    else:
+        key = _cache_key(user.pk)
+        scope = cache.get(key)
+        if scope is None:
+            scope = resolve_scope(user)
+            cache.set(key, scope, getattr(settings, "EOI_SCOPE_CACHE_TIMEOUT", 300))
+
+    request._eoi_scope = scope
+    return scope
+
+
+def invalidate_scope(user_ids) -> None:
+    cache.delete_many([_cache_key(uid) for uid in user_ids])
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def _membership_changed(sender, instance, **kwargs):
+    invalidate_scope([instance.user_id])
+
+
+@receiver(post_save, sender=Club)
+def _club_changed(sender, instance, created, **kwargs):
+    # αλλαγή περιφέρειας ομίλου -> αλλάζει το club_region_ids των μελών του
+    if not created:
+        invalidate_scope(instance.memberships.values_list("user_id", flat=True))
+
+
+# -----------------------------
+# Admin / views
+# -----------------------------
+class ScopedAdminMixin:
+    """
+    Για ModelAdmin: φιλτράρει get_queryset (changelist, change form, actions,
+    autocomplete) και τα FK choices στο scope του χρήστη.
+
+        scope_field = "club"            # Athlete, Horse
+        scope_field = "athlete__club"   # έγγραφα / ιατρικές αθλητή
+        scope_field = ""                # το ίδιο το Club
+    """
+
+    scope_field = "club"
+
+    def get_queryset(self, request):
+        return get_scope(request).filter(super().get_queryset(request), self.scope_field)
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        related = db_field.related_model
+        related_admin = self.admin_site._registry.get(related)
+        if "queryset" not in kwargs and isinstance(related_admin, ScopedAdminMixin):
+            kwargs["queryset"] = get_scope(request).filter(
+                related._default_manager.all(), related_admin.scope_field
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+class ScopedQuerysetMixin:
+    """Το ίδιο για class-based views (ListView/DetailView/API)."""
+
+    scope_field = "club"
+
+    def get_queryset(self):
+        return get_scope(self.request).filter(super().get_queryset(), self.scope_field)
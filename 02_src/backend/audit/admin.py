@@ -0,0 +1,81 @@
+from django.contrib import admin
+from django.utils.html import format_html_join
+
+from .models import AthleteVersion, AuditEvent, ClubVersion, HorseVersion
+
+
+@admin.register(AuditEvent)
+class AuditEventAdmin(admin.ModelAdmin):
+    list_display = ("timestamp", "model", "object_id", "action", "user", "source", "changed_fields")
+    list_filter = ("action", "model", "source")
+    list_select_related = ("user",)
+    search_fields = ("=object_id", "user__username")
+    ordering = ("-timestamp", "-id")
+    date_hierarchy = "timestamp"
+    # ✅ χωρίς COUNT(*) σε εκατομμύρια γραμμές
+    show_full_result_count = False
+    fields = ("timestamp", "model", "object_id", "action", "user", "source", "changes_display")
+    readonly_fields = fields
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description="Πεδία")
+    def changed_fields(self, obj):
+        return ", ".join(sorted(obj.changes))
+
+    @admin.display(description="Αλλαγές")
+    def changes_display(self, obj):
+        return format_html_join(
+            "", "<div><b>{}</b>: {} → {}</div>",
+            ((f, old if old is not None else "-", new if new is not None else "-") for f, (old, new) in sorted(obj.changes.items())),
+        )
+
+
+# -----------------------------
+# Εκδόσεις (κατάσταση ανά ημερομηνία)
+# -----------------------------
+class VersionAdmin(admin.ModelAdmin):
+    list_filter = ("is_active",)
+    ordering = ("-valid_from", "-id")
+    date_hierarchy = "valid_from"
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(AthleteVersion)
+class AthleteVersionAdmin(VersionAdmin):
+    list_display = ("athlete", "club", "is_active", "valid_from", "valid_to")
+    list_select_related = ("athlete", "club")
+    search_fields = ("=athlete__id", "athlete__eoi_registry_number")
+    raw_id_fields = ("athlete", "club")
+
+
+@admin.register(HorseVersion)
+class HorseVersionAdmin(VersionAdmin):
+    list_display = ("horse", "club", "is_active", "valid_from", "valid_to")
+    list_select_related = ("horse", "club")
+    search_fields = ("=horse__id",)
+    raw_id_fields = ("horse", "club")
+
+
+@admin.register(ClubVersion)
+class ClubVersionAdmin(VersionAdmin):
+    list_display = ("club", "region", "is_active", "valid_from", "valid_to")
+    list_select_related = ("club", "region")
+    search_fields = ("=club__id", "club__code")
+    raw_id_fields = ("club", "region")
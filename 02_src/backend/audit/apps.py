@@ -0,0 +1,23 @@
+from django.apps import AppConfig
+
+
+class AuditConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "audit"
+    verbose_name = "Ιστορικό Αλλαγών"
+
+    def ready(self):
+        from django.core.signals import request_finished
+
+        from registry.models import AthleteDocument, AthleteMedicalCertificate, Athlete, Horse, HorseDocument
+        from organizations.models import Club
+
+        from . import recorder, temporal  # noqa: F401  (temporal: receiver του changes_recorded)
+
+        recorder.register(Athlete, exclude=("first_name_uc", "last_name_uc", "father_name_uc", "mother_name_uc", "updated_at"))
+        recorder.register(Horse)
+        recorder.register(Club)
+        recorder.register(AthleteDocument)
+        recorder.register(AthleteMedicalCertificate)
+        recorder.register(HorseDocument)
+        request_finished.connect(recorder.flush, dispatch_uid="audit_flush")
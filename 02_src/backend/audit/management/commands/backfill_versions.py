@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from audit.temporal import TEMPORAL, backfill
+
+
+class Command(BaseCommand):
+    help = "Δημιουργεί την τρέχουσα έκδοση (ιστορικό ανά ημερομηνία) για αθλητές / ίππους / ομίλους που δεν έχουν."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        for model in TEMPORAL:
+            with transaction.atomic():
+                count = backfill(model)
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"OK. {(time.perf_counter() - started) * 1000:.0f} ms"))
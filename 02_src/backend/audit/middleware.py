@@ -0,0 +1,18 @@
+from . import recorder
+
+
+class AuditMiddleware:
+    """
+    Μετά το AuthenticationMiddleware: χρήστης / προέλευση για το AuditEvent.
+    Οι εγγραφές του request γράφονται μαζί στο request_finished (αφού σταλεί η απάντηση).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder.begin_request(request)
+        try:
+            return self.get_response(request)
+        finally:
+            recorder.end_request()
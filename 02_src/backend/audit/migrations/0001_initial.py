@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:30
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=60, verbose_name='Μοντέλο')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='Id')),
+                ('action', models.CharField(choices=[('C', 'Δημιουργία'), ('U', 'Αλλαγή'), ('D', 'Διαγραφή'), ('B', 'Μαζική αλλαγή'), ('I', 'Εισαγωγή')], max_length=1, verbose_name='Ενέργεια')),
+                ('changes', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Αλλαγές')),
+                ('source', models.CharField(blank=True, max_length=60, verbose_name='Προέλευση')),
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Χρόνος')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audit_events', to=settings.AUTH_USER_MODEL, verbose_name='Χρήστης')),
+            ],
+            options={
+                'verbose_name': 'Αλλαγή',
+                'verbose_name_plural': 'Ιστορικό Αλλαγών',
+                'ordering': ['-timestamp', '-id'],
+                'indexes': [models.Index(fields=['model', 'object_id', '-timestamp', '-id'], name='audit_object_idx'), models.Index(fields=['timestamp'], name='audit_timestamp_idx'), models.Index(fields=['user', '-timestamp'], name='audit_user_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0001_initial'),
+        ('organizations', '0001_initial'),
+        ('registry', '0016_horse_pedigree'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AthleteVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('valid_from', models.DateTimeField(verbose_name='Ισχύει από')),
+                ('valid_to', models.DateTimeField(blank=True, null=True, verbose_name='Ισχύει έως')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Ενεργός')),
+                ('athlete', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='versions', to='registry.athlete', verbose_name='Αθλητής')),
+                ('club', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='organizations.club', verbose_name='Όμιλος')),
+            ],
+            options={
+                'verbose_name': 'Έκδοση Αθλητή',
+                'verbose_name_plural': 'Ιστορικό Αθλητών (ανά ημερομηνία)',
+                'ordering': ['-valid_from'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['athlete', 'valid_from'], name='athlete_version_idx'), models.Index(fields=['club', 'valid_from', 'valid_to'], name='athlete_version_club_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('valid_to__isnull', True)), fields=('athlete',), name='uniq_current_athlete_version')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ClubVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('valid_from', models.DateTimeField(verbose_name='Ισχύει από')),
+                ('valid_to', models.DateTimeField(blank=True, null=True, verbose_name='Ισχύει έως')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Ενεργός')),
+                ('club', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='versions', to='organizations.club', verbose_name='Όμιλος')),
+                ('region', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='organizations.region', verbose_name='Περιφέρεια')),
+            ],
+            options={
+                'verbose_name': 'Έκδοση Ομίλου',
+                'verbose_name_plural': 'Ιστορικό Ομίλων (ανά ημερομηνία)',
+                'ordering': ['-valid_from'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['club', 'valid_from'], name='club_version_idx'), models.Index(fields=['region', 'valid_from', 'valid_to'], name='club_version_region_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('valid_to__isnull', True)), fields=('club',), name='uniq_current_club_version')],
+            },
+        ),
+        migrations.CreateModel(
+            name='HorseVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('valid_from', models.DateTimeField(verbose_name='Ισχύει από')),
+                ('valid_to', models.DateTimeField(blank=True, null=True, verbose_name='Ισχύει έως')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Ενεργός')),
+                ('club', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='organizations.club', verbose_name='Όμιλος')),
+                ('horse', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='versions', to='registry.horse', verbose_name='Ίππος')),
+            ],
+            options={
+                'verbose_name': 'Έκδοση Ίππου',
+                'verbose_name_plural': 'Ιστορικό Ίππων (ανά ημερομηνία)',
+                'ordering': ['-valid_from'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['horse', 'valid_from'], name='horse_version_idx'), models.Index(fields=['club', 'valid_from', 'valid_to'], name='horse_version_club_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('valid_to__isnull', True)), fields=('horse',), name='uniq_current_horse_version')],
+            },
+        ),
+    ]
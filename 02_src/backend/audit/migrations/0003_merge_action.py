@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0002_versions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditevent',
+            name='action',
+            field=models.CharField(choices=[('C', 'Δημιουργία'), ('U', 'Αλλαγή'), ('D', 'Διαγραφή'), ('B', 'Μαζική αλλαγή'), ('I', 'Εισαγωγή'), ('M', 'Συγχώνευση')], max_length=1, verbose_name='Ενέργεια'),
+        ),
+    ]
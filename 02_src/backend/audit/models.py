@@ -0,0 +1,203 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class AuditEvent(models.Model):
+    """
+    Append-only ιστορικό αλλαγών (audit/recorder.py): μία γραμμή ανά αντικείμενο και
+    αλλαγή, με τις τιμές πριν / μετά ανά πεδίο. Καλύπτει save() / delete() (signals),
+    τα μαζικά update() των actions και τις εισαγωγές.
+    """
+
+    class Action(models.TextChoices):
+        CREATE = "C", "Δημιουργία"
+        UPDATE = "U", "Αλλαγή"
+        DELETE = "D", "Διαγραφή"
+        BULK_UPDATE = "B", "Μαζική αλλαγή"
+        IMPORT = "I", "Εισαγωγή"
+        MERGE = "M", "Συγχώνευση"
+
+    # "registry.athlete": χωρίς join στο ContentType για το ιστορικό
+    model = models.CharField(max_length=60, verbose_name="Μοντέλο")
+    object_id = models.PositiveBigIntegerField(verbose_name="Id")
+    action = models.CharField(max_length=1, choices=Action.choices, verbose_name="Ενέργεια")
+    # {"πεδίο": [παλιά, νέα]}
+    changes = models.JSONField(default=dict, encoder=DjangoJSONEncoder, verbose_name="Αλλαγές")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="audit_events",
+        verbose_name="Χρήστης",
+    )
+    source = models.CharField(max_length=60, blank=True, verbose_name="Προέλευση")
+    timestamp = models.DateTimeField(default=timezone.now, verbose_name="Χρόνος")
+
+    class Meta:
+        verbose_name = "Αλλαγή"
+        verbose_name_plural = "Ιστορικό Αλλαγών"
+        ordering = ["-timestamp", "-id"]
+        indexes = [
+            # "ιστορικό του αθλητή Χ": range scan, νεότερα πρώτα (keyset σε timestamp, id)
+            models.Index(fields=["model", "object_id", "-timestamp", "-id"], name="audit_object_idx"),
+            # "τι άλλαξε χθες" / αρχειοθέτηση παλιών
+            models.Index(fields=["timestamp"], name="audit_timestamp_idx"),
+            models.Index(fields=["user", "-timestamp"], name="audit_user_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise ValueError("Το ιστορικό αλλαγών δεν τροποποιείται.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Το ιστορικό αλλαγών δεν διαγράφεται.")
+
+    def __str__(self):
+        return f"{self.model} #{self.object_id} {self.get_action_display()} ({self.timestamp:%d/%m/%Y %H:%M})"
+
+
+# -----------------------------
+# Εκδόσεις με διάστημα ισχύος (audit/temporal.py)
+# -----------------------------
+class VersionQuerySet(models.QuerySet):
+    def as_of(self, when):
+        """Η κατάσταση που ίσχυε τη στιγμή `when` (date = στο τέλος της ημέρας). Ένα range scan."""
+        from .temporal import instant
+
+        moment = instant(when)
+        return self.filter(valid_from__lte=moment).filter(
+            models.Q(valid_to__gt=moment) | models.Q(valid_to__isnull=True)
+        )
+
+    def current(self):
+        return self.filter(valid_to__isnull=True)
+
+
+class Version(models.Model):
+    """
+    Μία γραμμή ανά διάστημα [valid_from, valid_to) με σταθερές τιμές· valid_to κενό = τρέχουσα.
+    Γεμίζει από τις ίδιες αλλαγές με το AuditEvent, στην ίδια συναλλαγή.
+    """
+
+    valid_from = models.DateTimeField(verbose_name="Ισχύει από")
+    valid_to = models.DateTimeField(null=True, blank=True, verbose_name="Ισχύει έως")
+
+    objects = VersionQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+        ordering = ["-valid_from"]
+
+
+class AthleteVersion(Version):
+    # χωρίς FK constraint: το ιστορικό μένει και μετά από διαγραφή / συγχώνευση
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="versions",
+        verbose_name="Αθλητής",
+    )
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Όμιλος",
+    )
+    is_active = models.BooleanField(default=True, verbose_name="Ενεργός")
+
+    class Meta(Version.Meta):
+        verbose_name = "Έκδοση Αθλητή"
+        verbose_name_plural = "Ιστορικό Αθλητών (ανά ημερομηνία)"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["athlete"], condition=models.Q(valid_to__isnull=True), name="uniq_current_athlete_version"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["athlete", "valid_from"], name="athlete_version_idx"),
+            # "ποιοι ανήκαν στον όμιλο Χ στις ..."
+            models.Index(fields=["club", "valid_from", "valid_to"], name="athlete_version_club_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete_id}: {self.club_id} ({self.valid_from:%d/%m/%Y} – {self.valid_to or '…'})"
+
+
+class HorseVersion(Version):
+    horse = models.ForeignKey(
+        "registry.Horse",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="versions",
+        verbose_name="Ίππος",
+    )
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Όμιλος",
+    )
+    is_active = models.BooleanField(default=True, verbose_name="Ενεργός")
+
+    class Meta(Version.Meta):
+        verbose_name = "Έκδοση Ίππου"
+        verbose_name_plural = "Ιστορικό Ίππων (ανά ημερομηνία)"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["horse"], condition=models.Q(valid_to__isnull=True), name="uniq_current_horse_version"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["horse", "valid_from"], name="horse_version_idx"),
+            models.Index(fields=["club", "valid_from", "valid_to"], name="horse_version_club_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.horse_id}: {self.club_id} ({self.valid_from:%d/%m/%Y} – {self.valid_to or '…'})"
+
+
+class ClubVersion(Version):
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="versions",
+        verbose_name="Όμιλος",
+    )
+    region = models.ForeignKey(
+        "organizations.Region",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Περιφέρεια",
+    )
+    is_active = models.BooleanField(default=True, verbose_name="Ενεργός")
+
+    class Meta(Version.Meta):
+        verbose_name = "Έκδοση Ομίλου"
+        verbose_name_plural = "Ιστορικό Ομίλων (ανά ημερομηνία)"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["club"], condition=models.Q(valid_to__isnull=True), name="uniq_current_club_version"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["club", "valid_from"], name="club_version_idx"),
+            models.Index(fields=["region", "valid_from", "valid_to"], name="club_version_region_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.club_id}: {self.region_id} ({self.valid_from:%d/%m/%Y} – {self.valid_to or '…'})"
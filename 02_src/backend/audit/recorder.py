@@ -0,0 +1,285 @@
+"""
+Καταγραφή αλλαγών (AuditEvent) με φθηνές εγγραφές.
+
+    register(Model, exclude=...)      -> save() / delete() μέσω signals (apps.ready)
+    update(queryset, **values)        -> αντί για queryset.update() (actions ενεργοποίησης κ.λπ.)
+    record_changes(Model, rows)       -> για εισαγωγές με bulk_create / upsert
+    audit_context(source, user)       -> εντολές / εισαγωγές: προέλευση + μία εγγραφή στο τέλος
+    history(Model, pk, before, limit) -> keyset στο index (model, object_id, -timestamp, -id)
+
+Οι εγγραφές δεν γράφονται στη στιγμή:
+- μέσα σε συναλλαγή περιμένουν το commit (rollback = καμία εγγραφή, και σε savepoint)
+- μετά μπαίνουν σε buffer του thread, που γράφεται με ΕΝΑ bulk_create όταν τελειώσει
+  το request (request_finished, αφού σταλεί η απάντηση) ή το audit_context,
+  ή όταν γεμίσει (BUFFER_LIMIT)
+- εκτός request / context γράφονται αμέσως
+"""
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone as dt_timezone
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.fields.files import FieldFile
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .models import AuditEvent
+
+BUFFER_LIMIT = 1000
+MAX_PAGE_SIZE = 200
+HISTORY_FIELDS = ("id", "action", "changes", "user_id", "user__username", "source", "timestamp")
+
+# label -> attnames που καταγράφονται
+_AUDITED: dict[str, tuple[str, ...]] = {}
+
+_state = threading.local()
+
+# στέλνεται ΜΕΣΑ στη συναλλαγή της αλλαγής (sender = μοντέλο, events = μη αποθηκευμένα
+# AuditEvent) για όσους πρέπει να ενημερωθούν ατομικά μαζί της, π.χ. audit/temporal.py
+changes_recorded = Signal()
+
+
+def label(model) -> str:
+    return model._meta.label_lower
+
+
+def fields_of(model) -> tuple[str, ...]:
+    return _AUDITED.get(label(model), ())
+
+
+# -----------------------------
+# context (χρήστης / προέλευση / buffer)
+# -----------------------------
+def _buffer() -> list[AuditEvent]:
+    if not hasattr(_state, "buffer"):
+        _state.buffer = []
+        _state.depth = 0
+        _state.source = ""
+        _state.user = None
+        _state.request = None
+    return _state.buffer
+
+
+def _user_id():
+    request = getattr(_state, "request", None)
+    user = getattr(request, "user", None) if request is not None else getattr(_state, "user", None)
+    return user.pk if user is not None and user.is_authenticated else None
+
+
+def begin_request(request) -> None:
+    """AuditMiddleware: ο χρήστης διαβάζεται μόνο αν γίνει κάποια αλλαγή (lazy request.user)."""
+    _buffer()
+    _state.request = request
+    _state.source = "admin" if request.path.startswith("/admin/") else "web"
+    _state.depth += 1
+
+
+def end_request() -> None:
+    _state.request = None
+    _state.source = ""
+    _state.depth = max(0, _state.depth - 1)
+
+
+@contextmanager
+def audit_context(source: str, user=None):
+    _buffer()
+    previous = (_state.source, _state.user)
+    _state.source, _state.user = source, user
+    _state.depth += 1
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+        _state.source, _state.user = previous
+        if not _state.depth:
+            flush()
+
+
+def flush(**kwargs) -> int:
+    """Ένα bulk_create για ό,τι μαζεύτηκε (και ως receiver του request_finished)."""
+    events = _buffer()
+    if not events:
+        return 0
+    _state.buffer = []
+    AuditEvent.objects.bulk_create(events, batch_size=BUFFER_LIMIT)
+    return len(events)
+
+
+def _deliver(events: list[AuditEvent]) -> None:
+    buffer = _buffer()
+    buffer.extend(events)
+    if not _state.depth or len(buffer) >= BUFFER_LIMIT:
+        flush()
+
+
+def _enqueue(model, events: list[AuditEvent]) -> None:
+    if not events:
+        return
+    changes_recorded.send(sender=model, events=events)
+    # ένα callback ανά κλήση: αν γίνει rollback (και σε savepoint) πετιέται μαζί του
+    transaction.on_commit(partial(_deliver, events))
+
+
+def _event(model_label: str, object_id, action: str, changes: dict, now: datetime) -> AuditEvent:
+    return AuditEvent(
+        model=model_label,
+        object_id=object_id,
+        action=action,
+        changes=changes,
+        user_id=_user_id(),
+        source=getattr(_state, "source", ""),
+        timestamp=now,
+    )
+
+
+# -----------------------------
+# τιμές / διαφορές
+# -----------------------------
+def _value(v):
+    if isinstance(v, FieldFile):
+        return v.name or ""
+    return v
+
+
+def _snapshot(instance, fields) -> dict:
+    return {f: _value(getattr(instance, f)) for f in fields}
+
+
+def diff(old: dict | None, new: dict | None) -> dict:
+    old, new = old or {}, new or {}
+    return {
+        f: [old.get(f), new.get(f)]
+        for f in (new.keys() | old.keys())
+        if old.get(f) != new.get(f)
+    }
+
+
+# -----------------------------
+# save() / delete()
+# -----------------------------
+def _fields_for_save(sender, update_fields) -> tuple[str, ...]:
+    fields = fields_of(sender)
+    if update_fields is None:
+        return fields
+    names = {sender._meta.get_field(f).attname for f in update_fields}
+    return tuple(f for f in fields if f in names)
+
+
+def _pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._audit_old = None
+    if raw or instance.pk is None or instance._state.adding:
+        return
+    fields = _fields_for_save(sender, update_fields)
+    if fields:
+        instance._audit_old = sender._base_manager.filter(pk=instance.pk).values(*fields).first()
+
+
+def _post_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    fields = _fields_for_save(sender, update_fields)
+    if not fields:
+        return
+    old = getattr(instance, "_audit_old", None)
+    new = _snapshot(instance, fields)
+    if created or old is None:
+        action = AuditEvent.Action.CREATE
+        changes = {f: [None, v] for f, v in new.items() if v not in (None, "")}
+    else:
+        action = AuditEvent.Action.UPDATE
+        changes = diff(old, new)
+        if not changes:
+            return
+    instance._audit_old = None
+    _enqueue(sender, [_event(label(sender), instance.pk, action, changes, timezone.now())])
+
+
+def _post_delete(sender, instance, **kwargs):
+    old = _snapshot(instance, fields_of(sender))
+    changes = {f: [v, None] for f, v in old.items() if v not in (None, "")}
+    _enqueue(sender, [_event(label(sender), instance.pk, AuditEvent.Action.DELETE, changes, timezone.now())])
+
+
+def register(model, exclude=()) -> None:
+    fields = tuple(
+        f.attname
+        for f in model._meta.concrete_fields
+        if not f.primary_key and f.name not in exclude and f.attname not in exclude
+    )
+    _AUDITED[label(model)] = fields
+    uid = f"audit_{label(model)}"
+    pre_save.connect(_pre_save, sender=model, dispatch_uid=uid)
+    post_save.connect(_post_save, sender=model, dispatch_uid=uid)
+    post_delete.connect(_post_delete, sender=model, dispatch_uid=uid)
+
+
+# -----------------------------
+# μαζικές αλλαγές
+# -----------------------------
+def record_changes(model, rows, action: str = AuditEvent.Action.IMPORT) -> int:
+    """rows: [(pk, παλιές τιμές | None, νέες τιμές)]. Μόνο όσες διαφέρουν."""
+    now = timezone.now()
+    model_label = label(model)
+    events = []
+    for pk, old, new in rows:
+        changes = diff(old, new)
+        if changes:
+            events.append(_event(model_label, pk, action, changes, now))
+    _enqueue(model, events)
+    return len(events)
+
+
+def update(queryset, **values) -> int:
+    """
+    queryset.update(**values) με καταγραφή: SELECT των παλιών τιμών, UPDATE, SELECT των
+    νέων (δουλεύει και με F() / expressions), ένα bulk insert μόνο για όσα άλλαξαν.
+    """
+    model = queryset.model
+    audited = set(fields_of(model))
+    fields = [f for f in (model._meta.get_field(name).attname for name in values) if f in audited]
+    if not fields:
+        return queryset.update(**values)
+    with transaction.atomic():
+        old = {row.pop("pk"): row for row in queryset.order_by().values("pk", *fields)}
+        if not old:
+            return 0
+        count = model._base_manager.filter(pk__in=old).update(**values)
+        new = {row.pop("pk"): row for row in model._base_manager.filter(pk__in=old).values("pk", *fields)}
+        record_changes(model, ((pk, old[pk], new.get(pk)) for pk in old), AuditEvent.Action.BULK_UPDATE)
+    return count
+
+
+# -----------------------------
+# ιστορικό
+# -----------------------------
+CURSOR_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+def _cursor(row: dict) -> str:
+    return f"{row['timestamp'].astimezone(dt_timezone.utc).strftime(CURSOR_FORMAT)}_{row['id']}"
+
+
+def parse_cursor(value: str | None) -> tuple[datetime, int] | None:
+    """"20260503T100000000000_1234" (UTC) -> (timestamp, id). ValueError αν δεν είναι έγκυρο."""
+    if not value:
+        return None
+    moment, _, pk = value.partition("_")
+    return datetime.strptime(moment, CURSOR_FORMAT).replace(tzinfo=dt_timezone.utc), int(pk)
+
+
+def history(model, object_id, before=None, limit: int = 50) -> tuple[list[dict], str | None]:
+    """Νεότερα πρώτα· ένα query στο audit_object_idx ανεξάρτητα από το μέγεθος του log."""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    model_label = model if isinstance(model, str) else label(model)
+    qs = AuditEvent.objects.filter(model=model_label, object_id=object_id)
+    if before is not None:
+        moment, pk = before
+        qs = qs.filter(Q(timestamp__lt=moment) | Q(timestamp=moment, id__lt=pk))
+    rows = list(qs.order_by("-timestamp", "-id").values(*HISTORY_FIELDS)[:limit])
+    cursor = _cursor(rows[-1]) if len(rows) == limit else None
+    return rows, cursor
@@ -0,0 +1,168 @@
+"""
+Κατάσταση μητρώου σε παλαιότερη ημερομηνία ("σε ποιον όμιλο ανήκε / ήταν ενεργός στις ...").
+
+    AthleteVersion.objects.as_of(date).filter(club_id=...)   -> ένα query, χωρίς replay του log
+    club_as_of(Athlete.objects.filter(...), date)            -> annotate με όμιλο / ενεργό στην ημερομηνία
+    state_as_of(Athlete, pk, date)                           -> μία γραμμή
+
+Οι εκδόσεις γράφονται από το ίδιο ρεύμα αλλαγών με το AuditEvent (signal
+changes_recorded), άρα καλύπτουν save(), recorder.update() και εισαγωγές. Σε αντίθεση
+με το AuditEvent (που γράφεται μετά το commit) γράφονται στην ίδια συναλλαγή.
+Μόνο όταν αλλάζει κάποιο από τα πεδία του TEMPORAL.
+
+`manage.py backfill_versions` για όσα υπήρχαν πριν (μία τρέχουσα έκδοση ανά αντικείμενο).
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Subquery
+from django.dispatch import receiver
+from django.utils import timezone
+
+from organizations.models import Club
+from registry.models import Athlete, Horse
+
+from .models import AthleteVersion, AuditEvent, ClubVersion, HorseVersion
+from .recorder import changes_recorded
+
+# μοντέλο -> (μοντέλο εκδόσεων, FK προς το αντικείμενο, πεδία με ιστορικό)
+TEMPORAL = {
+    Athlete: (AthleteVersion, "athlete_id", ("club_id", "is_active")),
+    Horse: (HorseVersion, "horse_id", ("club_id", "is_active")),
+    Club: (ClubVersion, "club_id", ("region_id", "is_active")),
+}
+# για αντικείμενα χωρίς created_at που υπήρχαν πριν από το ιστορικό
+BEGINNING = datetime(1900, 1, 1, tzinfo=dt_timezone.utc)
+CHUNK_SIZE = 1000
+
+
+def instant(when) -> datetime:
+    """date -> το τελευταίο μικροδευτερόλεπτο της ημέρας (τοπική ώρα), datetime -> ως έχει."""
+    if isinstance(when, datetime):
+        return when if timezone.is_aware(when) else timezone.make_aware(when)
+    if isinstance(when, date):
+        return timezone.make_aware(datetime.combine(when + timedelta(days=1), time.min)) - timedelta(microseconds=1)
+    raise TypeError(f"Αναμενόταν date / datetime, δόθηκε {when!r}")
+
+
+def _created(model, ids) -> dict:
+    if not any(f.name == "created_at" for f in model._meta.concrete_fields):
+        return {}
+    return dict(model._base_manager.filter(pk__in=ids).values_list("pk", "created_at"))
+
+
+# -----------------------------
+# ενημέρωση από το ρεύμα αλλαγών
+# -----------------------------
+@receiver(changes_recorded)
+def _changes_recorded(sender, events, **kwargs):
+    spec = TEMPORAL.get(sender)
+    if spec is None:
+        return
+    version_model, fk, fields = spec
+    A = AuditEvent.Action
+    relevant = [
+        e for e in events
+        if e.action in (A.CREATE, A.DELETE) or any(f in e.changes for f in fields)
+    ]
+    if not relevant:
+        return
+    ids = {e.object_id for e in relevant}
+
+    with transaction.atomic(savepoint=False):
+        current = {getattr(v, fk): v for v in version_model.objects.filter(**{f"{fk}__in": ids}, valid_to__isnull=True)}
+        # αντικείμενα που υπήρχαν πριν από το ιστορικό: παλιές τιμές = τρέχουσες + changes[0]
+        missing = {e.object_id for e in relevant if e.action != A.CREATE} - current.keys()
+        rows = {
+            row.pop("pk"): row
+            for row in sender._base_manager.filter(pk__in=missing).values("pk", *fields)
+        } if missing else {}
+        created = _created(sender, missing) if missing else {}
+
+        closing: dict[datetime, list[int]] = defaultdict(list)
+        new = []
+        for e in relevant:
+            previous = current.pop(e.object_id, None)
+            if previous is None and e.action != A.CREATE:
+                base = dict(rows.get(e.object_id) or {f: None for f in fields})
+                base.update({f: e.changes[f][0] for f in fields if f in e.changes})
+                previous = version_model(
+                    **{fk: e.object_id}, valid_from=created.get(e.object_id) or BEGINNING, **base
+                )
+                new.append(previous)
+            if previous is not None:
+                if previous.pk is None:
+                    previous.valid_to = e.timestamp
+                else:
+                    closing[e.timestamp].append(previous.pk)
+                base = {f: getattr(previous, f) for f in fields}
+            else:
+                base = {f: None for f in fields}
+            if e.action == A.DELETE:
+                continue
+            base.update({f: e.changes[f][1] for f in fields if f in e.changes})
+            if base.get("is_active") is None:
+                base["is_active"] = True
+            version = version_model(**{fk: e.object_id}, valid_from=e.timestamp, **base)
+            current[e.object_id] = version
+            new.append(version)
+
+        for moment, pks in closing.items():
+            version_model.objects.filter(pk__in=pks).update(valid_to=moment)
+        version_model.objects.bulk_create(new, batch_size=CHUNK_SIZE)
+
+
+def backfill(model) -> int:
+    """Μία τρέχουσα έκδοση για όσα αντικείμενα δεν έχουν (π.χ. πριν από την εγκατάσταση)."""
+    version_model, fk, fields = TEMPORAL[model]
+    qs = model._base_manager.filter(
+        ~Exists(version_model.objects.filter(**{fk: OuterRef("pk")}, valid_to__isnull=True))
+    )
+    has_created = any(f.name == "created_at" for f in model._meta.concrete_fields)
+    values = ("pk", *fields, *(("created_at",) if has_created else ()))
+    count = 0
+    batch = []
+    for row in qs.order_by("pk").values(*values).iterator(chunk_size=CHUNK_SIZE):
+        pk = row.pop("pk")
+        valid_from = row.pop("created_at", None) or BEGINNING
+        batch.append(version_model(**{fk: pk}, valid_from=valid_from, **row))
+        if len(batch) >= CHUNK_SIZE:
+            count += len(version_model.objects.bulk_create(batch))
+            batch = []
+    count += len(version_model.objects.bulk_create(batch))
+    return count
+
+
+# -----------------------------
+# queries
+# -----------------------------
+def state_as_of(model, pk, when) -> dict | None:
+    version_model, fk, fields = TEMPORAL[model]
+    return (
+        version_model.objects.as_of(when)
+        .filter(**{fk: pk})
+        .values(fk, *fields, "valid_from", "valid_to")
+        .first()
+    )
+
+
+def club_as_of(queryset, when):
+    """
+    Athlete / Horse queryset + club_as_of / active_as_of της ημερομηνίας (correlated subquery
+    στο index (athlete, valid_from): ένα πέρασμα για όλη τη λίστα).
+    """
+    version_model, fk, _ = TEMPORAL[queryset.model]
+    versions = version_model.objects.as_of(when).filter(**{fk: OuterRef("pk")}).order_by("-valid_from")
+    return queryset.annotate(
+        club_as_of=Subquery(versions.values("club_id")[:1]),
+        active_as_of=Subquery(versions.values("is_active")[:1]),
+    )
+
+
+def roster_as_of(club_id, when, model=Athlete):
+    """Οι αθλητές (ή ίπποι) του ομίλου στην ημερομηνία, με το index (club, valid_from, valid_to)."""
+    version_model, _, _ = TEMPORAL[model]
+    return version_model.objects.as_of(when).filter(club_id=club_id)
@@ -0,0 +1,155 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from organizations.models import Club
+from registry.models import Athlete
+
+from .models import AthleteVersion, AuditEvent
+from .recorder import audit_context, history, label, parse_cursor, update
+from .temporal import backfill, club_as_of, roster_as_of, state_as_of
+
+
+class RecorderTests(TestCase):
+    """Εγγραφές μετά το commit, diff μόνο όσων άλλαξαν, keyset ιστορικό (audit/recorder.py)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=5, horses=2, competitions=1, clubs=2, stdout=StringIO())
+        cls.club, cls.other_club = Club.objects.order_by("pk")[:2]
+
+    def _events(self, athlete) -> list[AuditEvent]:
+        return list(AuditEvent.objects.filter(model=label(Athlete), object_id=athlete.pk).order_by("id"))
+
+    def test_save_records_create_and_diff(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            athlete = Athlete.objects.create(last_name="Audit", club=self.club)
+        with self.captureOnCommitCallbacks(execute=True):
+            athlete.last_name = "Audited"
+            athlete.save()
+            # χωρίς αλλαγή: καμία εγγραφή
+            athlete.save()
+        created, changed = self._events(athlete)
+        self.assertEqual(created.action, AuditEvent.Action.CREATE)
+        self.assertEqual(created.changes["last_name"], [None, "Audit"])
+        self.assertEqual(changed.action, AuditEvent.Action.UPDATE)
+        self.assertEqual(changed.changes, {"last_name": ["Audit", "Audited"]})
+
+    def test_nothing_is_written_before_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            athlete = Athlete.objects.create(last_name="Pending")
+            self.assertEqual(self._events(athlete), [])
+        self.assertTrue(callbacks)
+
+    def test_rolled_back_savepoint_leaves_no_events(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            athlete = Athlete.objects.create(last_name="Kept")
+            try:
+                with transaction.atomic():
+                    athlete.last_name = "Lost"
+                    athlete.save()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual([e.action for e in self._events(athlete)], [AuditEvent.Action.CREATE])
+
+    def test_bulk_update_records_only_changed_rows(self):
+        first, *rest = Athlete.objects.order_by("pk")[:3]
+        Athlete.objects.filter(pk__in=[a.pk for a in rest]).update(club=self.club)
+        Athlete.objects.filter(pk=first.pk).update(club=self.other_club)
+        with self.captureOnCommitCallbacks(execute=True):
+            count = update(Athlete.objects.filter(pk__in=[first.pk, *(a.pk for a in rest)]), club=self.other_club)
+        self.assertEqual(count, 3)
+        events = AuditEvent.objects.filter(action=AuditEvent.Action.BULK_UPDATE)
+        self.assertEqual(set(events.values_list("object_id", flat=True)), {a.pk for a in rest})
+        for event in events:
+            self.assertEqual(event.changes, {"club_id": [self.club.pk, self.other_club.pk]})
+
+    def test_context_sets_source(self):
+        athlete = Athlete.objects.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            with audit_context("import"):
+                for name in ("One", "Two"):
+                    athlete.last_name = name
+                    athlete.save()
+        self.assertEqual(
+            list(AuditEvent.objects.filter(model=label(Athlete), object_id=athlete.pk).values_list("source", flat=True)),
+            ["import", "import"],
+        )
+
+    def test_history_pages_newest_first(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            athlete = Athlete.objects.create(last_name="v0")
+            for n in range(1, 5):
+                athlete.last_name = f"v{n}"
+                athlete.save()
+        rows, cursor = history(Athlete, athlete.pk, limit=3)
+        self.assertEqual([r["changes"]["last_name"][1] for r in rows], ["v4", "v3", "v2"])
+        self.assertIsNotNone(cursor)
+        rest, cursor = history(Athlete, athlete.pk, before=parse_cursor(cursor), limit=3)
+        self.assertEqual([r["changes"]["last_name"][1] for r in rest], ["v1", "v0"])
+        self.assertIsNone(cursor)
+
+
+class VersionTests(TestCase):
+    """Κατάσταση μητρώου σε παλαιότερη στιγμή (audit/temporal.py)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=5, horses=2, competitions=1, clubs=2, stdout=StringIO())
+        cls.club, cls.other_club = Club.objects.order_by("pk")[:2]
+
+    def _move(self, athlete, club) -> None:
+        athlete.club = club
+        athlete.save()
+
+    def test_club_change_opens_new_version(self):
+        athlete = Athlete.objects.create(last_name="Mover", club=self.club)
+        before = timezone.now()
+        self._move(athlete, self.other_club)
+        after = timezone.now()
+
+        self.assertEqual(state_as_of(Athlete, athlete.pk, before)["club_id"], self.club.pk)
+        self.assertEqual(state_as_of(Athlete, athlete.pk, after)["club_id"], self.other_club.pk)
+        self.assertIn(athlete.pk, roster_as_of(self.club.pk, before).values_list("athlete_id", flat=True))
+        self.assertNotIn(athlete.pk, roster_as_of(self.club.pk, after).values_list("athlete_id", flat=True))
+        annotated = club_as_of(Athlete.objects.filter(pk=athlete.pk), before).get()
+        self.assertEqual((annotated.club_as_of, annotated.active_as_of), (self.club.pk, True))
+        self.assertEqual(AthleteVersion.objects.filter(athlete=athlete, valid_to__isnull=True).count(), 1)
+
+    def test_other_fields_do_not_version(self):
+        athlete = Athlete.objects.create(last_name="Still", club=self.club)
+        athlete.last_name = "Renamed"
+        athlete.save()
+        self.assertEqual(AthleteVersion.objects.filter(athlete=athlete).count(), 1)
+
+    def test_rollback_leaves_no_version(self):
+        athlete = Athlete.objects.create(last_name="Stay", club=self.club)
+        try:
+            with transaction.atomic():
+                self._move(athlete, self.other_club)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        (version,) = AthleteVersion.objects.filter(athlete=athlete)
+        self.assertEqual((version.club_id, version.valid_to), (self.club.pk, None))
+
+    def test_object_before_history(self):
+        athlete = Athlete.objects.create(last_name="Old", club=self.club)
+        AthleteVersion.objects.filter(athlete=athlete).delete()
+        # η πρώτη αλλαγή ξαναφτιάχνει την προηγούμενη κατάσταση από τις παλιές τιμές
+        self._move(athlete, self.other_club)
+        first, current = AthleteVersion.objects.filter(athlete=athlete).order_by("valid_from")
+        self.assertEqual((first.club_id, first.valid_to), (self.club.pk, current.valid_from))
+        self.assertEqual((current.club_id, current.valid_to), (self.other_club.pk, None))
+
+    def test_backfill(self):
+        AthleteVersion.objects.all().delete()
+        self.assertEqual(backfill(Athlete), Athlete.objects.count())
+        self.assertEqual(backfill(Athlete), 0)
+        athlete = Athlete.objects.filter(club__isnull=False).first()
+        state = state_as_of(Athlete, athlete.pk, timezone.now())
+        self.assertEqual((state["club_id"], state["valid_from"]), (athlete.club_id, athlete.created_at))
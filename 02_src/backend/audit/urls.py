@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import views
+
+app_name = "audit"
+
+urlpatterns = [
+    path("as-of/athletes/<int:pk>/", views.athlete_as_of, name="athlete_as_of"),
+    path("as-of/clubs/<int:club_id>/athletes/", views.club_roster_as_of, name="club_roster_as_of"),
+    path("<str:app_label>/<str:model_name>/<int:pk>/", views.object_history, name="object_history"),
+]
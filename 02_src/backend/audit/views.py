@@ -0,0 +1,99 @@
+from datetime import date
+
+from django.apps import apps
+from django.contrib import admin
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from accounts.scoping import ScopedAdminMixin, get_scope
+
+from organizations.models import Club
+from registry.models import Athlete
+
+from .recorder import fields_of, history, parse_cursor
+from .temporal import roster_as_of, state_as_of
+
+
+@require_GET
+def object_history(request, app_label, model_name, pk):
+    """
+    GET /api/audit/<app>/<model>/<id>/?before=<cursor>&limit=<n>
+    Ιστορικό αλλαγών ενός αντικειμένου, νεότερα πρώτα (keyset σε timestamp, id).
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    try:
+        model = apps.get_model(app_label, model_name)
+    except LookupError:
+        model = None
+    if model is None or not fields_of(model):
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    if not (request.user.has_perm("audit.view_auditevent") and request.user.has_perm(f"{app_label}.view_{model_name}")):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+    try:
+        before = parse_cursor(request.GET.get("before"))
+        limit = int(request.GET.get("limit", 50))
+    except ValueError:
+        return JsonResponse({"error": "Μη έγκυρες παράμετροι"}, status=400)
+
+    # ίδιο scope με το admin του μοντέλου (και για διαγραμμένα: μόνο όποιος βλέπει τα πάντα)
+    model_admin = admin.site._registry.get(model)
+    if isinstance(model_admin, ScopedAdminMixin):
+        scope = get_scope(request)
+        if not scope.is_global and not scope.filter(model.objects.filter(pk=pk), model_admin.scope_field).exists():
+            return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+
+    rows, cursor = history(model, pk, before, limit)
+    return JsonResponse({"results": rows, "next": cursor})
+
+
+def _as_of_date(request):
+    value = request.GET.get("date")
+    return date.fromisoformat(value) if value else None
+
+
+@require_GET
+def athlete_as_of(request, pk):
+    """GET /api/audit/as-of/athletes/<id>/?date=YYYY-MM-DD — όμιλος / ενεργός στο τέλος της ημέρας."""
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("registry.view_athlete"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+    try:
+        when = _as_of_date(request)
+    except ValueError:
+        return JsonResponse({"error": "Μη έγκυρη ημερομηνία"}, status=400)
+    if when is None:
+        return JsonResponse({"error": "Απαιτείται date"}, status=400)
+    scope = get_scope(request)
+    if not scope.is_global and not scope.filter(Athlete.objects.filter(pk=pk), "club").exists():
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    state = state_as_of(Athlete, pk, when)
+    return JsonResponse({"athlete": pk, "date": when, "state": state})
+
+
+@require_GET
+def club_roster_as_of(request, club_id):
+    """GET /api/audit/as-of/clubs/<id>/athletes/?date=YYYY-MM-DD — οι αθλητές του ομίλου εκείνη την ημέρα."""
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("registry.view_athlete"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+    try:
+        when = _as_of_date(request)
+    except ValueError:
+        return JsonResponse({"error": "Μη έγκυρη ημερομηνία"}, status=400)
+    if when is None:
+        return JsonResponse({"error": "Απαιτείται date"}, status=400)
+    scope = get_scope(request)
+    if not scope.is_global and not scope.filter(Club.objects.filter(pk=club_id), "").exists():
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    rows = list(
+        roster_as_of(club_id, when)
+        .order_by("athlete__last_name", "athlete__first_name", "athlete_id")
+        .values(
+            "athlete_id", "athlete__eoi_registry_number", "athlete__last_name", "athlete__first_name",
+            "is_active", "valid_from", "valid_to",
+        )
+    )
+    return JsonResponse({"club": club_id, "date": when, "results": rows})
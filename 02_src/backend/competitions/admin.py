@@ -1,3 +1,364 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
 
-# Register your models here.
+from accounts.scoping import ScopedAdminMixin
+
+from .dressage import recalculate, submit_sheet, unpack_marks, validate_sheet
+from .eligibility import check_entries
+from .models import (
+    Competition,
+    CompetitionClass,
+    CompetitionRecord,
+    DressageMovement,
+    DressageSheet,
+    DressageTest,
+    Entry,
+    Result,
+    ScoringEvent,
+)
+from .scoring import ScoringError, freeze_class, record_event, reopen_class, validate_event
+from .startlists import StartListError, draw_class
+
+
+# -----------------------------
+# Actions
+# -----------------------------
+@admin.action(description="✅ Έγκριση (με έλεγχο καταλληλότητας)")
+def approve_eligible(modeladmin, request, queryset):
+    drafts = queryset.filter(status=Entry.Status.DRAFT).select_related("competition_class").order_by()
+    results = check_entries(drafts.only("pk", "athlete_id", "horse_id", "competition_class__date", "competition_class__age_category"))
+    ok_ids = [pk for pk, res in results.items() if res.ok]
+    approved = Entry.objects.filter(pk__in=ok_ids).update(status=Entry.Status.APPROVED) if ok_ids else 0
+    modeladmin.message_user(request, f"Εγκρίθηκαν {approved} συμμετοχές.", messages.SUCCESS)
+
+    failed = [(pk, res) for pk, res in results.items() if not res.ok]
+    if failed:
+        shown = "; ".join(f"#{pk}: {', '.join(res.reasons)}" for pk, res in failed[:20])
+        more = f" (+{len(failed) - 20})" if len(failed) > 20 else ""
+        modeladmin.message_user(request, f"Δεν εγκρίθηκαν {len(failed)}: {shown}{more}", messages.WARNING)
+
+
+@admin.action(description="🎲 Κλήρωση σειράς εκκίνησης (νέο seed)")
+def draw_start_list(modeladmin, request, queryset):
+    for competition_class in queryset:
+        try:
+            result = draw_class(competition_class)
+        except StartListError as e:
+            modeladmin.message_user(request, f"{competition_class}: {e}", messages.ERROR)
+            continue
+        modeladmin.message_user(
+            request,
+            f"{competition_class}: {len(result.order)} εκκινήσεις, seed {result.seed} ({result.elapsed_ms:.0f} ms)",
+            messages.SUCCESS,
+        )
+        for warning in result.warnings:
+            modeladmin.message_user(request, f"{competition_class}: {warning}", messages.WARNING)
+
+
+@admin.action(description="🏁 Οριστικοποίηση αποτελεσμάτων (επίσημα + ιστορικό)")
+def freeze_results(modeladmin, request, queryset):
+    for competition_class in queryset:
+        try:
+            count = freeze_class(competition_class)
+        except ScoringError as e:
+            modeladmin.message_user(request, f"{competition_class}: {e}", messages.ERROR)
+            continue
+        modeladmin.message_user(request, f"{competition_class}: {count} αποτελέσματα οριστικοποιήθηκαν.", messages.SUCCESS)
+
+
+@admin.action(description="✏️ Άνοιγμα οριστικοποιημένων για διόρθωση")
+def reopen_results(modeladmin, request, queryset):
+    for competition_class in queryset:
+        try:
+            reopen_class(competition_class)
+        except ScoringError as e:
+            modeladmin.message_user(request, f"{competition_class}: {e}", messages.ERROR)
+            continue
+        modeladmin.message_user(
+            request,
+            f"{competition_class}: ανοιχτό για διορθώσεις· οριστικοποιήστε ξανά για να ενημερωθεί το ιστορικό.",
+            messages.SUCCESS,
+        )
+
+
+@admin.action(description="🧮 Ξαναϋπολογισμός δεξιοτεχνίας (φύλλα κριτών)")
+def recalculate_dressage(modeladmin, request, queryset):
+    try:
+        stats = recalculate(queryset, user=request.user)
+    except ScoringError as e:
+        modeladmin.message_user(request, str(e), messages.ERROR)
+        return
+    modeladmin.message_user(
+        request,
+        f"{stats.sheets} φύλλα, {stats.sheets_changed} άλλαξαν, {stats.events} νέοι βαθμοί σε {stats.classes} αγωνίσματα.",
+        messages.SUCCESS,
+    )
+    if stats.skipped_frozen:
+        modeladmin.message_user(request, f"{stats.skipped_frozen} αγωνίσματα με επίσημα αποτελέσματα δεν άλλαξαν.", messages.WARNING)
+
+
+# -----------------------------
+# Inlines
+# -----------------------------
+class CompetitionClassInline(admin.TabularInline):
+    model = CompetitionClass
+    extra = 0
+    fields = ("number", "name", "discipline", "date", "height_cm", "dressage_test", "distance_km", "age_category", "fee", "max_entries")
+    ordering = ("date", "number")
+
+
+RESULT_FIELDS = ("status", "rank", "faults", "time_seconds", "score", "tiebreak", "stages_completed", "prize_money", "is_official")
+# ✅ βαθμολογία/κατάταξη μόνο μέσω ScoringEvent, αλλιώς χαλάει η live κατάταξη
+RESULT_READONLY = ("status", "rank", "faults", "time_seconds", "score", "tiebreak", "stages_completed", "is_official")
+
+
+def _results_frozen(result) -> bool:
+    return result is not None and result.entry.competition_class.results_frozen_at is not None
+
+
+class ResultInline(admin.StackedInline):
+    model = Result
+    extra = 0
+    fields = RESULT_FIELDS
+    readonly_fields = RESULT_READONLY
+
+    # ✅ Result γεννιέται μόνο από ScoringEvent
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def get_readonly_fields(self, request, obj=None):
+        # obj = η συμμετοχή· ✅ μετά την οριστικοποίηση ούτε το έπαθλο (είναι ήδη στο ιστορικό)
+        if obj is not None and obj.competition_class.results_frozen_at is not None:
+            return RESULT_FIELDS
+        return RESULT_READONLY
+
+
+# -----------------------------
+# Competitions
+# -----------------------------
+@admin.register(Competition)
+class CompetitionAdmin(admin.ModelAdmin):
+    list_display = ("name", "start_date", "end_date", "venue", "organizer", "status")
+    list_filter = ("status",)
+    list_select_related = ("organizer",)
+    search_fields = ("name", "venue", "organizer__name", "organizer__code")
+    ordering = ("-start_date",)
+    date_hierarchy = "start_date"
+    autocomplete_fields = ("organizer",)
+    readonly_fields = ("created_at",)
+
+    inlines = (CompetitionClassInline,)
+
+
+@admin.register(CompetitionClass)
+class CompetitionClassAdmin(admin.ModelAdmin):
+    list_display = (
+        "competition", "number", "name", "discipline", "date", "age_category", "fee", "max_entries",
+        "drawn_at", "results_frozen_at",
+    )
+    list_filter = ("discipline", "age_category")
+    list_select_related = ("competition",)
+    search_fields = ("name", "competition__name")
+    ordering = ("-date", "number")
+    autocomplete_fields = ("competition",)
+    readonly_fields = ("draw_seed", "drawn_at", "results_frozen_at")
+    actions = (draw_start_list, freeze_results, reopen_results, recalculate_dressage)
+
+    fieldsets = (
+        (None, {
+            "fields": (
+                "competition", "number", "name", "discipline", "date",
+                "height_cm", "dressage_test", "dressage_program", "distance_km", "age_category", "fee", "max_entries",
+            )
+        }),
+        ("Σειρά εκκίνησης", {"fields": ("draw_method", "min_rider_gap", "club_rule", "draw_seed", "drawn_at")}),
+        ("Αποτελέσματα", {"fields": ("results_frozen_at",)}),
+    )
+
+
+# -----------------------------
+# Entries
+# -----------------------------
+@admin.register(Entry)
+class EntryAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    list_display = ("competition_class", "start_order", "athlete", "horse", "club", "status", "created_at")
+    list_filter = ("status", "competition_class__discipline")
+    list_select_related = ("competition_class__competition", "athlete", "horse", "club")
+    search_fields = (
+        "athlete__eoi_registry_number",
+        "athlete__last_name_uc",
+        "horse__registry_number",
+        "horse__name",
+        "competition_class__competition__name",
+    )
+    ordering = ("-created_at",)
+    autocomplete_fields = ("competition_class", "athlete", "horse", "club")
+    readonly_fields = ("start_order", "submitted_by", "created_at", "updated_at")
+
+    inlines = (ResultInline,)
+    actions = (approve_eligible,)
+
+    def save_model(self, request, obj, form, change):
+        if not change and obj.submitted_by_id is None:
+            obj.submitted_by = request.user
+        super().save_model(request, obj, form, change)
+
+
+@admin.register(Result)
+class ResultAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = "entry__club"
+
+    list_display = ("entry", "status", "rank", "faults", "time_seconds", "score", "prize_money", "is_official")
+    list_filter = ("status", "is_official")
+    list_select_related = ("entry__athlete", "entry__horse")
+    search_fields = ("entry__athlete__last_name_uc", "entry__horse__name")
+    ordering = ("entry__competition_class", "rank")
+    autocomplete_fields = ("entry",)
+    readonly_fields = RESULT_READONLY
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_readonly_fields(self, request, obj=None):
+        if _results_frozen(obj):
+            return ("entry",) + RESULT_FIELDS
+        return RESULT_READONLY
+
+
+# -----------------------------
+# Scoring events (append-only)
+# -----------------------------
+class ScoringEventForm(forms.ModelForm):
+    class Meta:
+        model = ScoringEvent
+        fields = ("entry", "kind", "round_no", "judge", "faults", "time_seconds", "score", "vet_passed", "status", "supersedes")
+
+    def clean(self):
+        data = super().clean()
+        entry = data.get("entry")
+        if entry is not None and data.get("kind"):
+            values = {"judge": data.get("judge"), "score": data.get("score"), "status": data.get("status")}
+            try:
+                validate_event(entry.competition_class, entry, data["kind"], values, data.get("supersedes"))
+            except ScoringError as e:
+                raise forms.ValidationError(str(e))
+        return data
+
+
+@admin.register(ScoringEvent)
+class ScoringEventAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = "entry__club"
+
+    list_display = ("id", "competition_class", "entry", "kind", "round_no", "judge", "faults", "time_seconds", "score", "status", "supersedes", "recorded_by", "recorded_at")
+    list_filter = ("kind",)
+    list_select_related = ("competition_class__competition", "entry__athlete", "entry__horse", "recorded_by")
+    search_fields = ("entry__athlete__last_name_uc", "entry__horse__name", "competition_class__competition__name")
+    ordering = ("-id",)
+    autocomplete_fields = ("entry", "supersedes")
+    form = ScoringEventForm
+
+    def has_change_permission(self, request, obj=None):
+        return obj is None and super().has_change_permission(request, obj)
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        # ✅ όπως και το API: νέο event + ξαναϋπολογισμός Result/κατάταξης
+        values = {f: form.cleaned_data.get(f) for f in ("round_no", "faults", "time_seconds", "score", "vet_passed")}
+        values["judge"] = form.cleaned_data.get("judge") or ""
+        values["status"] = form.cleaned_data.get("status") or ""
+        outcome = record_event(obj.entry, obj.kind, user=request.user, supersedes=obj.supersedes, **values)
+        obj.pk = outcome.event.pk
+
+
+@admin.register(CompetitionRecord)
+class CompetitionRecordAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    list_display = ("date", "competition_name", "class_name", "athlete", "horse", "club", "status", "rank", "starters", "prize_money")
+    list_filter = ("discipline", "status")
+    list_select_related = ("athlete", "horse", "club")
+    search_fields = ("athlete__last_name_uc", "athlete__eoi_registry_number", "horse__name", "competition_name")
+    ordering = ("-date",)
+    date_hierarchy = "date"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+# -----------------------------
+# Δεξιοτεχνία
+# -----------------------------
+class DressageMovementInline(admin.TabularInline):
+    model = DressageMovement
+    extra = 0
+    fields = ("number", "label", "coefficient", "is_collective")
+    ordering = ("number",)
+
+
+@admin.register(DressageTest)
+class DressageTestAdmin(admin.ModelAdmin):
+    list_display = ("code", "name", "error_penalty", "errors_to_eliminate", "updated_at")
+    search_fields = ("code", "name")
+    ordering = ("code",)
+    readonly_fields = ("updated_at",)
+
+    inlines = (DressageMovementInline,)
+
+
+class DressageSheetForm(forms.ModelForm):
+    marks_text = forms.CharField(
+        label="Βαθμοί",
+        help_text="Με τη σειρά των κινήσεων, χωρισμένοι με κενό (π.χ. 7 7.5 6.5 ...). «-» = χωρίς βαθμό.",
+        widget=forms.Textarea(attrs={"rows": 3}),
+    )
+
+    class Meta:
+        model = DressageSheet
+        fields = ("entry", "judge", "errors")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk is not None:
+            self.fields["marks_text"].initial = " ".join(
+                "-" if m is None else f"{m.normalize():f}" for m in unpack_marks(self.instance.marks)
+            )
+            # ✅ συμμετοχή / κριτής δεν αλλάζουν (νέο φύλλο αντί γι' αυτό)
+            self.fields["entry"].disabled = True
+            self.fields["judge"].disabled = True
+
+    def clean_marks_text(self):
+        return [None if m == "-" else m.replace(",", ".") for m in self.cleaned_data["marks_text"].split()]
+
+    def clean(self):
+        data = super().clean()
+        entry = data.get("entry")
+        if entry is not None and data.get("judge") and "marks_text" in data:
+            try:
+                validate_sheet(entry.competition_class, data["judge"], data["marks_text"])
+            except ScoringError as e:
+                raise forms.ValidationError(str(e))
+        return data
+
+
+@admin.register(DressageSheet)
+class DressageSheetAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = "entry__club"
+
+    list_display = ("competition_class", "entry", "judge", "total", "collective_total", "errors", "percentage", "updated_by", "updated_at")
+    list_filter = ("judge",)
+    list_select_related = ("competition_class__competition", "entry__athlete", "entry__horse", "updated_by")
+    search_fields = ("entry__athlete__last_name_uc", "entry__horse__name", "competition_class__competition__name")
+    ordering = ("competition_class", "entry", "judge")
+    autocomplete_fields = ("entry",)
+    form = DressageSheetForm
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        # ✅ υπολογισμός + DR_MARK event + κατάταξη, όπως και το API
+        submit_sheet(obj.entry, obj.judge, form.cleaned_data["marks_text"], obj.errors, user=request.user)
+        obj.pk = DressageSheet.objects.only("pk").get(entry=obj.entry, judge=obj.judge).pk
@@ -2,4 +2,12 @@ from django.apps import AppConfig
 
 
 class CompetitionsConfig(AppConfig):
-    name = 'competitions'
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "competitions"
+    verbose_name = "Αγώνες"
+
+    def ready(self):
+        from . import eligibility  # noqa: F401  (signals ακύρωσης cache)
+        from . import history  # noqa: F401  (results_frozen -> στατιστικά σεζόν)
+        from . import live  # noqa: F401  (standings_changed -> live πίνακες)
+        from . import partnerships  # noqa: F401  (Entry / results_frozen -> ζεύγη αθλητή / ίππου)
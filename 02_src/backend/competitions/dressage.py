@@ -0,0 +1,355 @@
+"""
+Δεξιοτεχνία: φύλλα κριτών -> ποσοστό -> ScoringEvent (DR_MARK) -> Result / κατάταξη.
+
+- Βαθμοί 0-10 σε μισούς βαθμούς. Ένα DressageSheet ανά κριτή ανά συμμετοχή,
+  με όλες τις κινήσεις σε ΕΝΑ πεδίο bytes (1 byte = μισοί βαθμοί μιας κίνησης).
+- Σύνολο = Σ βαθμός × συντελεστής, ποσοστό = (σύνολο - ποινές) / μέγιστο × 100.
+  Με numpy όλα τα φύλλα ενός προγράμματος υπολογίζονται μαζί (πίνακας
+  φύλλα × κινήσεις επί διάνυσμα συντελεστών)· χωρίς numpy, απλό Python.
+- submit_sheet(): ένα φύλλο. Το ποσοστό γράφεται ως DR_MARK event (διόρθωση του
+  προηγούμενου του ίδιου κριτή), οπότε μέσος όρος κριτών, ισοβαθμία και
+  κατάταξη ενημερώνονται incremental από το competitions/scoring.py.
+- Λάθη διαδρομής >= errors_to_eliminate: STATUS=EL event, κρατιέται στο φύλλο
+  (elimination_event). Όταν η διόρθωση του φύλλου ή του προγράμματος πέσει κάτω
+  από το όριο, το event ακυρώνεται (STATUS χωρίς κατάσταση που το διορθώνει).
+- recalculate(): όλα τα φύλλα αγωνισμάτων (π.χ. διόρθωση συντελεστών σε
+  πρωτάθλημα): ένα query για τα φύλλα, vectorised υπολογισμός, bulk_update
+  και ένα record_events_bulk ανά αγώνισμα που άλλαξε.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.db import transaction
+
+from .models import CompetitionClass, DressageMovement, DressageSheet, DressageTest, Entry, Result, ScoringEvent
+from .scoring import ScoringError, ScoringOutcome, record_event, record_events_bulk
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+MAX_MARK = 10
+UNMARKED = 255
+PERCENT = Decimal("0.001")
+
+
+# -----------------------------
+# βαθμοί <-> bytes
+# -----------------------------
+def pack_marks(marks) -> bytes:
+    """[7.5, 8, None, ...] -> bytes (None = χωρίς βαθμό ακόμα)."""
+    packed = bytearray()
+    for i, mark in enumerate(marks, start=1):
+        if mark is None or mark == "":
+            packed.append(UNMARKED)
+            continue
+        try:
+            half = Decimal(str(mark)) * 2
+        except ArithmeticError:
+            raise ScoringError(f"Κίνηση {i}: μη έγκυρος βαθμός «{mark}».")
+        if half != half.to_integral_value() or not 0 <= half <= MAX_MARK * 2:
+            raise ScoringError(f"Κίνηση {i}: ο βαθμός πρέπει να είναι 0-{MAX_MARK} ανά μισό βαθμό.")
+        packed.append(int(half))
+    return bytes(packed)
+
+
+def unpack_marks(data) -> list[Decimal | None]:
+    return [None if b == UNMARKED else Decimal(b) / 2 for b in bytes(data)]
+
+
+# -----------------------------
+# προγράμματα
+# -----------------------------
+@dataclass(frozen=True)
+class TestVector:
+    coefficients: tuple[int, ...]
+    collective: tuple[bool, ...]
+    error_penalty: Decimal
+    errors_to_eliminate: int
+
+    @property
+    def size(self) -> int:
+        return len(self.coefficients)
+
+    @property
+    def max_total(self) -> int:
+        return MAX_MARK * sum(self.coefficients)
+
+    def eliminates(self, errors: int) -> bool:
+        return bool(self.errors_to_eliminate) and errors >= self.errors_to_eliminate
+
+
+def load_vectors(test_ids) -> dict[int, TestVector]:
+    """2 queries για όσα προγράμματα κι αν ζητηθούν."""
+    tests = {
+        pk: (penalty, eliminate)
+        for pk, penalty, eliminate in DressageTest.objects.filter(pk__in=set(test_ids)).values_list(
+            "pk", "error_penalty", "errors_to_eliminate"
+        )
+    }
+    movements = defaultdict(list)
+    for test_id, coefficient, is_collective in (
+        DressageMovement.objects.filter(test_id__in=tests)
+        .order_by("test_id", "number")
+        .values_list("test_id", "coefficient", "is_collective")
+    ):
+        movements[test_id].append((coefficient, is_collective))
+    return {
+        pk: TestVector(
+            coefficients=tuple(c for c, _ in movements[pk]),
+            collective=tuple(k for _, k in movements[pk]),
+            error_penalty=penalty,
+            errors_to_eliminate=eliminate,
+        )
+        for pk, (penalty, eliminate) in tests.items()
+    }
+
+
+# -----------------------------
+# υπολογισμός
+# -----------------------------
+@dataclass(frozen=True)
+class SheetScore:
+    total: Decimal
+    collective_total: Decimal
+    percentage: Decimal
+
+
+def _fit(data, size: int) -> bytes:
+    # φύλλα παλιότερης έκδοσης του προγράμματος: κόβονται / συμπληρώνονται
+    data = bytes(data)[:size]
+    return data + bytes([UNMARKED]) * (size - len(data))
+
+
+def _half_totals(vector: TestVector, marks: list[bytes]) -> list[tuple[int, int]]:
+    """[(σύνολο, συνολικοί βαθμοί)] σε μισούς βαθμούς, ακέραια (ακριβή) αριθμητική."""
+    if np is not None:
+        matrix = np.frombuffer(b"".join(marks), dtype=np.uint8).reshape(len(marks), vector.size).astype(np.int64)
+        matrix[matrix == UNMARKED] = 0
+        coefficients = np.array(vector.coefficients, dtype=np.int64)
+        totals = matrix @ coefficients
+        collective = matrix @ (coefficients * np.array(vector.collective, dtype=np.int64))
+        return list(zip(totals.tolist(), collective.tolist()))
+
+    result = []
+    for data in marks:
+        total = collective = 0
+        for mark, coefficient, is_collective in zip(data, vector.coefficients, vector.collective):
+            if mark != UNMARKED:
+                total += mark * coefficient
+                if is_collective:
+                    collective += mark * coefficient
+        result.append((total, collective))
+    return result
+
+
+def score_sheets(vector: TestVector, sheets) -> list[SheetScore]:
+    """sheets: [(marks bytes, λάθη διαδρομής)] του ίδιου προγράμματος."""
+    if not sheets or not vector.size:
+        return [SheetScore(Decimal(0), Decimal(0), Decimal(0)) for _ in sheets]
+    marks = [_fit(data, vector.size) for data, _ in sheets]
+    max_total = Decimal(vector.max_total)
+    scores = []
+    for (total, collective), (_, errors) in zip(_half_totals(vector, marks), sheets):
+        total = Decimal(total) / 2
+        net = max(total - errors * vector.error_penalty, Decimal(0))
+        scores.append(SheetScore(total, Decimal(collective) / 2, (net * 100 / max_total).quantize(PERCENT)))
+    return scores
+
+
+# -----------------------------
+# καταχώρηση φύλλου
+# -----------------------------
+def validate_sheet(competition_class: CompetitionClass, judge: str, marks) -> tuple[TestVector, bytes]:
+    """Έλεγχος φύλλου πριν την καταχώρηση. Επιστρέφει (πρόγραμμα, βαθμοί σε bytes)."""
+    if competition_class.discipline != CompetitionClass.Discipline.DRESSAGE:
+        raise ScoringError("Το αγώνισμα δεν είναι δεξιοτεχνίας.")
+    if competition_class.dressage_program_id is None:
+        raise ScoringError("Το αγώνισμα δεν έχει πρόγραμμα βαθμολόγησης.")
+    if competition_class.results_frozen_at is not None:
+        raise ScoringError("Τα αποτελέσματα του αγωνίσματος έχουν οριστικοποιηθεί.")
+    if judge not in DressageSheet.Judge.values:
+        raise ScoringError(f"Άγνωστη θέση κριτή: {judge}")
+    vector = load_vectors([competition_class.dressage_program_id])[competition_class.dressage_program_id]
+    data = pack_marks(marks)
+    if len(data) != vector.size:
+        raise ScoringError(f"Το πρόγραμμα έχει {vector.size} κινήσεις, δόθηκαν {len(data)} βαθμοί.")
+    return vector, data
+
+
+def submit_sheet(entry: Entry, judge: str, marks, errors: int = 0, user=None) -> ScoringOutcome:
+    """Νέο / διορθωμένο φύλλο κριτή -> DR_MARK event -> Result και κατάταξη."""
+    cc = entry.competition_class
+    vector, data = validate_sheet(cc, judge, marks)
+    score = score_sheets(vector, [(data, errors)])[0]
+
+    with transaction.atomic():
+        sheet, _ = DressageSheet.objects.update_or_create(
+            entry=entry,
+            judge=judge,
+            defaults={
+                "competition_class_id": cc.pk,
+                "marks": data,
+                "errors": errors,
+                "total": score.total,
+                "collective_total": score.collective_total,
+                "percentage": score.percentage,
+                "updated_by": user if user is not None and user.is_authenticated else None,
+            },
+        )
+        previous = (
+            ScoringEvent.objects.filter(
+                entry=entry, kind=ScoringEvent.Kind.DRESSAGE_MARK, judge=judge, superseded_by__isnull=True
+            )
+            .order_by("-id")
+            .first()
+        )
+        outcome = record_event(
+            entry,
+            ScoringEvent.Kind.DRESSAGE_MARK,
+            user=user,
+            supersedes=previous,
+            judge=judge,
+            score=score.percentage,
+            tiebreak=score.collective_total,
+        )
+        elimination = _active_elimination(sheet)
+        if vector.eliminates(errors) and elimination is None:
+            outcome = record_event(
+                entry, ScoringEvent.Kind.STATUS, user=user, judge=judge, status=Result.Status.ELIMINATED
+            )
+            elimination = outcome.event
+        elif not vector.eliminates(errors) and elimination is not None:
+            outcome = record_event(
+                entry, ScoringEvent.Kind.STATUS, user=user, supersedes=elimination, judge=judge, status=""
+            )
+            elimination = None
+        if sheet.elimination_event_id != (elimination.pk if elimination else None):
+            sheet.elimination_event = elimination
+            sheet.save(update_fields=["elimination_event"])
+    return outcome
+
+
+def _active_elimination(sheet: DressageSheet) -> ScoringEvent | None:
+    """Ο αποκλεισμός του φύλλου, αν δεν τον έχει διορθώσει κάποιος στο μεταξύ (π.χ. από το admin)."""
+    if sheet.elimination_event_id is None:
+        return None
+    return ScoringEvent.objects.filter(pk=sheet.elimination_event_id, superseded_by__isnull=True).first()
+
+
+# -----------------------------
+# μαζικός ξαναϋπολογισμός
+# -----------------------------
+@dataclass
+class RecalculationStats:
+    classes: int = 0
+    sheets: int = 0
+    sheets_changed: int = 0
+    events: int = 0
+    skipped_frozen: int = 0
+
+
+def recalculate(classes, user=None) -> RecalculationStats:
+    """
+    classes: queryset / λίστα CompetitionClass. Αγωνίσματα με επίσημα
+    αποτελέσματα δεν αλλάζουν (μετρούν στο skipped_frozen).
+    """
+    stats = RecalculationStats()
+    by_pk = {}
+    for cc in classes:
+        if cc.discipline != CompetitionClass.Discipline.DRESSAGE or cc.dressage_program_id is None:
+            continue
+        if cc.results_frozen_at is not None:
+            stats.skipped_frozen += 1
+            continue
+        by_pk[cc.pk] = cc
+    if not by_pk:
+        return stats
+
+    vectors = load_vectors({cc.dressage_program_id for cc in by_pk.values()})
+    sheets_by_test = defaultdict(list)
+    for sheet in (
+        DressageSheet.objects.filter(competition_class_id__in=by_pk).order_by()
+    ):
+        sheets_by_test[by_pk[sheet.competition_class_id].dressage_program_id].append(sheet)
+
+    # τρέχον ενεργό DR_MARK ανά (συμμετοχή, κριτή) και ενεργοί αποκλεισμοί (STATUS)
+    active = {}
+    active_status = set()
+    for pk, kind, entry_id, judge, score, tiebreak in (
+        ScoringEvent.objects.filter(
+            competition_class_id__in=by_pk,
+            kind__in=[ScoringEvent.Kind.DRESSAGE_MARK, ScoringEvent.Kind.STATUS],
+            superseded_by__isnull=True,
+        )
+        .order_by("id")
+        .values_list("pk", "kind", "entry_id", "judge", "score", "tiebreak")
+    ):
+        if kind == ScoringEvent.Kind.STATUS:
+            active_status.add(pk)
+        else:
+            active[entry_id, judge] = (pk, score, tiebreak)
+
+    changed_sheets = {}
+    events = defaultdict(list)
+    eliminations = []  # (φύλλο, νέο STATUS=EL event): το pk υπάρχει μετά το bulk_create
+    for test_id, sheets in sheets_by_test.items():
+        vector = vectors[test_id]
+        scores = score_sheets(vector, [(s.marks, s.errors) for s in sheets])
+        stats.sheets += len(sheets)
+        for sheet, score in zip(sheets, scores):
+            if (sheet.total, sheet.collective_total, sheet.percentage) != (score.total, score.collective_total, score.percentage):
+                sheet.total, sheet.collective_total, sheet.percentage = score.total, score.collective_total, score.percentage
+                changed_sheets[sheet.pk] = sheet
+            event_pk, event_score, event_tiebreak = active.get((sheet.entry_id, sheet.judge), (None, None, None))
+            if (event_score, event_tiebreak) != (score.percentage, score.collective_total):
+                events[sheet.competition_class_id].append(ScoringEvent(
+                    entry_id=sheet.entry_id,
+                    kind=ScoringEvent.Kind.DRESSAGE_MARK,
+                    judge=sheet.judge,
+                    score=score.percentage,
+                    tiebreak=score.collective_total,
+                    supersedes_id=event_pk,
+                ))
+
+            # το ίδιο όριο λαθών με το submit_sheet (π.χ. αλλαγή του errors_to_eliminate)
+            elimination = sheet.elimination_event_id if sheet.elimination_event_id in active_status else None
+            if vector.eliminates(sheet.errors) and elimination is None:
+                event = ScoringEvent(
+                    entry_id=sheet.entry_id, kind=ScoringEvent.Kind.STATUS, judge=sheet.judge,
+                    status=Result.Status.ELIMINATED,
+                )
+                events[sheet.competition_class_id].append(event)
+                eliminations.append((sheet, event))
+                changed_sheets[sheet.pk] = sheet
+            elif not vector.eliminates(sheet.errors) and elimination is not None:
+                events[sheet.competition_class_id].append(ScoringEvent(
+                    entry_id=sheet.entry_id, kind=ScoringEvent.Kind.STATUS, judge=sheet.judge, status="",
+                    supersedes_id=elimination,
+                ))
+                elimination = None
+            if sheet.elimination_event_id != elimination:
+                sheet.elimination_event_id = elimination
+                changed_sheets[sheet.pk] = sheet
+
+    with transaction.atomic():
+        for class_id, class_events in events.items():
+            record_events_bulk(by_pk[class_id], class_events, user=user)
+        for sheet, event in eliminations:
+            sheet.elimination_event_id = event.pk
+        # upsert αντί για bulk_update (CASE WHEN ανά γραμμή, αργό σε χιλιάδες φύλλα)
+        DressageSheet.objects.bulk_create(
+            list(changed_sheets.values()),
+            update_conflicts=True,
+            unique_fields=["entry", "judge"],
+            update_fields=["total", "collective_total", "percentage", "elimination_event", "updated_at"],
+            batch_size=500,
+        )
+    stats.sheets_changed = len(changed_sheets)
+    stats.events = sum(len(e) for e in events.values())
+    stats.classes = len(events)
+    return stats
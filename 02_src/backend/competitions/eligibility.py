@@ -0,0 +1,352 @@
+"""
+Έλεγχος καταλληλότητας συμμετοχών, σε παρτίδες.
+
+Για μια ολόκληρη λίστα (αθλητής, ίππος, αγώνισμα, ημερομηνία) γίνονται
+λίγα set-based queries αντί για N queries ανά ζευγάρι. Ιατρική, άδεια, συνδρομή
+και έγγραφα ίππου έρχονται από τα διαστήματα του registry.eligibility (ίδιοι κανόνες
+με το μητρώο)· μόνο όσοι δεν καλύπτονται αναλύονται ανά προϋπόθεση για το μήνυμα.
+
+Τα αποτελέσματα ανά (αθλητή, ημερομηνία) και (ίππο, ημερομηνία) μένουν στο cache.
+Κάθε αθλητής / ίππος έχει δική του "έκδοση": αλλαγή σε ιατρική, άδεια,
+συνδρομή ή έγγραφο ίππου την αυξάνει και ακυρώνει μόνο τις δικές του εγγραφές.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from audit.recorder import changes_recorded
+
+from registry import eligibility as registry_eligibility
+from registry.models import (
+    Athlete,
+    AthleteEligibility,
+    AthleteMedicalCertificate,
+    AthleteSubscription,
+    Horse,
+    HorseDocument,
+    HorseEligibility,
+)
+
+from .models import CompetitionClass
+
+# κανόνες -> μήνυμα αποτυχίας
+ATHLETE_ACTIVE = "athlete_active"
+MEDICAL = "medical"
+LICENSE = "license"
+SUBSCRIPTION = "subscription"
+AGE_CATEGORY = "age_category"
+HORSE_ACTIVE = "horse_active"
+HORSE_PASSPORT = "horse_passport"
+HORSE_MEDICAL = "horse_medical"
+
+MESSAGES = {
+    ATHLETE_ACTIVE: "Ανενεργός αθλητής",
+    MEDICAL: "Δεν υπάρχει σε ισχύ ιατρική βεβαίωση",
+    LICENSE: "Δεν υπάρχει άδεια αθλητή",
+    SUBSCRIPTION: "Δεν υπάρχει εξοφλημένη συνδρομή",
+    AGE_CATEGORY: "Η ηλικία δεν αντιστοιχεί στην κατηγορία",
+    HORSE_ACTIVE: "Ανενεργός ίππος",
+    HORSE_PASSPORT: "Δεν υπάρχει σε ισχύ διαβατήριο ίππου",
+    HORSE_MEDICAL: "Δεν υπάρχει σε ισχύ ιατρικό ίππου (εμβόλια)",
+}
+
+# προϋποθέσεις του registry.eligibility -> κανόνας
+ATHLETE_REQUIREMENTS = {
+    AthleteEligibility.Requirement.MEDICAL: MEDICAL,
+    AthleteEligibility.Requirement.LICENSE: LICENSE,
+    AthleteEligibility.Requirement.SUBSCRIPTION: SUBSCRIPTION,
+}
+HORSE_REQUIREMENTS = {
+    HorseEligibility.Requirement.PASSPORT: HORSE_PASSPORT,
+    HorseEligibility.Requirement.MEDICAL: HORSE_MEDICAL,
+}
+
+# ηλικία = έτος αγώνα - έτος γέννησης (όπως στους κανονισμούς)
+AGE_LIMITS = {
+    CompetitionClass.AgeCategory.CHILDREN: (12, 14),
+    CompetitionClass.AgeCategory.JUNIORS: (14, 18),
+    CompetitionClass.AgeCategory.YOUNG_RIDERS: (16, 21),
+    CompetitionClass.AgeCategory.SENIORS: (18, None),
+    CompetitionClass.AgeCategory.VETERANS: (45, None),
+    CompetitionClass.AgeCategory.OPEN: (None, None),
+}
+
+
+@dataclass
+class EligibilityRequest:
+    athlete_id: int
+    horse_id: int
+    age_category: str = CompetitionClass.AgeCategory.OPEN
+    on_date: date | None = None
+
+    def __post_init__(self):
+        if self.on_date is None:
+            self.on_date = timezone.localdate()
+
+
+@dataclass
+class EligibilityResult:
+    athlete_id: int
+    horse_id: int
+    on_date: date
+    rules: dict[str, bool] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return all(self.rules.values())
+
+    @property
+    def reasons(self) -> list[str]:
+        return [MESSAGES[rule] for rule, passed in self.rules.items() if not passed]
+
+
+# -----------------------------
+# cache (εκδόσεις ανά αθλητή / ίππο)
+# -----------------------------
+def _version_key(kind: str, pk) -> str:
+    return f"eoi:elig:{kind}:{pk}:v"
+
+
+def _entry_key(kind: str, pk, version, on_date: date) -> str:
+    return f"eoi:elig:{kind}:{pk}:{version}:{on_date.isoformat()}"
+
+
+def _bump(kind: str, pks) -> None:
+    for pk in pks:
+        try:
+            cache.incr(_version_key(kind, pk))
+        except ValueError:
+            cache.set(_version_key(kind, pk), 1, None)
+
+
+def invalidate_many(kind: str, pks) -> None:
+    """
+    Νέα έκδοση μετά το commit: αν αυξανόταν πριν, ένας ταυτόχρονος έλεγχος θα διάβαζε
+    ακόμα τα παλιά δεδομένα και θα τα αποθήκευε με τη νέα έκδοση.
+    """
+    pks = set(pks)
+    if pks:
+        transaction.on_commit(partial(_bump, kind, pks))
+
+
+def invalidate(kind: str, pk) -> None:
+    invalidate_many(kind, [pk])
+
+
+def _cached(kind: str, keys: set[tuple[int, date]]) -> tuple[dict, dict]:
+    """Επιστρέφει (βρέθηκαν, εκδόσεις) για τα (pk, date)."""
+    pks = {pk for pk, _ in keys}
+    raw_versions = cache.get_many([_version_key(kind, pk) for pk in pks])
+    versions = {pk: raw_versions.get(_version_key(kind, pk), 0) for pk in pks}
+    wanted = {_entry_key(kind, pk, versions[pk], d): (pk, d) for pk, d in keys}
+    found = cache.get_many(list(wanted))
+    return {wanted[k]: v for k, v in found.items()}, versions
+
+
+def _store(kind: str, values: dict, versions: dict) -> None:
+    timeout = getattr(settings, "EOI_ELIGIBILITY_CACHE_TIMEOUT", 6 * 3600)
+    cache.set_many(
+        {_entry_key(kind, pk, versions[pk], d): rules for (pk, d), rules in values.items()},
+        timeout,
+    )
+
+
+# -----------------------------
+# set-based υπολογισμός
+# -----------------------------
+def _failed_rules(requirements: dict, names: dict, on_date: date) -> dict[str, bool]:
+    """Ποια προϋπόθεση λείπει, μόνο για όσους δεν καλύπτει κανένα διάστημα."""
+    if requirements is None:
+        return {rule: False for rule in names.values()}
+    return {names[code]: registry_eligibility.covers(periods, on_date) for code, periods in requirements.items()}
+
+
+def _window_rules(model, keys: set[tuple[int, date]], requirements, names: dict) -> dict:
+    """
+    Ιατρική / άδεια / συνδρομή (ή διαβατήριο / ιατρικό ίππου) από τα διαστήματα του
+    registry.eligibility: ένα range scan, και ανάλυση ανά προϋπόθεση μόνο για όσους αποτυγχάνουν.
+    """
+    period_model, owner = registry_eligibility.PERIODS[model]
+    covered = defaultdict(list)
+    for pk, start, end in (
+        period_model.objects.filter(
+            **{f"{owner}_id__in": {pk for pk, _ in keys}},
+            eligible_until__gte=min(d for _, d in keys),
+        )
+        .order_by()
+        .values_list(f"{owner}_id", "eligible_from", "eligible_until")
+    ):
+        covered[pk].append((start, end))
+
+    passed = {rule: True for rule in names.values()}
+    out = {}
+    failing = {}
+    for pk, d in keys:
+        if registry_eligibility.covers(covered[pk], d):
+            out[(pk, d)] = passed
+        else:
+            failing[(pk, d)] = pk
+    if failing:
+        details = requirements(set(failing.values()))
+        for (pk, d) in failing:
+            out[(pk, d)] = _failed_rules(details.get(pk), names, d)
+    return out
+
+
+def _athlete_rules(keys: set[tuple[int, date]]) -> dict:
+    athletes = {
+        a["pk"]: a
+        for a in Athlete.objects.filter(pk__in={pk for pk, _ in keys})
+        .order_by()
+        .values("pk", "is_active", "birth_date")
+    }
+    windows = _window_rules(Athlete, keys, registry_eligibility.athlete_requirements, ATHLETE_REQUIREMENTS)
+
+    out = {}
+    for pk, d in keys:
+        a = athletes.get(pk)
+        if a is None:
+            out[(pk, d)] = {ATHLETE_ACTIVE: False}
+            continue
+        out[(pk, d)] = {
+            ATHLETE_ACTIVE: a["is_active"],
+            **windows[(pk, d)],
+            # η ηλικία κρατιέται εδώ ώστε να μη χρειάζεται query ανά κατηγορία
+            "_birth_year": a["birth_date"].year if a["birth_date"] else None,
+        }
+    return out
+
+
+def _horse_rules(keys: set[tuple[int, date]]) -> dict:
+    active = dict(Horse.objects.filter(pk__in={pk for pk, _ in keys}).order_by().values_list("pk", "is_active"))
+    windows = _window_rules(Horse, keys, registry_eligibility.horse_requirements, HORSE_REQUIREMENTS)
+    return {(pk, d): {HORSE_ACTIVE: bool(active.get(pk)), **windows[(pk, d)]} for pk, d in keys}
+
+
+def _age_ok(birth_year, age_category: str, on_date: date) -> bool:
+    low, high = AGE_LIMITS.get(age_category, (None, None))
+    if low is None and high is None:
+        return True
+    if birth_year is None:
+        return False
+    age = on_date.year - birth_year
+    return (low is None or age >= low) and (high is None or age <= high)
+
+
+def _rules_for(kind: str, keys: set[tuple[int, date]], compute) -> dict:
+    found, versions = _cached(kind, keys)
+    missing = keys - found.keys()
+    if missing:
+        computed = compute(missing)
+        _store(kind, computed, versions)
+        found.update(computed)
+    return found
+
+
+def check_eligibility(requests: list[EligibilityRequest]) -> list[EligibilityResult]:
+    """Ελέγχει όλη την παρτίδα. Το αποτέλεσμα είναι στην ίδια σειρά με τα requests."""
+    if not requests:
+        return []
+
+    athlete_keys = {(r.athlete_id, r.on_date) for r in requests}
+    horse_keys = {(r.horse_id, r.on_date) for r in requests}
+    athlete_rules = _rules_for("a", athlete_keys, _athlete_rules)
+    horse_rules = _rules_for("h", horse_keys, _horse_rules)
+
+    results = []
+    for r in requests:
+        a = dict(athlete_rules[(r.athlete_id, r.on_date)])
+        birth_year = a.pop("_birth_year", None)
+        rules = {**a, AGE_CATEGORY: _age_ok(birth_year, r.age_category, r.on_date)}
+        rules.update(horse_rules[(r.horse_id, r.on_date)])
+        results.append(EligibilityResult(r.athlete_id, r.horse_id, r.on_date, rules))
+    return results
+
+
+def check_entries(entries) -> dict[int, EligibilityResult]:
+    """
+    Για queryset/λίστα Entry. Χρειάζεται competition_class (select_related)
+    για ημερομηνία και κατηγορία. Επιστρέφει entry.pk -> αποτέλεσμα.
+    """
+    entries = list(entries)
+    results = check_eligibility([
+        EligibilityRequest(
+            athlete_id=e.athlete_id,
+            horse_id=e.horse_id,
+            age_category=e.competition_class.age_category,
+            on_date=e.competition_class.date,
+        )
+        for e in entries
+    ])
+    return {e.pk: res for e, res in zip(entries, results)}
+
+
+# -----------------------------
+# ακύρωση cache
+# -----------------------------
+@receiver(post_save, sender=Athlete)
+@receiver(post_delete, sender=Athlete)
+def _athlete_changed(sender, instance, **kwargs):
+    invalidate("a", instance.pk)
+
+
+@receiver(post_save, sender=AthleteMedicalCertificate)
+@receiver(post_delete, sender=AthleteMedicalCertificate)
+@receiver(post_save, sender=AthleteSubscription)
+@receiver(post_delete, sender=AthleteSubscription)
+def _athlete_document_changed(sender, instance, **kwargs):
+    invalidate("a", instance.athlete_id)
+
+
+@receiver(post_save, sender=Horse)
+@receiver(post_delete, sender=Horse)
+def _horse_changed(sender, instance, **kwargs):
+    invalidate("h", instance.pk)
+
+
+@receiver(post_save, sender=HorseDocument)
+@receiver(post_delete, sender=HorseDocument)
+def _horse_document_changed(sender, instance, **kwargs):
+    invalidate("h", instance.horse_id)
+
+
+# μαζικές αλλαγές (audit.recorder.update / record_changes, π.χ. actions ενεργοποίησης,
+# συγχώνευση) δεν στέλνουν post_save: ίδιο ρεύμα αλλαγών με το audit/temporal.py
+_OWNERS = {
+    Athlete: ("a", None),
+    Horse: ("h", None),
+    AthleteMedicalCertificate: ("a", "athlete_id"),
+    HorseDocument: ("h", "horse_id"),
+}
+
+
+@receiver(registry_eligibility.eligibility_refreshed)
+def _periods_refreshed(sender, ids, **kwargs):
+    # τα διαστήματα ενημερώνονται στο commit της αλλαγής: νέα έκδοση και μετά από αυτά
+    invalidate_many(_OWNERS[sender][0], ids)
+
+
+@receiver(changes_recorded)
+def _changes_recorded(sender, events, **kwargs):
+    spec = _OWNERS.get(sender)
+    if spec is None:
+        return
+    kind, owner = spec
+    ids = {e.object_id for e in events}
+    if owner is None:
+        invalidate_many(kind, ids)
+        return
+    # ο κάτοχος πριν (από το changes, π.χ. μεταφορά σε άλλον αθλητή) και τώρα
+    owners = {v for e in events for v in e.changes.get(owner, ()) if v is not None}
+    owners.update(sender._base_manager.filter(pk__in=ids).values_list(owner, flat=True))
+    invalidate_many(kind, owners)
@@ -0,0 +1,152 @@
+"""
+Μαζική υποβολή δηλώσεων συμμετοχής: ένας όμιλος δηλώνει δεκάδες ζευγάρια
+αθλητή/ίππου σε ένα αγώνισμα, σε μία συναλλαγή και με σταθερό αριθμό queries
+(όχι ένα ανά ζευγάρι).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.db import IntegrityError, transaction
+
+from accounts.scoping import Scope
+from registry.models import Athlete, Horse
+
+from .models import CompetitionClass, Entry
+from .partnerships import schedule as schedule_partnerships
+
+
+class EntrySubmissionError(Exception):
+    def __init__(self, errors: list[dict]):
+        super().__init__("; ".join(e["error"] for e in errors))
+        self.errors = errors
+
+
+@dataclass
+class SubmissionResult:
+    created: list[Entry] = field(default_factory=list)
+    duplicates: list[dict] = field(default_factory=list)
+
+
+def _resolve(model, key_field: str, refs: set) -> dict:
+    """Δέχεται pk (int) ή αριθμό μητρώου (str) και επιστρέφει ref -> object."""
+    ids = {r for r in refs if isinstance(r, int)}
+    keys = {r for r in refs if isinstance(r, str)}
+    out = {}
+    if ids:
+        out.update({obj.pk: obj for obj in model.objects.filter(pk__in=ids).order_by()})
+    if keys:
+        out.update({getattr(obj, key_field): obj for obj in model.objects.filter(**{f"{key_field}__in": keys}).order_by()})
+    return out
+
+
+def _ref(value):
+    """pk (int) ή αριθμός μητρώου (str). None για ό,τι άλλο (bool, null, λίστα, dict ...)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int) or (isinstance(value, str) and value):
+        return value
+    return None
+
+
+def submit_entries(
+    competition_class: CompetitionClass,
+    pairs: list[dict],
+    user=None,
+    scope: Scope | None = None,
+    status: str = Entry.Status.DRAFT,
+) -> SubmissionResult:
+    """
+    pairs = [{"athlete": 12 | "ΑΜ...", "horse": 7 | "ΑΜ ίππου"}, ...]
+
+    - Όλα ή τίποτα: αν κάποιο ζευγάρι είναι λάθος (άγνωστος αθλητής, εκτός scope ...)
+      σηκώνεται EntrySubmissionError και δεν γράφεται τίποτα.
+    - Ζευγάρια που έχουν ήδη δήλωση στο αγώνισμα παραλείπονται (duplicates).
+    """
+    errors = []
+    refs = {}
+    for i, p in enumerate(pairs):
+        if not isinstance(p, dict):
+            errors.append({"index": i, "error": "Αναμένεται {\"athlete\": ..., \"horse\": ...}"})
+            continue
+        athlete_ref, horse_ref = _ref(p.get("athlete")), _ref(p.get("horse"))
+        if athlete_ref is None:
+            errors.append({"index": i, "error": f"Μη έγκυρος αθλητής: {p.get('athlete')!r}"})
+        elif horse_ref is None:
+            errors.append({"index": i, "error": f"Μη έγκυρος ίππος: {p.get('horse')!r}"})
+        else:
+            refs[i] = (athlete_ref, horse_ref)
+
+    athletes = _resolve(Athlete, "eoi_registry_number", {a for a, _ in refs.values()})
+    horses = _resolve(Horse, "registry_number", {h for _, h in refs.values()})
+    allowed_athlete_ids = None
+    if scope is not None and not scope.is_global:
+        allowed_athlete_ids = set(
+            scope.filter(Athlete.objects.filter(pk__in=[a.pk for a in athletes.values()]))
+            .order_by().values_list("pk", flat=True)
+        )
+
+    wanted = {}
+    for i, (athlete_ref, horse_ref) in refs.items():
+        athlete = athletes.get(athlete_ref)
+        horse = horses.get(horse_ref)
+        if athlete is None:
+            errors.append({"index": i, "error": f"Άγνωστος αθλητής: {athlete_ref}"})
+            continue
+        if horse is None:
+            errors.append({"index": i, "error": f"Άγνωστος ίππος: {horse_ref}"})
+            continue
+        if allowed_athlete_ids is not None and athlete.pk not in allowed_athlete_ids:
+            errors.append({"index": i, "error": f"Ο αθλητής {athlete} δεν ανήκει στον όμιλό σας"})
+            continue
+        if not athlete.is_active or not horse.is_active:
+            errors.append({"index": i, "error": f"Ανενεργός αθλητής ή ίππος: {athlete} / {horse}"})
+            continue
+        wanted[(athlete.pk, horse.pk)] = (athlete, horse)
+
+    if errors:
+        raise EntrySubmissionError(sorted(errors, key=lambda e: e["index"]))
+
+    result = SubmissionResult()
+    with transaction.atomic():
+        # κλείδωμα του αγωνίσματος: ταυτόχρονες υποβολές δεν περνούν το max_entries
+        cc = CompetitionClass.objects.select_for_update().get(pk=competition_class.pk)
+
+        existing = set(
+            Entry.objects.filter(
+                competition_class=cc,
+                athlete_id__in={a for a, _ in wanted},
+                horse_id__in={h for _, h in wanted},
+            ).order_by().values_list("athlete_id", "horse_id")
+        )
+        for key in existing & wanted.keys():
+            athlete, horse = wanted.pop(key)
+            result.duplicates.append({"athlete": athlete.pk, "horse": horse.pk})
+
+        if cc.max_entries is not None:
+            current = Entry.objects.filter(competition_class=cc).count()
+            if current + len(wanted) > cc.max_entries:
+                raise EntrySubmissionError([{
+                    "index": None,
+                    "error": f"Ξεπερνιέται το όριο συμμετοχών ({cc.max_entries}, ήδη {current})",
+                }])
+
+        objs = [
+            Entry(
+                competition_class=cc,
+                athlete=athlete,
+                horse=horse,
+                club_id=athlete.club_id,
+                status=status,
+                submitted_by=user if user is not None and user.is_authenticated else None,
+            )
+            for athlete, horse in wanted.values()
+        ]
+        try:
+            result.created = Entry.objects.bulk_create(objs)
+        except IntegrityError as e:
+            # ταυτόχρονη υποβολή του ίδιου ζευγαριού
+            raise EntrySubmissionError([{"index": None, "error": f"Διπλή δήλωση: {e}"}]) from e
+        schedule_partnerships(wanted.keys())
+
+    return result
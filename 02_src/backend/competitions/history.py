@@ -0,0 +1,178 @@
+"""
+Ιστορικό αγώνων αθλητή / ίππου για τις σελίδες προφίλ.
+
+- AthleteSeasonStats / HorseSeasonStats / PairSeasonStats: αθροίσματα ανά σεζόν
+  από το CompetitionRecord. Ενημερώνονται στην οριστικοποίηση (signal
+  results_frozen) ΜΟΝΟ για τους αθλητές / ίππους / ζεύγη και τις σεζόν του αγωνίσματος,
+  πριν και μετά την ενημέρωση των CompetitionRecord (διορθώσεις μετά το reopen_class).
+- timeline(): keyset σελιδοποίηση σε (date, id) πάνω στο index (athlete|horse, -date, -id).
+
+Οι σελίδες προφίλ δεν κάνουν ποτέ aggregate στο request.
+`manage.py rebuild_history` για πλήρη αναδημιουργία.
+"""
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum, Value
+from django.db.models.functions import Coalesce, ExtractYear
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import (
+    AthleteSeasonStats,
+    CompetitionClass,
+    CompetitionRecord,
+    HorseSeasonStats,
+    PairSeasonStats,
+    Result,
+)
+from .scoring import results_frozen
+
+STAT_FIELDS = [
+    "starts", "completed", "wins", "placings", "clear_rounds", "eliminations",
+    "total_faults", "prize_money", "best_rank", "last_date", "refreshed_at",
+]
+
+# είδος -> (μοντέλο, πεδία ταυτότητας)
+KINDS = {
+    "athlete": (AthleteSeasonStats, ("athlete_id",)),
+    "horse": (HorseSeasonStats, ("horse_id",)),
+    "pair": (PairSeasonStats, ("athlete_id", "horse_id")),
+}
+
+TIMELINE_FIELDS = (
+    "id", "date", "competition_name", "class_name", "discipline", "age_category", "height_cm",
+    "athlete_id", "horse_id", "status", "rank", "starters", "faults", "time_seconds", "score", "prize_money",
+)
+MAX_PAGE_SIZE = 200
+
+
+def _aggregates() -> dict:
+    S = Result.Status
+    ok = Q(status=S.OK)
+    return {
+        "starts": Count("pk", filter=~Q(status=S.NOT_STARTED)),
+        "completed": Count("pk", filter=ok),
+        "wins": Count("pk", filter=ok & Q(rank=1)),
+        "placings": Count("pk", filter=ok & Q(rank__lte=3)),
+        "clear_rounds": Count(
+            "pk",
+            filter=ok & Q(faults=0, discipline__in=[CompetitionClass.Discipline.SHOW_JUMPING, CompetitionClass.Discipline.EVENTING]),
+        ),
+        "eliminations": Count("pk", filter=Q(status__in=[S.ELIMINATED, S.RETIRED, S.DISQUALIFIED])),
+        "total_faults": Coalesce(Sum("faults"), Value(Decimal(0))),
+        "prize_money": Coalesce(Sum("prize_money"), Value(Decimal(0))),
+        "best_rank": Min("rank", filter=ok),
+        "last_date": Max("date"),
+    }
+
+
+def _grouped(records, identity: tuple[str, ...]):
+    return (
+        records.order_by()
+        .annotate(season=ExtractYear("date"))
+        .values(*identity, "season")
+        .annotate(**_aggregates())
+    )
+
+
+# -----------------------------
+# ενημέρωση
+# -----------------------------
+def refresh_stats(keys: dict[str, set[tuple]]) -> int:
+    """
+    keys: {"athlete": {(athlete_id, season)}, "horse": {(horse_id, season)},
+           "pair": {(athlete_id, horse_id, season)}}
+    Ένα GROUP BY ανά είδος, μόνο για τα ids / σεζόν που ζητήθηκαν.
+    """
+    now = timezone.now()
+    count = 0
+    for kind, wanted in keys.items():
+        if not wanted:
+            continue
+        model, identity = KINDS[kind]
+        records = CompetitionRecord.objects.filter(
+            date__year__in={key[-1] for key in wanted},
+            **{f"{field}__in": {key[i] for key in wanted} for i, field in enumerate(identity)},
+        )
+        objs = []
+        for row in _grouped(records, identity):
+            key = tuple(row[f] for f in identity) + (row["season"],)
+            if key not in wanted:
+                continue
+            objs.append(model(refreshed_at=now, **row))
+        with transaction.atomic():
+            model.objects.bulk_create(
+                objs,
+                update_conflicts=True,
+                unique_fields=[f.removesuffix("_id") for f in identity] + ["season"],
+                update_fields=STAT_FIELDS,
+                batch_size=1000,
+            )
+            # κλειδιά που δεν έχουν πια αποτελέσματα
+            stale = wanted - {tuple(getattr(o, f) for f in identity) + (o.season,) for o in objs}
+            for key in stale:
+                model.objects.filter(season=key[-1], **dict(zip(identity, key))).delete()
+        count += len(objs)
+    return count
+
+
+def stats_keys(rows) -> dict[str, set[tuple]]:
+    """rows: [(athlete_id, horse_id, date)] -> κλειδιά για το refresh_stats()."""
+    keys = {"athlete": set(), "horse": set(), "pair": set()}
+    for athlete_id, horse_id, day in rows:
+        keys["athlete"].add((athlete_id, day.year))
+        keys["horse"].add((horse_id, day.year))
+        keys["pair"].add((athlete_id, horse_id, day.year))
+    return keys
+
+
+def refresh_for_records(records, previous=()) -> int:
+    """previous: κλειδιά (athlete_id, horse_id, date) που είχαν οι εγγραφές πριν αλλάξουν."""
+    rows = list(records.order_by().values_list("athlete_id", "horse_id", "date"))
+    return refresh_stats(stats_keys(rows + list(previous)))
+
+
+def rebuild_all() -> int:
+    now = timezone.now()
+    count = 0
+    for model, identity in KINDS.values():
+        with transaction.atomic():
+            model.objects.all().delete()
+            objs = [model(refreshed_at=now, **row) for row in _grouped(CompetitionRecord.objects.all(), identity)]
+            model.objects.bulk_create(objs, batch_size=1000)
+        count += len(objs)
+    return count
+
+
+@receiver(results_frozen)
+def _class_frozen(sender, competition_class_id, previous=(), **kwargs):
+    refresh_for_records(CompetitionRecord.objects.filter(entry__competition_class_id=competition_class_id), previous)
+
+
+# -----------------------------
+# timeline
+# -----------------------------
+def parse_cursor(value: str | None) -> tuple[date, int] | None:
+    """"2026-05-03_1234" -> (date, id). ValueError αν δεν είναι έγκυρο."""
+    if not value:
+        return None
+    day, _, pk = value.partition("_")
+    return date.fromisoformat(day), int(pk)
+
+
+def timeline(records, before: tuple[date, int] | None = None, limit: int = 50) -> tuple[list[dict], str | None]:
+    """
+    records: CompetitionRecord ενός αθλητή ή ίππου. Νεότερα πρώτα.
+    Επιστρέφει (γραμμές, cursor επόμενης σελίδας | None).
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if before is not None:
+        day, pk = before
+        records = records.filter(Q(date__lt=day) | Q(date=day, id__lt=pk))
+    rows = list(records.order_by("-date", "-id").values(*TIMELINE_FIELDS)[:limit])
+    cursor = f"{rows[-1]['date'].isoformat()}_{rows[-1]['id']}" if len(rows) == limit else None
+    return rows, cursor
@@ -0,0 +1,215 @@
+"""
+Live κατάταξη για θεατές / γραμματεία (Server-Sent Events μέσω config/asgi.py).
+
+- Ένα snapshot ανά αγώνισμα στο cache (για όσους συνδέονται αργότερα).
+- Σε κάθε standings_changed (competitions/scoring.py): ΕΝΑ query για τις
+  γραμμές που άλλαξαν. Μετά το snapshot ενημερώνεται και το diff στέλνεται
+  (ήδη σε JSON) σε όλους τους συνδεδεμένους μέσω του in-process broker.
+  1000 θεατές = 1 ανάγνωση βάσης ανά αλλαγή, όχι 1000.
+- Με πολλούς workers (processes) ο broker δεν φτάνει στους άλλους: κάθε
+  σύνδεση ελέγχει περιοδικά την έκδοση του snapshot στο (κοινό) cache και,
+  αν μείνει πίσω, παίρνει ολόκληρο το snapshot (cache read, όχι DB).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from django.dispatch import receiver
+
+from .models import CompetitionClass, Result
+from .scoring import standings_changed
+
+# πόσο περιμένει μια σύνδεση πριν ελέγξει το cache / στείλει keep-alive
+POLL_SECONDS = 15
+# diffs που χωράνε στην ουρά ενός αργού client πριν του ξαναστείλουμε snapshot
+QUEUE_SIZE = 50
+
+
+def _snapshot_key(class_id: int) -> str:
+    return f"eoi:live:snapshot:{class_id}"
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":"))
+
+
+# -----------------------------
+# δεδομένα
+# -----------------------------
+def standings_rows(class_id: int, entry_ids=None) -> list[dict]:
+    """Γραμμές κατάταξης (1 query). entry_ids: μόνο αυτές (για diffs)."""
+    qs = Result.objects.filter(entry__competition_class_id=class_id)
+    if entry_ids is not None:
+        qs = qs.filter(entry_id__in=entry_ids)
+    rows = qs.order_by(F("rank").asc(nulls_last=True), "entry__start_order", "entry_id").values(
+        "entry_id", "rank", "status", "faults", "time_seconds", "score",
+        "entry__start_order", "entry__athlete__last_name", "entry__athlete__first_name", "entry__horse__name",
+    )
+    return [
+        {
+            "entry": r["entry_id"],
+            "rank": r["rank"],
+            "status": r["status"],
+            "faults": r["faults"],
+            "time": r["time_seconds"],
+            "score": r["score"],
+            "start": r["entry__start_order"],
+            "rider": f"{r['entry__athlete__last_name']} {r['entry__athlete__first_name']}".strip(),
+            "horse": r["entry__horse__name"],
+        }
+        for r in rows
+    ]
+
+
+def _sort_rows(rows: list[dict]) -> list[dict]:
+    return sorted(rows, key=lambda r: (r["rank"] is None, r["rank"] or 0, r["start"] or 0, r["entry"]))
+
+
+def get_snapshot(class_id: int) -> dict | None:
+    """Από το cache· σε miss 2 queries (αγώνισμα + γραμμές). None = δεν υπάρχει αγώνισμα."""
+    snapshot = cache.get(_snapshot_key(class_id))
+    if snapshot is not None:
+        return snapshot
+    cc = CompetitionClass.objects.filter(pk=class_id).values("standings_version", "results_frozen_at").first()
+    if cc is None:
+        return None
+    snapshot = {
+        "class": class_id,
+        "version": cc["standings_version"],
+        "official": cc["results_frozen_at"] is not None,
+        "rows": json.loads(_dumps(standings_rows(class_id))),
+    }
+    # add(): αν στο μεταξύ κάποιος έγραψε νεότερο, κρατάμε εκείνο
+    cache.add(_snapshot_key(class_id), snapshot, None)
+    return snapshot
+
+
+# -----------------------------
+# broker (in-process pub/sub)
+# -----------------------------
+class Subscription:
+    def __init__(self, class_id: int, loop: asyncio.AbstractEventLoop):
+        self.class_id = class_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        # γέμισε η ουρά -> χάθηκαν diffs -> στείλε ξανά snapshot
+        self.overflowed = False
+
+    def _put(self, message) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class Broker:
+    def __init__(self):
+        self._subscriptions: dict[int, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, class_id: int) -> Subscription:
+        subscription = Subscription(class_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions[class_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subs = self._subscriptions.get(subscription.class_id)
+            if subs is not None:
+                subs.discard(subscription)
+                if not subs:
+                    del self._subscriptions[subscription.class_id]
+
+    def publish(self, class_id: int, message) -> int:
+        """Καλείται από οποιοδήποτε thread. Επιστρέφει πόσοι θα το λάβουν."""
+        with self._lock:
+            subs = list(self._subscriptions.get(class_id, ()))
+        for subscription in subs:
+            subscription.loop.call_soon_threadsafe(subscription._put, message)
+        return len(subs)
+
+    def subscriber_count(self, class_id: int) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(class_id, ()))
+
+
+broker = Broker()
+
+
+@receiver(standings_changed)
+def _on_standings_changed(sender, outcome, **kwargs):
+    class_id = outcome.competition_class_id
+    changed = {c.entry_id for c in outcome.changes}
+    if outcome.result is not None:
+        # ίδια θέση αλλά νέα σφάλματα / χρόνος / βαθμός
+        changed.add(outcome.result.entry_id)
+    rows = json.loads(_dumps(standings_rows(class_id, changed))) if changed else []
+    diff = {"class": class_id, "version": outcome.version, "official": outcome.official, "rows": rows}
+
+    # snapshot: patch αν είναι ακριβώς η προηγούμενη έκδοση, αλλιώς θα ξαναχτιστεί όταν χρειαστεί
+    key = _snapshot_key(class_id)
+    snapshot = cache.get(key)
+    if snapshot is not None and snapshot["version"] == outcome.version - 1:
+        by_entry = {r["entry"]: r for r in snapshot["rows"]}
+        by_entry.update({r["entry"]: r for r in rows})
+        snapshot = {**diff, "rows": _sort_rows(list(by_entry.values()))}
+        cache.set(key, snapshot, None)
+    else:
+        cache.delete(key)
+
+    broker.publish(class_id, (outcome.version, _dumps(diff)))
+
+
+# -----------------------------
+# SSE
+# -----------------------------
+def _sse(event: str, version: int, data: str) -> str:
+    return f"event: {event}\nid: {version}\ndata: {data}\n\n"
+
+
+async def stream_standings(class_id: int, snapshot: dict, last_event_id: int | None):
+    """Async generator για StreamingHttpResponse (text/event-stream)."""
+    subscription = broker.subscribe(class_id)
+    try:
+        version = snapshot["version"]
+        if last_event_id != version:
+            yield _sse("snapshot", version, _dumps(snapshot))
+        else:
+            yield ": up to date\n\n"
+
+        while True:
+            try:
+                message_version, payload = await asyncio.wait_for(subscription.queue.get(), POLL_SECONDS)
+            except asyncio.TimeoutError:
+                # άλλος worker μπορεί να έχει ενημερώσει το cache
+                latest = await sync_to_async(cache.get)(_snapshot_key(class_id))
+                if latest is not None and latest["version"] > version:
+                    version = latest["version"]
+                    yield _sse("snapshot", version, _dumps(latest))
+                else:
+                    yield ": keep-alive\n\n"
+                continue
+
+            if message_version <= version:
+                continue
+            if subscription.overflowed or message_version != version + 1:
+                # χάθηκαν ενδιάμεσα diffs: ολόκληρο snapshot
+                subscription.overflowed = False
+                latest = await sync_to_async(get_snapshot)(class_id)
+                if latest is None:
+                    return
+                version = latest["version"]
+                yield _sse("snapshot", version, _dumps(latest))
+                continue
+            version = message_version
+            yield _sse("diff", version, payload)
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from competitions.models import CompetitionClass
+from competitions.startlists import StartListError, draw_class, export_pdf, export_xlsx
+
+
+class Command(BaseCommand):
+    help = (
+        "Κλήρωση σειράς εκκίνησης αγωνίσματος. Με --seed ξαναβγάζει ακριβώς την ίδια "
+        "σειρά (π.χ. --seed <CompetitionClass.draw_seed> για έλεγχο μιας κλήρωσης)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("class_id", type=int)
+        parser.add_argument("--seed", type=int, default=None, help="Default: νέο τυχαίο seed.")
+        parser.add_argument("--xlsx", type=Path, default=None, help="Αποθήκευση σε XLSX.")
+        parser.add_argument("--pdf", type=Path, default=None, help="Αποθήκευση σε PDF.")
+
+    def handle(self, *args, **options):
+        try:
+            competition_class = CompetitionClass.objects.select_related("competition").get(pk=options["class_id"])
+        except CompetitionClass.DoesNotExist:
+            raise CommandError(f"Δεν βρέθηκε αγώνισμα #{options['class_id']}")
+
+        try:
+            result = draw_class(competition_class, seed=options["seed"])
+            for path, export in ((options["xlsx"], export_xlsx), (options["pdf"], export_pdf)):
+                if path:
+                    path.write_bytes(export(competition_class))
+                    self.stdout.write(f"  -> {path}")
+        except StartListError as e:
+            raise CommandError(str(e))
+
+        for warning in result.warnings:
+            self.stdout.write(self.style.WARNING(warning))
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. {len(result.order)} εκκινήσεις, seed {result.seed}, "
+            f"{result.iterations} κινήσεις, {result.elapsed_ms:.0f} ms"
+        ))
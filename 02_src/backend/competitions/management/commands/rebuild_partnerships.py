@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from competitions.partnerships import rebuild_all
+
+
+class Command(BaseCommand):
+    help = "Αναδημιουργεί τα ζεύγη αθλητή / ίππου (Partnership) από τις δηλώσεις και το ιστορικό αγώνων."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = rebuild_all()
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. {count} ζεύγη, {(time.perf_counter() - started) * 1000:.0f} ms"
+        ))
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from competitions.dressage import recalculate
+from competitions.models import CompetitionClass
+from competitions.scoring import ScoringError
+
+
+class Command(BaseCommand):
+    help = (
+        "Ξαναϋπολογισμός φύλλων κριτών δεξιοτεχνίας (π.χ. μετά από διόρθωση συντελεστών "
+        "ενός προγράμματος). Αλλάζουν μόνο όσα φύλλα / αποτελέσματα διαφέρουν."
+    )
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument("--competition", type=int, help="Όλα τα αγωνίσματα ενός αγώνα (id).")
+        target.add_argument("--class", dest="class_ids", type=int, nargs="+", help="Συγκεκριμένα αγωνίσματα (ids).")
+        target.add_argument("--test", help="Όλα τα αγωνίσματα με αυτό το πρόγραμμα (κωδικός).")
+
+    def handle(self, *args, **options):
+        classes = CompetitionClass.objects.filter(discipline=CompetitionClass.Discipline.DRESSAGE)
+        if options["competition"]:
+            classes = classes.filter(competition_id=options["competition"])
+        elif options["class_ids"]:
+            classes = classes.filter(pk__in=options["class_ids"])
+        else:
+            classes = classes.filter(dressage_program__code=options["test"])
+
+        started = time.perf_counter()
+        try:
+            stats = recalculate(classes.order_by("pk"))
+        except ScoringError as e:
+            raise CommandError(str(e))
+
+        if stats.skipped_frozen:
+            self.stdout.write(self.style.WARNING(f"{stats.skipped_frozen} αγωνίσματα με επίσημα αποτελέσματα δεν άλλαξαν."))
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. {stats.sheets} φύλλα, {stats.sheets_changed} άλλαξαν, "
+            f"{stats.events} νέοι βαθμοί σε {stats.classes} αγωνίσματα, "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        ))
@@ -0,0 +1,133 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:41
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+        ('registry', '0013_horse_club'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Competition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, verbose_name='Αγώνας')),
+                ('venue', models.CharField(blank=True, max_length=200, verbose_name='Τόπος')),
+                ('start_date', models.DateField(verbose_name='Έναρξη')),
+                ('end_date', models.DateField(blank=True, null=True, verbose_name='Λήξη')),
+                ('entries_open_at', models.DateTimeField(blank=True, null=True, verbose_name='Άνοιγμα δηλώσεων')),
+                ('entries_close_at', models.DateTimeField(blank=True, null=True, verbose_name='Κλείσιμο δηλώσεων')),
+                ('status', models.CharField(choices=[('DRAFT', 'Πρόχειρος'), ('OPEN', 'Ανοιχτές δηλώσεις'), ('CLOSED', 'Κλειστές δηλώσεις'), ('FINISHED', 'Ολοκληρώθηκε')], default='DRAFT', max_length=20, verbose_name='Κατάσταση')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Δημιουργήθηκε')),
+                ('organizer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='organized_competitions', to='organizations.club', verbose_name='Διοργανωτής')),
+            ],
+            options={
+                'verbose_name': 'Αγώνας',
+                'verbose_name_plural': 'Αγώνες',
+                'ordering': ['-start_date', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CompetitionClass',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveSmallIntegerField(default=1, verbose_name='Α/Α Αγωνίσματος')),
+                ('name', models.CharField(max_length=200, verbose_name='Αγώνισμα')),
+                ('discipline', models.CharField(choices=[('SJ', 'Υπερπήδηση Εμποδίων'), ('DR', 'Ιππική Δεξιοτεχνία'), ('EN', 'Αντοχή'), ('EV', 'Σύνθετη Ιππασία')], max_length=2, verbose_name='Άθλημα')),
+                ('date', models.DateField(verbose_name='Ημερομηνία')),
+                ('height_cm', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Ύψος (cm)')),
+                ('dressage_test', models.CharField(blank=True, max_length=80, verbose_name='Πρόγραμμα (Dressage)')),
+                ('distance_km', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True, verbose_name='Απόσταση (km)')),
+                ('age_category', models.CharField(choices=[('CH', 'Παίδες'), ('JR', 'Έφηβοι'), ('YR', 'Νέοι'), ('SR', 'Ανδρών - Γυναικών'), ('VT', 'Βετεράνοι'), ('OP', 'Ανοιχτή')], default='OP', max_length=2, verbose_name='Κατηγορία')),
+                ('fee', models.DecimalField(decimal_places=2, default=0, max_digits=8, verbose_name='Παράβολο (€)')),
+                ('max_entries', models.PositiveIntegerField(blank=True, null=True, verbose_name='Μέγιστες συμμετοχές')),
+                ('competition', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='classes', to='competitions.competition', verbose_name='Αγώνας')),
+            ],
+            options={
+                'verbose_name': 'Αγώνισμα',
+                'verbose_name_plural': 'Αγωνίσματα',
+                'ordering': ['competition', 'date', 'number'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Entry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('DRAFT', 'Πρόχειρη'), ('APPROVED', 'Εγκρίθηκε'), ('PAID', 'Εξοφλήθηκε'), ('FINAL', 'Οριστική')], default='DRAFT', max_length=20, verbose_name='Κατάσταση')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Δηλώθηκε')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Ενημερώθηκε')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='entries', to='registry.athlete', verbose_name='Αθλητής')),
+                ('club', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='entries', to='organizations.club', verbose_name='Όμιλος')),
+                ('competition_class', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='competitions.competitionclass', verbose_name='Αγώνισμα')),
+                ('horse', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='entries', to='registry.horse', verbose_name='Ίππος')),
+                ('submitted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='submitted_entries', to=settings.AUTH_USER_MODEL, verbose_name='Δηλώθηκε από')),
+            ],
+            options={
+                'verbose_name': 'Συμμετοχή',
+                'verbose_name_plural': 'Συμμετοχές',
+                'ordering': ['competition_class', 'created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Result',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('OK', 'Ολοκλήρωσε'), ('EL', 'Αποκλεισμός'), ('RT', 'Εγκατάλειψη'), ('DQ', 'Ακύρωση'), ('NS', 'Δεν εκκίνησε')], default='OK', max_length=2, verbose_name='Κατάσταση')),
+                ('rank', models.PositiveIntegerField(blank=True, null=True, verbose_name='Κατάταξη')),
+                ('faults', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True, verbose_name='Σφάλματα')),
+                ('time_seconds', models.DecimalField(blank=True, decimal_places=2, max_digits=8, null=True, verbose_name='Χρόνος (s)')),
+                ('score', models.DecimalField(blank=True, decimal_places=3, max_digits=8, null=True, verbose_name='Βαθμολογία / %')),
+                ('prize_money', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Έπαθλο (€)')),
+                ('is_official', models.BooleanField(default=False, verbose_name='Επίσημο')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Ενημερώθηκε')),
+                ('entry', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='result', to='competitions.entry', verbose_name='Συμμετοχή')),
+            ],
+            options={
+                'verbose_name': 'Αποτέλεσμα',
+                'verbose_name_plural': 'Αποτελέσματα',
+                'ordering': ['entry__competition_class', 'rank'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['status', 'start_date'], name='competition_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitionclass',
+            index=models.Index(fields=['competition', 'date', 'number'], name='class_competition_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitionclass',
+            index=models.Index(fields=['discipline', 'age_category', 'date'], name='class_discipline_cat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['competition_class', 'status'], name='entry_class_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['club', 'status'], name='entry_club_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['athlete', 'horse'], name='entry_athlete_horse_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['horse', 'athlete'], name='entry_horse_athlete_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='entry',
+            constraint=models.UniqueConstraint(fields=('competition_class', 'athlete', 'horse'), name='entry_unique_pair_per_class'),
+        ),
+    ]
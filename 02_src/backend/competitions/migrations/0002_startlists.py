@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions', '0001_initial'),
+        ('organizations', '0001_initial'),
+        ('registry', '0015_eligibility_snapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='competitionclass',
+            name='club_rule',
+            field=models.CharField(choices=[('NONE', 'Χωρίς κανόνα'), ('SPREAD', 'Όχι διαδοχικά ίδιος όμιλος'), ('GROUP', 'Ομαδοποίηση ανά όμιλο')], default='NONE', max_length=10, verbose_name='Κανόνας ομίλων'),
+        ),
+        migrations.AddField(
+            model_name='competitionclass',
+            name='draw_method',
+            field=models.CharField(choices=[('RANDOM', 'Τυχαία κλήρωση'), ('RANKED', 'Με βάση την κατάταξη (οι καλύτεροι τελευταίοι)'), ('REVERSE', 'Με βάση την κατάταξη (οι καλύτεροι πρώτοι)')], default='RANDOM', max_length=10, verbose_name='Μέθοδος κλήρωσης'),
+        ),
+        migrations.AddField(
+            model_name='competitionclass',
+            name='draw_seed',
+            field=models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Seed κλήρωσης'),
+        ),
+        migrations.AddField(
+            model_name='competitionclass',
+            name='drawn_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Κληρώθηκε'),
+        ),
+        migrations.AddField(
+            model_name='competitionclass',
+            name='min_rider_gap',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Πόσες θέσεις τουλάχιστον ανάμεσα σε δύο εκκινήσεις του ίδιου αναβάτη.', verbose_name='Ελάχιστη απόσταση ίδιου αναβάτη'),
+        ),
+        migrations.AddField(
+            model_name='entry',
+            name='start_order',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Σειρά εκκίνησης'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['competition_class', 'start_order'], name='entry_class_start_order_idx'),
+        ),
+    ]
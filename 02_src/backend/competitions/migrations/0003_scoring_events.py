@@ -0,0 +1,89 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:52
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions', '0002_startlists'),
+        ('organizations', '0001_initial'),
+        ('registry', '0015_eligibility_snapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='competitionclass',
+            name='results_frozen_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Επίσημα αποτελέσματα'),
+        ),
+        migrations.AddField(
+            model_name='competitionclass',
+            name='standings_version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Έκδοση κατάταξης'),
+        ),
+        migrations.AddField(
+            model_name='result',
+            name='stages_completed',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Γύροι / Σημεία ελέγχου'),
+        ),
+        migrations.CreateModel(
+            name='CompetitionRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Ημερομηνία')),
+                ('competition_name', models.CharField(max_length=200, verbose_name='Αγώνας')),
+                ('class_name', models.CharField(max_length=200, verbose_name='Αγώνισμα')),
+                ('discipline', models.CharField(choices=[('SJ', 'Υπερπήδηση Εμποδίων'), ('DR', 'Ιππική Δεξιοτεχνία'), ('EN', 'Αντοχή'), ('EV', 'Σύνθετη Ιππασία')], max_length=2, verbose_name='Άθλημα')),
+                ('age_category', models.CharField(choices=[('CH', 'Παίδες'), ('JR', 'Έφηβοι'), ('YR', 'Νέοι'), ('SR', 'Ανδρών - Γυναικών'), ('VT', 'Βετεράνοι'), ('OP', 'Ανοιχτή')], max_length=2, verbose_name='Κατηγορία')),
+                ('height_cm', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Ύψος (cm)')),
+                ('status', models.CharField(choices=[('OK', 'Ολοκλήρωσε'), ('EL', 'Αποκλεισμός'), ('RT', 'Εγκατάλειψη'), ('DQ', 'Ακύρωση'), ('NS', 'Δεν εκκίνησε')], max_length=2, verbose_name='Κατάσταση')),
+                ('rank', models.PositiveIntegerField(blank=True, null=True, verbose_name='Κατάταξη')),
+                ('starters', models.PositiveIntegerField(default=0, verbose_name='Εκκινήσεις')),
+                ('faults', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True, verbose_name='Σφάλματα')),
+                ('time_seconds', models.DecimalField(blank=True, decimal_places=2, max_digits=8, null=True, verbose_name='Χρόνος (s)')),
+                ('score', models.DecimalField(blank=True, decimal_places=3, max_digits=8, null=True, verbose_name='Βαθμολογία / %')),
+                ('prize_money', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Έπαθλο (€)')),
+                ('frozen_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Οριστικοποιήθηκε')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='competition_records', to='registry.athlete', verbose_name='Αθλητής')),
+                ('club', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='competition_records', to='organizations.club', verbose_name='Όμιλος')),
+                ('entry', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='record', to='competitions.entry', verbose_name='Συμμετοχή')),
+                ('horse', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='competition_records', to='registry.horse', verbose_name='Ίππος')),
+            ],
+            options={
+                'verbose_name': 'Ιστορικό Αγώνα',
+                'verbose_name_plural': 'Ιστορικό Αγώνων',
+                'ordering': ['-date', 'competition_name'],
+                'indexes': [models.Index(fields=['athlete', '-date'], name='record_athlete_date_idx'), models.Index(fields=['horse', '-date'], name='record_horse_date_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ScoringEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('SJ_ROUND', 'Υπερπήδηση: γύρος (σφάλματα / χρόνος)'), ('DR_MARK', 'Δεξιοτεχνία: βαθμός κριτή (%)'), ('EN_CHECK', 'Αντοχή: σημείο ελέγχου'), ('STATUS', 'Κατάσταση (αποκλεισμός / εγκατάλειψη ...)')], max_length=10, verbose_name='Είδος')),
+                ('round_no', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Γύρος / Σημείο ελέγχου')),
+                ('judge', models.CharField(blank=True, max_length=10, verbose_name='Κριτής')),
+                ('faults', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True, verbose_name='Σφάλματα')),
+                ('time_seconds', models.DecimalField(blank=True, decimal_places=2, max_digits=8, null=True, verbose_name='Χρόνος (s)')),
+                ('score', models.DecimalField(blank=True, decimal_places=3, max_digits=8, null=True, verbose_name='Βαθμολογία / %')),
+                ('vet_passed', models.BooleanField(blank=True, null=True, verbose_name='Κτηνιατρικός έλεγχος')),
+                ('status', models.CharField(blank=True, choices=[('OK', 'Ολοκλήρωσε'), ('EL', 'Αποκλεισμός'), ('RT', 'Εγκατάλειψη'), ('DQ', 'Ακύρωση'), ('NS', 'Δεν εκκίνησε')], max_length=2, verbose_name='Κατάσταση')),
+                ('recorded_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Καταχωρήθηκε')),
+                ('competition_class', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='scoring_events', to='competitions.competitionclass', verbose_name='Αγώνισμα')),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='scoring_events', to='competitions.entry', verbose_name='Συμμετοχή')),
+                ('recorded_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='scoring_events', to=settings.AUTH_USER_MODEL, verbose_name='Καταχωρήθηκε από')),
+                ('supersedes', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='superseded_by', to='competitions.scoringevent', verbose_name='Διορθώνει')),
+            ],
+            options={
+                'verbose_name': 'Συμβάν βαθμολογίας',
+                'verbose_name_plural': 'Συμβάντα βαθμολογίας',
+                'ordering': ['competition_class', 'id'],
+                'indexes': [models.Index(fields=['entry', 'id'], name='scoring_event_entry_idx'), models.Index(fields=['competition_class', 'id'], name='scoring_event_class_idx')],
+            },
+        ),
+    ]
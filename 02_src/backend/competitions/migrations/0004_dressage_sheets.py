@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions', '0003_scoring_events'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DressageTest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=30, unique=True, verbose_name='Κωδικός')),
+                ('name', models.CharField(max_length=200, verbose_name='Πρόγραμμα')),
+                ('error_penalty', models.DecimalField(decimal_places=1, default=2, max_digits=4, verbose_name='Ποινή ανά λάθος διαδρομής')),
+                ('errors_to_eliminate', models.PositiveSmallIntegerField(default=3, verbose_name='Λάθη για αποκλεισμό')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Ενημερώθηκε')),
+            ],
+            options={
+                'verbose_name': 'Πρόγραμμα Δεξιοτεχνίας',
+                'verbose_name_plural': 'Προγράμματα Δεξιοτεχνίας',
+                'ordering': ['code'],
+            },
+        ),
+        migrations.AddField(
+            model_name='result',
+            name='tiebreak',
+            field=models.DecimalField(blank=True, decimal_places=3, max_digits=8, null=True, verbose_name='Ισοβαθμία'),
+        ),
+        migrations.AddField(
+            model_name='scoringevent',
+            name='tiebreak',
+            field=models.DecimalField(blank=True, decimal_places=3, max_digits=8, null=True, verbose_name='Ισοβαθμία'),
+        ),
+        migrations.AddField(
+            model_name='competitionclass',
+            name='dressage_program',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='classes', to='competitions.dressagetest', verbose_name='Πρόγραμμα βαθμολόγησης'),
+        ),
+        migrations.CreateModel(
+            name='DressageSheet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('judge', models.CharField(choices=[('E', 'E'), ('H', 'H'), ('C', 'C'), ('M', 'M'), ('B', 'B')], max_length=1, verbose_name='Κριτής')),
+                ('marks', models.BinaryField(verbose_name='Βαθμοί')),
+                ('errors', models.PositiveSmallIntegerField(default=0, verbose_name='Λάθη διαδρομής')),
+                ('total', models.DecimalField(decimal_places=1, default=0, max_digits=7, verbose_name='Σύνολο')),
+                ('collective_total', models.DecimalField(decimal_places=1, default=0, max_digits=7, verbose_name='Συνολικοί βαθμοί')),
+                ('percentage', models.DecimalField(decimal_places=3, default=0, max_digits=6, verbose_name='Ποσοστό %')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Ενημερώθηκε')),
+                ('competition_class', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dressage_sheets', to='competitions.competitionclass', verbose_name='Αγώνισμα')),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dressage_sheets', to='competitions.entry', verbose_name='Συμμετοχή')),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Καταχωρήθηκε από')),
+            ],
+            options={
+                'verbose_name': 'Φύλλο Κριτή',
+                'verbose_name_plural': 'Φύλλα Κριτών',
+                'ordering': ['competition_class', 'entry', 'judge'],
+                'indexes': [models.Index(fields=['competition_class', 'entry'], name='dressage_sheet_class_idx')],
+                'constraints': [models.UniqueConstraint(fields=('entry', 'judge'), name='uniq_dressage_sheet_judge')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DressageMovement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveSmallIntegerField(verbose_name='Α/Α')),
+                ('label', models.CharField(max_length=200, verbose_name='Κίνηση')),
+                ('coefficient', models.PositiveSmallIntegerField(default=1, verbose_name='Συντελεστής')),
+                ('is_collective', models.BooleanField(default=False, verbose_name='Συνολικός βαθμός')),
+                ('test', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='movements', to='competitions.dressagetest', verbose_name='Πρόγραμμα')),
+            ],
+            options={
+                'verbose_name': 'Κίνηση',
+                'verbose_name_plural': 'Κινήσεις',
+                'ordering': ['test', 'number'],
+                'constraints': [models.UniqueConstraint(fields=('test', 'number'), name='uniq_dressage_movement_number')],
+            },
+        ),
+    ]
@@ -0,0 +1,141 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions', '0004_dressage_sheets'),
+        ('organizations', '0001_initial'),
+        ('registry', '0015_eligibility_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AthleteSeasonStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField(verbose_name='Σεζόν')),
+                ('starts', models.PositiveIntegerField(default=0, verbose_name='Εκκινήσεις')),
+                ('completed', models.PositiveIntegerField(default=0, verbose_name='Ολοκληρώσεις')),
+                ('wins', models.PositiveIntegerField(default=0, verbose_name='Νίκες')),
+                ('placings', models.PositiveIntegerField(default=0, verbose_name='Θέσεις 1-3')),
+                ('clear_rounds', models.PositiveIntegerField(default=0, verbose_name='Μηδενικές')),
+                ('eliminations', models.PositiveIntegerField(default=0, verbose_name='Αποκλεισμοί / Εγκαταλείψεις')),
+                ('total_faults', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Σύνολο σφαλμάτων')),
+                ('prize_money', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Έπαθλα (€)')),
+                ('best_rank', models.PositiveIntegerField(blank=True, null=True, verbose_name='Καλύτερη θέση')),
+                ('last_date', models.DateField(blank=True, null=True, verbose_name='Τελευταίος αγώνας')),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Ενημερώθηκε')),
+            ],
+            options={
+                'verbose_name': 'Στατιστικά Αθλητή',
+                'verbose_name_plural': 'Στατιστικά Αθλητών',
+                'ordering': ['-season'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='HorseSeasonStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField(verbose_name='Σεζόν')),
+                ('starts', models.PositiveIntegerField(default=0, verbose_name='Εκκινήσεις')),
+                ('completed', models.PositiveIntegerField(default=0, verbose_name='Ολοκληρώσεις')),
+                ('wins', models.PositiveIntegerField(default=0, verbose_name='Νίκες')),
+                ('placings', models.PositiveIntegerField(default=0, verbose_name='Θέσεις 1-3')),
+                ('clear_rounds', models.PositiveIntegerField(default=0, verbose_name='Μηδενικές')),
+                ('eliminations', models.PositiveIntegerField(default=0, verbose_name='Αποκλεισμοί / Εγκαταλείψεις')),
+                ('total_faults', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Σύνολο σφαλμάτων')),
+                ('prize_money', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Έπαθλα (€)')),
+                ('best_rank', models.PositiveIntegerField(blank=True, null=True, verbose_name='Καλύτερη θέση')),
+                ('last_date', models.DateField(blank=True, null=True, verbose_name='Τελευταίος αγώνας')),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Ενημερώθηκε')),
+            ],
+            options={
+                'verbose_name': 'Στατιστικά Ίππου',
+                'verbose_name_plural': 'Στατιστικά Ίππων',
+                'ordering': ['-season'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PairSeasonStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField(verbose_name='Σεζόν')),
+                ('starts', models.PositiveIntegerField(default=0, verbose_name='Εκκινήσεις')),
+                ('completed', models.PositiveIntegerField(default=0, verbose_name='Ολοκληρώσεις')),
+                ('wins', models.PositiveIntegerField(default=0, verbose_name='Νίκες')),
+                ('placings', models.PositiveIntegerField(default=0, verbose_name='Θέσεις 1-3')),
+                ('clear_rounds', models.PositiveIntegerField(default=0, verbose_name='Μηδενικές')),
+                ('eliminations', models.PositiveIntegerField(default=0, verbose_name='Αποκλεισμοί / Εγκαταλείψεις')),
+                ('total_faults', models.DecimalField(decimal_places=2, default=0, max_digits=10, verbose_name='Σύνολο σφαλμάτων')),
+                ('prize_money', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Έπαθλα (€)')),
+                ('best_rank', models.PositiveIntegerField(blank=True, null=True, verbose_name='Καλύτερη θέση')),
+                ('last_date', models.DateField(blank=True, null=True, verbose_name='Τελευταίος αγώνας')),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Ενημερώθηκε')),
+            ],
+            options={
+                'verbose_name': 'Στατιστικά Ζεύγους',
+                'verbose_name_plural': 'Στατιστικά Ζευγών',
+                'ordering': ['-season'],
+                'abstract': False,
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='competitionrecord',
+            name='record_athlete_date_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='competitionrecord',
+            name='record_horse_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='competitionrecord',
+            index=models.Index(fields=['athlete', '-date', '-id'], name='record_athlete_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitionrecord',
+            index=models.Index(fields=['horse', '-date', '-id'], name='record_horse_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='athleteseasonstats',
+            name='athlete',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_stats', to='registry.athlete', verbose_name='Αθλητής'),
+        ),
+        migrations.AddField(
+            model_name='horseseasonstats',
+            name='horse',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_stats', to='registry.horse', verbose_name='Ίππος'),
+        ),
+        migrations.AddField(
+            model_name='pairseasonstats',
+            name='athlete',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pair_season_stats', to='registry.athlete', verbose_name='Αθλητής'),
+        ),
+        migrations.AddField(
+            model_name='pairseasonstats',
+            name='horse',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pair_season_stats', to='registry.horse', verbose_name='Ίππος'),
+        ),
+        migrations.AddConstraint(
+            model_name='athleteseasonstats',
+            constraint=models.UniqueConstraint(fields=('athlete', 'season'), name='uniq_athlete_season_stats'),
+        ),
+        migrations.AddConstraint(
+            model_name='horseseasonstats',
+            constraint=models.UniqueConstraint(fields=('horse', 'season'), name='uniq_horse_season_stats'),
+        ),
+        migrations.AddIndex(
+            model_name='pairseasonstats',
+            index=models.Index(fields=['horse', 'season'], name='pair_stats_horse_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='pairseasonstats',
+            constraint=models.UniqueConstraint(fields=('athlete', 'horse', 'season'), name='uniq_pair_season_stats'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions', '0005_season_stats'),
+        ('registry', '0016_horse_pedigree'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Partnership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entries', models.PositiveIntegerField(default=0, verbose_name='Δηλώσεις')),
+                ('last_entry_date', models.DateField(blank=True, null=True, verbose_name='Τελευταία δήλωση')),
+                ('starts', models.PositiveIntegerField(default=0, verbose_name='Εκκινήσεις')),
+                ('wins', models.PositiveIntegerField(default=0, verbose_name='Νίκες')),
+                ('best_rank', models.PositiveIntegerField(blank=True, null=True, verbose_name='Καλύτερη θέση')),
+                ('first_date', models.DateField(blank=True, null=True, verbose_name='Πρώτος αγώνας')),
+                ('last_date', models.DateField(blank=True, null=True, verbose_name='Τελευταίος αγώνας')),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Ενημερώθηκε')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='partnerships', to='registry.athlete', verbose_name='Αθλητής')),
+                ('horse', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='partnerships', to='registry.horse', verbose_name='Ίππος')),
+            ],
+            options={
+                'verbose_name': 'Ζεύγος Αθλητή / Ίππου',
+                'verbose_name_plural': 'Ζεύγη Αθλητών / Ίππων',
+                'ordering': ['-last_entry_date'],
+                'indexes': [models.Index(fields=['athlete', '-last_entry_date', '-entries'], name='partnership_athlete_idx'), models.Index(fields=['horse', '-last_entry_date', '-entries'], name='partnership_horse_idx')],
+                'constraints': [models.UniqueConstraint(fields=('athlete', 'horse'), name='uniq_partnership')],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions', '0006_partnerships'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dressagesheet',
+            name='elimination_event',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='competitions.scoringevent', verbose_name='Αποκλεισμός'),
+        ),
+    ]
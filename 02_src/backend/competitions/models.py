@@ -1,3 +1,664 @@
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
-# Create your models here.
+
+class Competition(models.Model):
+    class Status(models.TextChoices):
+        DRAFT = "DRAFT", "Πρόχειρος"
+        OPEN = "OPEN", "Ανοιχτές δηλώσεις"
+        CLOSED = "CLOSED", "Κλειστές δηλώσεις"
+        FINISHED = "FINISHED", "Ολοκληρώθηκε"
+
+    name = models.CharField(max_length=200, verbose_name="Αγώνας")
+    venue = models.CharField(max_length=200, blank=True, verbose_name="Τόπος")
+    start_date = models.DateField(verbose_name="Έναρξη")
+    end_date = models.DateField(null=True, blank=True, verbose_name="Λήξη")
+    organizer = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="organized_competitions",
+        verbose_name="Διοργανωτής",
+    )
+    entries_open_at = models.DateTimeField(null=True, blank=True, verbose_name="Άνοιγμα δηλώσεων")
+    entries_close_at = models.DateTimeField(null=True, blank=True, verbose_name="Κλείσιμο δηλώσεων")
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.DRAFT,
+        verbose_name="Κατάσταση",
+    )
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Δημιουργήθηκε")
+
+    class Meta:
+        verbose_name = "Αγώνας"
+        verbose_name_plural = "Αγώνες"
+        ordering = ["-start_date", "name"]
+        indexes = [
+            models.Index(fields=["status", "start_date"], name="competition_status_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.start_date:%d/%m/%Y})"
+
+    def entries_are_open(self, now=None) -> bool:
+        now = now or timezone.now()
+        if self.status != self.Status.OPEN:
+            return False
+        if self.entries_open_at and now < self.entries_open_at:
+            return False
+        if self.entries_close_at and now > self.entries_close_at:
+            return False
+        return True
+
+
+class CompetitionClass(models.Model):
+    class Discipline(models.TextChoices):
+        SHOW_JUMPING = "SJ", "Υπερπήδηση Εμποδίων"
+        DRESSAGE = "DR", "Ιππική Δεξιοτεχνία"
+        ENDURANCE = "EN", "Αντοχή"
+        EVENTING = "EV", "Σύνθετη Ιππασία"
+
+    class DrawMethod(models.TextChoices):
+        RANDOM = "RANDOM", "Τυχαία κλήρωση"
+        RANKED = "RANKED", "Με βάση την κατάταξη (οι καλύτεροι τελευταίοι)"
+        REVERSE_RANKED = "REVERSE", "Με βάση την κατάταξη (οι καλύτεροι πρώτοι)"
+
+    class ClubRule(models.TextChoices):
+        NONE = "NONE", "Χωρίς κανόνα"
+        SPREAD = "SPREAD", "Όχι διαδοχικά ίδιος όμιλος"
+        GROUP = "GROUP", "Ομαδοποίηση ανά όμιλο"
+
+    class AgeCategory(models.TextChoices):
+        CHILDREN = "CH", "Παίδες"
+        JUNIORS = "JR", "Έφηβοι"
+        YOUNG_RIDERS = "YR", "Νέοι"
+        SENIORS = "SR", "Ανδρών - Γυναικών"
+        VETERANS = "VT", "Βετεράνοι"
+        OPEN = "OP", "Ανοιχτή"
+
+    competition = models.ForeignKey(
+        Competition,
+        on_delete=models.CASCADE,
+        related_name="classes",
+        verbose_name="Αγώνας",
+    )
+    number = models.PositiveSmallIntegerField(default=1, verbose_name="Α/Α Αγωνίσματος")
+    name = models.CharField(max_length=200, verbose_name="Αγώνισμα")
+    discipline = models.CharField(max_length=2, choices=Discipline.choices, verbose_name="Άθλημα")
+    date = models.DateField(verbose_name="Ημερομηνία")
+
+    height_cm = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="Ύψος (cm)")
+    dressage_test = models.CharField(max_length=80, blank=True, verbose_name="Πρόγραμμα (Dressage)")
+    # κινήσεις / συντελεστές για τα φύλλα κριτών (competitions/dressage.py)
+    dressage_program = models.ForeignKey(
+        "DressageTest",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="classes",
+        verbose_name="Πρόγραμμα βαθμολόγησης",
+    )
+    distance_km = models.DecimalField(
+        max_digits=6, decimal_places=2, null=True, blank=True, verbose_name="Απόσταση (km)"
+    )
+
+    age_category = models.CharField(
+        max_length=2,
+        choices=AgeCategory.choices,
+        default=AgeCategory.OPEN,
+        verbose_name="Κατηγορία",
+    )
+    fee = models.DecimalField(max_digits=8, decimal_places=2, default=0, verbose_name="Παράβολο (€)")
+    max_entries = models.PositiveIntegerField(null=True, blank=True, verbose_name="Μέγιστες συμμετοχές")
+
+    # σειρά εκκίνησης (competitions/startlists.py)
+    draw_method = models.CharField(
+        max_length=10,
+        choices=DrawMethod.choices,
+        default=DrawMethod.RANDOM,
+        verbose_name="Μέθοδος κλήρωσης",
+    )
+    min_rider_gap = models.PositiveSmallIntegerField(
+        default=5,
+        verbose_name="Ελάχιστη απόσταση ίδιου αναβάτη",
+        help_text="Πόσες θέσεις τουλάχιστον ανάμεσα σε δύο εκκινήσεις του ίδιου αναβάτη.",
+    )
+    club_rule = models.CharField(
+        max_length=10,
+        choices=ClubRule.choices,
+        default=ClubRule.NONE,
+        verbose_name="Κανόνας ομίλων",
+    )
+    draw_seed = models.PositiveBigIntegerField(null=True, blank=True, verbose_name="Seed κλήρωσης")
+    drawn_at = models.DateTimeField(null=True, blank=True, verbose_name="Κληρώθηκε")
+
+    # live αποτελέσματα (competitions/scoring.py)
+    standings_version = models.PositiveIntegerField(default=0, editable=False, verbose_name="Έκδοση κατάταξης")
+    results_frozen_at = models.DateTimeField(null=True, blank=True, verbose_name="Επίσημα αποτελέσματα")
+
+    class Meta:
+        verbose_name = "Αγώνισμα"
+        verbose_name_plural = "Αγωνίσματα"
+        ordering = ["competition", "date", "number"]
+        indexes = [
+            models.Index(fields=["competition", "date", "number"], name="class_competition_date_idx"),
+            models.Index(fields=["discipline", "age_category", "date"], name="class_discipline_cat_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.competition.name} - {self.number}. {self.name}"
+
+
+class Entry(models.Model):
+    class Status(models.TextChoices):
+        DRAFT = "DRAFT", "Πρόχειρη"
+        APPROVED = "APPROVED", "Εγκρίθηκε"
+        PAID = "PAID", "Εξοφλήθηκε"
+        FINAL = "FINAL", "Οριστική"
+
+    competition_class = models.ForeignKey(
+        CompetitionClass,
+        on_delete=models.CASCADE,
+        related_name="entries",
+        verbose_name="Αγώνισμα",
+    )
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.PROTECT,
+        related_name="entries",
+        verbose_name="Αθλητής",
+    )
+    horse = models.ForeignKey(
+        "registry.Horse",
+        on_delete=models.PROTECT,
+        related_name="entries",
+        verbose_name="Ίππος",
+    )
+    # ο όμιλος του αθλητή τη στιγμή της δήλωσης (για "δηλώσεις ομίλου" χωρίς join)
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="entries",
+        verbose_name="Όμιλος",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.DRAFT,
+        verbose_name="Κατάσταση",
+    )
+    start_order = models.PositiveIntegerField(null=True, blank=True, verbose_name="Σειρά εκκίνησης")
+    submitted_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="submitted_entries",
+        verbose_name="Δηλώθηκε από",
+    )
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Δηλώθηκε")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Συμμετοχή"
+        verbose_name_plural = "Συμμετοχές"
+        ordering = ["competition_class", "created_at"]
+        constraints = [
+            # "υπάρχει ήδη δήλωση για αυτό το ζευγάρι;" = lookup στο unique index
+            models.UniqueConstraint(
+                fields=["competition_class", "athlete", "horse"],
+                name="entry_unique_pair_per_class",
+            ),
+        ]
+        indexes = [
+            # συμμετοχές ανά αγώνισμα (και ανά κατάσταση)
+            models.Index(fields=["competition_class", "status"], name="entry_class_status_idx"),
+            # λίστα εκκίνησης
+            models.Index(fields=["competition_class", "start_order"], name="entry_class_start_order_idx"),
+            # συμμετοχές ομίλου προς έγκριση
+            models.Index(fields=["club", "status"], name="entry_club_status_idx"),
+            # ιστορικό ζευγαριού αθλητή / ίππου
+            models.Index(fields=["athlete", "horse"], name="entry_athlete_horse_idx"),
+            models.Index(fields=["horse", "athlete"], name="entry_horse_athlete_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.club_id is None and self.athlete_id:
+            self.club_id = self.athlete.club_id
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.athlete} / {self.horse}"
+
+
+class Result(models.Model):
+    class Status(models.TextChoices):
+        OK = "OK", "Ολοκλήρωσε"
+        ELIMINATED = "EL", "Αποκλεισμός"
+        RETIRED = "RT", "Εγκατάλειψη"
+        DISQUALIFIED = "DQ", "Ακύρωση"
+        NOT_STARTED = "NS", "Δεν εκκίνησε"
+
+    entry = models.OneToOneField(
+        Entry,
+        on_delete=models.CASCADE,
+        related_name="result",
+        verbose_name="Συμμετοχή",
+    )
+    status = models.CharField(max_length=2, choices=Status.choices, default=Status.OK, verbose_name="Κατάσταση")
+    rank = models.PositiveIntegerField(null=True, blank=True, verbose_name="Κατάταξη")
+    faults = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True, verbose_name="Σφάλματα")
+    time_seconds = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True, verbose_name="Χρόνος (s)")
+    score = models.DecimalField(max_digits=8, decimal_places=3, null=True, blank=True, verbose_name="Βαθμολογία / %")
+    # ισοβαθμία (DR: συνολικοί βαθμοί, μέσος όρος κριτών)
+    tiebreak = models.DecimalField(max_digits=8, decimal_places=3, null=True, blank=True, verbose_name="Ισοβαθμία")
+    # γύροι (SJ) / κριτές (DR) / σημεία ελέγχου (EN) που έχουν καταχωρηθεί
+    stages_completed = models.PositiveSmallIntegerField(default=0, verbose_name="Γύροι / Σημεία ελέγχου")
+    prize_money = models.DecimalField(max_digits=10, decimal_places=2, default=0, verbose_name="Έπαθλο (€)")
+    is_official = models.BooleanField(default=False, verbose_name="Επίσημο")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Αποτέλεσμα"
+        verbose_name_plural = "Αποτελέσματα"
+        ordering = ["entry__competition_class", "rank"]
+
+    def __str__(self):
+        return f"{self.entry} - {self.rank or '-'}"
+
+
+class ScoringEvent(models.Model):
+    """
+    Append-only: κάθε χρόνος / σφάλμα / βαθμός κριτή / σημείο ελέγχου είναι νέα γραμμή.
+    Διόρθωση = νέο event με supersedes -> το παλιό. Το Result είναι το άθροισμα των events.
+    """
+
+    class Kind(models.TextChoices):
+        JUMPING_ROUND = "SJ_ROUND", "Υπερπήδηση: γύρος (σφάλματα / χρόνος)"
+        DRESSAGE_MARK = "DR_MARK", "Δεξιοτεχνία: βαθμός κριτή (%)"
+        ENDURANCE_CHECKPOINT = "EN_CHECK", "Αντοχή: σημείο ελέγχου"
+        STATUS = "STATUS", "Κατάσταση (αποκλεισμός / εγκατάλειψη ...)"
+
+    competition_class = models.ForeignKey(
+        CompetitionClass,
+        on_delete=models.CASCADE,
+        related_name="scoring_events",
+        verbose_name="Αγώνισμα",
+    )
+    entry = models.ForeignKey(
+        Entry,
+        on_delete=models.CASCADE,
+        related_name="scoring_events",
+        verbose_name="Συμμετοχή",
+    )
+    kind = models.CharField(max_length=10, choices=Kind.choices, verbose_name="Είδος")
+    # γύρος (SJ) / θέση κριτή π.χ. "C" (DR) / αριθμός σημείου ελέγχου (EN)
+    round_no = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="Γύρος / Σημείο ελέγχου")
+    judge = models.CharField(max_length=10, blank=True, verbose_name="Κριτής")
+    faults = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True, verbose_name="Σφάλματα")
+    time_seconds = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True, verbose_name="Χρόνος (s)")
+    score = models.DecimalField(max_digits=8, decimal_places=3, null=True, blank=True, verbose_name="Βαθμολογία / %")
+    tiebreak = models.DecimalField(max_digits=8, decimal_places=3, null=True, blank=True, verbose_name="Ισοβαθμία")
+    vet_passed = models.BooleanField(null=True, blank=True, verbose_name="Κτηνιατρικός έλεγχος")
+    status = models.CharField(max_length=2, choices=Result.Status.choices, blank=True, verbose_name="Κατάσταση")
+    supersedes = models.OneToOneField(
+        "self",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="superseded_by",
+        verbose_name="Διορθώνει",
+    )
+    recorded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="scoring_events",
+        verbose_name="Καταχωρήθηκε από",
+    )
+    recorded_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Καταχωρήθηκε")
+
+    class Meta:
+        verbose_name = "Συμβάν βαθμολογίας"
+        verbose_name_plural = "Συμβάντα βαθμολογίας"
+        ordering = ["competition_class", "id"]
+        indexes = [
+            # ξαναϋπολογισμός ενός Result = τα events της συμμετοχής
+            models.Index(fields=["entry", "id"], name="scoring_event_entry_idx"),
+            # ροή αγωνίσματος ("ό,τι μετά το event X")
+            models.Index(fields=["competition_class", "id"], name="scoring_event_class_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise ValueError("Τα συμβάντα βαθμολογίας δεν αλλάζουν· καταχωρήστε διόρθωση.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Τα συμβάντα βαθμολογίας δεν διαγράφονται· καταχωρήστε διόρθωση.")
+
+    def __str__(self):
+        return f"#{self.pk} {self.get_kind_display()} - {self.entry_id}"
+
+
+class CompetitionRecord(models.Model):
+    """
+    Ιστορικό αγώνων αθλητή / ίππου (denormalised, γράφεται στην οριστικοποίηση).
+    Δεν χρειάζεται joins σε αγώνες/αγωνίσματα για το "βιογραφικό" αθλητή ή ίππου.
+    """
+
+    entry = models.OneToOneField(
+        Entry,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="record",
+        verbose_name="Συμμετοχή",
+    )
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.CASCADE,
+        related_name="competition_records",
+        verbose_name="Αθλητής",
+    )
+    horse = models.ForeignKey(
+        "registry.Horse",
+        on_delete=models.CASCADE,
+        related_name="competition_records",
+        verbose_name="Ίππος",
+    )
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="competition_records",
+        verbose_name="Όμιλος",
+    )
+    date = models.DateField(verbose_name="Ημερομηνία")
+    competition_name = models.CharField(max_length=200, verbose_name="Αγώνας")
+    class_name = models.CharField(max_length=200, verbose_name="Αγώνισμα")
+    discipline = models.CharField(max_length=2, choices=CompetitionClass.Discipline.choices, verbose_name="Άθλημα")
+    age_category = models.CharField(max_length=2, choices=CompetitionClass.AgeCategory.choices, verbose_name="Κατηγορία")
+    height_cm = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="Ύψος (cm)")
+    status = models.CharField(max_length=2, choices=Result.Status.choices, verbose_name="Κατάσταση")
+    rank = models.PositiveIntegerField(null=True, blank=True, verbose_name="Κατάταξη")
+    starters = models.PositiveIntegerField(default=0, verbose_name="Εκκινήσεις")
+    faults = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True, verbose_name="Σφάλματα")
+    time_seconds = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True, verbose_name="Χρόνος (s)")
+    score = models.DecimalField(max_digits=8, decimal_places=3, null=True, blank=True, verbose_name="Βαθμολογία / %")
+    prize_money = models.DecimalField(max_digits=10, decimal_places=2, default=0, verbose_name="Έπαθλο (€)")
+    frozen_at = models.DateTimeField(default=timezone.now, verbose_name="Οριστικοποιήθηκε")
+
+    class Meta:
+        verbose_name = "Ιστορικό Αγώνα"
+        verbose_name_plural = "Ιστορικό Αγώνων"
+        ordering = ["-date", "competition_name"]
+        indexes = [
+            # timeline με keyset σελιδοποίηση σε (date, id) (competitions/history.py)
+            models.Index(fields=["athlete", "-date", "-id"], name="record_athlete_date_idx"),
+            models.Index(fields=["horse", "-date", "-id"], name="record_horse_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.date:%d/%m/%Y} {self.competition_name} - {self.class_name}: {self.rank or self.status}"
+
+
+# -----------------------------
+# Στατιστικά σεζόν (competitions/history.py)
+# -----------------------------
+class SeasonStats(models.Model):
+    """Αθροίσματα ανά σεζόν από το CompetitionRecord, για τις σελίδες αθλητή / ίππου."""
+
+    season = models.PositiveSmallIntegerField(verbose_name="Σεζόν")
+    starts = models.PositiveIntegerField(default=0, verbose_name="Εκκινήσεις")
+    completed = models.PositiveIntegerField(default=0, verbose_name="Ολοκληρώσεις")
+    wins = models.PositiveIntegerField(default=0, verbose_name="Νίκες")
+    placings = models.PositiveIntegerField(default=0, verbose_name="Θέσεις 1-3")
+    clear_rounds = models.PositiveIntegerField(default=0, verbose_name="Μηδενικές")
+    eliminations = models.PositiveIntegerField(default=0, verbose_name="Αποκλεισμοί / Εγκαταλείψεις")
+    total_faults = models.DecimalField(max_digits=10, decimal_places=2, default=0, verbose_name="Σύνολο σφαλμάτων")
+    prize_money = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="Έπαθλα (€)")
+    best_rank = models.PositiveIntegerField(null=True, blank=True, verbose_name="Καλύτερη θέση")
+    last_date = models.DateField(null=True, blank=True, verbose_name="Τελευταίος αγώνας")
+    refreshed_at = models.DateTimeField(default=timezone.now, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        abstract = True
+        ordering = ["-season"]
+
+
+class AthleteSeasonStats(SeasonStats):
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.CASCADE,
+        related_name="season_stats",
+        verbose_name="Αθλητής",
+    )
+
+    class Meta(SeasonStats.Meta):
+        verbose_name = "Στατιστικά Αθλητή"
+        verbose_name_plural = "Στατιστικά Αθλητών"
+        constraints = [
+            models.UniqueConstraint(fields=["athlete", "season"], name="uniq_athlete_season_stats"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete_id} {self.season}"
+
+
+class HorseSeasonStats(SeasonStats):
+    horse = models.ForeignKey(
+        "registry.Horse",
+        on_delete=models.CASCADE,
+        related_name="season_stats",
+        verbose_name="Ίππος",
+    )
+
+    class Meta(SeasonStats.Meta):
+        verbose_name = "Στατιστικά Ίππου"
+        verbose_name_plural = "Στατιστικά Ίππων"
+        constraints = [
+            models.UniqueConstraint(fields=["horse", "season"], name="uniq_horse_season_stats"),
+        ]
+
+    def __str__(self):
+        return f"{self.horse_id} {self.season}"
+
+
+class PairSeasonStats(SeasonStats):
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.CASCADE,
+        related_name="pair_season_stats",
+        verbose_name="Αθλητής",
+    )
+    horse = models.ForeignKey(
+        "registry.Horse",
+        on_delete=models.CASCADE,
+        related_name="pair_season_stats",
+        verbose_name="Ίππος",
+    )
+
+    class Meta(SeasonStats.Meta):
+        verbose_name = "Στατιστικά Ζεύγους"
+        verbose_name_plural = "Στατιστικά Ζευγών"
+        constraints = [
+            models.UniqueConstraint(fields=["athlete", "horse", "season"], name="uniq_pair_season_stats"),
+        ]
+        indexes = [
+            # "με ποιους αναβάτες έχει τρέξει ο ίππος"
+            models.Index(fields=["horse", "season"], name="pair_stats_horse_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete_id}/{self.horse_id} {self.season}"
+
+
+# -----------------------------
+# Ζεύγη αθλητή / ίππου (competitions/partnerships.py)
+# -----------------------------
+class Partnership(models.Model):
+    """
+    Σύνοψη κάθε ζευγαριού αθλητή / ίππου σε όλες τις σεζόν.
+    Δηλώσεις από το Entry, εκκινήσεις / αποτελέσματα από το CompetitionRecord.
+    Για "ποιοι αναβάτες έχουν τρέξει τον ίππο" και "τα άλογα του αναβάτη" στις φόρμες δηλώσεων.
+    """
+
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.CASCADE,
+        related_name="partnerships",
+        verbose_name="Αθλητής",
+    )
+    horse = models.ForeignKey(
+        "registry.Horse",
+        on_delete=models.CASCADE,
+        related_name="partnerships",
+        verbose_name="Ίππος",
+    )
+    entries = models.PositiveIntegerField(default=0, verbose_name="Δηλώσεις")
+    last_entry_date = models.DateField(null=True, blank=True, verbose_name="Τελευταία δήλωση")
+    starts = models.PositiveIntegerField(default=0, verbose_name="Εκκινήσεις")
+    wins = models.PositiveIntegerField(default=0, verbose_name="Νίκες")
+    best_rank = models.PositiveIntegerField(null=True, blank=True, verbose_name="Καλύτερη θέση")
+    first_date = models.DateField(null=True, blank=True, verbose_name="Πρώτος αγώνας")
+    last_date = models.DateField(null=True, blank=True, verbose_name="Τελευταίος αγώνας")
+    refreshed_at = models.DateTimeField(default=timezone.now, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Ζεύγος Αθλητή / Ίππου"
+        verbose_name_plural = "Ζεύγη Αθλητών / Ίππων"
+        ordering = ["-last_entry_date"]
+        constraints = [
+            models.UniqueConstraint(fields=["athlete", "horse"], name="uniq_partnership"),
+        ]
+        indexes = [
+            # "τα άλογα του αναβάτη" (πρόσφατα πρώτα) / "οι αναβάτες του ίππου"
+            models.Index(fields=["athlete", "-last_entry_date", "-entries"], name="partnership_athlete_idx"),
+            models.Index(fields=["horse", "-last_entry_date", "-entries"], name="partnership_horse_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete_id}/{self.horse_id}"
+
+
+# -----------------------------
+# Δεξιοτεχνία: προγράμματα και φύλλα κριτών
+# -----------------------------
+class DressageTest(models.Model):
+    code = models.CharField(max_length=30, unique=True, verbose_name="Κωδικός")
+    name = models.CharField(max_length=200, verbose_name="Πρόγραμμα")
+    # λάθη διαδρομής: βαθμοί που αφαιρούνται ανά λάθος, από κάθε κριτή
+    error_penalty = models.DecimalField(max_digits=4, decimal_places=1, default=2, verbose_name="Ποινή ανά λάθος διαδρομής")
+    # πόσα λάθη διαδρομής φέρνουν αποκλεισμό (0 = κανένα όριο)
+    errors_to_eliminate = models.PositiveSmallIntegerField(default=3, verbose_name="Λάθη για αποκλεισμό")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Πρόγραμμα Δεξιοτεχνίας"
+        verbose_name_plural = "Προγράμματα Δεξιοτεχνίας"
+        ordering = ["code"]
+
+    def __str__(self):
+        return f"{self.code} - {self.name}"
+
+
+class DressageMovement(models.Model):
+    test = models.ForeignKey(
+        DressageTest,
+        on_delete=models.CASCADE,
+        related_name="movements",
+        verbose_name="Πρόγραμμα",
+    )
+    number = models.PositiveSmallIntegerField(verbose_name="Α/Α")
+    label = models.CharField(max_length=200, verbose_name="Κίνηση")
+    coefficient = models.PositiveSmallIntegerField(default=1, verbose_name="Συντελεστής")
+    # συνολικοί βαθμοί (collective marks): μετράνε και στην ισοβαθμία
+    is_collective = models.BooleanField(default=False, verbose_name="Συνολικός βαθμός")
+
+    class Meta:
+        verbose_name = "Κίνηση"
+        verbose_name_plural = "Κινήσεις"
+        ordering = ["test", "number"]
+        constraints = [
+            models.UniqueConstraint(fields=["test", "number"], name="uniq_dressage_movement_number"),
+        ]
+
+    def __str__(self):
+        return f"{self.number}. {self.label}"
+
+
+class DressageSheet(models.Model):
+    """
+    Ένα φύλλο ανά κριτή ανά συμμετοχή. Οι βαθμοί όλων των κινήσεων είναι ΕΝΑ
+    πεδίο bytes (1 byte ανά κίνηση, σε μισούς βαθμούς, 255 = χωρίς βαθμό),
+    ώστε ο ξαναϋπολογισμός χιλιάδων φύλλων να είναι ένας πίνακας στη μνήμη.
+    """
+
+    class Judge(models.TextChoices):
+        E = "E", "E"
+        H = "H", "H"
+        C = "C", "C"
+        M = "M", "M"
+        B = "B", "B"
+
+    competition_class = models.ForeignKey(
+        CompetitionClass,
+        on_delete=models.CASCADE,
+        related_name="dressage_sheets",
+        verbose_name="Αγώνισμα",
+    )
+    entry = models.ForeignKey(
+        Entry,
+        on_delete=models.CASCADE,
+        related_name="dressage_sheets",
+        verbose_name="Συμμετοχή",
+    )
+    judge = models.CharField(max_length=1, choices=Judge.choices, verbose_name="Κριτής")
+    marks = models.BinaryField(verbose_name="Βαθμοί")
+    errors = models.PositiveSmallIntegerField(default=0, verbose_name="Λάθη διαδρομής")
+
+    # υπολογισμένα (competitions/dressage.py)
+    total = models.DecimalField(max_digits=7, decimal_places=1, default=0, verbose_name="Σύνολο")
+    collective_total = models.DecimalField(max_digits=7, decimal_places=1, default=0, verbose_name="Συνολικοί βαθμοί")
+    percentage = models.DecimalField(max_digits=6, decimal_places=3, default=0, verbose_name="Ποσοστό %")
+    # STATUS=EL λόγω λαθών διαδρομής αυτού του φύλλου· ακυρώνεται αν η διόρθωση πέσει κάτω από το όριο
+    elimination_event = models.OneToOneField(
+        "ScoringEvent",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Αποκλεισμός",
+    )
+
+    updated_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Καταχωρήθηκε από",
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Φύλλο Κριτή"
+        verbose_name_plural = "Φύλλα Κριτών"
+        ordering = ["competition_class", "entry", "judge"]
+        constraints = [
+            models.UniqueConstraint(fields=["entry", "judge"], name="uniq_dressage_sheet_judge"),
+        ]
+        indexes = [
+            models.Index(fields=["competition_class", "entry"], name="dressage_sheet_class_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.entry} - {self.judge}: {self.percentage}%"
@@ -0,0 +1,182 @@
+"""
+Ζεύγη αθλητή / ίππου (Partnership): μία γραμμή ανά ζευγάρι με δηλώσεις,
+εκκινήσεις, νίκες, καλύτερη θέση, πρώτο / τελευταίο αγώνα.
+
+    usual_horses(athlete)   -> τα άλογα του αναβάτη, ένα query στο index (athlete, -last_entry_date)
+    riders_of(horse)        -> οι αναβάτες του ίππου, ένα query στο index (horse, -last_entry_date)
+
+Ενημέρωση (μόνο για τα ζευγάρια που άλλαξαν, μία φορά στο commit):
+- Entry post_save / post_delete (και αλλαγή αθλητή / ίππου σε υπάρχουσα δήλωση)
+- submit_entries() (bulk_create χωρίς signals) -> schedule()
+- results_frozen -> τα ζευγάρια του αγωνίσματος
+`manage.py rebuild_partnerships` για πλήρη αναδημιουργία (π.χ. μετά από αλλαγή ημερομηνίας αγωνίσματος).
+"""
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from config.transactions import CommitQueue
+
+from .models import CompetitionRecord, Entry, Partnership, Result
+from .scoring import results_frozen
+
+PARTNERSHIP_FIELDS = [
+    "entries", "last_entry_date", "starts", "wins", "best_rank", "first_date", "last_date", "refreshed_at",
+]
+SUGGESTION_FIELDS = (
+    "entries", "last_entry_date", "starts", "wins", "best_rank", "first_date", "last_date",
+)
+CHUNK_SIZE = 500
+
+
+def _entry_totals(entries):
+    return (
+        entries.order_by()
+        .values("athlete_id", "horse_id")
+        .annotate(entries=Count("pk"), last_entry_date=Max("competition_class__date"))
+    )
+
+
+def _record_totals(records):
+    S = Result.Status
+    started = ~Q(status=S.NOT_STARTED)
+    return (
+        records.order_by()
+        .values("athlete_id", "horse_id")
+        .annotate(
+            starts=Count("pk", filter=started),
+            wins=Count("pk", filter=Q(status=S.OK, rank=1)),
+            best_rank=Min("rank", filter=Q(status=S.OK)),
+            first_date=Min("date", filter=started),
+            last_date=Max("date", filter=started),
+        )
+    )
+
+
+def _merge(entry_rows, record_rows, wanted=None) -> dict[tuple[int, int], dict]:
+    merged: dict[tuple[int, int], dict] = {}
+    for rows in (entry_rows, record_rows):
+        for row in rows:
+            key = (row.pop("athlete_id"), row.pop("horse_id"))
+            if wanted is None or key in wanted:
+                merged.setdefault(key, {}).update(row)
+    return merged
+
+
+def _objs(merged: dict[tuple[int, int], dict]) -> list[Partnership]:
+    now = timezone.now()
+    return [
+        Partnership(athlete_id=athlete_id, horse_id=horse_id, refreshed_at=now, **values)
+        for (athlete_id, horse_id), values in merged.items()
+    ]
+
+
+# -----------------------------
+# ενημέρωση
+# -----------------------------
+def refresh_pairs(pairs) -> int:
+    """pairs: {(athlete_id, horse_id)}. Δύο GROUP BY ανά chunk + upsert."""
+    pairs = list(set(pairs))
+    count = 0
+    for i in range(0, len(pairs), CHUNK_SIZE):
+        wanted = set(pairs[i:i + CHUNK_SIZE])
+        filters = {"athlete_id__in": {a for a, _ in wanted}, "horse_id__in": {h for _, h in wanted}}
+        merged = _merge(
+            _entry_totals(Entry.objects.filter(**filters)),
+            _record_totals(CompetitionRecord.objects.filter(**filters)),
+            wanted,
+        )
+        with transaction.atomic():
+            Partnership.objects.bulk_create(
+                _objs(merged),
+                update_conflicts=True,
+                unique_fields=["athlete", "horse"],
+                update_fields=PARTNERSHIP_FIELDS,
+                batch_size=1000,
+            )
+            # ζευγάρια χωρίς δηλώσεις / αποτελέσματα πια
+            for athlete_id, horse_id in wanted - merged.keys():
+                Partnership.objects.filter(athlete_id=athlete_id, horse_id=horse_id).delete()
+        count += len(merged)
+    return count
+
+
+def rebuild_all() -> int:
+    merged = _merge(_entry_totals(Entry.objects.all()), _record_totals(CompetitionRecord.objects.all()))
+    with transaction.atomic():
+        Partnership.objects.all().delete()
+        Partnership.objects.bulk_create(_objs(merged), batch_size=1000)
+    return len(merged)
+
+
+# -----------------------------
+# incremental ενημέρωση στο commit
+# -----------------------------
+def _process(pairs=()) -> None:
+    refresh_pairs(pairs)
+
+
+# όσες αλλαγές κι αν γίνουν σε μια συναλλαγή, ένας υπολογισμός στο commit
+_pending = CommitQueue("partnerships", _process)
+
+
+def schedule(pairs) -> None:
+    _pending.add(pairs=pairs)
+
+
+@receiver(pre_save, sender=Entry)
+def _entry_saving(sender, instance, update_fields=None, **kwargs):
+    # αλλαγή αθλητή / ίππου σε υπάρχουσα δήλωση: ενημερώνεται και το παλιό ζευγάρι
+    if instance.pk is None or (update_fields is not None and not {"athlete", "horse"} & set(update_fields)):
+        return
+    old = Entry.objects.filter(pk=instance.pk).values_list("athlete_id", "horse_id").first()
+    if old is not None and old != (instance.athlete_id, instance.horse_id):
+        schedule([old])
+
+
+@receiver(post_save, sender=Entry)
+@receiver(post_delete, sender=Entry)
+def _entry_changed(sender, instance, **kwargs):
+    schedule([(instance.athlete_id, instance.horse_id)])
+
+
+@receiver(results_frozen)
+def _class_frozen(sender, competition_class_id, previous=(), **kwargs):
+    pairs = set(
+        CompetitionRecord.objects.filter(entry__competition_class_id=competition_class_id)
+        .order_by()
+        .values_list("athlete_id", "horse_id")
+        .distinct()
+    )
+    # και τα ζεύγη πριν τη διόρθωση (reopen_class -> άλλος ίππος / αθλητής)
+    schedule(pairs | {(athlete_id, horse_id) for athlete_id, horse_id, _ in previous})
+
+
+# -----------------------------
+# queries
+# -----------------------------
+def usual_horses(athlete_id: int, limit: int = 10, active_only: bool = True) -> list[dict]:
+    """Τα άλογα του αναβάτη για τις φόρμες δηλώσεων: πιο πρόσφατα / συχνά πρώτα. Ένα query."""
+    qs = Partnership.objects.filter(athlete_id=athlete_id)
+    if active_only:
+        qs = qs.filter(horse__is_active=True)
+    return list(
+        qs.order_by("-last_entry_date", "-entries", "horse_id")
+        .values("horse_id", "horse__registry_number", "horse__name", *SUGGESTION_FIELDS)[:limit]
+    )
+
+
+def riders_of(horse_id: int, limit: int = 50) -> list[dict]:
+    """Οι αναβάτες του ίππου (μητρώο ίππων). Ένα query."""
+    return list(
+        Partnership.objects.filter(horse_id=horse_id)
+        .order_by("-last_entry_date", "-entries", "athlete_id")
+        .values(
+            "athlete_id", "athlete__eoi_registry_number", "athlete__last_name", "athlete__first_name",
+            *SUGGESTION_FIELDS,
+        )[:limit]
+    )
@@ -0,0 +1,456 @@
+"""
+Live αποτελέσματα: append-only ScoringEvent -> Result -> κατάταξη αγωνίσματος.
+
+record_event():
+  1. κλείδωμα αγωνίσματος (μία εγγραφή τη φορά ανά αγώνισμα)
+  2. νέο ScoringEvent
+  3. ξαναϋπολογισμός ΜΟΝΟ του Result της συμμετοχής (από τα δικά της events)
+  4. incremental κατάταξη: η ταξινομημένη λίστα (κλειδί, entry) του αγωνίσματος
+     μένει στο cache. Η συμμετοχή μετακινείται με bisect και αλλάζουν μόνο
+     οι θέσεις ανάμεσα στην παλιά και τη νέα της θέση (ποτέ sort όλου του αγωνίσματος)
+  5. μετά το commit: signal standings_changed με τις αλλαγές θέσεων
+
+freeze_class(): επίσημα αποτελέσματα + ιστορικό αθλητή / ίππου (CompetitionRecord).
+reopen_class(): άνοιγμα για διόρθωση· η επόμενη freeze_class() ενημερώνει το ιστορικό.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from .models import CompetitionClass, CompetitionRecord, Entry, Result, ScoringEvent
+
+INFINITY = Decimal("Infinity")
+
+# ποια events δέχεται κάθε άθλημα (STATUS: όλα)
+KINDS_BY_DISCIPLINE = {
+    CompetitionClass.Discipline.SHOW_JUMPING: {ScoringEvent.Kind.JUMPING_ROUND},
+    CompetitionClass.Discipline.EVENTING: {ScoringEvent.Kind.JUMPING_ROUND},
+    CompetitionClass.Discipline.DRESSAGE: {ScoringEvent.Kind.DRESSAGE_MARK},
+    CompetitionClass.Discipline.ENDURANCE: {ScoringEvent.Kind.ENDURANCE_CHECKPOINT},
+}
+
+# στέλνεται μετά το commit: sender=CompetitionClass, outcome=ScoringOutcome
+standings_changed = Signal()
+# στέλνεται μετά το commit της οριστικοποίησης: sender=CompetitionClass, competition_class_id=<id>,
+# previous=[(athlete_id, horse_id, date)] των CompetitionRecord πριν την ενημέρωση (ξανά-οριστικοποίηση
+# μετά από διόρθωση αθλητή / ίππου / ημερομηνίας: και τα παλιά κλειδιά ξαναϋπολογίζονται)
+results_frozen = Signal()
+
+
+class ScoringError(Exception):
+    pass
+
+
+@dataclass
+class RankChange:
+    entry_id: int
+    old_rank: int | None
+    new_rank: int | None
+
+
+@dataclass
+class ScoringOutcome:
+    competition_class_id: int
+    version: int
+    event: ScoringEvent | None
+    result: Result | None
+    changes: list[RankChange] = field(default_factory=list)
+    official: bool = False
+
+
+# -----------------------------
+# events -> Result
+# -----------------------------
+def aggregate(discipline: str, events) -> dict:
+    """
+    events: τα ενεργά (όχι διορθωμένα) events μιας συμμετοχής, με τη σειρά καταχώρησης.
+    Επιστρέφει τα πεδία του Result.
+    """
+    status = None
+    stages: dict = {}
+    for e in events:
+        if e.kind == ScoringEvent.Kind.STATUS:
+            # κενή κατάσταση: ακύρωση (διορθώνει ένα STATUS event, δεν αλλάζει τίποτα άλλο)
+            if e.status:
+                status = e.status
+        elif e.kind == ScoringEvent.Kind.DRESSAGE_MARK:
+            stages[e.judge] = e
+        else:
+            stages[e.round_no or 1] = e
+
+    values = {"faults": None, "time_seconds": None, "score": None, "tiebreak": None, "stages_completed": len(stages)}
+    if discipline in (CompetitionClass.Discipline.SHOW_JUMPING, CompetitionClass.Discipline.EVENTING):
+        if stages:
+            values["faults"] = sum((e.faults or 0 for e in stages.values()), Decimal(0))
+            # χρόνος του τελευταίου γύρου (π.χ. jump-off)
+            values["time_seconds"] = stages[max(stages)].time_seconds
+    elif discipline == CompetitionClass.Discipline.DRESSAGE:
+        marks = [e.score for e in stages.values() if e.score is not None]
+        if marks:
+            values["score"] = (sum(marks, Decimal(0)) / len(marks)).quantize(Decimal("0.001"))
+        tiebreaks = [e.tiebreak for e in stages.values() if e.tiebreak is not None]
+        if tiebreaks:
+            values["tiebreak"] = (sum(tiebreaks, Decimal(0)) / len(tiebreaks)).quantize(Decimal("0.001"))
+    elif discipline == CompetitionClass.Discipline.ENDURANCE:
+        if any(e.vet_passed is False for e in stages.values()) and status is None:
+            status = Result.Status.ELIMINATED
+        passed = [e for e in stages.values() if e.vet_passed is not False]
+        values["stages_completed"] = len(passed)
+        times = [e.time_seconds for e in passed if e.time_seconds is not None]
+        values["time_seconds"] = max(times) if times else None
+
+    values["status"] = status or Result.Status.OK
+    return values
+
+
+def ranking_key(discipline: str, status, faults, time_seconds, score, stages_completed, tiebreak=None):
+    """Μικρότερο = καλύτερο. None = εκτός κατάταξης (δεν έχει αγωνιστεί / αποκλεισμός ...)."""
+    if status != Result.Status.OK or not stages_completed:
+        return None
+    time_key = time_seconds if time_seconds is not None else INFINITY
+    if discipline == CompetitionClass.Discipline.DRESSAGE:
+        # ισοβαθμία: μεγαλύτερο άθροισμα συνολικών βαθμών
+        return (-(score or 0), -(tiebreak or 0))
+    if discipline == CompetitionClass.Discipline.ENDURANCE:
+        return (-stages_completed, time_key)
+    # SJ / EV: περισσότεροι γύροι (jump-off) μπροστά, μετά σφάλματα, μετά χρόνος
+    return (-stages_completed, faults or 0, time_key)
+
+
+def _result_key(discipline: str, result: Result):
+    return ranking_key(
+        discipline, result.status, result.faults, result.time_seconds, result.score, result.stages_completed,
+        result.tiebreak,
+    )
+
+
+# -----------------------------
+# κατάταξη (ταξινομημένη λίστα στο cache)
+# -----------------------------
+class Standings:
+    """
+    items: ταξινομημένη λίστα (κλειδί, entry_id) των συμμετοχών με κατάταξη.
+    Ισοβαθμίες μοιράζονται θέση: rank = πλήθος με μικρότερο κλειδί + 1.
+    """
+
+    def __init__(self, items=None, keys=None):
+        self.items: list[tuple] = items or []
+        self.keys: dict[int, tuple] = keys or {}
+
+    @classmethod
+    def from_db(cls, competition_class: CompetitionClass) -> Standings:
+        return cls.build(
+            competition_class.discipline,
+            Result.objects.filter(entry__competition_class=competition_class)
+            .order_by()
+            .values_list("entry_id", "status", "faults", "time_seconds", "score", "stages_completed", "tiebreak"),
+        )
+
+    @classmethod
+    def build(cls, discipline: str, rows) -> Standings:
+        """rows: (entry_id, status, faults, time_seconds, score, stages_completed, tiebreak)"""
+        keys = {}
+        for entry_id, *values in rows:
+            key = ranking_key(discipline, *values)
+            if key is not None:
+                keys[entry_id] = key
+        return cls(sorted((k, e) for e, k in keys.items()), keys)
+
+    def rank_of_key(self, key) -> int:
+        return bisect_left(self.items, (key,)) + 1
+
+    def rank(self, entry_id: int) -> int | None:
+        key = self.keys.get(entry_id)
+        return None if key is None else self.rank_of_key(key)
+
+    def move(self, entry_id: int, new_key) -> list[RankChange]:
+        """Μετακινεί μία συμμετοχή και επιστρέφει ΜΟΝΟ τις θέσεις που άλλαξαν."""
+        old_key = self.keys.get(entry_id)
+        if old_key == new_key:
+            return []
+        old_rank = self.rank(entry_id)
+
+        # όσοι έχουν κλειδί > old_key ανεβαίνουν μία θέση (φεύγει κάποιος μπροστά τους),
+        # όσοι έχουν κλειδί > new_key πέφτουν μία (μπαίνει κάποιος μπροστά τους)
+        # -> αλλάζουν μόνο όσοι είναι ανάμεσα στα δύο κλειδιά
+        if old_key is not None:
+            self.items.pop(bisect_left(self.items, (old_key, entry_id)))
+            del self.keys[entry_id]
+        if new_key is not None:
+            insort(self.items, (new_key, entry_id))
+            self.keys[entry_id] = new_key
+
+        changes = []
+        if old_key is None or (new_key is not None and new_key < old_key):
+            lo = bisect_right(self.items, (new_key, INFINITY))
+            hi = len(self.items) if old_key is None else bisect_right(self.items, (old_key, INFINITY))
+            delta = 1
+        else:
+            lo = bisect_right(self.items, (old_key, INFINITY))
+            hi = len(self.items) if new_key is None else bisect_right(self.items, (new_key, INFINITY))
+            delta = -1
+        for key, other in self.items[lo:hi]:
+            if other == entry_id:
+                continue
+            new_rank = self.rank_of_key(key)
+            changes.append(RankChange(other, new_rank - delta, new_rank))
+
+        changes.append(RankChange(entry_id, old_rank, self.rank(entry_id)))
+        return changes
+
+    def as_list(self) -> list[tuple[int, int]]:
+        """[(entry_id, rank)] με τη σειρά κατάταξης."""
+        return [(entry_id, self.rank_of_key(key)) for key, entry_id in self.items]
+
+
+def _standings_key(class_id: int) -> str:
+    return f"eoi:standings:{class_id}"
+
+
+def get_standings(competition_class: CompetitionClass) -> Standings:
+    """Από το cache αν είναι της τρέχουσας έκδοσης, αλλιώς (σπάνια) από τη βάση."""
+    cached = cache.get(_standings_key(competition_class.pk))
+    if cached is not None and cached[0] == competition_class.standings_version:
+        return Standings(*cached[1])
+    standings = Standings.from_db(competition_class)
+    cache.set(_standings_key(competition_class.pk), (competition_class.standings_version, (standings.items, standings.keys)), None)
+    return standings
+
+
+# -----------------------------
+# καταχώρηση
+# -----------------------------
+def validate_event(competition_class: CompetitionClass, entry: Entry, kind: str, values: dict, supersedes):
+    if competition_class.results_frozen_at is not None:
+        raise ScoringError("Τα αποτελέσματα του αγωνίσματος έχουν οριστικοποιηθεί.")
+    if kind not in ScoringEvent.Kind.values:
+        raise ScoringError(f"Άγνωστο είδος συμβάντος: {kind}")
+    if kind != ScoringEvent.Kind.STATUS and kind not in KINDS_BY_DISCIPLINE.get(competition_class.discipline, ()):
+        raise ScoringError(f"Το συμβάν {kind} δεν ταιριάζει στο άθλημα {competition_class.get_discipline_display()}.")
+    if kind == ScoringEvent.Kind.STATUS and values.get("status") not in Result.Status.values:
+        voids = not values.get("status") and supersedes is not None and supersedes.kind == ScoringEvent.Kind.STATUS
+        if not voids:
+            raise ScoringError("Απαιτείται έγκυρη κατάσταση (OK/EL/RT/DQ/NS).")
+    if kind == ScoringEvent.Kind.DRESSAGE_MARK and (not values.get("judge") or values.get("score") is None):
+        raise ScoringError("Απαιτείται κριτής και βαθμός.")
+    if supersedes is not None:
+        if supersedes.entry_id != entry.pk:
+            raise ScoringError("Η διόρθωση αφορά άλλη συμμετοχή.")
+        if ScoringEvent.objects.filter(supersedes=supersedes).exists():
+            raise ScoringError("Το συμβάν έχει ήδη διορθωθεί.")
+
+
+def record_event(entry: Entry, kind: str, user=None, supersedes: ScoringEvent | None = None, **values) -> ScoringOutcome:
+    """
+    values: round_no, judge, faults, time_seconds, score, tiebreak, vet_passed, status
+    """
+    with transaction.atomic():
+        cc = CompetitionClass.objects.select_for_update().get(pk=entry.competition_class_id)
+        validate_event(cc, entry, kind, values, supersedes)
+
+        event = ScoringEvent.objects.create(
+            competition_class=cc,
+            entry=entry,
+            kind=kind,
+            supersedes=supersedes,
+            recorded_by=user if user is not None and user.is_authenticated else None,
+            **values,
+        )
+        events = ScoringEvent.objects.filter(entry=entry, superseded_by__isnull=True).order_by("id")
+        fields = aggregate(cc.discipline, events)
+
+        standings = get_standings(cc)
+        result, _ = Result.objects.get_or_create(entry=entry)
+        for name, value in fields.items():
+            setattr(result, name, value)
+        changes = standings.move(entry.pk, _result_key(cc.discipline, result))
+        result.rank = standings.rank(entry.pk)
+        result.save()
+
+        others = {c.entry_id: c.new_rank for c in changes if c.entry_id != entry.pk}
+        if others:
+            to_update = list(Result.objects.filter(entry_id__in=others).only("pk", "entry_id", "rank"))
+            for r in to_update:
+                r.rank = others[r.entry_id]
+            Result.objects.bulk_update(to_update, ["rank"], batch_size=500)
+
+        cc.standings_version += 1
+        CompetitionClass.objects.filter(pk=cc.pk).update(standings_version=cc.standings_version)
+        outcome = ScoringOutcome(cc.pk, cc.standings_version, event, result, changes)
+        _publish_on_commit(standings, outcome)
+    return outcome
+
+
+def _publish_on_commit(standings: Standings, outcome: ScoringOutcome) -> None:
+    def publish():
+        cache.set(_standings_key(outcome.competition_class_id), (outcome.version, (standings.items, standings.keys)), None)
+        standings_changed.send(sender=CompetitionClass, outcome=outcome)
+
+    transaction.on_commit(publish)
+
+
+RESULT_FIELDS = ["status", "faults", "time_seconds", "score", "tiebreak", "stages_completed"]
+
+
+def record_events_bulk(competition_class: CompetitionClass, events: list[ScoringEvent], user=None) -> ScoringOutcome:
+    """
+    Πολλά events ενός αγωνίσματος μαζί (π.χ. ξαναϋπολογισμός πρωταθλήματος):
+    ένα κλείδωμα, Results με ένα upsert, ΜΙΑ πλήρης ταξινόμηση και μία νέα έκδοση
+    αντί για N incremental μετακινήσεις. Τα events έρχονται ήδη ελεγμένα.
+    """
+    with transaction.atomic():
+        cc = CompetitionClass.objects.select_for_update().get(pk=competition_class.pk)
+        if cc.results_frozen_at is not None:
+            raise ScoringError("Τα αποτελέσματα του αγωνίσματος έχουν οριστικοποιηθεί.")
+        recorded_by = user if user is not None and user.is_authenticated else None
+        for e in events:
+            e.competition_class = cc
+            e.recorded_by = recorded_by
+        ScoringEvent.objects.bulk_create(events, batch_size=500)
+
+        entry_ids = {e.entry_id for e in events}
+        active = defaultdict(list)
+        for e in ScoringEvent.objects.filter(entry_id__in=entry_ids, superseded_by__isnull=True).order_by("id"):
+            active[e.entry_id].append(e)
+
+        # όλο το αγώνισμα στη μνήμη: νέα πεδία, νέα κατάταξη, ένα upsert
+        results = {r.entry_id: r for r in Result.objects.filter(entry__competition_class=cc).order_by()}
+        old_ranks = {entry_id: r.rank for entry_id, r in results.items()}
+        for entry_id in entry_ids:
+            result = results.setdefault(entry_id, Result(entry_id=entry_id))
+            for name, value in aggregate(cc.discipline, active[entry_id]).items():
+                setattr(result, name, value)
+
+        standings = Standings.build(
+            cc.discipline,
+            ((r.entry_id, r.status, r.faults, r.time_seconds, r.score, r.stages_completed, r.tiebreak) for r in results.values()),
+        )
+        changes, to_save = [], []
+        for entry_id, result in results.items():
+            old_rank = old_ranks.get(entry_id)
+            result.rank = standings.rank(entry_id)
+            if entry_id in entry_ids or result.rank != old_rank:
+                changes.append(RankChange(entry_id, old_rank, result.rank))
+                to_save.append(result)
+        Result.objects.bulk_create(
+            to_save,
+            update_conflicts=True,
+            unique_fields=["entry"],
+            update_fields=RESULT_FIELDS + ["rank", "updated_at"],
+            batch_size=500,
+        )
+
+        cc.standings_version += 1
+        CompetitionClass.objects.filter(pk=cc.pk).update(standings_version=cc.standings_version)
+        outcome = ScoringOutcome(cc.pk, cc.standings_version, None, None, changes)
+        _publish_on_commit(standings, outcome)
+    return outcome
+
+
+# -----------------------------
+# οριστικοποίηση
+# -----------------------------
+RECORD_FIELDS = [
+    "athlete", "horse", "club", "date", "competition_name", "class_name", "discipline",
+    "age_category", "height_cm", "status", "rank", "starters", "faults", "time_seconds",
+    "score", "prize_money", "frozen_at",
+]
+
+
+def freeze_class(competition_class: CompetitionClass) -> int:
+    """Επίσημα αποτελέσματα: Result.is_official + ιστορικό αθλητή/ίππου. Επιστρέφει πλήθος."""
+    with transaction.atomic():
+        cc = CompetitionClass.objects.select_for_update().select_related("competition").get(pk=competition_class.pk)
+        if cc.results_frozen_at is not None:
+            raise ScoringError("Τα αποτελέσματα έχουν ήδη οριστικοποιηθεί.")
+
+        results = list(
+            Result.objects.filter(entry__competition_class=cc).select_related("entry").order_by()
+        )
+        starters = sum(1 for r in results if r.status != Result.Status.NOT_STARTED)
+        previous = list(
+            CompetitionRecord.objects.filter(entry__competition_class=cc).values_list("athlete_id", "horse_id", "date")
+        )
+        now = timezone.now()
+        records = [
+            CompetitionRecord(
+                entry_id=r.entry_id,
+                athlete_id=r.entry.athlete_id,
+                horse_id=r.entry.horse_id,
+                club_id=r.entry.club_id,
+                date=cc.date,
+                competition_name=cc.competition.name,
+                class_name=cc.name,
+                discipline=cc.discipline,
+                age_category=cc.age_category,
+                height_cm=cc.height_cm,
+                status=r.status,
+                rank=r.rank,
+                starters=starters,
+                faults=r.faults,
+                time_seconds=r.time_seconds,
+                score=r.score,
+                prize_money=r.prize_money,
+                frozen_at=now,
+            )
+            for r in results
+        ]
+        CompetitionRecord.objects.bulk_create(
+            records, update_conflicts=True, unique_fields=["entry"], update_fields=RECORD_FIELDS, batch_size=500
+        )
+        Result.objects.filter(entry__competition_class=cc).update(is_official=True)
+        cc.results_frozen_at = now
+        cc.standings_version += 1
+        cc.save(update_fields=["results_frozen_at", "standings_version"])
+
+        # καμία αλλαγή θέσης, μόνο "επίσημα" (live πίνακες, snapshots)
+        outcome = ScoringOutcome(cc.pk, cc.standings_version, None, None, official=True)
+
+        def publish():
+            standings_changed.send(sender=CompetitionClass, outcome=outcome)
+            results_frozen.send(sender=CompetitionClass, competition_class_id=cc.pk, previous=previous)
+
+        transaction.on_commit(publish)
+
+    competition_class.results_frozen_at = cc.results_frozen_at
+    competition_class.standings_version = cc.standings_version
+    return len(records)
+
+
+def reopen_class(competition_class: CompetitionClass) -> None:
+    """
+    Άνοιγμα οριστικοποιημένου αγωνίσματος για διόρθωση. Το ιστορικό
+    (CompetitionRecord) μένει ως έχει μέχρι την επόμενη freeze_class().
+    """
+    with transaction.atomic():
+        cc = CompetitionClass.objects.select_for_update().get(pk=competition_class.pk)
+        if cc.results_frozen_at is None:
+            raise ScoringError("Τα αποτελέσματα δεν έχουν οριστικοποιηθεί.")
+        Result.objects.filter(entry__competition_class=cc).update(is_official=False)
+        cc.results_frozen_at = None
+        cc.standings_version += 1
+        cc.save(update_fields=["results_frozen_at", "standings_version"])
+
+        outcome = ScoringOutcome(cc.pk, cc.standings_version, None, None)
+        transaction.on_commit(lambda: standings_changed.send(sender=CompetitionClass, outcome=outcome))
+
+    competition_class.results_frozen_at = None
+    competition_class.standings_version = cc.standings_version
+
+
+@receiver(post_delete, sender=Entry)
+def _entry_deleted(sender, instance, **kwargs):
+    # η κατάταξη στο cache έχει ακόμα τη συμμετοχή: νέα έκδοση -> ξαναχτίζεται από τη βάση
+    CompetitionClass.objects.filter(pk=instance.competition_class_id).update(
+        standings_version=F("standings_version") + 1
+    )
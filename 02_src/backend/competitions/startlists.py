@@ -0,0 +1,526 @@
+"""
+Κλήρωση σειράς εκκίνησης αγωνίσματος.
+
+1. Αρχική σειρά: τυχαία (RANDOM) ή με βάση την κατάταξη (RANKED / REVERSE_RANKED).
+2. Greedy τοποθέτηση που σέβεται όσο γίνεται τους κανόνες.
+3. Local search (ανταλλαγές θέσεων) πάνω σε ένα κόστος:
+   - ίδιος αναβάτης σε απόσταση < min_rider_gap (σχεδόν "σκληρός" κανόνας)
+   - οι ίπποι του ίδιου αναβάτη όσο πιο ομοιόμορφα απλωμένοι γίνεται
+   - κανόνας ομίλων (όχι διαδοχικά / ομαδοποίηση)
+   - στις κληρώσεις με κατάταξη: απόκλιση από τη θέση της κατάταξης
+   Κάθε ανταλλαγή ξαναϋπολογίζει μόνο τους όρους που επηρεάζει (O(1) ανά κίνηση),
+   οπότε αγωνίσματα με εκατοντάδες εκκινήσεις λύνονται σε κλάσματα του δευτερολέπτου.
+
+Όλα εξαρτώνται μόνο από το seed (όχι από χρόνο), άρα ίδιο seed + ίδιες
+συμμετοχές = ίδια σειρά. Το seed αποθηκεύεται στο CompetitionClass.
+"""
+from __future__ import annotations
+
+import io
+import itertools
+import random
+import secrets
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from .models import CompetitionClass, Entry, Result
+
+try:
+    import openpyxl
+    from openpyxl.styles import Font
+except ImportError:  # pragma: no cover
+    openpyxl = None
+
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen import canvas
+except ImportError:  # pragma: no cover
+    canvas = None
+
+# γραμματοσειρές με ελληνικά (οι ενσωματωμένες του PDF δεν έχουν)
+PDF_FONT_CANDIDATES = [
+    "C:/Windows/Fonts/arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/Library/Fonts/Arial Unicode.ttf",
+]
+
+# βάρη κόστους
+W_RIDER_GAP = 1000
+W_RIDER_SPREAD = 1
+W_CLUB = 50
+W_RANK = 2
+
+# ποιες συμμετοχές μπαίνουν στη λίστα
+STARTING_STATUSES = (Entry.Status.APPROVED, Entry.Status.PAID, Entry.Status.FINAL)
+
+
+class StartListError(Exception):
+    pass
+
+
+@dataclass
+class Starter:
+    entry_id: int
+    rider_id: int
+    horse_id: int
+    club_id: int | None = None
+    # μεγαλύτερο = καλύτερο (π.χ. έπαθλα σεζόν)
+    strength: float = 0
+
+
+@dataclass
+class DrawRules:
+    method: str = CompetitionClass.DrawMethod.RANDOM
+    min_rider_gap: int = 5
+    club_rule: str = CompetitionClass.ClubRule.NONE
+    max_iterations: int | None = None
+
+
+@dataclass
+class DrawResult:
+    order: list[Starter]
+    seed: int
+    cost: int
+    rider_gap_violations: int
+    club_violations: int
+    iterations: int
+    elapsed_ms: float = 0
+    warnings: list[str] = field(default_factory=list)
+
+
+# -----------------------------
+# solver
+# -----------------------------
+class _Solver:
+    def __init__(self, starters: list[Starter], rules: DrawRules, rng: random.Random):
+        self.rules = rules
+        self.rng = rng
+        self.n = len(starters)
+
+        # αρχική σειρά + θέση-στόχος (μόνο για κληρώσεις με κατάταξη)
+        keys = [(s.strength, rng.random()) for s in starters]
+        idx = list(range(self.n))
+        if rules.method == CompetitionClass.DrawMethod.RANDOM:
+            rng.shuffle(idx)
+            self.target = None
+        else:
+            # RANKED: οι καλύτεροι ξεκινούν τελευταίοι
+            idx.sort(key=lambda i: keys[i], reverse=rules.method == CompetitionClass.DrawMethod.REVERSE_RANKED)
+            self.target = [0] * self.n
+        if rules.club_rule == CompetitionClass.ClubRule.GROUP:
+            # οι όμιλοι με τη σειρά που εμφανίζονται (τυχαία ή κατάταξης), οι αναβάτες κάθε ομίλου μαζί
+            club_rank = {c: k for k, c in enumerate(dict.fromkeys(starters[i].club_id for i in idx))}
+            idx.sort(key=lambda i: club_rank[starters[i].club_id])
+            if self.target is None:
+                idx = self._interleave(idx, starters)
+        if self.target is not None:
+            # στόχος = η σειρά κατάταξης (μέσα σε κάθε όμιλο, αν ομαδοποιούνται)
+            for p, i in enumerate(idx):
+                self.target[i] = p
+
+        self.starters = starters
+        self.rider = [s.rider_id for s in starters]
+        self.club = [s.club_id for s in starters]
+        self.rider_entries: dict[int, list[int]] = {}
+        for i, r in enumerate(self.rider):
+            self.rider_entries.setdefault(r, []).append(i)
+        # ιδανική απόσταση για αναβάτη με k ίππους: ομοιόμορφα σε όλη τη λίστα
+        # (στην ομαδοποίηση: μέσα στο μπλοκ των ομίλων του, αλλιώς το άπλωμα διαλύει τους ομίλους)
+        span = {r: self.n for r in self.rider_entries}
+        self.club_weight = W_CLUB
+        if rules.club_rule == CompetitionClass.ClubRule.GROUP:
+            club_size: dict[int | None, int] = {}
+            for c in self.club:
+                club_size[c] = club_size.get(c, 0) + 1
+            span = {r: sum(club_size[c] for c in {self.club[i] for i in e}) for r, e in self.rider_entries.items()}
+            # μία έξοδος από το μπλοκ κοστίζει περισσότερο από όσο κερδίζει το άπλωμα (<= n),
+            # αλλά λιγότερο από την απόσταση αναβάτη
+            self.club_weight = max(W_CLUB, min(W_RIDER_SPREAD * self.n, W_RIDER_GAP // 2))
+        self.ideal_gap = {r: span[r] // len(e) for r, e in self.rider_entries.items() if len(e) > 1}
+
+        self.order = self._greedy(idx)
+        self.pos = [0] * self.n
+        for p, i in enumerate(self.order):
+            self.pos[i] = p
+
+    @staticmethod
+    def _interleave(idx: list[int], starters: list[Starter]) -> list[int]:
+        """Μέσα σε κάθε όμιλο: ένας ίππος από κάθε αναβάτη ανά γύρο, ώστε το μπλοκ να χωράει την απόσταση."""
+        out: list[int] = []
+        for _, block in itertools.groupby(idx, key=lambda i: starters[i].club_id):
+            by_rider: dict[int, list[int]] = {}
+            for i in block:
+                by_rider.setdefault(starters[i].rider_id, []).append(i)
+            # πρώτα όσοι έχουν τους περισσότερους ίππους (σταθερή ταξινόμηση: μένει η τυχαία σειρά)
+            queues = sorted(by_rider.values(), key=len, reverse=True)
+            for round_ in range(len(queues[0])):
+                out.extend(q[round_] for q in queues if round_ < len(q))
+        return out
+
+    # --- κόστος ---
+    def _pair_cost(self, p: int) -> int:
+        """Κόστος του ζεύγους θέσεων (p, p + 1) λόγω κανόνα ομίλων."""
+        rule = self.rules.club_rule
+        if rule == CompetitionClass.ClubRule.NONE:
+            return 0
+        a, b = self.club[self.order[p]], self.club[self.order[p + 1]]
+        if a is None or b is None:
+            return 0
+        if rule == CompetitionClass.ClubRule.SPREAD:
+            return self.club_weight if a == b else 0
+        return self.club_weight if a != b else 0
+
+    def _rider_cost(self, rider: int) -> int:
+        entries = self.rider_entries[rider]
+        if len(entries) < 2:
+            return 0
+        positions = sorted(self.pos[i] for i in entries)
+        gap, ideal = self.rules.min_rider_gap, self.ideal_gap[rider]
+        cost = 0
+        for a, b in zip(positions, positions[1:]):
+            d = b - a
+            if d < gap:
+                cost += W_RIDER_GAP * (gap - d)
+            if d < ideal:
+                cost += W_RIDER_SPREAD * (ideal - d)
+        return cost
+
+    def _rank_cost(self, i: int) -> int:
+        if self.target is None:
+            return 0
+        return W_RANK * abs(self.pos[i] - self.target[i])
+
+    def _local_cost(self, p: int, q: int) -> int:
+        pairs = {x for x in (p - 1, p, q - 1, q) if 0 <= x < self.n - 1}
+        riders = {self.rider[self.order[p]], self.rider[self.order[q]]}
+        return (
+            sum(self._pair_cost(x) for x in pairs)
+            + sum(self._rider_cost(r) for r in riders)
+            + self._rank_cost(self.order[p])
+            + self._rank_cost(self.order[q])
+        )
+
+    def total_cost(self) -> int:
+        return (
+            sum(self._pair_cost(p) for p in range(self.n - 1))
+            + sum(self._rider_cost(r) for r in self.rider_entries)
+            + sum(self._rank_cost(i) for i in range(self.n))
+        )
+
+    def _swap(self, p: int, q: int) -> None:
+        a, b = self.order[p], self.order[q]
+        self.order[p], self.order[q] = b, a
+        self.pos[a], self.pos[b] = q, p
+
+    # --- κατασκευή ---
+    def _greedy(self, idx: list[int]) -> list[int]:
+        """
+        Παίρνει τον πρώτο υποψήφιο (σε μικρό παράθυρο) που δεν παραβιάζει κανόνα.
+        Στην ομαδοποίηση το idx είναι ήδη ανά όμιλο και μένει στον όμιλο του πρώτου της ουράς.
+        """
+        gap = self.rules.min_rider_gap
+        rule = self.rules.club_rule
+        window = 30 if self.target is None else 8
+        pool = list(idx)
+        order: list[int] = []
+        last_pos: dict[int, int] = {}
+        for p in range(self.n):
+            prev_club = self.club[order[-1]] if order else None
+            pick = 0
+            for k, i in enumerate(pool[:window]):
+                r = self.rider[i]
+                if r in last_pos and p - last_pos[r] < gap:
+                    continue
+                c = self.club[i]
+                if rule == CompetitionClass.ClubRule.SPREAD and c is not None and c == prev_club:
+                    continue
+                if rule == CompetitionClass.ClubRule.GROUP and c != self.club[pool[0]]:
+                    continue
+                pick = k
+                break
+            i = pool.pop(pick)
+            order.append(i)
+            last_pos[self.rider[i]] = p
+        return order
+
+    # --- local search ---
+    def _conflicts(self) -> list[int]:
+        bad = [p for p in range(self.n - 1) if self._pair_cost(p)]
+        for r, entries in self.rider_entries.items():
+            if len(entries) > 1 and self._rider_cost(r) >= W_RIDER_GAP:
+                bad.extend(self.pos[i] for i in entries)
+        return bad
+
+    def _block(self, p: int) -> tuple[int, int]:
+        """Οι θέσεις του συνεχόμενου μπλοκ με τον όμιλο της θέσης p."""
+        club = self.club[self.order[p]]
+        low = high = p
+        while low > 0 and self.club[self.order[low - 1]] == club:
+            low -= 1
+        while high < self.n - 1 and self.club[self.order[high + 1]] == club:
+            high += 1
+        return low, high
+
+    def _rider_gap_conflicts(self) -> bool:
+        return any(len(e) > 1 and self._rider_cost(r) >= W_RIDER_GAP for r, e in self.rider_entries.items())
+
+    def solve(self) -> tuple[int, int]:
+        n = self.n
+        if n < 2:
+            return self.total_cost(), 0
+        max_iter = self.rules.max_iterations or min(30 * n, 20_000)
+        # σταματάμε όταν δεν βελτιώνεται πια (μετράμε κινήσεις, όχι χρόνο: αναπαραγώγιμο)
+        patience = n
+        cost = self.total_cost()
+        bad = self._conflicts()
+        rng = self.rng
+        # ομαδοποίηση: πρώτα μόνο ανταλλαγές μέσα στο μπλοκ του ομίλου (δεν το χαλάνε)· έξω από αυτό
+        # μόνο αν μείνουν αναβάτες σε απόσταση < min_rider_gap που δεν λύνονται μέσα στα μπλοκ
+        in_block = self.rules.club_rule == CompetitionClass.ClubRule.GROUP
+        last_improvement = 0
+        it = 0
+        for it in range(1, max_iter + 1):
+            if cost == 0:
+                break
+            if it - last_improvement > patience:
+                if not (in_block and self._rider_gap_conflicts()):
+                    break
+                in_block, last_improvement = False, it
+            if it % n == 0:
+                bad = self._conflicts()
+            p = rng.choice(bad) if bad and rng.random() < 0.7 else rng.randrange(n)
+            if in_block:
+                low, high = self._block(p)
+                q = rng.randint(low, high)
+            elif self.target is not None:
+                # στις κληρώσεις κατάταξης οι μακρινές ανταλλαγές δεν περνούν ποτέ
+                q = min(n - 1, max(0, p + rng.randint(-12, 12)))
+            else:
+                q = rng.randrange(n)
+            if p == q:
+                continue
+            if p > q:
+                p, q = q, p
+            before = self._local_cost(p, q)
+            self._swap(p, q)
+            delta = self._local_cost(p, q) - before
+            if delta < 0:
+                cost += delta
+                last_improvement = it
+            elif delta > 0:
+                self._swap(p, q)
+        return cost, it
+
+    def _split_clubs(self) -> int:
+        """Ομαδοποίηση: πόσα μπλοκ παραπάνω από ένα ανά όμιλο (όσοι δεν έχουν όμιλο δεν μετράνε)."""
+        clubs = [self.club[i] for i in self.order if self.club[i] is not None]
+        blocks = sum(1 for p, c in enumerate(clubs) if p == 0 or c != clubs[p - 1])
+        return blocks - len(set(clubs))
+
+    def report(self) -> tuple[int, int]:
+        gap = self.rules.min_rider_gap
+        rider_violations = 0
+        for entries in self.rider_entries.values():
+            positions = sorted(self.pos[i] for i in entries)
+            rider_violations += sum(1 for a, b in zip(positions, positions[1:]) if b - a < gap)
+        if self.rules.club_rule == CompetitionClass.ClubRule.GROUP:
+            # τα όρια ανάμεσα σε διαφορετικούς ομίλους είναι αναπόφευκτα: μετράνε μόνο οι διασπάσεις
+            club_violations = self._split_clubs()
+        else:
+            club_violations = sum(1 for p in range(self.n - 1) if self._pair_cost(p))
+        return rider_violations, club_violations
+
+
+def solve(starters: list[Starter], rules: DrawRules, seed: int) -> DrawResult:
+    started = time.perf_counter()
+    # σταθερή αρχική σειρά: το αποτέλεσμα εξαρτάται μόνο από seed + συμμετοχές
+    starters = sorted(starters, key=lambda s: s.entry_id)
+    solver = _Solver(starters, rules, random.Random(seed))
+    cost, iterations = solver.solve()
+    rider_violations, club_violations = solver.report()
+
+    warnings = []
+    if rider_violations:
+        warnings.append(
+            f"{rider_violations} εκκινήσεις αναβατών με απόσταση μικρότερη από {rules.min_rider_gap}"
+        )
+    if club_violations and rules.club_rule == CompetitionClass.ClubRule.SPREAD:
+        warnings.append(f"{club_violations} διαδοχικές εκκινήσεις ίδιου ομίλου")
+    if club_violations and rules.club_rule == CompetitionClass.ClubRule.GROUP:
+        warnings.append(f"{club_violations} όμιλοι χωρισμένοι σε περισσότερα από ένα μπλοκ")
+
+    return DrawResult(
+        order=[starters[i] for i in solver.order],
+        seed=seed,
+        cost=cost,
+        rider_gap_violations=rider_violations,
+        club_violations=club_violations,
+        iterations=iterations,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+        warnings=warnings,
+    )
+
+
+# -----------------------------
+# κλήρωση αγωνίσματος
+# -----------------------------
+def _starters(competition_class: CompetitionClass) -> list[Starter]:
+    entries = list(
+        Entry.objects.filter(competition_class=competition_class, status__in=STARTING_STATUSES)
+        .order_by()
+        .values_list("pk", "athlete_id", "horse_id", "club_id")
+    )
+    strength = {}
+    if competition_class.draw_method != CompetitionClass.DrawMethod.RANDOM and entries:
+        # κατάταξη = έπαθλα του ζευγαριού στη σεζόν μέχρι την ημέρα του αγωνίσματος
+        rows = (
+            Result.objects.filter(
+                is_official=True,
+                entry__athlete_id__in={a for _, a, _, _ in entries},
+                entry__competition_class__date__year=competition_class.date.year,
+                entry__competition_class__date__lt=competition_class.date,
+            )
+            .order_by()
+            .values_list("entry__athlete_id", "entry__horse_id")
+            .annotate(total=Sum("prize_money"))
+        )
+        strength = {(a, h): float(total or 0) for a, h, total in rows}
+    return [
+        Starter(entry_id=pk, rider_id=a, horse_id=h, club_id=c, strength=strength.get((a, h), 0))
+        for pk, a, h, c in entries
+    ]
+
+
+def draw_class(competition_class: CompetitionClass, seed: int | None = None) -> DrawResult:
+    """
+    Κληρώνει (ή ξανακληρώνει με το ίδιο seed) και αποθηκεύει Entry.start_order.
+    seed=None -> νέο τυχαίο seed.
+    """
+    if seed is None:
+        seed = secrets.randbits(48)
+    with transaction.atomic():
+        cc = CompetitionClass.objects.select_for_update().get(pk=competition_class.pk)
+        starters = _starters(cc)
+        if not starters:
+            raise StartListError("Δεν υπάρχουν εγκεκριμένες συμμετοχές στο αγώνισμα.")
+        result = solve(
+            starters,
+            DrawRules(method=cc.draw_method, min_rider_gap=cc.min_rider_gap, club_rule=cc.club_rule),
+            seed,
+        )
+
+        Entry.objects.filter(competition_class=cc).exclude(status__in=STARTING_STATUSES).update(start_order=None)
+        Entry.objects.bulk_update(
+            [Entry(pk=s.entry_id, start_order=n) for n, s in enumerate(result.order, start=1)],
+            ["start_order"],
+            batch_size=500,
+        )
+        cc.draw_seed = seed
+        cc.drawn_at = timezone.now()
+        cc.save(update_fields=["draw_seed", "drawn_at"])
+
+    competition_class.draw_seed, competition_class.drawn_at = cc.draw_seed, cc.drawn_at
+    return result
+
+
+# -----------------------------
+# εξαγωγή
+# -----------------------------
+HEADERS = ["Α/Α", "Αναβάτης", "ΑΜ Αθλητή", "Ίππος", "ΑΜ Ίππου", "Όμιλος"]
+
+
+def start_list_rows(competition_class: CompetitionClass) -> list[list]:
+    entries = (
+        Entry.objects.filter(competition_class=competition_class, start_order__isnull=False)
+        .select_related("athlete", "horse", "club")
+        .order_by("start_order")
+    )
+    return [
+        [
+            e.start_order,
+            f"{e.athlete.last_name} {e.athlete.first_name}".strip(),
+            e.athlete.eoi_registry_number or "",
+            e.horse.name,
+            e.horse.registry_number,
+            e.club.name if e.club else "",
+        ]
+        for e in entries
+    ]
+
+
+def _title(competition_class: CompetitionClass) -> str:
+    return f"{competition_class} ({competition_class.date:%d/%m/%Y})"
+
+
+def export_xlsx(competition_class: CompetitionClass) -> bytes:
+    if openpyxl is None:
+        raise StartListError("Το openpyxl δεν είναι εγκατεστημένο. Τρέξε: py -m pip install openpyxl")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Σειρά εκκίνησης"
+    ws.append([_title(competition_class)])
+    ws["A1"].font = Font(bold=True, size=13)
+    ws.append([f"Κλήρωση: {competition_class.get_draw_method_display()}, seed {competition_class.draw_seed}"])
+    ws.append([])
+    ws.append(HEADERS)
+    for cell in ws[4]:
+        cell.font = Font(bold=True)
+    for row in start_list_rows(competition_class):
+        ws.append(row)
+    for col, width in zip("ABCDEF", (6, 32, 14, 24, 14, 32)):
+        ws.column_dimensions[col].width = width
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def _pdf_font() -> str:
+    if "EOI" in pdfmetrics.getRegisteredFontNames():
+        return "EOI"
+    configured = getattr(settings, "EOI_PDF_FONT_PATH", None)
+    for path in ([configured] if configured else []) + PDF_FONT_CANDIDATES:
+        if Path(path).exists():
+            pdfmetrics.registerFont(TTFont("EOI", str(path)))
+            return "EOI"
+    return "Helvetica"
+
+
+def export_pdf(competition_class: CompetitionClass) -> bytes:
+    if canvas is None:
+        raise StartListError("Το reportlab δεν είναι εγκατεστημένο. Τρέξε: py -m pip install reportlab")
+    font = _pdf_font()
+    buf = io.BytesIO()
+    pdf = canvas.Canvas(buf, pagesize=A4)
+    width, height = A4
+    columns = (15 * mm, 28 * mm, 85 * mm, 145 * mm)
+    rows = start_list_rows(competition_class)
+
+    def header(y):
+        pdf.setFont(font, 12)
+        pdf.drawString(15 * mm, y, _title(competition_class))
+        pdf.setFont(font, 9)
+        y -= 10 * mm
+        for x, text in zip(columns, (HEADERS[0], HEADERS[1], HEADERS[3], HEADERS[5])):
+            pdf.drawString(x, y, text)
+        pdf.setFont(font, 9)
+        return y - 6 * mm
+
+    y = header(height - 20 * mm)
+    for order, rider, _, horse, _, club in rows:
+        if y < 20 * mm:
+            pdf.showPage()
+            y = header(height - 20 * mm)
+        for x, text in zip(columns, (str(order), rider, horse, club)):
+            pdf.drawString(x, y, text[:40])
+        y -= 6 * mm
+    pdf.save()
+    return buf.getvalue()
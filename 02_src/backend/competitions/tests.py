@@ -1,3 +1,314 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.contrib import admin
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import User
+from audit.recorder import update as audit_update
+from registry.models import Athlete, Horse
+
+from .dressage import recalculate, submit_sheet
+from .eligibility import ATHLETE_ACTIVE, LICENSE, MEDICAL, EligibilityRequest, check_eligibility
+from .entries import EntrySubmissionError, submit_entries
+from .models import (
+    CompetitionClass, DressageMovement, DressageTest, Entry, HorseSeasonStats, Partnership, Result, ScoringEvent,
+)
+from .partnerships import rebuild_all, refresh_pairs, riders_of, usual_horses
+from .scoring import freeze_class, record_event, reopen_class
+from .startlists import DrawRules, Starter, solve
+
+
+class SubmitEntriesValidationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=20, horses=10, competitions=1, clubs=2, stdout=StringIO())
+        cls.competition_class = CompetitionClass.objects.first()
+        cls.athlete = Athlete.objects.first()
+        cls.horse = Horse.objects.first()
+
+    def test_malformed_items_are_reported_by_index(self):
+        pairs = [
+            "not a dict",
+            {"athlete": [1], "horse": self.horse.pk},
+            {"athlete": self.athlete.pk, "horse": {"pk": 1}},
+            {"athlete": True, "horse": self.horse.pk},
+            {"athlete": "ΔΕΝ-ΥΠΑΡΧΕΙ", "horse": self.horse.pk},
+        ]
+        with self.assertRaises(EntrySubmissionError) as ctx:
+            submit_entries(self.competition_class, pairs)
+        self.assertEqual([e["index"] for e in ctx.exception.errors], [0, 1, 2, 3, 4])
+
+
+class EligibilityCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=20, horses=10, competitions=1, clubs=2, stdout=StringIO())
+        cls.athlete = Athlete.objects.filter(is_active=True).first()
+        cls.horse = Horse.objects.first()
+
+    def setUp(self):
+        cache.clear()
+
+    def _active(self) -> bool:
+        request = EligibilityRequest(self.athlete.pk, self.horse.pk, on_date=timezone.localdate())
+        return check_eligibility([request])[0].rules[ATHLETE_ACTIVE]
+
+    def test_bulk_deactivation_invalidates_cached_result(self):
+        self.assertTrue(self._active())  # στο cache
+        with self.captureOnCommitCallbacks(execute=True):
+            audit_update(Athlete.objects.filter(pk=self.athlete.pk), is_active=False)
+        self.assertFalse(self._active())
+
+    def test_invalidation_waits_for_commit(self):
+        self.assertTrue(self._active())
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            audit_update(Athlete.objects.filter(pk=self.athlete.pk), is_active=False)
+            # πριν το commit η έκδοση δεν έχει αλλάξει
+            self.assertTrue(self._active())
+        self.assertTrue(callbacks)
+
+    def test_on_date_defaults_to_today(self):
+        result = check_eligibility([EligibilityRequest(self.athlete.pk, self.horse.pk)])[0]
+        self.assertEqual(result.on_date, timezone.localdate())
+
+    def test_reasons_follow_registry_periods(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for certificate in self.athlete.medical_certificates.all():
+                certificate.delete()
+        rules = check_eligibility([EligibilityRequest(self.athlete.pk, self.horse.pk)])[0].rules
+        # χωρίς διάστημα συμμετοχής: ανάλυση ανά προϋπόθεση με τους κανόνες του registry
+        self.assertFalse(rules[MEDICAL])
+        license_date = self.athlete.athlete_license_date
+        self.assertEqual(rules[LICENSE], license_date is not None and license_date <= timezone.localdate())
+
+
+class DressageEliminationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=30, horses=15, competitions=2, clubs=2, stdout=StringIO())
+        cls.program = DressageTest.objects.create(code="T1", name="Test", errors_to_eliminate=2)
+        DressageMovement.objects.bulk_create([
+            DressageMovement(test=cls.program, number=1, label="A", coefficient=1),
+            DressageMovement(test=cls.program, number=2, label="B", coefficient=1, is_collective=True),
+        ])
+        template = CompetitionClass.objects.first()
+        cls.competition_class = CompetitionClass.objects.create(
+            competition=template.competition, number=99, name="Dressage T1", date=template.date,
+            discipline=CompetitionClass.Discipline.DRESSAGE, dressage_program=cls.program,
+        )
+        Entry.objects.create(
+            competition_class=cls.competition_class, athlete=Athlete.objects.first(), horse=Horse.objects.first()
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.competition_class.refresh_from_db()
+        self.entry = self.competition_class.entries.first()
+
+    def _result(self) -> Result:
+        return Result.objects.get(entry=self.entry)
+
+    def test_corrected_sheet_lifts_elimination(self):
+        submit_sheet(self.entry, "C", [7, 7], errors=2)
+        self.assertEqual(self._result().status, Result.Status.ELIMINATED)
+
+        submit_sheet(self.entry, "C", [7, 7], errors=0)
+        result = self._result()
+        self.assertEqual(result.status, Result.Status.OK)
+        self.assertEqual(result.rank, 1)
+
+    def test_recalculate_applies_changed_threshold(self):
+        submit_sheet(self.entry, "C", [7, 7], errors=1)
+        self.assertEqual(self._result().status, Result.Status.OK)
+
+        DressageTest.objects.filter(pk=self.program.pk).update(errors_to_eliminate=1)
+        recalculate(CompetitionClass.objects.filter(pk=self.competition_class.pk))
+        self.assertEqual(self._result().status, Result.Status.ELIMINATED)
+
+        DressageTest.objects.filter(pk=self.program.pk).update(errors_to_eliminate=3)
+        recalculate(CompetitionClass.objects.filter(pk=self.competition_class.pk))
+        self.assertEqual(self._result().status, Result.Status.OK)
+
+
+class RefreezeHistoryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=10, horses=5, competitions=1, clubs=1, stdout=StringIO())
+        template = CompetitionClass.objects.first()
+        cls.competition_class = CompetitionClass.objects.create(
+            competition=template.competition, number=99, name="SJ 100", date=template.date,
+            discipline=CompetitionClass.Discipline.SHOW_JUMPING,
+        )
+        cls.old_horse, cls.new_horse = Horse.objects.all()[:2]
+        cls.entry = Entry.objects.create(
+            competition_class=cls.competition_class, athlete=Athlete.objects.first(), horse=cls.old_horse
+        )
+
+    def _starts(self, horse) -> int:
+        stats = HorseSeasonStats.objects.filter(horse=horse, season=self.competition_class.date.year).first()
+        return stats.starts if stats else 0
+
+    def test_corrected_horse_refreshes_old_stats(self):
+        cache.clear()
+        old_starts, new_starts = self._starts(self.old_horse), self._starts(self.new_horse)
+        record_event(self.entry, ScoringEvent.Kind.JUMPING_ROUND, round_no=1, faults=0, time_seconds=60)
+        with self.captureOnCommitCallbacks(execute=True):
+            freeze_class(self.competition_class)
+        self.assertEqual(self._starts(self.old_horse), old_starts + 1)
+
+        reopen_class(self.competition_class)
+        Entry.objects.filter(pk=self.entry.pk).update(horse=self.new_horse)
+        with self.captureOnCommitCallbacks(execute=True):
+            freeze_class(self.competition_class)
+        self.assertEqual(self._starts(self.old_horse), old_starts)
+        self.assertEqual(self._starts(self.new_horse), new_starts + 1)
+
+
+class ResultProtectionTests(TestCase):
+    """Result μόνο από ScoringEvent: admin, API και διαγραφή συμμετοχής."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=10, horses=5, competitions=1, clubs=1, stdout=StringIO())
+        template = CompetitionClass.objects.first()
+        cls.competition_class = CompetitionClass.objects.create(
+            competition=template.competition, number=99, name="SJ 100", date=template.date,
+            discipline=CompetitionClass.Discipline.SHOW_JUMPING,
+        )
+        athlete, other = Athlete.objects.all()[:2]
+        cls.entry = Entry.objects.create(competition_class=cls.competition_class, athlete=athlete, horse=Horse.objects.first())
+        cls.other = Entry.objects.create(competition_class=cls.competition_class, athlete=other, horse=Horse.objects.last())
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "pw", login_code="admin")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_frozen_result_is_read_only(self):
+        record_event(self.entry, ScoringEvent.Kind.JUMPING_ROUND, round_no=1, faults=0, time_seconds=60)
+        result = Result.objects.get(entry=self.entry)
+        model_admin = admin.site._registry[Result]
+        request = RequestFactory().get("/")
+        request.user = self.user
+        self.assertFalse(model_admin.has_add_permission(request))
+        self.assertNotIn("prize_money", model_admin.get_readonly_fields(request, result))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            freeze_class(self.competition_class)
+        result = Result.objects.select_related("entry__competition_class").get(pk=result.pk)
+        self.assertIn("prize_money", model_admin.get_readonly_fields(request, result))
+
+    def test_event_api_rejects_non_boolean_vet_passed(self):
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse("competitions:record_scoring_event", args=[self.competition_class.pk]),
+            {"entry": self.entry.pk, "kind": ScoringEvent.Kind.STATUS, "status": "RT", "vet_passed": "no"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ScoringEvent.objects.filter(entry=self.entry).exists())
+
+    def test_deleting_entry_bumps_standings_version(self):
+        version = CompetitionClass.objects.get(pk=self.competition_class.pk).standings_version
+        self.other.delete()
+        self.assertEqual(CompetitionClass.objects.get(pk=self.competition_class.pk).standings_version, version + 1)
+
+
+class StartListDrawTests(SimpleTestCase):
+    """Κανόνες ομίλων και αναπαραγωγιμότητα της κλήρωσης (competitions/startlists.py)."""
+
+    def setUp(self):
+        # 4 όμιλοι x 8 εκκινήσεις, δύο αναβάτες ανά όμιλο με δεύτερο ίππο
+        self.starters = [
+            Starter(entry_id=club * 8 + k + 1, rider_id=club * 100 + k % 6, horse_id=club * 8 + k + 1,
+                    club_id=club, strength=k % 3)
+            for club in range(4) for k in range(8)
+        ]
+
+    def _clubs(self, result) -> list[int]:
+        return [s.club_id for s in result.order]
+
+    def test_spread_avoids_consecutive_clubs(self):
+        for method in CompetitionClass.DrawMethod.values:
+            rules = DrawRules(method=method, min_rider_gap=3, club_rule=CompetitionClass.ClubRule.SPREAD)
+            result = solve(self.starters, rules, seed=11)
+            clubs = self._clubs(result)
+            self.assertFalse([p for p in range(len(clubs) - 1) if clubs[p] == clubs[p + 1]], method)
+            self.assertEqual(result.rider_gap_violations, 0)
+
+    def test_group_keeps_each_club_together(self):
+        for method in CompetitionClass.DrawMethod.values:
+            for seed in range(5):
+                rules = DrawRules(method=method, min_rider_gap=3, club_rule=CompetitionClass.ClubRule.GROUP)
+                result = solve(self.starters, rules, seed=seed)
+                clubs = self._clubs(result)
+                blocks = [c for p, c in enumerate(clubs) if p == 0 or c != clubs[p - 1]]
+                self.assertEqual(len(blocks), 4, (method, seed))
+                self.assertEqual((result.club_violations, result.rider_gap_violations), (0, 0))
+                self.assertEqual(result.warnings, [])
+
+    def test_group_reports_split_clubs(self):
+        # ο αναβάτης 1 δεν χωράει με απόσταση 3 σε μπλοκ τριών: η απόσταση προηγείται, με προειδοποίηση
+        starters = [Starter(1, 1, 1, 1), Starter(2, 1, 2, 1), Starter(3, 2, 3, 1)] + [
+            Starter(k, k, k, 2) for k in range(4, 8)
+        ]
+        result = solve(starters, DrawRules(min_rider_gap=3, club_rule=CompetitionClass.ClubRule.GROUP), seed=1)
+        self.assertEqual(result.rider_gap_violations, 0)
+        self.assertGreater(result.club_violations, 0)
+        self.assertTrue(result.warnings)
+
+    def test_same_seed_same_order(self):
+        rules = DrawRules(min_rider_gap=3, club_rule=CompetitionClass.ClubRule.SPREAD)
+        first = solve(self.starters, rules, seed=42)
+        again = solve(list(reversed(self.starters)), rules, seed=42)
+        other = solve(self.starters, rules, seed=43)
+        self.assertEqual([s.entry_id for s in first.order], [s.entry_id for s in again.order])
+        self.assertNotEqual([s.entry_id for s in first.order], [s.entry_id for s in other.order])
+
+
+class PartnershipTests(TestCase):
+    """Ζεύγη αθλητή / ίππου από τις δηλώσεις και τα αποτελέσματα (competitions/partnerships.py)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=20, horses=10, competitions=2, clubs=2, stdout=StringIO())
+        cls.competition_class = CompetitionClass.objects.first()
+        cls.athlete = Athlete.objects.create(last_name="Partner")
+        cls.horse = Horse.objects.create(registry_number="GR-P-1", name="First")
+        cls.other = Horse.objects.create(registry_number="GR-P-2", name="Second")
+
+    def _rows(self) -> set[tuple]:
+        return set(Partnership.objects.values_list("athlete_id", "horse_id", "entries", "starts", "wins", "best_rank"))
+
+    def test_refresh_matches_rebuild(self):
+        rebuild_all()
+        expected = self._rows()
+        self.assertTrue(expected)
+        pairs = {(a, h) for a, h, *_ in expected}
+        Partnership.objects.all().delete()
+        self.assertEqual(refresh_pairs(pairs), len(pairs))
+        self.assertEqual(self._rows(), expected)
+
+    def test_entry_changes_follow_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            entry = Entry.objects.create(
+                competition_class=self.competition_class, athlete=self.athlete, horse=self.horse
+            )
+        (suggestion,) = usual_horses(self.athlete.pk)
+        self.assertEqual((suggestion["horse_id"], suggestion["entries"]), (self.horse.pk, 1))
+        self.assertEqual(suggestion["last_entry_date"], self.competition_class.date)
+        self.assertEqual([r["athlete_id"] for r in riders_of(self.horse.pk)], [self.athlete.pk])
+
+        # άλλος ίππος στην ίδια δήλωση: το παλιό ζευγάρι φεύγει
+        with self.captureOnCommitCallbacks(execute=True):
+            entry.horse = self.other
+            entry.save()
+        self.assertEqual([h["horse_id"] for h in usual_horses(self.athlete.pk)], [self.other.pk])
+        self.assertEqual(riders_of(self.horse.pk), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            entry.delete()
+        self.assertFalse(Partnership.objects.filter(athlete=self.athlete).exists())
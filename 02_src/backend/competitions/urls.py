@@ -0,0 +1,18 @@
+from django.urls import path, re_path
+
+from . import views
+
+app_name = "competitions"
+
+urlpatterns = [
+    path("classes/<int:class_id>/entries/bulk/", views.bulk_submit_entries, name="bulk_submit_entries"),
+    path("classes/<int:class_id>/events/", views.record_scoring_event, name="record_scoring_event"),
+    path("classes/<int:class_id>/sheets/", views.submit_dressage_sheet, name="submit_dressage_sheet"),
+    path("classes/<int:class_id>/standings/", views.class_standings, name="class_standings"),
+    path("classes/<int:class_id>/live/", views.live_standings, name="live_standings"),
+    re_path(
+        r"^classes/(?P<class_id>\d+)/startlist\.(?P<fmt>xlsx|pdf)$",
+        views.start_list_export,
+        name="start_list_export",
+    ),
+]
@@ -1,3 +1,260 @@
-from django.shortcuts import render
+import json
+from decimal import Decimal, InvalidOperation
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import require_GET, require_POST
+
+from accounts.scoping import get_scope
+
+from .dressage import submit_sheet
+from .entries import EntrySubmissionError, submit_entries
+from .live import get_snapshot, standings_rows, stream_standings
+from .models import CompetitionClass, Entry, ScoringEvent
+from .scoring import ScoringError, record_event
+from .startlists import StartListError, export_pdf, export_xlsx
+
+MAX_BULK_ENTRIES = 500
+
+
+@require_POST
+def bulk_submit_entries(request, class_id):
+    """
+    POST /api/competitions/classes/<id>/entries/bulk/
+    {"entries": [{"athlete": <pk ή ΑΜ>, "horse": <pk ή ΑΜ ίππου>}, ...]}
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("competitions.add_entry"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα δήλωσης συμμετοχών"}, status=403)
+
+    competition_class = get_object_or_404(
+        CompetitionClass.objects.select_related("competition"), pk=class_id
+    )
+    if not competition_class.competition.entries_are_open():
+        return JsonResponse({"error": "Οι δηλώσεις δεν είναι ανοιχτές"}, status=409)
+
+    try:
+        payload = json.loads(request.body or b"{}")
+        pairs = payload["entries"]
+        if not isinstance(pairs, list):
+            raise TypeError
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({"error": "Αναμένεται JSON {\"entries\": [...]}"}, status=400)
+    if len(pairs) > MAX_BULK_ENTRIES:
+        return JsonResponse({"error": f"Έως {MAX_BULK_ENTRIES} δηλώσεις ανά αίτημα"}, status=400)
+
+    try:
+        result = submit_entries(competition_class, pairs, user=request.user, scope=get_scope(request))
+    except EntrySubmissionError as e:
+        return JsonResponse({"errors": e.errors}, status=400)
+
+    return JsonResponse(
+        {
+            "created": [
+                {"id": e.pk, "athlete": e.athlete_id, "horse": e.horse_id, "status": e.status}
+                for e in result.created
+            ],
+            "duplicates": result.duplicates,
+        },
+        status=201,
+    )
+
+
+EXPORTS = {
+    "xlsx": (export_xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "pdf": (export_pdf, "application/pdf"),
+}
+
+
+@require_GET
+def start_list_export(request, class_id, fmt):
+    """GET /api/competitions/classes/<id>/startlist.<xlsx|pdf>"""
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("competitions.view_entry"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής συμμετοχών"}, status=403)
+
+    competition_class = get_object_or_404(CompetitionClass.objects.select_related("competition"), pk=class_id)
+    if competition_class.drawn_at is None:
+        return JsonResponse({"error": "Δεν έχει γίνει κλήρωση"}, status=409)
+
+    export, content_type = EXPORTS[fmt]
+    try:
+        data = export(competition_class)
+    except StartListError as e:
+        return JsonResponse({"error": str(e)}, status=501)
+
+    response = HttpResponse(data, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="startlist_{competition_class.pk}.{fmt}"'
+    return response
+
+
+# -----------------------------
+# Live αποτελέσματα
+# -----------------------------
+def _decimal(value):
+    return None if value in (None, "") else Decimal(str(value))
+
+
+def _bool(value):
+    if value is None or isinstance(value, bool):
+        return value
+    raise ValueError(value)
+
+
+@require_POST
+def record_scoring_event(request, class_id):
+    """
+    POST /api/competitions/classes/<id>/events/
+    {"entry": 12, "kind": "SJ_ROUND", "round": 1, "faults": 4, "time": 71.32}
+    {"entry": 12, "kind": "DR_MARK", "judge": "C", "score": 68.5}
+    {"entry": 12, "kind": "EN_CHECK", "round": 2, "time": 7412, "vet_passed": true}
+    {"entry": 12, "kind": "STATUS", "status": "RT"}
+    Διόρθωση: ίδιο σώμα + "supersedes": <id event>.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("competitions.add_scoringevent"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα καταχώρησης αποτελεσμάτων"}, status=403)
+
+    try:
+        payload = json.loads(request.body or b"{}")
+        entry = Entry.objects.get(pk=int(payload["entry"]), competition_class_id=class_id)
+        supersedes = None
+        if payload.get("supersedes"):
+            supersedes = ScoringEvent.objects.get(pk=int(payload["supersedes"]))
+        values = {
+            "round_no": int(payload["round"]) if payload.get("round") is not None else None,
+            "judge": str(payload.get("judge") or ""),
+            "faults": _decimal(payload.get("faults")),
+            "time_seconds": _decimal(payload.get("time")),
+            "score": _decimal(payload.get("score")),
+            "vet_passed": _bool(payload.get("vet_passed")),
+            "status": str(payload.get("status") or ""),
+        }
+        kind = payload["kind"]
+    except (ValueError, KeyError, TypeError, InvalidOperation):
+        return JsonResponse({"error": "Μη έγκυρο σώμα αιτήματος"}, status=400)
+    except (Entry.DoesNotExist, ScoringEvent.DoesNotExist):
+        return JsonResponse({"error": "Δεν βρέθηκε η συμμετοχή / το συμβάν στο αγώνισμα"}, status=404)
+
+    try:
+        outcome = record_event(entry, kind, user=request.user, supersedes=supersedes, **values)
+    except ScoringError as e:
+        return JsonResponse({"error": str(e)}, status=409)
+
+    result = outcome.result
+    return JsonResponse(
+        {
+            "event": outcome.event.pk,
+            "version": outcome.version,
+            "result": {
+                "entry": entry.pk,
+                "status": result.status,
+                "rank": result.rank,
+                "faults": result.faults,
+                "time": result.time_seconds,
+                "score": result.score,
+            },
+            "changes": [{"entry": c.entry_id, "from": c.old_rank, "to": c.new_rank} for c in outcome.changes],
+        },
+        status=201,
+    )
+
+
+@require_POST
+def submit_dressage_sheet(request, class_id):
+    """
+    POST /api/competitions/classes/<id>/sheets/
+    {"entry": 12, "judge": "C", "marks": [7, 7.5, 6.5, ...], "errors": 0}
+    Ξανά για την ίδια συμμετοχή / κριτή = διόρθωση του φύλλου.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("competitions.add_dressagesheet"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα καταχώρησης βαθμολογίας"}, status=403)
+
+    try:
+        payload = json.loads(request.body or b"{}")
+        entry = Entry.objects.select_related("competition_class").get(
+            pk=int(payload["entry"]), competition_class_id=class_id
+        )
+        marks = payload["marks"]
+        if not isinstance(marks, list):
+            raise TypeError
+        errors = int(payload.get("errors") or 0)
+        if errors < 0:
+            raise ValueError
+        judge = str(payload["judge"])
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({"error": "Μη έγκυρο σώμα αιτήματος"}, status=400)
+    except Entry.DoesNotExist:
+        return JsonResponse({"error": "Δεν βρέθηκε η συμμετοχή στο αγώνισμα"}, status=404)
+
+    try:
+        outcome = submit_sheet(entry, judge, marks, errors, user=request.user)
+    except ScoringError as e:
+        return JsonResponse({"error": str(e)}, status=409)
+
+    result = outcome.result
+    return JsonResponse(
+        {
+            "version": outcome.version,
+            "result": {
+                "entry": entry.pk,
+                "status": result.status,
+                "rank": result.rank,
+                "score": result.score,
+                "tiebreak": result.tiebreak,
+                "judges": result.stages_completed,
+            },
+            "changes": [{"entry": c.entry_id, "from": c.old_rank, "to": c.new_rank} for c in outcome.changes],
+        },
+        status=201,
+    )
+
+
+@require_GET
+def class_standings(request, class_id):
+    """GET /api/competitions/classes/<id>/standings/"""
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("competitions.view_result"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής αποτελεσμάτων"}, status=403)
+
+    competition_class = get_object_or_404(CompetitionClass, pk=class_id)
+    return JsonResponse({
+        "class": competition_class.pk,
+        "version": competition_class.standings_version,
+        "official": competition_class.results_frozen_at is not None,
+        "standings": standings_rows(competition_class.pk),
+    })
+
+
+@require_GET
+async def live_standings(request, class_id):
+    """
+    GET /api/competitions/classes/<id>/live/   (text/event-stream, δημόσιο)
+
+    event "snapshot": ολόκληρος ο πίνακας, event "diff": μόνο οι γραμμές που
+    άλλαξαν. Το id κάθε event είναι η έκδοση της κατάταξης, οπότε ο browser
+    στέλνει Last-Event-ID στην επανασύνδεση και δεν ξαναπαίρνει snapshot αν
+    δεν άλλαξε τίποτα. Χρειάζεται ASGI server (config/asgi.py).
+    """
+    snapshot = await sync_to_async(get_snapshot)(class_id)
+    if snapshot is None:
+        raise Http404
+    try:
+        last_event_id = int(request.headers.get("Last-Event-ID", ""))
+    except ValueError:
+        last_event_id = None
+
+    response = StreamingHttpResponse(
+        stream_standings(class_id, snapshot, last_event_id), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    # nginx: όχι buffering, αλλιώς τα events φτάνουν όλα μαζί
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -5,6 +5,15 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+Τα live streams (π.χ. /api/competitions/classes/<id>/live/, Server-Sent
+Events) θέλουν ASGI server για να μη δεσμεύουν ένα thread ανά θεατή:
+
+    uvicorn config.asgi:application --workers 1
+
+Με 1 worker όλοι οι θεατές ενός αγωνίσματος τροφοδοτούνται από τον ίδιο
+in-process broker (competitions/live.py). Με περισσότερους workers χρειάζεται
+κοινό cache (π.χ. Redis) ώστε να συγχρονίζονται μέσω του snapshot.
 """
 
 import os
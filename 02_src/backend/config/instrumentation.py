@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("eoi.perf")
+slow_logger = logging.getLogger("eoi.perf.slow")
+
+
+# -------------------------------------------------------------------
+# SQL fingerprints
+# -------------------------------------------------------------------
+_RE_STRING = re.compile(r"'(?:[^']|'')*'")
+_RE_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_RE_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?|\d+)\s*,?)+\)", re.IGNORECASE)
+_RE_SPACES = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Αφαιρεί literals / λίστες IN ώστε ίδια queries με άλλες τιμές
+    να έχουν το ίδιο αποτύπωμα (έτσι φαίνονται τα N+1).
+    """
+    s = _RE_STRING.sub("?", sql)
+    s = _RE_NUMBER.sub("?", s)
+    s = _RE_IN_LIST.sub("IN (...)", s)
+    return _RE_SPACES.sub(" ", s).strip()
+
+
+def fingerprint(sql: str) -> str:
+    return hashlib.sha1(normalize_sql(sql).encode("utf-8")).hexdigest()[:12]
+
+
+# -------------------------------------------------------------------
+# Recorder
+# -------------------------------------------------------------------
+@dataclass
+class QueryRecord:
+    sql: str
+    duration_ms: float
+    fingerprint: str
+
+
+@dataclass
+class RequestMetrics:
+    queries: list[QueryRecord] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+    total_ms: float = 0.0
+
+    @property
+    def sql_count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def sql_ms(self) -> float:
+        return sum(q.duration_ms for q in self.queries)
+
+    def duplicates(self) -> dict[str, int]:
+        """fingerprint -> πλήθος, μόνο για όσα εκτελέστηκαν > 1 φορά."""
+        counts = Counter(q.fingerprint for q in self.queries)
+        return {fp: n for fp, n in counts.most_common() if n > 1}
+
+    def sample_for(self, fp: str) -> str:
+        for q in self.queries:
+            if q.fingerprint == fp:
+                return q.sql
+        return ""
+
+    def finish(self) -> None:
+        self.total_ms = (time.perf_counter() - self.started) * 1000
+
+    def as_dict(self) -> dict:
+        return {
+            "sql_count": self.sql_count,
+            "sql_ms": round(self.sql_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+            "duplicates": self.duplicates(),
+        }
+
+
+class _QueryCollector:
+    """execute_wrapper που γράφει κάθε query στο RequestMetrics."""
+
+    def __init__(self, metrics: RequestMetrics):
+        self.metrics = metrics
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.metrics.queries.append(
+                QueryRecord(
+                    sql=sql,
+                    duration_ms=(time.perf_counter() - start) * 1000,
+                    fingerprint=fingerprint(sql),
+                )
+            )
+
+
+@contextmanager
+def record_queries():
+    """
+    Καταγράφει όλα τα queries (σε όλες τις συνδέσεις) μέσα στο block.
+
+        with record_queries() as m:
+            ...
+        m.sql_count, m.sql_ms, m.duplicates()
+    """
+    metrics = RequestMetrics()
+    collector = _QueryCollector(metrics)
+    with ExitStack() as stack:
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(collector))
+        try:
+            yield metrics
+        finally:
+            metrics.finish()
+
+
+# -------------------------------------------------------------------
+# Budgets
+# -------------------------------------------------------------------
+def get_budget(view_name: str | None) -> dict | None:
+    """
+    settings.PERF_BUDGETS = {"admin:registry_athlete_changelist": {"queries": 10, "total_ms": 500}}
+    Τα κλειδιά είναι URL names και δέχονται wildcards (fnmatch).
+    """
+    if not view_name:
+        return None
+    budgets = getattr(settings, "PERF_BUDGETS", {}) or {}
+    if view_name in budgets:
+        return budgets[view_name]
+    for pattern, budget in budgets.items():
+        if fnmatchcase(view_name, pattern):
+            return budget
+    return None
+
+
+def budget_violations(metrics: RequestMetrics, budget: dict | None) -> list[str]:
+    if not budget:
+        return []
+    out = []
+    if "queries" in budget and metrics.sql_count > budget["queries"]:
+        out.append(f"queries {metrics.sql_count} > {budget['queries']}")
+    if "sql_ms" in budget and metrics.sql_ms > budget["sql_ms"]:
+        out.append(f"sql_ms {metrics.sql_ms:.1f} > {budget['sql_ms']}")
+    if "total_ms" in budget and metrics.total_ms > budget["total_ms"]:
+        out.append(f"total_ms {metrics.total_ms:.1f} > {budget['total_ms']}")
+    return out
+
+
+# -------------------------------------------------------------------
+# Middleware
+# -------------------------------------------------------------------
+class QueryInstrumentationMiddleware:
+    """
+    Για κάθε request μετράει SQL count, SQL time, total time και διπλά queries.
+    - Server-Timing header (φαίνεται στο Network tab του browser)
+    - structured log (JSON, DEBUG) στον logger "eoi.perf"
+    - αργά requests / υπερβάσεις budget -> "eoi.perf.slow" με το SQL που φταίει
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "PERF_INSTRUMENTATION", True)
+        self.slow_ms = getattr(settings, "PERF_SLOW_REQUEST_MS", 500)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        with record_queries() as metrics:
+            response = self.get_response(request)
+
+        match = getattr(request, "resolver_match", None)
+        view_name = match.view_name if match else None
+        violations = budget_violations(metrics, get_budget(view_name))
+
+        response["Server-Timing"] = (
+            f'sql;dur={metrics.sql_ms:.1f};desc="{metrics.sql_count} queries", '
+            f"app;dur={max(metrics.total_ms - metrics.sql_ms, 0):.1f}, "
+            f"total;dur={metrics.total_ms:.1f}"
+        )
+        response.eoi_metrics = metrics
+
+        payload = {
+            "method": request.method,
+            "path": request.path,
+            "view": view_name,
+            "status": response.status_code,
+            **metrics.as_dict(),
+        }
+        if violations:
+            payload["budget_violations"] = violations
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(json.dumps(payload, ensure_ascii=False), extra={"perf": payload})
+
+        if violations or metrics.total_ms >= self.slow_ms:
+            self._log_slow(payload, metrics)
+
+        return response
+
+    def _log_slow(self, payload: dict, metrics: RequestMetrics) -> None:
+        slowest = sorted(metrics.queries, key=lambda q: q.duration_ms, reverse=True)[:5]
+        sample = {
+            **payload,
+            "slowest_sql": [
+                {"ms": round(q.duration_ms, 2), "sql": q.sql} for q in slowest
+            ],
+            "duplicate_sql": {
+                fp: {"count": n, "sql": metrics.sample_for(fp)}
+                for fp, n in list(metrics.duplicates().items())[:5]
+            },
+        }
+        slow_logger.warning(json.dumps(sample, ensure_ascii=False), extra={"perf": sample})
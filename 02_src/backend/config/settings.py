@@ -22,6 +22,10 @@ MEDICAL_CERT_TEMPLATE_PATH = (
     EOI_ROOT / "01_docs" / "02_forms_official" / "Ιατρική_Βεβαίωση_ΕΟΙ.docx"
 )
 
+# Γραμματοσειρά TTF με ελληνικά για τα PDF (λίστες εκκίνησης).
+# None = δοκιμάζει Arial (Windows) / DejaVuSans (Linux).
+EOI_PDF_FONT_PATH = None
+
 # -------------------------------------------------------------------
 # Security / Debug
 # -------------------------------------------------------------------
@@ -44,21 +48,63 @@ INSTALLED_APPS = [
     "accounts",
     "organizations",
     "registry",
+    "competitions",
+    "rankings",
+    "finance",
+    "audit",
 ]
 
 # -------------------------------------------------------------------
 # Middleware
 # -------------------------------------------------------------------
 MIDDLEWARE = [
+    # πρώτο, για να μετράει όλο το request (SQL count / χρόνοι / Server-Timing)
+    "config.instrumentation.QueryInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "audit.middleware.AuditMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# -------------------------------------------------------------------
+# Performance instrumentation (config/instrumentation.py)
+# -------------------------------------------------------------------
+PERF_INSTRUMENTATION = True
+PERF_SLOW_REQUEST_MS = 500
+
+# Budgets ανά URL name (δέχεται wildcards). Τα tests τα ελέγχουν με config.testing.
+PERF_BUDGETS = {
+    "admin:registry_athlete_changelist": {"queries": 10},
+    "admin:registry_horse_changelist": {"queries": 10},
+    "admin:registry_*_changelist": {"queries": 12},
+    "admin:registry_athlete_change": {"queries": 15},
+    "admin:autocomplete": {"queries": 5},
+    "competitions:bulk_submit_entries": {"queries": 15},
+    "registry:eligible_*": {"queries": 6},
+    "registry:*_history": {"queries": 6},
+    "registry:horse_pedigree": {"queries": 5},
+    "registry:athlete_horses": {"queries": 5},
+    "registry:horse_riders": {"queries": 5},
+    "registry:horse_descendants": {"queries": 5},
+    "registry:document_download": {"queries": 5},
+    "competitions:start_list_export": {"queries": 6},
+    "competitions:record_scoring_event": {"queries": 15},
+    "competitions:submit_dressage_sheet": {"queries": 25},
+    "competitions:class_standings": {"queries": 5},
+    "rankings:ranking_table": {"queries": 1},
+    "finance:club_balances": {"queries": 5},
+    "finance:renewal_progress": {"queries": 5},
+    "audit:object_history": {"queries": 5},
+    "audit:athlete_as_of": {"queries": 5},
+    "audit:club_roster_as_of": {"queries": 5},
+    # μόνο η σύνδεση (snapshot από cache ή 2 queries)· τα updates δεν ξαναδιαβάζουν τη βάση
+    "competitions:live_standings": {"queries": 2},
+}
+
 # -------------------------------------------------------------------
 # URLs / Templates
 # -------------------------------------------------------------------
@@ -92,6 +138,27 @@ DATABASES = {
     }
 }
 
+# -------------------------------------------------------------------
+# Cache (scoping / δικαιώματα). Σε production: κοινό cache (π.χ. Redis)
+# ώστε η ακύρωση να φτάνει σε όλους τους workers.
+# -------------------------------------------------------------------
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "eoi-default",
+        # default 300: δεν χωράει ούτε ένας αγώνας στο cache καταλληλότητας
+        "OPTIONS": {"MAX_ENTRIES": 50000},
+    }
+}
+
+# Πόσο κρατιέται ο έλεγχος καταλληλότητας (ανά αθλητή/ίππο και ημερομηνία).
+# Αλλαγές σε ιατρικές, άδειες, συνδρομές και έγγραφα ίππων το ακυρώνουν αμέσως.
+EOI_ELIGIBILITY_CACHE_TIMEOUT = 6 * 3600
+
+# Πόσο κρατιέται το scope χρήστη (ομίλοι/περιφέρειες) στο cache.
+# Αλλαγές σε Membership το ακυρώνουν αμέσως.
+EOI_SCOPE_CACHE_TIMEOUT = 300
+
 # -------------------------------------------------------------------
 # Password validation
 # -------------------------------------------------------------------
@@ -118,8 +185,44 @@ STATIC_URL = "/static/"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = EOI_ROOT / "media"
 
+# Έγγραφα / βεβαιώσεις: content-addressed στο MEDIA_ROOT/blobs (registry/storage.py)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "documents": {"BACKEND": "registry.storage.BlobStorage"},
+}
+
+# Λήψη εγγράφων (registry/downloads.py): μετά τον έλεγχο δικαιωμάτων το αρχείο το στέλνει ο web server.
+#   "nginx":  X-Accel-Redirect, π.χ. location /protected-media/ { internal; alias <MEDIA_ROOT>/; }
+#   "apache": X-Sendfile (mod_xsendfile, XSendFilePath <MEDIA_ROOT>)
+#   None:     από το Django (dev / χωρίς web server μπροστά)
+EOI_SENDFILE = None
+EOI_SENDFILE_URL = "/protected-media/"
+
 # -------------------------------------------------------------------
 # Default PK / Custom User
 # -------------------------------------------------------------------
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "accounts.User"
+
+# Δικαιώματα από ρόλους ΕΟΙ, με compiled/cached πίνακα (accounts/permissions.py)
+AUTHENTICATION_BACKENDS = ["accounts.backends.RoleBackend"]
+EOI_RBAC_CACHE_TIMEOUT = 3600
+
+# -------------------------------------------------------------------
+# Logging
+# -------------------------------------------------------------------
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        # ένα JSON ανά request (sql_count, sql_ms, total_ms, duplicates) σε DEBUG· κρυφό by default
+        # (αλλιώς γεμίζει το output του manage.py test), "level": "DEBUG" για να φαίνονται
+        "eoi.perf": {"handlers": ["console"], "level": "INFO", "propagate": False},
+        # αργά requests / υπερβάσεις budget μαζί με το SQL
+        "eoi.perf.slow": {"handlers": ["console"], "level": "WARNING", "propagate": False},
+    },
+}
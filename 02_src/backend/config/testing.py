@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from .instrumentation import budget_violations, get_budget, record_queries
+
+
+def _report(label: str, metrics, violations: list[str]) -> str:
+    lines = [f"Υπέρβαση budget για {label}: " + ", ".join(violations)]
+    for fp, n in metrics.duplicates().items():
+        lines.append(f"  x{n} [{fp}] {metrics.sample_for(fp)}")
+    return "\n".join(lines)
+
+
+@contextmanager
+def query_budget(view_name: str | None = None, **limits):
+    """
+    Test helper. Αποτυγχάνει (AssertionError) αν το block ξεπεράσει το budget.
+
+        with query_budget("admin:registry_athlete_changelist"):
+            self.client.get(url)
+
+        with query_budget(queries=3):
+            ...
+
+    Αν δοθεί view_name, το budget έρχεται από settings.PERF_BUDGETS
+    (τα **limits το συμπληρώνουν/υπερισχύουν).
+    """
+    budget = dict(get_budget(view_name) or {})
+    budget.update(limits)
+    if not budget:
+        raise AssertionError(f"Δεν υπάρχει budget για {view_name!r} στο PERF_BUDGETS")
+
+    with record_queries() as metrics:
+        yield metrics
+
+    violations = budget_violations(metrics, budget)
+    if violations:
+        raise AssertionError(_report(view_name or "block", metrics, violations))
+
+
+class QueryBudgetMixin:
+    """
+    Για TestCase: ελέγχει τα metrics που άφησε το QueryInstrumentationMiddleware
+    πάνω στο response.
+
+        response = self.client.get(url)
+        self.assertWithinBudget(response)
+    """
+
+    def assertWithinBudget(self, response, view_name: str | None = None, **limits):
+        metrics = getattr(response, "eoi_metrics", None)
+        if metrics is None:
+            self.fail("Το response δεν έχει metrics (λείπει το QueryInstrumentationMiddleware;)")
+
+        if view_name is None and response.resolver_match:
+            view_name = response.resolver_match.view_name
+
+        budget = dict(get_budget(view_name) or {})
+        budget.update(limits)
+        violations = budget_violations(metrics, budget)
+        if violations:
+            self.fail(_report(view_name or "response", metrics, violations))
+
+    def assertNoDuplicateQueries(self, response, allowed: int = 1):
+        metrics = response.eoi_metrics
+        dupes = {fp: n for fp, n in metrics.duplicates().items() if n > allowed}
+        if dupes:
+            self.fail(_report("response", metrics, [f"{len(dupes)} επαναλαμβανόμενα queries"]))
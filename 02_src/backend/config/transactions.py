@@ -0,0 +1,46 @@
+"""
+Ουρά κλειδιών προς ξαναϋπολογισμό στο commit (καταλληλότητα, γενεαλογία, ζεύγη).
+
+    pending = CommitQueue("eligibility", process)   # process(athletes=set(), horses=set())
+    pending.add(athletes=[...])
+
+Μέσα σε συναλλαγή τα κλειδιά μαζεύονται ανά σύνδεση και το process τρέχει μία φορά,
+στο πρώτο callback μετά το commit· τα υπόλοιπα βρίσκουν την ουρά άδεια. Κάθε add()
+γράφει δικό του callback (μόνο δημόσιο API: κανένας έλεγχος του connection.run_on_commit),
+οπότε ένα rollback ενός savepoint δεν αφήνει την ουρά χωρίς callback. Κλειδιά από
+συναλλαγή που έγινε rollback μένουν για το επόμενο commit: ο υπολογισμός ξαναδιαβάζει
+τη βάση, οπότε κοστίζουν μόνο χρόνο.
+Εκτός συναλλαγής: αμέσως.
+"""
+from __future__ import annotations
+
+from django.db import connection, transaction
+
+
+class CommitQueue:
+    def __init__(self, name: str, process):
+        self.attr = f"_eoi_commit_queue_{name}"
+        self.process = process
+
+    def _keys(self) -> dict[str, set]:
+        keys = getattr(connection, self.attr, None)
+        if keys is None:
+            keys = {}
+            setattr(connection, self.attr, keys)
+        return keys
+
+    def add(self, **keys) -> None:
+        pending = self._keys()
+        for kind, values in keys.items():
+            pending.setdefault(kind, set()).update(values)
+        if connection.in_atomic_block:
+            transaction.on_commit(self.flush)
+        else:
+            self.flush()
+
+    def flush(self) -> None:
+        keys = {kind: values for kind, values in self._keys().items() if values}
+        # άδειασμα πριν το process: ό,τι προγραμματιστεί μέσα του μπαίνει σε νέα ουρά
+        setattr(connection, self.attr, {})
+        if keys:
+            self.process(**keys)
@@ -1,12 +1,17 @@
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 from django.conf import settings
 from django.conf.urls.static import static
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("api/competitions/", include("competitions.urls")),
+    path("api/registry/", include("registry.urls")),
+    path("api/rankings/", include("rankings.urls")),
+    path("api/finance/", include("finance.urls")),
+    path("api/audit/", include("audit.urls")),
 ]
 
-# για να ανοίγουν τα uploaded αρχεία στο dev
+# για να ανοίγουν τα uploaded αρχεία στο dev (σε production μόνο μέσω registry/downloads.py)
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,326 @@
+from django import forms
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
+from django.utils.html import format_html, format_html_join
+
+from accounts.scoping import ScopedAdminMixin
+
+from .ledger import post, reverse, settle, validate_entry
+from . import bank
+from .models import AthleteBalance, BankStatement, BankStatementLine, ClubBalance, LedgerEntry, RenewalBatch
+from .renewals import preview, progress, start
+
+
+# -----------------------------
+# Actions
+# -----------------------------
+@admin.action(description="↩️ Αντιλογισμός")
+def reverse_entries(modeladmin, request, queryset):
+    done = 0
+    for entry in queryset.exclude(kind=LedgerEntry.Kind.REVERSAL).filter(reversed_by__isnull=True):
+        try:
+            reverse(entry, user=request.user)
+            done += 1
+        except ValidationError as e:
+            modeladmin.message_user(request, f"#{entry.pk}: {'; '.join(e.messages)}", messages.WARNING)
+    modeladmin.message_user(request, f"{done} αντιλογισμοί.", messages.SUCCESS)
+
+
+@admin.action(description="✅ Σήμανση ως εξοφλημένες")
+def settle_entries(modeladmin, request, queryset):
+    count = settle(queryset.filter(amount__gt=0).values_list("pk", flat=True))
+    modeladmin.message_user(request, f"{count} χρεώσεις εξοφλήθηκαν.", messages.SUCCESS)
+
+
+@admin.action(description="🔁 Νέα αυτόματη αντιστοίχιση")
+def rematch_lines(modeladmin, request, queryset):
+    if queryset.model is BankStatement:
+        queryset = BankStatementLine.objects.filter(statement__in=queryset)
+    try:
+        count = bank.rematch(queryset, user=request.user)
+    except ValidationError as e:
+        modeladmin.message_user(request, "; ".join(e.messages), messages.ERROR)
+        return
+    modeladmin.message_user(request, f"{count} κινήσεις αντιστοιχίστηκαν.", messages.SUCCESS)
+
+
+@admin.action(description="🚫 Αγνόηση (δεν αφορά χρεώσεις)")
+def ignore_lines(modeladmin, request, queryset):
+    count = bank.ignore(queryset)
+    modeladmin.message_user(request, f"{count} κινήσεις αγνοήθηκαν.", messages.SUCCESS)
+
+
+@admin.action(description="▶️ Εκτέλεση στο παρασκήνιο")
+def run_renewals(modeladmin, request, queryset):
+    started = sum(start(batch) for batch in queryset)
+    modeladmin.message_user(
+        request, f"{started} ανανεώσεις ξεκίνησαν (η πρόοδος φαίνεται στη λίστα).", messages.SUCCESS
+    )
+
+
+# -----------------------------
+# Καθολικό (append-only)
+# -----------------------------
+class LedgerEntryForm(forms.ModelForm):
+    class Meta:
+        model = LedgerEntry
+        fields = ("kind", "athlete", "club", "season", "date", "amount", "description", "reference", "entry", "subscription")
+
+    def clean(self):
+        data = super().clean()
+        if data.get("kind") and data.get("amount") is not None:
+            try:
+                validate_entry(LedgerEntry(
+                    kind=data["kind"], amount=data["amount"], athlete=data.get("athlete"), club=data.get("club"),
+                ))
+            except ValidationError as e:
+                raise forms.ValidationError(e.messages)
+        return data
+
+
+@admin.register(LedgerEntry)
+class LedgerEntryAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "date", "season", "kind", "athlete", "club", "amount", "status", "reference", "description", "posted_by")
+    list_filter = ("kind", "status", "season")
+    list_select_related = ("athlete", "club", "posted_by")
+    search_fields = ("reference", "description", "athlete__last_name_uc", "athlete__eoi_registry_number", "club__name")
+    ordering = ("-id",)
+    date_hierarchy = "date"
+    autocomplete_fields = ("athlete", "club", "entry", "subscription")
+    actions = (reverse_entries, settle_entries)
+    form = LedgerEntryForm
+
+    def has_change_permission(self, request, obj=None):
+        # ✅ μόνο καταχώρηση νέων· διορθώσεις με αντιλογισμό
+        return obj is None and super().has_change_permission(request, obj)
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        # ✅ καταχώρηση + υπόλοιπα στην ίδια συναλλαγή
+        (created,) = post([obj], user=request.user)
+        obj.pk = created.pk
+
+
+# -----------------------------
+# Υπόλοιπα (μόνο ανάγνωση)
+# -----------------------------
+class _BalanceAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    list_filter = ("season",)
+    ordering = ("-season", "-balance")
+
+    def has_add_permission(self, request):
+        # ✅ ενημερώνονται από το καθολικό (`manage.py reconcile_balances` για έλεγχο)
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(AthleteBalance)
+class AthleteBalanceAdmin(_BalanceAdmin):
+    scope_field = "athlete__club"
+
+    list_display = ("athlete", "season", "debit", "credit", "balance", "postings", "last_posted_at")
+    list_select_related = ("athlete",)
+    search_fields = ("athlete__last_name_uc", "athlete__eoi_registry_number")
+
+
+@admin.register(ClubBalance)
+class ClubBalanceAdmin(_BalanceAdmin):
+    list_display = ("club", "season", "debit", "credit", "balance", "postings", "last_posted_at")
+    list_select_related = ("club",)
+    search_fields = ("club__name", "club__code")
+
+
+# -----------------------------
+# Μαζική ανανέωση συνδρομών
+# -----------------------------
+@admin.register(RenewalBatch)
+class RenewalBatchAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    list_display = (
+        "id", "season", "club", "region", "amount", "paid", "status", "progress_display",
+        "created_subscriptions", "skipped", "total_amount", "created_by", "finished_at",
+    )
+    list_filter = ("status", "season", "paid")
+    list_select_related = ("club", "region", "created_by")
+    autocomplete_fields = ("club",)
+    ordering = ("-id",)
+    actions = (run_renewals,)
+    fields = ("season", "club", "region", "amount", "valid_from", "valid_until", "paid")
+    result_fields = (
+        "status", "progress_display", "preview_display", "total", "created_subscriptions", "skipped",
+        "total_amount", "error", "created_by", "created_at", "queued_at", "started_at", "finished_at",
+    )
+
+    def get_fields(self, request, obj=None):
+        return self.fields + (self.result_fields if obj else ())
+
+    def get_readonly_fields(self, request, obj=None):
+        # ✅ αφού ξεκινήσει, δεν αλλάζουν οι παράμετροι
+        if obj is not None and obj.status not in (RenewalBatch.Status.DRAFT, RenewalBatch.Status.FAILED):
+            return self.fields + self.result_fields
+        return self.result_fields
+
+    def has_delete_permission(self, request, obj=None):
+        return obj is None or obj.status == RenewalBatch.Status.DRAFT
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            obj.created_by = request.user
+        super().save_model(request, obj, form, change)
+
+    @admin.display(description="Πρόοδος")
+    def progress_display(self, obj):
+        data = progress(obj)
+        return f"{data['processed']}/{data['total']} ({data['percent']}%) {data['phase']}".strip()
+
+    @admin.display(description="Προεπισκόπηση")
+    def preview_display(self, obj):
+        if obj.status != RenewalBatch.Status.DRAFT:
+            return "-"
+        data = preview(obj)
+        rows = format_html_join(
+            "", "<tr><td>{}</td><td>{}</td><td>{}</td><td>{} €</td></tr>",
+            ((c["club"], c["athletes"], c["to_renew"], c["amount"]) for c in data["clubs"]),
+        )
+        return format_html(
+            "<p>{} αθλητές, {} για ανανέωση, {} έχουν ήδη συνδρομή, σύνολο {} €</p>"
+            "<table><tr><th>Όμιλος</th><th>Αθλητές</th><th>Ανανέωση</th><th>Ποσό</th></tr>{}</table>",
+            data["athletes"], data["to_renew"], data["already_subscribed"], data["total_amount"], rows,
+        )
+
+
+# -----------------------------
+# Τράπεζα: αντίγραφα κίνησης + ουρά ελέγχου
+# -----------------------------
+class BankStatementForm(forms.ModelForm):
+    upload = forms.FileField(label="Αρχείο", help_text="CSV της τράπεζας ή camt.053 (XML).")
+
+    class Meta:
+        model = BankStatement
+        fields = ()
+
+    def clean_upload(self):
+        upload = self.cleaned_data["upload"]
+        try:
+            # ✅ πλήρης έλεγχος (μορφή, διπλό αρχείο) χωρίς αποθήκευση
+            self.preview = bank.import_statement(upload, upload.name, dry_run=True)
+        except ValidationError as e:
+            raise forms.ValidationError(e.messages)
+        upload.seek(0)
+        return upload
+
+
+@admin.register(BankStatement)
+class BankStatementAdmin(admin.ModelAdmin):
+    list_display = ("id", "file_name", "format", "lines", "matched", "unmatched", "total_amount", "uploaded_by", "uploaded_at")
+    list_filter = ("format",)
+    list_select_related = ("uploaded_by",)
+    search_fields = ("file_name",)
+    ordering = ("-id",)
+    actions = (rematch_lines,)
+    form = BankStatementForm
+    readonly_fields = ("file_name", "format", "sha256", "lines", "matched", "unmatched", "total_amount", "uploaded_by", "uploaded_at")
+
+    def get_fields(self, request, obj=None):
+        return ("upload",) if obj is None else self.readonly_fields
+
+    def get_form(self, request, obj=None, change=False, **kwargs):
+        if obj is not None:
+            kwargs["form"] = forms.ModelForm
+        return super().get_form(request, obj, change, **kwargs)
+
+    def has_change_permission(self, request, obj=None):
+        # ✅ μόνο ανάγνωση· οι διορθώσεις γίνονται στις κινήσεις
+        return obj is None and super().has_change_permission(request, obj)
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        # ✅ αντιστοίχιση + πληρωμές + εξόφληση στην ίδια συναλλαγή
+        upload = form.cleaned_data["upload"]
+        stats = bank.import_statement(upload, upload.name, user=request.user)
+        obj.pk = stats.statement.pk
+        obj.file_name = stats.statement.file_name
+        self.message_user(
+            request,
+            f"{stats.lines} κινήσεις: {stats.matched} αντιστοιχίστηκαν ({stats.settled_charges} χρεώσεις εξοφλήθηκαν), "
+            f"{stats.unmatched} προς έλεγχο.",
+            messages.SUCCESS if not stats.unmatched else messages.WARNING,
+        )
+
+
+class BankStatementLineForm(forms.ModelForm):
+    charges = forms.CharField(
+        label="Χρεώσεις",
+        required=False,
+        help_text="Ids (#12) ή κωδικοί πληρωμής των ανοιχτών χρεώσεων, χωρισμένα με κόμμα. Πρέπει να αθροίζουν στο ποσό.",
+    )
+
+    class Meta:
+        model = BankStatementLine
+        fields = ()
+
+    def clean_charges(self):
+        text = self.cleaned_data["charges"]
+        self.charge_ids = bank.charges_for(text) if text else []
+        if text and not self.charge_ids:
+            raise forms.ValidationError("Δεν βρέθηκαν ανοιχτές χρεώσεις.")
+        if self.charge_ids:
+            try:
+                bank.check_manual(self.instance, self.charge_ids)
+            except ValidationError as e:
+                raise forms.ValidationError(e.messages)
+        return text
+
+
+@admin.register(BankStatementLine)
+class BankStatementLineAdmin(admin.ModelAdmin):
+    list_display = ("id", "statement", "booking_date", "amount", "payer", "reference", "status", "score", "match_note", "payment")
+    list_filter = ("status", "statement")
+    list_select_related = ("statement", "payment")
+    search_fields = ("payer", "reference", "bank_reference")
+    ordering = ("status", "-booking_date", "id")
+    date_hierarchy = "booking_date"
+    actions = (rematch_lines, ignore_lines)
+    form = BankStatementLineForm
+    readonly_fields = (
+        "statement", "line_no", "booking_date", "amount", "payer", "reference", "bank_reference",
+        "status", "payment", "score", "match_note", "matched_at", "open_charges_display",
+    )
+
+    def get_fields(self, request, obj=None):
+        if obj is not None and obj.status == BankStatementLine.Status.UNMATCHED:
+            return self.readonly_fields + ("charges",)
+        return self.readonly_fields
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description="Υποψήφιες χρεώσεις (ίδιο ποσό)")
+    def open_charges_display(self, obj):
+        if obj.status != BankStatementLine.Status.UNMATCHED:
+            return "-"
+        rows = (
+            LedgerEntry.objects.filter(status=LedgerEntry.Status.OPEN, amount=obj.amount)
+            .select_related("athlete", "club")
+            .order_by("-date")[:20]
+        )
+        return format_html_join(
+            "", "<div>#{} {} {} {} ({})</div>",
+            ((e.pk, e.reference or "-", e.athlete or e.club or "", e.amount, e.season) for e in rows),
+        ) or "-"
+
+    def save_model(self, request, obj, form, change):
+        # ✅ χειροκίνητη αντιστοίχιση: πληρωμή + εξόφληση
+        if getattr(form, "charge_ids", None):
+            bank.match_manually(obj, form.charge_ids, user=request.user)
@@ -0,0 +1,660 @@
+"""
+Αντιστοίχιση αντιγράφων κίνησης τράπεζας (CSV ή camt.053) με τις ανοιχτές χρεώσεις.
+
+    import_statement(f, name)   -> ανάγνωση (streaming), αντιστοίχιση, πληρωμές + εξόφληση μαζικά
+    rematch(lines)              -> ξανά αυτόματη αντιστοίχιση για όσες έμειναν "Προς έλεγχο"
+    match_manually(line, ids)   -> από την ουρά ελέγχου του admin (ή ignore(lines))
+
+Οι ανοιχτές χρεώσεις φορτώνονται ΜΙΑ φορά και ευρετηριάζονται:
+    κωδικός πληρωμής -> χρεώσεις        (dict, ακριβής ταύτιση)
+    ποσό -> ταξινομημένοι ελεύθεροι κωδικοί (bisect + difflib για κωδικούς με τυπογραφικά λάθη)
+    ποσό -> χρεώσεις / επώνυμο -> χρεώσεις / λέξη -> επωνυμίες ομίλων
+οπότε κάθε κίνηση κοστίζει O(log n) αντί για σύγκριση με όλες τις χρεώσεις. Οι χρεώσεις
+σημειώνονται ως δεσμευμένες (take) μόνο όταν η αντιστοίχιση γίνεται δεκτή (payable).
+
+Σειρά κανόνων ανά κίνηση (πρώτος που ταιριάζει):
+    1. κωδικός στην αιτιολογία και ίδιο ποσό (μία χρέωση ή όλες με τον κωδικό)
+    2. παρόμοιος κωδικός (>= FUZZY_MIN) και ίδιο ποσό, χωρίς δεύτερο εξίσου καλό υποψήφιο·
+       για κωδικούς με ψηφία ελέγχου (has_check_digits) μόνο αν τα ψηφία είναι ίδια
+    3. ονοματεπώνυμο / όμιλος του καταθέτη και ίδιο ποσό (μία χρέωση ή όλο το ανοιχτό υπόλοιπο)
+Μόνο εισερχόμενα ποσά· για κάθε αντιστοίχιση μία εγγραφή "Πληρωμή" και εξόφληση των χρεώσεων.
+"""
+from __future__ import annotations
+
+import codecs
+import csv
+import difflib
+import hashlib
+import io
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterator
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+try:
+    # προστασία από XML bombs σε αρχεία που ανεβαίνουν από το admin
+    from defusedxml.ElementTree import iterparse
+except ImportError:
+    from xml.etree.ElementTree import iterparse
+
+from .ledger import CHARGE_KINDS, has_check_digits, post, settle_many
+from .models import BankStatement, BankStatementLine, LedgerEntry
+
+CSV_COLUMNS = {
+    "date": ("ΗΜΕΡΟΜΗΝΙΑ", "ΗΜΝΙΑ", "ΗΜΕΡΟΜΗΝΙΑΛΟΓΙΣΤΙΚΟΠΟΙΗΣΗΣ", "ΗΜΕΡΟΜΗΝΙΑΑΞΙΑΣ", "DATE", "BOOKINGDATE", "VALUEDATE"),
+    "amount": ("ΠΟΣΟ", "AMOUNT"),
+    "credit": ("ΠΙΣΤΩΣΗ", "CREDIT"),
+    "debit": ("ΧΡΕΩΣΗ", "DEBIT"),
+    "payer": ("ΚΑΤΑΘΕΤΗΣ", "ΕΠΩΝΥΜΙΑ", "ΕΝΤΟΛΕΑΣ", "ΟΝΟΜΑ", "PAYER", "NAME", "COUNTERPARTY", "ORDERINGPARTY"),
+    "reference": ("ΑΙΤΙΟΛΟΓΙΑ", "ΠΕΡΙΓΡΑΦΗ", "ΣΧΟΛΙΑ", "REFERENCE", "DESCRIPTION", "REMITTANCEINFORMATION", "DETAILS"),
+    "bank_reference": ("ΚΩΔΙΚΟΣΣΥΝΑΛΛΑΓΗΣ", "ΑΡΙΘΜΟΣΣΥΝΑΛΛΑΓΗΣ", "ΑΡΣΥΝΑΛΛΑΓΗΣ", "TRANSACTIONID", "REFERENCENUMBER"),
+}
+MAX_HEADER_SCAN = 30
+SNIFF_BYTES = 64 * 1024
+
+FUZZY_MIN = 0.85          # ελάχιστη ομοιότητα κωδικού (difflib ratio)
+FUZZY_MARGIN = 0.05       # ο δεύτερος υποψήφιος πρέπει να απέχει τουλάχιστον τόσο
+FUZZY_NEIGHBOURS = 4      # γείτονες στους ταξινομημένους κωδικούς (ανά κατεύθυνση)
+MIN_TOKEN = 5             # μικρότερα κομμάτια αιτιολογίας δεν ελέγχονται ως κωδικοί
+MAX_JOINED_TOKENS = 4     # "SUB 2026 123" -> "SUB2026123"
+LINE_CHUNK = 500
+
+NO_MATCH = "Καμία ανοιχτή χρέωση με αυτόν τον κωδικό / καταθέτη και ποσό"
+MATCHED = (BankStatementLine.Status.MATCHED, BankStatementLine.Status.MANUAL)
+
+
+@dataclass
+class StatementRow:
+    line_no: int
+    amount: Decimal
+    booking_date: date | None = None
+    payer: str = ""
+    reference: str = ""
+    bank_reference: str = ""
+
+
+@dataclass
+class Match:
+    charges: list[dict]
+    score: Decimal
+    rule: str
+    detail: str = ""
+
+    @property
+    def note(self) -> str:
+        return f"{self.rule} ({self.detail})" if self.detail else self.rule
+
+
+@dataclass
+class ImportStats:
+    lines: int = 0
+    skipped_debits: int = 0
+    matched: int = 0
+    unmatched: int = 0
+    settled_charges: int = 0
+    amount: Decimal = Decimal("0.00")
+    matched_amount: Decimal = Decimal("0.00")
+    statement: BankStatement | None = None
+    rules: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+def _clean(v: Any) -> str:
+    if v is None:
+        return ""
+    return " ".join(str(v).split())
+
+
+def _fold(v: Any) -> str:
+    """Κεφαλαία χωρίς τόνους: "Ποσό" -> "ΠΟΣΟ"."""
+    s = unicodedata.normalize("NFD", _clean(v).upper())
+    return "".join(ch for ch in s if not unicodedata.combining(ch))
+
+
+def _header(v: Any) -> str:
+    return "".join(ch for ch in _fold(v) if ch.isalnum())
+
+
+def ref_key(v: Any) -> str:
+    """Κωδικός πληρωμής χωρίς κενά / παύλες: "SUB-2026-15-55" -> "SUB20261555"."""
+    return "".join(ch for ch in _fold(v) if ch.isalnum())
+
+
+def _tokens(v: Any) -> list[str]:
+    return re.findall(r"\w+", _fold(v))
+
+
+def _digits(v: str) -> str:
+    return "".join(ch for ch in v if ch.isdigit())
+
+
+def parse_amount(v: Any) -> Decimal | None:
+    """1.234,56 / 1,234.56 / -50,00 / 50.00 / 50 €"""
+    if v is None or v == "":
+        return None
+    if isinstance(v, (int, float, Decimal)):
+        return Decimal(str(v)).quantize(Decimal("0.01"))
+    s = re.sub(r"[^\d,.\-+]", "", str(v))
+    if not s:
+        return None
+    if "," in s and "." in s:
+        thousands, decimal = (".", ",") if s.rfind(",") > s.rfind(".") else (",", ".")
+        s = s.replace(thousands, "").replace(decimal, ".")
+    elif "," in s:
+        s = s.replace(",", ".") if s.count(",") == 1 else s.replace(",", "")
+    elif s.count(".") > 1 or re.fullmatch(r"[-+]?\d{1,3}\.\d{3}", s):
+        s = s.replace(".", "")
+    try:
+        return Decimal(s).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None
+
+
+def parse_date(v: Any) -> date | None:
+    if v is None or v == "":
+        return None
+    if isinstance(v, datetime):
+        return v.date()
+    if isinstance(v, date):
+        return v
+    s = _clean(v)[:10]
+    for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y", "%Y-%m-%d", "%d/%m/%y"):
+        try:
+            return datetime.strptime(s, fmt).date()
+        except ValueError:
+            pass
+    return None
+
+
+# -----------------------------
+# ανάγνωση (streaming)
+# -----------------------------
+def _encoding(sample: bytes) -> str:
+    # οι ελληνικές τράπεζες δίνουν συχνά Windows-1253
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp1253"
+
+
+def _rows_csv(f) -> Iterator[StatementRow]:
+    sample = f.read(SNIFF_BYTES)
+    f.seek(0)
+    text = io.TextIOWrapper(f, encoding=_encoding(sample), newline="")
+    try:
+        head = text.read(4096)
+        text.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(head, delimiters=";,\t|")
+        except csv.Error:
+            dialect = csv.excel
+        index = None
+        for n, row in enumerate(csv.reader(text, dialect), start=1):
+            if index is None:
+                headers = [_header(c) for c in row]
+                found = {
+                    name: next((headers.index(h) for h in aliases if h in headers), None)
+                    for name, aliases in CSV_COLUMNS.items()
+                }
+                if found["amount"] is not None or found["credit"] is not None:
+                    index = found
+                elif n >= MAX_HEADER_SCAN:
+                    break
+                continue
+
+            def value(name):
+                i = index[name]
+                return row[i] if i is not None and i < len(row) else None
+
+            if index["credit"] is not None:
+                amount = parse_amount(value("credit")) or -(parse_amount(value("debit")) or Decimal(0))
+            else:
+                amount = parse_amount(value("amount"))
+            if amount is None:
+                continue
+            yield StatementRow(
+                line_no=n,
+                amount=amount,
+                booking_date=parse_date(value("date")),
+                payer=_clean(value("payer")),
+                reference=_clean(value("reference")),
+                bank_reference=_clean(value("bank_reference")),
+            )
+        if index is None:
+            raise ValidationError("Δεν βρέθηκε στήλη ποσού (Ποσό / Πίστωση / Amount) στο αρχείο.")
+    finally:
+        text.detach()
+
+
+def _rows_camt(f) -> Iterator[StatementRow]:
+    """camt.053 (όλες οι εκδόσεις): ένα <Ntry> τη φορά, χωρίς να φορτωθεί όλο το XML."""
+    ns = None
+    n = 0
+
+    def find(elem, path):
+        return elem.find("/".join(f"{{{ns}}}{p}" if ns else p for p in path.split("/")))
+
+    def text(elem, *paths):
+        for path in paths:
+            found = find(elem, path) if elem is not None else None
+            if found is not None and found.text:
+                return found.text.strip()
+        return ""
+
+    for event, elem in iterparse(f, events=("start", "end")):
+        if event == "start":
+            if ns is None:
+                ns = elem.tag[1:].split("}", 1)[0] if elem.tag.startswith("{") else ""
+            continue
+        if elem.tag.rsplit("}", 1)[-1] != "Ntry":
+            continue
+        sign = Decimal(1) if text(elem, "CdtDbtInd") == "CRDT" else Decimal(-1)
+        booked = parse_date(text(elem, "BookgDt/Dt", "BookgDt/DtTm", "ValDt/Dt"))
+        details = elem.findall("/".join(f"{{{ns}}}{p}" if ns else p for p in ("NtryDtls", "TxDtls")))
+        # μαζική πίστωση: μία γραμμή ανά TxDtls με το δικό της ποσό
+        for tx in (details if len(details) > 1 else [details[0] if details else None]):
+            n += 1
+            try:
+                amount = Decimal(text(tx, "Amt", "AmtDtls/TxAmt/Amt") if len(details) > 1 else text(elem, "Amt"))
+            except InvalidOperation:
+                continue
+            remittance = []
+            rmt = find(tx, "RmtInf") if tx is not None else None
+            if rmt is not None:
+                remittance = [e.text.strip() for e in rmt.iter() if e.text and e.text.strip() and len(e) == 0]
+            yield StatementRow(
+                line_no=n,
+                amount=sign * amount,
+                booking_date=booked,
+                payer=text(tx, "RltdPties/Dbtr/Nm", "RltdPties/Dbtr/Pty/Nm", "RltdPties/UltmtDbtr/Nm"),
+                reference=" ".join(remittance) or text(elem, "AddtlNtryInf"),
+                bank_reference=text(tx, "Refs/AcctSvcrRef", "Refs/EndToEndId") or text(elem, "AcctSvcrRef", "NtryRef"),
+            )
+        elem.clear()
+
+
+def detect_format(f, name: str = "") -> str:
+    if name.lower().endswith(".xml"):
+        return BankStatement.Format.CAMT053
+    head = f.read(512).lstrip()
+    f.seek(0)
+    return BankStatement.Format.CAMT053 if head.startswith((b"<", b"\xef\xbb\xbf<")) else BankStatement.Format.CSV
+
+
+def read_statement(f, fmt: str) -> Iterator[StatementRow]:
+    """f: αρχείο ανοιγμένο σε binary (seekable)."""
+    return _rows_camt(f) if fmt == BankStatement.Format.CAMT053 else _rows_csv(f)
+
+
+def file_sha256(f) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(SNIFF_BYTES), b""):
+        digest.update(chunk)
+    f.seek(0)
+    return digest.hexdigest()
+
+
+# -----------------------------
+# ευρετήριο ανοιχτών χρεώσεων
+# -----------------------------
+class OpenCharges:
+    def __init__(self, queryset=None):
+        qs = queryset if queryset is not None else LedgerEntry.objects.filter(
+            status=LedgerEntry.Status.OPEN, amount__gt=0, kind__in=CHARGE_KINDS
+        )
+        self.by_ref: dict[str, list[dict]] = defaultdict(list)
+        self.by_amount: dict[Decimal, list[dict]] = defaultdict(list)
+        self.by_name: dict[str, list[dict]] = defaultdict(list)
+        self.by_owner: dict[tuple, list[dict]] = defaultdict(list)
+        self.taken: set[int] = set()
+        # ποσό -> ταξινομημένοι κωδικοί με ελεύθερη χρέωση του ποσού (ενημερώνεται από το take())
+        self.free_keys: dict[Decimal, list[str]] = defaultdict(list)
+        self._free_count: dict[tuple[Decimal, str], int] = defaultdict(int)
+        # πιο "σπάνια" (μακρύτερη) λέξη -> επωνυμίες ομίλων με πολλές λέξεις
+        self.club_names: dict[str, list[str]] = defaultdict(list)
+        for c in qs.order_by("date", "pk").values(
+            "pk", "reference", "amount", "season", "athlete_id", "club_id",
+            "athlete__last_name", "athlete__first_name", "club__name",
+        ):
+            c["key"] = ref_key(c["reference"])
+            c["owner"] = ("a", c["athlete_id"]) if c["athlete_id"] else ("c", c["club_id"])
+            if c["key"]:
+                self.by_ref[c["key"]].append(c)
+                self._free_count[c["amount"], c["key"]] += 1
+            self.by_amount[c["amount"]].append(c)
+            self.by_owner[c["owner"]].append(c)
+            if c["athlete_id"]:
+                self.by_name[_fold(c["athlete__last_name"])].append(c)
+            elif c["club__name"]:
+                self.by_name[_fold(c["club__name"])].append(c)
+        for amount, key in self._free_count:
+            self.free_keys[amount].append(key)
+        for keys in self.free_keys.values():
+            keys.sort()
+        for name in self.by_name:
+            if " " in name:
+                self.club_names[max(_tokens(name), key=len)].append(name)
+
+    def free(self, charges) -> list[dict]:
+        return [c for c in charges if c["pk"] not in self.taken]
+
+    def take(self, charges) -> None:
+        for c in charges:
+            if c["pk"] in self.taken:
+                continue
+            self.taken.add(c["pk"])
+            if not c["key"]:
+                continue
+            slot = (c["amount"], c["key"])
+            self._free_count[slot] -= 1
+            if self._free_count[slot] == 0:
+                keys = self.free_keys[c["amount"]]
+                del keys[bisect_left(keys, c["key"])]
+
+    # -- κανόνες --
+    def _by_reference(self, row: StatementRow, candidates: list[str]) -> Match | None:
+        hits = [k for k in dict.fromkeys(candidates) if k in self.by_ref]
+        groups = [self.free(self.by_ref[k]) for k in hits]
+        for group in groups:
+            exact = [c for c in group if c["amount"] == row.amount]
+            if exact:
+                return Match([exact[0]], Decimal(1), "Κωδικός πληρωμής")
+            if group and sum(c["amount"] for c in group) == row.amount:
+                return Match(group, Decimal(1), "Κωδικός πληρωμής (όλες οι χρεώσεις)")
+        everything = [c for group in groups for c in group]
+        if len(groups) > 1 and sum(c["amount"] for c in everything) == row.amount:
+            return Match(everything, Decimal(1), "Πολλοί κωδικοί πληρωμής")
+        return None
+
+    def _fuzzy(self, row: StatementRow, candidates: list[str]) -> Match | None:
+        same_amount = self.free_keys.get(row.amount)
+        if not same_amount:
+            return None
+        scored: dict[str, float] = {}
+        for token in candidates:
+            if len(token) < MIN_TOKEN:
+                continue
+            i = bisect_left(same_amount, token)
+            nearby = same_amount[max(0, i - FUZZY_NEIGHBOURS):i + FUZZY_NEIGHBOURS]
+            # λάθος στους πρώτους χαρακτήρες: το bisect δεν το βρίσκει, οι ίδιου ποσού είναι λίγες
+            if len(same_amount) <= 50:
+                nearby += difflib.get_close_matches(token, same_amount, n=2, cutoff=FUZZY_MIN)
+            for key in nearby:
+                # διαφορετικό ψηφίο σε κωδικό με ψηφία ελέγχου: άλλος αθλητής, όχι τυπογραφικό λάθος
+                if has_check_digits(key) and _digits(key) != _digits(token):
+                    continue
+                ratio = difflib.SequenceMatcher(None, token, key).ratio()
+                scored[key] = max(scored.get(key, 0.0), ratio)
+        ranked = sorted(scored.items(), key=lambda kv: -kv[1])
+        if not ranked or ranked[0][1] < FUZZY_MIN:
+            return None
+        if len(ranked) > 1 and ranked[0][1] - ranked[1][1] < FUZZY_MARGIN:
+            return None
+        key, ratio = ranked[0]
+        charge = next(c for c in self.free(self.by_ref[key]) if c["amount"] == row.amount)
+        return Match([charge], Decimal(str(round(ratio, 3))), "Παρόμοιος κωδικός", charge["reference"])
+
+    def _by_payer(self, row: StatementRow) -> Match | None:
+        words = set(_tokens(row.payer))
+        if not words:
+            return None
+        folded = _fold(row.payer)
+        owners: dict[tuple, list[dict]] = {}
+        for word in words:
+            for c in self.free(self.by_name.get(word, [])):
+                if c["athlete_id"] and _fold(c["athlete__first_name"]) not in words:
+                    continue
+                owners.setdefault(c["owner"], self.free(self.by_owner[c["owner"]]))
+        # όμιλοι: ολόκληρη η επωνυμία μέσα στον καταθέτη
+        for name in (n for word in words for n in self.club_names.get(word, ()) if n in folded):
+            for c in self.free(self.by_name[name]):
+                owners.setdefault(c["owner"], self.free(self.by_owner[c["owner"]]))
+        matches = []
+        for charges in owners.values():
+            exact = [c for c in charges if c["amount"] == row.amount]
+            if len(exact) == 1:
+                matches.append(Match(exact, Decimal("0.800"), "Καταθέτης και ποσό"))
+            elif charges and sum(c["amount"] for c in charges) == row.amount:
+                matches.append(Match(charges, Decimal("0.800"), "Καταθέτης και ανοιχτό υπόλοιπο"))
+        return matches[0] if len(matches) == 1 else None
+
+    def match(self, row: StatementRow) -> Match | None:
+        if row.amount <= 0:
+            return None
+        tokens = [ref_key(t) for t in _tokens(row.reference)]
+        candidates = [
+            "".join(tokens[i:i + size])
+            for size in range(1, MAX_JOINED_TOKENS + 1)
+            for i in range(len(tokens) - size + 1)
+        ]
+        found = self._by_reference(row, candidates) or self._fuzzy(row, candidates) or self._by_payer(row)
+        if found is not None and payable(found.charges):
+            self.take(found.charges)
+        return found
+
+
+# -----------------------------
+# πληρωμές + εξόφληση
+# -----------------------------
+def payable(charges: list[dict]) -> bool:
+    """Μία πληρωμή καλύπτει μόνο χρεώσεις του ίδιου αθλητή / ομίλου και της ίδιας σεζόν."""
+    clubs = {c["club_id"] for c in charges}
+    return (
+        len({c["season"] for c in charges}) == 1
+        and len(clubs) == 1
+        and (len({c["athlete_id"] for c in charges}) == 1 or None not in clubs)
+    )
+
+
+def _payment(line: BankStatementLine, charges: list[dict]) -> LedgerEntry | None:
+    """Μία πληρωμή για τον ίδιο αθλητή / όμιλο και σεζόν· αλλιώς η κίνηση μένει για έλεγχο."""
+    if not payable(charges):
+        return None
+    seasons = {c["season"] for c in charges}
+    athletes = {c["athlete_id"] for c in charges}
+    clubs = {c["club_id"] for c in charges}
+    description = " ".join(filter(None, ["Τράπεζα:", line.payer, line.reference]))
+    return LedgerEntry(
+        kind=LedgerEntry.Kind.PAYMENT,
+        athlete_id=athletes.pop() if len(athletes) == 1 else None,
+        club_id=clubs.pop(),
+        season=seasons.pop(),
+        date=line.booking_date or timezone.localdate(),
+        amount=-line.amount,
+        description=description[:200],
+        reference=f"BANK-{line.statement_id}-{line.line_no}",
+    )
+
+
+def _apply(matches: list[tuple[BankStatementLine, Match]], user=None, manual: bool = False) -> int:
+    """Καταχώρηση όλων των πληρωμών με ένα post() και εξόφληση με ένα settle_many()."""
+    now = timezone.now()
+    planned = []
+    for line, found in matches:
+        payment = _payment(line, found.charges)
+        if payment is None:
+            line.match_note = "Χρεώσεις διαφορετικών αθλητών / σεζόν: χειροκίνητη αντιστοίχιση"
+            continue
+        planned.append((line, found, payment))
+    if not planned:
+        return 0
+    payments = post([payment for _, _, payment in planned], user=user)
+    expected = sum(len(found.charges) for _, found, _ in planned)
+    settled = settle_many({payment.pk: [c["pk"] for c in found.charges] for (_, found, _), payment in zip(planned, payments)})
+    if settled != expected:
+        # κάποιος άλλος εξόφλησε στο μεταξύ: rollback όλης της αντιστοίχισης
+        raise ValidationError("Ορισμένες χρεώσεις εξοφλήθηκαν στο μεταξύ. Δοκιμάστε ξανά.")
+    for (line, found, _), payment in zip(planned, payments):
+        line.payment = payment
+        line.status = BankStatementLine.Status.MANUAL if manual else BankStatementLine.Status.MATCHED
+        line.score = found.score
+        line.match_note = found.note
+        line.matched_at = now
+    return settled
+
+
+def _refresh_counts(statement_ids) -> None:
+    for statement in BankStatement.objects.filter(pk__in=statement_ids):
+        lines = statement.statement_lines.all()
+        statement.matched = lines.filter(status__in=MATCHED).count()
+        statement.unmatched = lines.filter(status=BankStatementLine.Status.UNMATCHED).count()
+        statement.save(update_fields=["matched", "unmatched"])
+
+
+def import_statement(f, name: str, user=None, dry_run: bool = False) -> ImportStats:
+    """f: binary αρχείο (path ανοιγμένο με "rb" ή UploadedFile)."""
+    stats = ImportStats()
+    sha = file_sha256(f)
+    existing = BankStatement.objects.filter(sha256=sha).first()
+    if existing is not None:
+        raise ValidationError(f"Το αρχείο έχει ήδη εισαχθεί ({existing}).")
+    fmt = detect_format(f, name)
+    index = OpenCharges()
+
+    with transaction.atomic():
+        statement = BankStatement(file_name=name[:255], format=fmt, sha256=sha, uploaded_by=user)
+        if not dry_run:
+            statement.save()
+        pending: list[tuple[BankStatementLine, Match | None]] = []
+
+        def flush():
+            if dry_run:
+                return
+            _apply([(line, found) for line, found in pending if found is not None], user=user)
+            BankStatementLine.objects.bulk_create([line for line, _ in pending])
+            pending.clear()
+
+        for row in read_statement(f, fmt):
+            if row.amount <= 0:
+                stats.skipped_debits += 1
+                continue
+            stats.lines += 1
+            stats.amount += row.amount
+            line = BankStatementLine(
+                statement=statement,
+                line_no=row.line_no,
+                booking_date=row.booking_date,
+                amount=row.amount,
+                payer=row.payer[:200],
+                reference=row.reference[:500],
+                bank_reference=row.bank_reference[:100],
+            )
+            found = index.match(row)
+            if found is None:
+                line.match_note = NO_MATCH
+            else:
+                stats.rules[found.rule] += 1
+                if dry_run and payable(found.charges):
+                    stats.matched += 1
+                    stats.settled_charges += len(found.charges)
+                    stats.matched_amount += row.amount
+            pending.append((line, found))
+            if len(pending) >= LINE_CHUNK:
+                flush()
+        flush()
+
+        if dry_run:
+            stats.unmatched = stats.lines - stats.matched
+            transaction.set_rollback(True)
+            return stats
+
+        lines = statement.statement_lines.all()
+        stats.matched = lines.filter(status__in=MATCHED).count()
+        stats.unmatched = stats.lines - stats.matched
+        stats.settled_charges = LedgerEntry.objects.filter(settlement__bank_line__statement=statement).count()
+        stats.matched_amount = sum(
+            lines.filter(status__in=MATCHED).values_list("amount", flat=True), Decimal("0.00")
+        )
+        statement.lines = stats.lines
+        statement.matched = stats.matched
+        statement.unmatched = stats.unmatched
+        statement.total_amount = stats.amount
+        statement.save(update_fields=["lines", "matched", "unmatched", "total_amount"])
+    stats.statement = statement
+    return stats
+
+
+# -----------------------------
+# ουρά ελέγχου
+# -----------------------------
+def rematch(lines, user=None) -> int:
+    """Νέα αυτόματη αντιστοίχιση (π.χ. αφού καταχωρήθηκαν οι χρεώσεις που έλειπαν)."""
+    lines = list(lines.filter(status=BankStatementLine.Status.UNMATCHED))
+    if not lines:
+        return 0
+    index = OpenCharges()
+    with transaction.atomic():
+        matches = []
+        for line in lines:
+            row = StatementRow(line.line_no, line.amount, line.booking_date, line.payer, line.reference)
+            found = index.match(row)
+            if found is not None:
+                matches.append((line, found))
+            else:
+                line.match_note = NO_MATCH
+        _apply(matches, user=user)
+        BankStatementLine.objects.bulk_update(lines, ["payment", "status", "score", "match_note", "matched_at"])
+        _refresh_counts({line.statement_id for line in lines})
+    return sum(1 for line, _ in matches if line.payment_id)
+
+
+def check_manual(line: BankStatementLine, charge_ids) -> list[dict]:
+    """Ο χρήστης διάλεξε τις χρεώσεις· το άθροισμά τους πρέπει να είναι ίσο με το ποσό της κίνησης."""
+    if line.status != BankStatementLine.Status.UNMATCHED:
+        raise ValidationError("Η κίνηση έχει ήδη αντιστοιχιστεί.")
+    index = OpenCharges(LedgerEntry.objects.filter(pk__in=charge_ids, status=LedgerEntry.Status.OPEN, amount__gt=0))
+    charges = [c for group in index.by_owner.values() for c in group]
+    missing = set(charge_ids) - {c["pk"] for c in charges}
+    if missing:
+        raise ValidationError(f"Δεν είναι ανοιχτές χρεώσεις: {', '.join(f'#{pk}' for pk in sorted(missing))}")
+    total = sum((c["amount"] for c in charges), Decimal("0.00"))
+    if total != line.amount:
+        raise ValidationError(f"Οι χρεώσεις αθροίζουν {total} €, η κίνηση είναι {line.amount} €.")
+    if _payment(line, charges) is None:
+        raise ValidationError("Οι χρεώσεις πρέπει να είναι του ίδιου αθλητή ή ομίλου και της ίδιας σεζόν.")
+    return charges
+
+
+def match_manually(line: BankStatementLine, charge_ids, user=None) -> int:
+    charges = check_manual(line, charge_ids)
+    with transaction.atomic():
+        settled = _apply([(line, Match(charges, Decimal(1), "Χειροκίνητα"))], user=user, manual=True)
+        line.save(update_fields=["payment", "status", "score", "match_note", "matched_at"])
+        _refresh_counts([line.statement_id])
+    return settled
+
+
+def ignore(lines) -> int:
+    with transaction.atomic():
+        lines = list(lines.filter(status=BankStatementLine.Status.UNMATCHED))
+        BankStatementLine.objects.filter(pk__in=[line.pk for line in lines]).update(
+            status=BankStatementLine.Status.IGNORED, matched_at=timezone.now()
+        )
+        _refresh_counts({line.statement_id for line in lines})
+    return len(lines)
+
+
+def charges_for(text: str) -> list[int]:
+    """Φόρμα admin: "#12, SUB-2026-5-25" -> ids ανοιχτών χρεώσεων (με id ή κωδικό πληρωμής)."""
+    ids, refs = [], []
+    for part in re.split(r"[,;\s]+", text.strip()):
+        if not part:
+            continue
+        if re.fullmatch(r"#?\d+", part):
+            ids.append(int(part.lstrip("#")))
+        else:
+            refs.append(part)
+    if refs:
+        ids.extend(
+            LedgerEntry.objects.filter(reference__in=refs, status=LedgerEntry.Status.OPEN, amount__gt=0)
+            .values_list("pk", flat=True)
+        )
+    return list(dict.fromkeys(ids))
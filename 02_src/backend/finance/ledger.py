@@ -0,0 +1,367 @@
+"""
+Καθολικό και υπόλοιπα.
+
+    post([LedgerEntry(...), ...])  -> bulk_create + ενημέρωση AthleteBalance / ClubBalance
+                                      στην ΙΔΙΑ συναλλαγή
+    reverse(entry)                 -> αντιλογισμός (νέα εγγραφή), η αρχική "Ακυρώθηκε"
+    settle(charges, payment)       -> μαζική σήμανση εξόφλησης (δεν αλλάζει υπόλοιπα)
+    settle_many({payment: charges}) -> το ίδιο για πολλές πληρωμές μαζί (αντιστοίχιση τράπεζας)
+    reconcile()                    -> ξαναϋπολογισμός από το καθολικό, αναφορά / διόρθωση αποκλίσεων
+    subscription_reference(...)    -> κωδικός πληρωμής συνδρομής με ψηφία ελέγχου
+
+Υπόλοιπο = άθροισμα amount: οι σελίδες ομίλου / αθλητή διαβάζουν μία γραμμή
+ανά σεζόν, όχι όλο το καθολικό.
+
+Λίγα κλειδιά (καταχώρηση από admin / πληρωμή): UPDATE ... SET x = x + Δ ανά γραμμή.
+Πολλά κλειδιά (μαζικές ανανεώσεις): κλείδωμα γραμμών υπολοίπου και ένα GROUP BY
+στο καθολικό μόνο για αυτά, upsert.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Max, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from competitions.eligibility import invalidate_many as invalidate_eligibility
+from registry.eligibility import schedule_athletes
+from registry.models import Athlete, AthleteSubscription
+
+from .models import AthleteBalance, ClubBalance, LedgerEntry
+
+ZERO = Decimal("0.00")
+
+CHARGE_KINDS = {LedgerEntry.Kind.SUBSCRIPTION, LedgerEntry.Kind.ENTRY_FEE, LedgerEntry.Kind.PENALTY}
+CREDIT_KINDS = {LedgerEntry.Kind.PAYMENT, LedgerEntry.Kind.PRIZE}
+
+# είδος υπολοίπου -> (μοντέλο, πεδίο)
+BALANCES = {
+    "athlete": (AthleteBalance, "athlete"),
+    "club": (ClubBalance, "club"),
+}
+BALANCE_FIELDS = ["debit", "credit", "balance", "postings", "last_posted_at"]
+
+# πάνω από τόσα κλειδιά: GROUP BY αντί για UPDATE ανά γραμμή
+INCREMENT_LIMIT = 20
+SETTLE_CHUNK = 500
+
+
+@dataclass
+class _Delta:
+    debit: Decimal = ZERO
+    credit: Decimal = ZERO
+    postings: int = 0
+
+    def add(self, amount: Decimal) -> None:
+        if amount >= 0:
+            self.debit += amount
+        else:
+            self.credit -= amount
+        self.postings += 1
+
+
+# -----------------------------
+# κωδικοί πληρωμής
+# -----------------------------
+def subscription_reference(season: int, athlete_id: int) -> str:
+    """
+    "SUB-2026-15-55": δύο ψηφία ελέγχου (ISO 7064 mod 97-10, όπως στο IBAN), ώστε ένα λάθος
+    ψηφίο ή μια αντιμετάθεση στην αιτιολογία να μη δείχνει σε άλλον αθλητή.
+    """
+    check = 98 - int(f"{season}{athlete_id}00") % 97
+    return f"SUB-{season}-{athlete_id}-{check:02d}"
+
+
+def has_check_digits(key: str) -> bool:
+    """ref_key() κωδικού από subscription_reference(): "SUB20261555" -> True."""
+    digits = key[3:]
+    return key.startswith("SUB") and digits.isdigit() and len(digits) > 6 and int(digits) % 97 == 1
+
+
+# -----------------------------
+# καταχώρηση
+# -----------------------------
+def validate_entry(entry: LedgerEntry) -> None:
+    errors = {}
+    if entry.athlete_id is None and entry.club_id is None:
+        errors["athlete"] = "Απαιτείται αθλητής ή όμιλος."
+    if not entry.amount:
+        errors["amount"] = "Το ποσό δεν μπορεί να είναι μηδέν."
+    elif entry.kind in CHARGE_KINDS and entry.amount < 0:
+        errors["amount"] = "Οι χρεώσεις έχουν θετικό ποσό."
+    elif entry.kind in CREDIT_KINDS and entry.amount > 0:
+        errors["amount"] = "Οι πληρωμές / τα έπαθλα έχουν αρνητικό ποσό (πίστωση)."
+    if errors:
+        raise ValidationError(errors)
+
+
+def post(entries: list[LedgerEntry], user=None) -> list[LedgerEntry]:
+    """
+    Καταχωρεί νέες εγγραφές και ενημερώνει τα υπόλοιπα ατομικά (όλα ή τίποτα).
+    Όμιλος = ο όμιλος του αθλητή αν δεν δοθεί. Σεζόν = έτος ημερομηνίας αν δεν δοθεί.
+    """
+    if not entries:
+        return []
+    missing_club = {e.athlete_id for e in entries if e.club_id is None and e.athlete_id is not None}
+    clubs = dict(Athlete.objects.filter(pk__in=missing_club).values_list("pk", "club_id")) if missing_club else {}
+    now = timezone.now()
+    for e in entries:
+        if e.pk is not None:
+            raise ValueError("Οι εγγραφές καθολικού καταχωρούνται μία φορά.")
+        if e.club_id is None and e.athlete_id is not None:
+            e.club_id = clubs.get(e.athlete_id)
+        if not e.season:
+            e.season = e.date.year
+        if user is not None and user.is_authenticated and e.posted_by_id is None:
+            e.posted_by = user
+        e.posted_at = now
+        validate_entry(e)
+
+    with transaction.atomic():
+        created = LedgerEntry.objects.bulk_create(entries, batch_size=1000)
+        deltas = {kind: defaultdict(_Delta) for kind in BALANCES}
+        for e in created:
+            if e.athlete_id is not None:
+                deltas["athlete"][(e.athlete_id, e.season)].add(e.amount)
+            if e.club_id is not None:
+                deltas["club"][(e.club_id, e.season)].add(e.amount)
+        for kind, by_key in deltas.items():
+            if len(by_key) > INCREMENT_LIMIT:
+                refresh_balances(kind, by_key.keys(), lock=True)
+            else:
+                _increment(kind, by_key, now)
+    return created
+
+
+def _increment(kind: str, deltas: dict[tuple[int, int], _Delta], now) -> None:
+    model, owner = BALANCES[kind]
+    model.objects.bulk_create(
+        [model(**{f"{owner}_id": owner_id}, season=season) for owner_id, season in deltas],
+        ignore_conflicts=True,
+    )
+    for (owner_id, season), d in deltas.items():
+        model.objects.filter(**{f"{owner}_id": owner_id}, season=season).update(
+            debit=F("debit") + d.debit,
+            credit=F("credit") + d.credit,
+            balance=F("balance") + (d.debit - d.credit),
+            postings=F("postings") + d.postings,
+            last_posted_at=now,
+        )
+
+
+def reverse(entry: LedgerEntry, user=None, description: str = "") -> LedgerEntry:
+    """Αντιλογισμός: νέα εγγραφή με αντίθετο ποσό· και οι δύο μένουν ως "Ακυρώθηκε"."""
+    with transaction.atomic():
+        entry = LedgerEntry.objects.select_for_update().get(pk=entry.pk)
+        if entry.kind == LedgerEntry.Kind.REVERSAL or hasattr(entry, "reversed_by"):
+            raise ValidationError("Η εγγραφή έχει ήδη αντιλογιστεί.")
+        (reversal,) = post([LedgerEntry(
+            kind=LedgerEntry.Kind.REVERSAL,
+            status=LedgerEntry.Status.CANCELLED,
+            athlete_id=entry.athlete_id,
+            club_id=entry.club_id,
+            season=entry.season,
+            amount=-entry.amount,
+            description=(description or f"Αντιλογισμός #{entry.pk}")[:200],
+            reference=entry.reference,
+            entry_id=entry.entry_id,
+            subscription_id=entry.subscription_id,
+            reverses=entry,
+        )], user=user)
+        entry.status = LedgerEntry.Status.CANCELLED
+        entry.save(update_fields=["status"])
+    return reversal
+
+
+def settle(charges, payment: LedgerEntry | None = None) -> int:
+    """
+    Ανοιχτές χρεώσεις -> "Εξοφλήθηκε" (ένα UPDATE). Επιστρέφει πόσες άλλαξαν.
+    Οι συνδεδεμένες συνδρομές γίνονται "Εξοφλήθηκε" (και ξαναϋπολογίζεται η καταλληλότητα).
+    """
+    return settle_many({payment.pk if payment is not None else None: charges})
+
+
+def settle_many(groups: dict) -> int:
+    """
+    {payment_id | None: [χρεώσεις]} -> ένα UPDATE ανά chunk (settlement με CASE),
+    π.χ. για όλες τις γραμμές ενός αντιγράφου κίνησης τράπεζας μαζί.
+    """
+    payment_of = {
+        c.pk if isinstance(c, LedgerEntry) else c: payment_id
+        for payment_id, charges in groups.items()
+        for c in charges
+    }
+    ids = list(payment_of)
+    now = timezone.now()
+    count = 0
+    with transaction.atomic():
+        subscription_ids = set(
+            LedgerEntry.objects.filter(pk__in=ids, status=LedgerEntry.Status.OPEN, subscription__isnull=False)
+            .values_list("subscription_id", flat=True)
+        )
+        for i in range(0, len(ids), SETTLE_CHUNK):
+            chunk = ids[i:i + SETTLE_CHUNK]
+            by_payment = defaultdict(list)
+            for pk in chunk:
+                by_payment[payment_of[pk]].append(pk)
+            count += LedgerEntry.objects.filter(pk__in=chunk, status=LedgerEntry.Status.OPEN).update(
+                status=LedgerEntry.Status.SETTLED,
+                settled_at=now,
+                settlement_id=Case(
+                    *(When(pk__in=pks, then=Value(payment_id)) for payment_id, pks in by_payment.items()),
+                    output_field=IntegerField(),
+                ),
+            )
+        if subscription_ids:
+            subscriptions_paid(subscription_ids)
+    return count
+
+
+def subscriptions_paid(subscription_ids, paid_on=None) -> int:
+    """Μαζικά (χωρίς save() / signals): συνδρομές -> εξοφλημένες + καταλληλότητα + cache δηλώσεων."""
+    paid_on = paid_on or timezone.localdate()
+    pending = AthleteSubscription.objects.filter(pk__in=subscription_ids, status=AthleteSubscription.Status.PENDING)
+    athlete_ids = set(pending.values_list("athlete_id", flat=True))
+    count = pending.update(status=AthleteSubscription.Status.PAID, paid_at=paid_on)
+    eligibility_changed(athlete_ids)
+    return count
+
+
+def eligibility_changed(athlete_ids) -> None:
+    """Ό,τι θα έκαναν τα signals του AthleteSubscription, μία φορά για όλους."""
+    if not athlete_ids:
+        return
+    schedule_athletes(athlete_ids)
+    invalidate_eligibility("a", athlete_ids)
+
+
+# -----------------------------
+# ξαναϋπολογισμός / reconcile
+# -----------------------------
+def _expected(kind: str, entries):
+    _, owner = BALANCES[kind]
+    return (
+        entries.filter(**{f"{owner}__isnull": False})
+        .order_by()
+        .values(f"{owner}_id", "season")
+        .annotate(
+            debit=Coalesce(Sum("amount", filter=Q(amount__gt=0)), Value(ZERO)),
+            credit=Coalesce(Sum("amount", filter=Q(amount__lt=0)), Value(ZERO)),
+            postings=Count("pk"),
+            last_posted_at=Max("posted_at"),
+        )
+    )
+
+
+def _balance(row: dict, model, owner: str):
+    debit = Decimal(row["debit"]).quantize(ZERO)
+    credit = -Decimal(row["credit"]).quantize(ZERO)
+    return model(
+        **{f"{owner}_id": row[f"{owner}_id"]},
+        season=row["season"],
+        debit=debit,
+        credit=credit,
+        balance=debit - credit,
+        postings=row["postings"],
+        last_posted_at=row["last_posted_at"],
+    )
+
+
+def refresh_balances(kind: str, keys, lock: bool = False) -> int:
+    """keys: {(owner_id, season)}. Ένα GROUP BY στο καθολικό μόνο για αυτά + upsert."""
+    model, owner = BALANCES[kind]
+    keys = set(keys)
+    owners = {k[0] for k in keys}
+    seasons = {k[1] for k in keys}
+    with transaction.atomic():
+        if lock:
+            # ταυτόχρονες καταχωρήσεις περιμένουν (και μετά προσθέτουν το Δ τους σε σωστή βάση)
+            model.objects.bulk_create(
+                [model(**{f"{owner}_id": o}, season=s) for o, s in keys], ignore_conflicts=True
+            )
+            list(model.objects.select_for_update().filter(**{f"{owner}_id__in": owners}, season__in=seasons).values_list("pk"))
+        rows = _expected(kind, LedgerEntry.objects.filter(**{f"{owner}_id__in": owners}, season__in=seasons))
+        objs = [_balance(r, model, owner) for r in rows if (r[f"{owner}_id"], r["season"]) in keys]
+        model.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=[owner, "season"],
+            update_fields=BALANCE_FIELDS,
+            batch_size=1000,
+        )
+    return len(objs)
+
+
+@dataclass
+class Drift:
+    kind: str
+    owner_id: int
+    season: int
+    stored: Decimal | None
+    expected: Decimal | None
+    stored_postings: int = 0
+    expected_postings: int = 0
+
+
+@dataclass
+class ReconcileReport:
+    checked: int = 0
+    drift: list[Drift] = field(default_factory=list)
+    fixed: bool = False
+
+
+def reconcile(season: int | None = None, fix: bool = False) -> ReconcileReport:
+    """
+    Ξαναϋπολογίζει ΟΛΑ τα υπόλοιπα από το καθολικό (ένα GROUP BY ανά είδος) και τα
+    συγκρίνει με τα αποθηκευμένα. fix=True: upsert των σωστών, διαγραφή όσων περισσεύουν.
+    """
+    report = ReconcileReport(fixed=fix)
+    for kind, (model, owner) in BALANCES.items():
+        entries = LedgerEntry.objects.all()
+        stored_qs = model.objects.all()
+        if season is not None:
+            entries = entries.filter(season=season)
+            stored_qs = stored_qs.filter(season=season)
+
+        expected = {(r[f"{owner}_id"], r["season"]): _balance(r, model, owner) for r in _expected(kind, entries)}
+        stored = {
+            (owner_id, s): (debit, credit, balance, postings)
+            for owner_id, s, debit, credit, balance, postings in stored_qs.order_by().values_list(
+                f"{owner}_id", "season", "debit", "credit", "balance", "postings"
+            )
+        }
+        report.checked += len(expected.keys() | stored.keys())
+        for key in sorted(expected.keys() | stored.keys()):
+            exp = expected.get(key)
+            have = stored.get(key)
+            exp_tuple = (exp.debit, exp.credit, exp.balance, exp.postings) if exp else None
+            if exp_tuple == have or (exp is None and have is not None and not have[3] and not have[2]):
+                continue
+            report.drift.append(Drift(
+                kind=kind,
+                owner_id=key[0],
+                season=key[1],
+                stored=have[2] if have else None,
+                expected=exp.balance if exp else None,
+                stored_postings=have[3] if have else 0,
+                expected_postings=exp.postings if exp else 0,
+            ))
+
+        if fix:
+            with transaction.atomic():
+                model.objects.bulk_create(
+                    list(expected.values()),
+                    update_conflicts=True,
+                    unique_fields=[owner, "season"],
+                    update_fields=BALANCE_FIELDS,
+                    batch_size=1000,
+                )
+                stale = stored.keys() - expected.keys()
+                for owner_id, s in stale:
+                    model.objects.filter(**{f"{owner}_id": owner_id}, season=s).delete()
+    return report
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from finance.bank import import_statement
+
+
+class Command(BaseCommand):
+    help = "Εισαγωγή αντιγράφου κίνησης τράπεζας (CSV / camt.053) και αντιστοίχιση με τις ανοιχτές χρεώσεις."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Αρχείο .csv ή .xml (camt.053)")
+        parser.add_argument("--dry-run", action="store_true", help="Μόνο έλεγχος, χωρίς αποθήκευση")
+
+    def handle(self, *args, **options):
+        p = Path(options["path"]).expanduser().resolve()
+        if not p.exists():
+            raise CommandError(f"Δεν βρέθηκε το αρχείο: {p}")
+        started = time.perf_counter()
+        try:
+            with p.open("rb") as f:
+                stats = import_statement(f, p.name, dry_run=options["dry_run"])
+        except ValidationError as e:
+            raise CommandError("; ".join(e.messages))
+        for rule, count in sorted(stats.rules.items(), key=lambda kv: -kv[1]):
+            self.stdout.write(f"  {rule}: {count}")
+        self.stdout.write(
+            f"Κινήσεις: {stats.lines} ({stats.amount} €) | χρεώσεις (αγνοήθηκαν): {stats.skipped_debits} | "
+            f"προς έλεγχο: {stats.unmatched}"
+        )
+        label = "Θα αντιστοιχιστούν" if options["dry_run"] else "Αντιστοιχίστηκαν"
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. {label}: {stats.matched} κινήσεις ({stats.matched_amount} €), {stats.settled_charges} χρεώσεις, "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        ))
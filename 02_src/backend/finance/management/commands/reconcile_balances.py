@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from finance.ledger import reconcile
+
+
+class Command(BaseCommand):
+    help = "Ξαναϋπολογίζει τα υπόλοιπα αθλητών / ομίλων από το καθολικό και αναφέρει αποκλίσεις."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--season", type=int, default=None, help="Μόνο μία σεζόν")
+        parser.add_argument("--fix", action="store_true", help="Διόρθωση των αποθηκευμένων υπολοίπων")
+        parser.add_argument("--limit", type=int, default=50, help="Πόσες αποκλίσεις να εμφανιστούν")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        report = reconcile(season=options["season"], fix=options["fix"])
+        for d in report.drift[: options["limit"]]:
+            self.stdout.write(self.style.WARNING(
+                f"{'Αθλητής' if d.kind == 'athlete' else 'Όμιλος'} #{d.owner_id} {d.season}: "
+                f"αποθηκευμένο {d.stored} € ({d.stored_postings} εγγρ.) / "
+                f"καθολικό {d.expected} € ({d.expected_postings} εγγρ.)"
+            ))
+        if len(report.drift) > options["limit"]:
+            self.stdout.write(f"... και άλλες {len(report.drift) - options['limit']}")
+        elapsed = (time.perf_counter() - started) * 1000
+        if not report.drift:
+            self.stdout.write(self.style.SUCCESS(f"OK. {report.checked} υπόλοιπα χωρίς αποκλίσεις, {elapsed:.0f} ms"))
+        elif report.fixed:
+            self.stdout.write(self.style.SUCCESS(f"Διορθώθηκαν {len(report.drift)} από {report.checked} υπόλοιπα, {elapsed:.0f} ms"))
+        else:
+            self.stdout.write(self.style.ERROR(
+                f"{len(report.drift)} αποκλίσεις σε {report.checked} υπόλοιπα ({elapsed:.0f} ms). Τρέξε με --fix για διόρθωση."
+            ))
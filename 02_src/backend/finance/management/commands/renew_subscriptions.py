@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import time
+from decimal import Decimal, InvalidOperation
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from finance.models import RenewalBatch
+from finance.renewals import preview, run
+from organizations.models import Club, Region
+
+
+class Command(BaseCommand):
+    help = "Μαζική ετήσια ανανέωση συνδρομών (όμιλος / περιφέρεια / όλοι): συνδρομές + χρεώσεις καθολικού σε μία συναλλαγή."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--season", type=int, required=True, help="Έτος συνδρομής")
+        parser.add_argument("--amount", type=str, required=True, help="Ποσό ανά αθλητή (€)")
+        parser.add_argument("--club", type=str, default=None, help="Κωδικός ομίλου")
+        parser.add_argument("--region", type=str, default=None, help="Όνομα περιφέρειας")
+        parser.add_argument("--paid", action="store_true", help="Ο όμιλος έχει ήδη πληρώσει")
+        parser.add_argument("--preview", action="store_true", help="Μόνο προεπισκόπηση, χωρίς αποθήκευση")
+
+    def handle(self, *args, **options):
+        try:
+            amount = Decimal(options["amount"].replace(",", ".")).quantize(Decimal("0.01"))
+        except InvalidOperation:
+            raise CommandError(f"Μη έγκυρο ποσό: {options['amount']}")
+        batch = RenewalBatch(season=options["season"], amount=amount, paid=options["paid"])
+        if options["club"]:
+            batch.club = Club.objects.filter(code=options["club"]).first()
+            if batch.club is None:
+                raise CommandError(f"Δεν βρέθηκε όμιλος με κωδικό {options['club']}")
+        if options["region"]:
+            batch.region = Region.objects.filter(name=options["region"]).first()
+            if batch.region is None:
+                raise CommandError(f"Δεν βρέθηκε περιφέρεια: {options['region']}")
+        try:
+            batch.full_clean()
+        except ValidationError as e:
+            raise CommandError("; ".join(e.messages))
+
+        data = preview(batch)
+        for c in data["clubs"]:
+            self.stdout.write(f"{c['club']}: {c['to_renew']}/{c['athletes']} αθλητές, {c['amount']} €")
+        self.stdout.write(
+            f"Για ανανέωση: {data['to_renew']} | έχουν ήδη συνδρομή: {data['already_subscribed']} | "
+            f"σύνολο: {data['total_amount']} €"
+        )
+        if options["preview"] or not data["to_renew"]:
+            return
+
+        batch.save()
+        started = time.perf_counter()
+        batch = run(batch.pk, on_progress=lambda done, total, phase: self.stdout.write(f"  {phase}: {done}/{total}"))
+        elapsed = (time.perf_counter() - started) * 1000
+        if batch.status == RenewalBatch.Status.DONE:
+            self.stdout.write(self.style.SUCCESS(
+                f"OK. {batch.created_subscriptions} συνδρομές, {batch.total_amount} €, {elapsed:.0f} ms (ανανέωση #{batch.pk})"
+            ))
+        else:
+            raise CommandError(f"Η ανανέωση #{batch.pk} απέτυχε: {batch.error}")
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:16
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('competitions', '0006_partnerships'),
+        ('organizations', '0001_initial'),
+        ('registry', '0016_horse_pedigree'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AthleteBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField(verbose_name='Σεζόν')),
+                ('debit', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Χρεώσεις (€)')),
+                ('credit', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Πιστώσεις (€)')),
+                ('balance', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Υπόλοιπο (€)')),
+                ('postings', models.PositiveIntegerField(default=0, verbose_name='Εγγραφές')),
+                ('last_posted_at', models.DateTimeField(blank=True, null=True, verbose_name='Τελευταία κίνηση')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balances', to='registry.athlete', verbose_name='Αθλητής')),
+            ],
+            options={
+                'verbose_name': 'Υπόλοιπο Αθλητή',
+                'verbose_name_plural': 'Υπόλοιπα Αθλητών',
+                'ordering': ['-season'],
+                'abstract': False,
+                'constraints': [models.UniqueConstraint(fields=('athlete', 'season'), name='uniq_athlete_balance')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ClubBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField(verbose_name='Σεζόν')),
+                ('debit', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Χρεώσεις (€)')),
+                ('credit', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Πιστώσεις (€)')),
+                ('balance', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Υπόλοιπο (€)')),
+                ('postings', models.PositiveIntegerField(default=0, verbose_name='Εγγραφές')),
+                ('last_posted_at', models.DateTimeField(blank=True, null=True, verbose_name='Τελευταία κίνηση')),
+                ('club', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balances', to='organizations.club', verbose_name='Όμιλος')),
+            ],
+            options={
+                'verbose_name': 'Υπόλοιπο Ομίλου',
+                'verbose_name_plural': 'Υπόλοιπα Ομίλων',
+                'ordering': ['-season'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['season', 'balance'], name='club_balance_season_idx')],
+                'constraints': [models.UniqueConstraint(fields=('club', 'season'), name='uniq_club_balance')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('SUB', 'Συνδρομή'), ('FEE', 'Παράβολο'), ('PEN', 'Πρόστιμο'), ('PRZ', 'Έπαθλο'), ('PAY', 'Πληρωμή'), ('ADJ', 'Διόρθωση'), ('REV', 'Αντιλογισμός')], max_length=3, verbose_name='Είδος')),
+                ('status', models.CharField(choices=[('OPEN', 'Ανοιχτή'), ('SETTLED', 'Εξοφλήθηκε'), ('CANCELLED', 'Ακυρώθηκε')], default='OPEN', max_length=10, verbose_name='Κατάσταση')),
+                ('season', models.PositiveSmallIntegerField(blank=True, help_text='Κενό = έτος ημερομηνίας.', verbose_name='Σεζόν')),
+                ('date', models.DateField(default=django.utils.timezone.localdate, verbose_name='Ημερομηνία')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Ποσό (€)')),
+                ('description', models.CharField(blank=True, max_length=200, verbose_name='Αιτιολογία')),
+                ('reference', models.CharField(blank=True, max_length=60, verbose_name='Κωδικός πληρωμής')),
+                ('settled_at', models.DateTimeField(blank=True, null=True, verbose_name='Εξοφλήθηκε')),
+                ('posted_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Καταχωρήθηκε')),
+                ('athlete', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entries', to='registry.athlete', verbose_name='Αθλητής')),
+                ('club', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entries', to='organizations.club', verbose_name='Όμιλος')),
+                ('entry', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='competitions.entry', verbose_name='Συμμετοχή')),
+                ('posted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to=settings.AUTH_USER_MODEL, verbose_name='Καταχωρήθηκε από')),
+                ('reverses', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='reversed_by', to='finance.ledgerentry', verbose_name='Αντιλογίζει')),
+                ('settlement', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='settles', to='finance.ledgerentry', verbose_name='Εξοφλήθηκε με')),
+                ('subscription', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='registry.athletesubscription', verbose_name='Συνδρομή')),
+            ],
+            options={
+                'verbose_name': 'Εγγραφή Καθολικού',
+                'verbose_name_plural': 'Καθολικό',
+                'ordering': ['-date', '-id'],
+                'indexes': [models.Index(fields=['athlete', 'season'], name='ledger_athlete_season_idx'), models.Index(fields=['club', 'season'], name='ledger_club_season_idx'), models.Index(fields=['status', 'reference'], name='ledger_status_ref_idx')],
+            },
+        ),
+    ]
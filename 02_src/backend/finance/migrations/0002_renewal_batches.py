@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0001_initial'),
+        ('organizations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RenewalBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField(verbose_name='Έτος')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=8, verbose_name='Ποσό ανά αθλητή (€)')),
+                ('valid_from', models.DateField(blank=True, help_text='Κενό = 1/1 του έτους.', null=True, verbose_name='Ισχύει από')),
+                ('valid_until', models.DateField(blank=True, help_text='Κενό = 31/12 του έτους.', null=True, verbose_name='Ισχύει μέχρι')),
+                ('paid', models.BooleanField(default=False, help_text='Ο όμιλος έχει ήδη πληρώσει: συνδρομές ως εξοφλημένες και μία πληρωμή ανά όμιλο στο καθολικό.', verbose_name='Εξοφλημένες')),
+                ('status', models.CharField(choices=[('DRAFT', 'Πρόχειρη'), ('QUEUED', 'Σε αναμονή'), ('RUNNING', 'Σε εξέλιξη'), ('DONE', 'Ολοκληρώθηκε'), ('FAILED', 'Απέτυχε')], default='DRAFT', max_length=10, verbose_name='Κατάσταση')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Αθλητές')),
+                ('created_subscriptions', models.PositiveIntegerField(default=0, verbose_name='Νέες συνδρομές')),
+                ('skipped', models.PositiveIntegerField(default=0, verbose_name='Είχαν ήδη συνδρομή')),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Σύνολο (€)')),
+                ('error', models.TextField(blank=True, verbose_name='Σφάλμα')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Δημιουργήθηκε')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Ξεκίνησε')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Ολοκληρώθηκε')),
+                ('club', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='renewal_batches', to='organizations.club', verbose_name='Όμιλος')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='renewal_batches', to=settings.AUTH_USER_MODEL, verbose_name='Δημιουργήθηκε από')),
+                ('region', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='renewal_batches', to='organizations.region', verbose_name='Περιφέρεια')),
+            ],
+            options={
+                'verbose_name': 'Ανανέωση Συνδρομών',
+                'verbose_name_plural': 'Ανανεώσεις Συνδρομών',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:25
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0002_renewal_batches'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BankStatement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file_name', models.CharField(max_length=255, verbose_name='Αρχείο')),
+                ('format', models.CharField(choices=[('CSV', 'CSV'), ('CAMT053', 'camt.053 (XML)')], max_length=10, verbose_name='Μορφή')),
+                ('sha256', models.CharField(editable=False, max_length=64, unique=True, verbose_name='SHA-256')),
+                ('lines', models.PositiveIntegerField(default=0, verbose_name='Κινήσεις')),
+                ('matched', models.PositiveIntegerField(default=0, verbose_name='Αντιστοιχίστηκαν')),
+                ('unmatched', models.PositiveIntegerField(default=0, verbose_name='Προς έλεγχο')),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Σύνολο (€)')),
+                ('uploaded_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Ανέβηκε')),
+                ('uploaded_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bank_statements', to=settings.AUTH_USER_MODEL, verbose_name='Ανέβηκε από')),
+            ],
+            options={
+                'verbose_name': 'Αντίγραφο Κίνησης Τράπεζας',
+                'verbose_name_plural': 'Αντίγραφα Κίνησης Τράπεζας',
+                'ordering': ['-uploaded_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BankStatementLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('line_no', models.PositiveIntegerField(verbose_name='Α/Α')),
+                ('booking_date', models.DateField(blank=True, null=True, verbose_name='Ημερομηνία')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Ποσό (€)')),
+                ('payer', models.CharField(blank=True, max_length=200, verbose_name='Καταθέτης')),
+                ('reference', models.CharField(blank=True, max_length=500, verbose_name='Αιτιολογία')),
+                ('bank_reference', models.CharField(blank=True, max_length=100, verbose_name='Κωδικός τράπεζας')),
+                ('status', models.CharField(choices=[('UNMATCHED', 'Προς έλεγχο'), ('MATCHED', 'Αντιστοιχίστηκε'), ('MANUAL', 'Αντιστοιχίστηκε χειροκίνητα'), ('IGNORED', 'Αγνοήθηκε')], default='UNMATCHED', max_length=10, verbose_name='Κατάσταση')),
+                ('score', models.DecimalField(blank=True, decimal_places=3, max_digits=4, null=True, verbose_name='Βαθμός ταύτισης')),
+                ('match_note', models.CharField(blank=True, max_length=200, verbose_name='Σημείωση')),
+                ('matched_at', models.DateTimeField(blank=True, null=True, verbose_name='Αντιστοιχίστηκε')),
+                ('payment', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='bank_line', to='finance.ledgerentry', verbose_name='Πληρωμή')),
+                ('statement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='statement_lines', to='finance.bankstatement', verbose_name='Αντίγραφο')),
+            ],
+            options={
+                'verbose_name': 'Κίνηση Τράπεζας',
+                'verbose_name_plural': 'Κινήσεις Τράπεζας',
+                'ordering': ['statement', 'line_no'],
+                'indexes': [models.Index(fields=['status', 'booking_date'], name='bank_line_status_idx')],
+                'constraints': [models.UniqueConstraint(fields=('statement', 'line_no'), name='uniq_bank_line')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0003_bank_statements'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='renewalbatch',
+            name='queued_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Σε αναμονή από'),
+        ),
+    ]
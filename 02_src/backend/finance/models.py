@@ -0,0 +1,362 @@
+from datetime import date
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils import timezone
+
+
+class LedgerEntry(models.Model):
+    """
+    Append-only καθολικό: συνδρομές, παράβολα, πρόστιμα, έπαθλα, πληρωμές.
+    amount > 0 = χρέωση (οφειλή προς την Ομοσπονδία), amount < 0 = πίστωση.
+    Διόρθωση = αντιλογισμός (νέα εγγραφή με reverses). Αλλάζει μόνο η κατάσταση
+    εξόφλησης (status / settled_at / settlement). Καταχώρηση μόνο μέσω finance/ledger.py::post().
+    """
+
+    class Kind(models.TextChoices):
+        SUBSCRIPTION = "SUB", "Συνδρομή"
+        ENTRY_FEE = "FEE", "Παράβολο"
+        PENALTY = "PEN", "Πρόστιμο"
+        PRIZE = "PRZ", "Έπαθλο"
+        PAYMENT = "PAY", "Πληρωμή"
+        ADJUSTMENT = "ADJ", "Διόρθωση"
+        REVERSAL = "REV", "Αντιλογισμός"
+
+    class Status(models.TextChoices):
+        OPEN = "OPEN", "Ανοιχτή"
+        SETTLED = "SETTLED", "Εξοφλήθηκε"
+        CANCELLED = "CANCELLED", "Ακυρώθηκε"
+
+    kind = models.CharField(max_length=3, choices=Kind.choices, verbose_name="Είδος")
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.OPEN, verbose_name="Κατάσταση")
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="ledger_entries",
+        verbose_name="Αθλητής",
+    )
+    # ο όμιλος τη στιγμή της καταχώρησης (υπόλοιπο ομίλου χωρίς join στους αθλητές)
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="ledger_entries",
+        verbose_name="Όμιλος",
+    )
+    season = models.PositiveSmallIntegerField(blank=True, verbose_name="Σεζόν", help_text="Κενό = έτος ημερομηνίας.")
+    date = models.DateField(default=timezone.localdate, verbose_name="Ημερομηνία")
+    amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Ποσό (€)")
+    description = models.CharField(max_length=200, blank=True, verbose_name="Αιτιολογία")
+    reference = models.CharField(max_length=60, blank=True, verbose_name="Κωδικός πληρωμής")
+
+    entry = models.ForeignKey(
+        "competitions.Entry",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="ledger_entries",
+        verbose_name="Συμμετοχή",
+    )
+    subscription = models.ForeignKey(
+        "registry.AthleteSubscription",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="ledger_entries",
+        verbose_name="Συνδρομή",
+    )
+    reverses = models.OneToOneField(
+        "self",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="reversed_by",
+        verbose_name="Αντιλογίζει",
+    )
+    settlement = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="settles",
+        verbose_name="Εξοφλήθηκε με",
+    )
+    settled_at = models.DateTimeField(null=True, blank=True, verbose_name="Εξοφλήθηκε")
+
+    posted_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="ledger_entries",
+        verbose_name="Καταχωρήθηκε από",
+    )
+    posted_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Καταχωρήθηκε")
+
+    # τα μόνα πεδία που αλλάζουν μετά την καταχώρηση
+    MUTABLE_FIELDS = frozenset({"status", "settled_at", "settlement"})
+
+    class Meta:
+        verbose_name = "Εγγραφή Καθολικού"
+        verbose_name_plural = "Καθολικό"
+        ordering = ["-date", "-id"]
+        indexes = [
+            # καρτέλα αθλητή / ομίλου και reconcile ανά σεζόν
+            models.Index(fields=["athlete", "season"], name="ledger_athlete_season_idx"),
+            models.Index(fields=["club", "season"], name="ledger_club_season_idx"),
+            # ανοιχτές οφειλές προς αντιστοίχιση με πληρωμές
+            models.Index(fields=["status", "reference"], name="ledger_status_ref_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if self.pk is not None and (update_fields is None or not self.MUTABLE_FIELDS.issuperset(update_fields)):
+            raise ValueError("Οι εγγραφές καθολικού δεν αλλάζουν· καταχωρήστε αντιλογισμό.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Οι εγγραφές καθολικού δεν διαγράφονται· καταχωρήστε αντιλογισμό.")
+
+    def __str__(self):
+        return f"#{self.pk} {self.get_kind_display()} {self.amount} €"
+
+
+# -----------------------------
+# Υπόλοιπα (finance/ledger.py)
+# -----------------------------
+class Balance(models.Model):
+    """Υπόλοιπο ανά σεζόν, ενημερώνεται στην ίδια συναλλαγή με κάθε καταχώρηση."""
+
+    season = models.PositiveSmallIntegerField(verbose_name="Σεζόν")
+    debit = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="Χρεώσεις (€)")
+    credit = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="Πιστώσεις (€)")
+    balance = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="Υπόλοιπο (€)")
+    postings = models.PositiveIntegerField(default=0, verbose_name="Εγγραφές")
+    last_posted_at = models.DateTimeField(null=True, blank=True, verbose_name="Τελευταία κίνηση")
+
+    class Meta:
+        abstract = True
+        ordering = ["-season"]
+
+
+class AthleteBalance(Balance):
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.CASCADE,
+        related_name="balances",
+        verbose_name="Αθλητής",
+    )
+
+    class Meta(Balance.Meta):
+        verbose_name = "Υπόλοιπο Αθλητή"
+        verbose_name_plural = "Υπόλοιπα Αθλητών"
+        constraints = [
+            models.UniqueConstraint(fields=["athlete", "season"], name="uniq_athlete_balance"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete_id} {self.season}: {self.balance} €"
+
+
+class ClubBalance(Balance):
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.CASCADE,
+        related_name="balances",
+        verbose_name="Όμιλος",
+    )
+
+    class Meta(Balance.Meta):
+        verbose_name = "Υπόλοιπο Ομίλου"
+        verbose_name_plural = "Υπόλοιπα Ομίλων"
+        constraints = [
+            models.UniqueConstraint(fields=["club", "season"], name="uniq_club_balance"),
+        ]
+        indexes = [
+            # "όμιλοι με οφειλές" ανά σεζόν
+            models.Index(fields=["season", "balance"], name="club_balance_season_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.club_id} {self.season}: {self.balance} €"
+
+
+# -----------------------------
+# Μαζική ανανέωση συνδρομών (finance/renewals.py)
+# -----------------------------
+class RenewalBatch(models.Model):
+    """
+    Ετήσια ανανέωση συνδρομών για έναν όμιλο ή μια περιφέρεια: συνδρομές + χρεώσεις
+    καθολικού + καταλληλότητα σε μία συναλλαγή, στο παρασκήνιο με ένδειξη προόδου.
+    """
+
+    class Status(models.TextChoices):
+        DRAFT = "DRAFT", "Πρόχειρη"
+        QUEUED = "QUEUED", "Σε αναμονή"
+        RUNNING = "RUNNING", "Σε εξέλιξη"
+        DONE = "DONE", "Ολοκληρώθηκε"
+        FAILED = "FAILED", "Απέτυχε"
+
+    season = models.PositiveSmallIntegerField(verbose_name="Έτος")
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="renewal_batches",
+        verbose_name="Όμιλος",
+    )
+    region = models.ForeignKey(
+        "organizations.Region",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="renewal_batches",
+        verbose_name="Περιφέρεια",
+    )
+    amount = models.DecimalField(max_digits=8, decimal_places=2, verbose_name="Ποσό ανά αθλητή (€)")
+    valid_from = models.DateField(null=True, blank=True, verbose_name="Ισχύει από", help_text="Κενό = 1/1 του έτους.")
+    valid_until = models.DateField(null=True, blank=True, verbose_name="Ισχύει μέχρι", help_text="Κενό = 31/12 του έτους.")
+    paid = models.BooleanField(
+        default=False,
+        verbose_name="Εξοφλημένες",
+        help_text="Ο όμιλος έχει ήδη πληρώσει: συνδρομές ως εξοφλημένες και μία πληρωμή ανά όμιλο στο καθολικό.",
+    )
+
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.DRAFT, verbose_name="Κατάσταση")
+    total = models.PositiveIntegerField(default=0, verbose_name="Αθλητές")
+    created_subscriptions = models.PositiveIntegerField(default=0, verbose_name="Νέες συνδρομές")
+    skipped = models.PositiveIntegerField(default=0, verbose_name="Είχαν ήδη συνδρομή")
+    total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="Σύνολο (€)")
+    error = models.TextField(blank=True, verbose_name="Σφάλμα")
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="renewal_batches",
+        verbose_name="Δημιουργήθηκε από",
+    )
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Δημιουργήθηκε")
+    queued_at = models.DateTimeField(null=True, blank=True, verbose_name="Σε αναμονή από")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="Ξεκίνησε")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Ολοκληρώθηκε")
+
+    class Meta:
+        verbose_name = "Ανανέωση Συνδρομών"
+        verbose_name_plural = "Ανανεώσεις Συνδρομών"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        target = self.club or self.region or "Όλοι οι όμιλοι"
+        return f"{self.season} - {target} ({self.get_status_display()})"
+
+    def clean(self):
+        if self.club_id is not None and self.region_id is not None:
+            raise ValidationError("Επιλέξτε όμιλο ή περιφέρεια, όχι και τα δύο.")
+        if self.amount is not None and self.amount < 0:
+            raise ValidationError({"amount": "Μη αρνητικό ποσό."})
+        if self.valid_from and self.valid_until and self.valid_until < self.valid_from:
+            raise ValidationError({"valid_until": "Πριν από την έναρξη."})
+
+    @property
+    def period(self) -> tuple[date, date]:
+        return (
+            self.valid_from or date(self.season, 1, 1),
+            self.valid_until or date(self.season, 12, 31),
+        )
+
+
+# -----------------------------
+# Αντίγραφα κίνησης τράπεζας (finance/bank.py)
+# -----------------------------
+class BankStatement(models.Model):
+    """Ένα αρχείο κινήσεων τράπεζας (CSV ή camt.053) που αντιστοιχίστηκε με τις ανοιχτές χρεώσεις."""
+
+    class Format(models.TextChoices):
+        CSV = "CSV", "CSV"
+        CAMT053 = "CAMT053", "camt.053 (XML)"
+
+    file_name = models.CharField(max_length=255, verbose_name="Αρχείο")
+    format = models.CharField(max_length=10, choices=Format.choices, verbose_name="Μορφή")
+    # το ίδιο αρχείο δεν εισάγεται δύο φορές
+    sha256 = models.CharField(max_length=64, unique=True, editable=False, verbose_name="SHA-256")
+    lines = models.PositiveIntegerField(default=0, verbose_name="Κινήσεις")
+    matched = models.PositiveIntegerField(default=0, verbose_name="Αντιστοιχίστηκαν")
+    unmatched = models.PositiveIntegerField(default=0, verbose_name="Προς έλεγχο")
+    total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name="Σύνολο (€)")
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="bank_statements",
+        verbose_name="Ανέβηκε από",
+    )
+    uploaded_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Ανέβηκε")
+
+    class Meta:
+        verbose_name = "Αντίγραφο Κίνησης Τράπεζας"
+        verbose_name_plural = "Αντίγραφα Κίνησης Τράπεζας"
+        ordering = ["-uploaded_at"]
+
+    def __str__(self):
+        return f"{self.file_name} ({self.uploaded_at:%d/%m/%Y})"
+
+
+class BankStatementLine(models.Model):
+    """Μία εισερχόμενη κίνηση. Όσες δεν αντιστοιχίστηκαν αυτόματα μένουν "Προς έλεγχο"."""
+
+    class Status(models.TextChoices):
+        UNMATCHED = "UNMATCHED", "Προς έλεγχο"
+        MATCHED = "MATCHED", "Αντιστοιχίστηκε"
+        MANUAL = "MANUAL", "Αντιστοιχίστηκε χειροκίνητα"
+        IGNORED = "IGNORED", "Αγνοήθηκε"
+
+    statement = models.ForeignKey(
+        BankStatement,
+        on_delete=models.CASCADE,
+        related_name="statement_lines",
+        verbose_name="Αντίγραφο",
+    )
+    line_no = models.PositiveIntegerField(verbose_name="Α/Α")
+    booking_date = models.DateField(null=True, blank=True, verbose_name="Ημερομηνία")
+    amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Ποσό (€)")
+    payer = models.CharField(max_length=200, blank=True, verbose_name="Καταθέτης")
+    reference = models.CharField(max_length=500, blank=True, verbose_name="Αιτιολογία")
+    bank_reference = models.CharField(max_length=100, blank=True, verbose_name="Κωδικός τράπεζας")
+
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.UNMATCHED, verbose_name="Κατάσταση"
+    )
+    payment = models.OneToOneField(
+        LedgerEntry,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="bank_line",
+        verbose_name="Πληρωμή",
+    )
+    score = models.DecimalField(max_digits=4, decimal_places=3, null=True, blank=True, verbose_name="Βαθμός ταύτισης")
+    match_note = models.CharField(max_length=200, blank=True, verbose_name="Σημείωση")
+    matched_at = models.DateTimeField(null=True, blank=True, verbose_name="Αντιστοιχίστηκε")
+
+    class Meta:
+        verbose_name = "Κίνηση Τράπεζας"
+        verbose_name_plural = "Κινήσεις Τράπεζας"
+        ordering = ["statement", "line_no"]
+        constraints = [
+            models.UniqueConstraint(fields=["statement", "line_no"], name="uniq_bank_line"),
+        ]
+        indexes = [
+            # ουρά ελέγχου
+            models.Index(fields=["status", "booking_date"], name="bank_line_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.booking_date or ''} {self.amount} € {self.payer}".strip()
@@ -0,0 +1,265 @@
+"""
+Μαζική ετήσια ανανέωση συνδρομών (RenewalBatch).
+
+    preview(batch)  -> πόσοι αθλητές / πόσα ανά όμιλο (2 GROUP BY, τίποτα δεν γράφεται)
+    start(batch)    -> στο παρασκήνιο (thread μετά το commit)
+    run(batch_id)   -> ΜΙΑ συναλλαγή: συνδρομές (bulk_create), χρεώσεις καθολικού (post),
+                       καταλληλότητα (στο commit), σε chunks με ένδειξη προόδου
+
+Κανένα Athlete.save() (ούτε επανυπολογισμός *_uc), κανένα signal ανά αθλητή.
+Αν κάτι αποτύχει δεν γράφεται τίποτα και η ανανέωση μένει "Απέτυχε" για επανάληψη.
+Αν το thread χαθεί (restart του server), η ανανέωση μένει "Σε εξέλιξη" ή "Σε αναμονή"· μετά από
+STALE_AFTER από την έναρξη / την αναμονή ξαναξεκινά όπως μια αποτυχημένη (η συναλλαγή της έχει
+γίνει ήδη rollback, ή δεν ξεκίνησε ποτέ).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+from registry.models import Athlete, AthleteSubscription
+
+from .ledger import eligibility_changed, post, settle_many, subscription_reference
+from .models import LedgerEntry, RenewalBatch
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+PROGRESS_TIMEOUT = 60 * 60
+# "Σε εξέλιξη" / "Σε αναμονή" για περισσότερο από τόσο: το thread χάθηκε, η ανανέωση μπορεί να ξαναξεκινήσει
+STALE_AFTER = timedelta(hours=2)
+RESTARTABLE = [RenewalBatch.Status.DRAFT, RenewalBatch.Status.FAILED]
+
+
+def _progress_key(batch_id: int) -> str:
+    return f"eoi:renewal:progress:{batch_id}"
+
+
+def _subscribed(season: int):
+    return AthleteSubscription.objects.filter(athlete=OuterRef("pk"), season=season)
+
+
+def eligible_athletes(batch: RenewalBatch):
+    """Ενεργοί αθλητές του ομίλου / της περιφέρειας (όλοι, αν δεν δοθεί κανένα)."""
+    qs = Athlete.objects.filter(is_active=True)
+    if batch.club_id is not None:
+        qs = qs.filter(club_id=batch.club_id)
+    elif batch.region_id is not None:
+        qs = qs.filter(club__region_id=batch.region_id)
+    return qs
+
+
+def athletes_to_renew(batch: RenewalBatch):
+    return eligible_athletes(batch).filter(~Exists(_subscribed(batch.season)))
+
+
+def _stale() -> Q:
+    cutoff = timezone.now() - STALE_AFTER
+    return (
+        Q(status=RenewalBatch.Status.RUNNING, started_at__lt=cutoff)
+        # χωρίς queued_at: σε αναμονή από πριν υπάρξει το πεδίο
+        | Q(status=RenewalBatch.Status.QUEUED) & (Q(queued_at__lt=cutoff) | Q(queued_at__isnull=True))
+    )
+
+
+def is_stale(batch: RenewalBatch) -> bool:
+    cutoff = timezone.now() - STALE_AFTER
+    if batch.status == RenewalBatch.Status.RUNNING:
+        return batch.started_at is not None and batch.started_at < cutoff
+    if batch.status == RenewalBatch.Status.QUEUED:
+        return batch.queued_at is None or batch.queued_at < cutoff
+    return False
+
+
+# -----------------------------
+# προεπισκόπηση
+# -----------------------------
+def preview(batch: RenewalBatch) -> dict:
+    rows = list(
+        eligible_athletes(batch)
+        .annotate(renewed=Exists(_subscribed(batch.season)))
+        .order_by()
+        .values("club_id", "club__code", "club__name")
+        .annotate(athletes=Count("pk"), to_renew=Count("pk", filter=Q(renewed=False)))
+        .order_by("club__code")
+    )
+    to_renew = sum(r["to_renew"] for r in rows)
+    return {
+        "athletes": sum(r["athletes"] for r in rows),
+        "to_renew": to_renew,
+        "already_subscribed": sum(r["athletes"] - r["to_renew"] for r in rows),
+        "total_amount": batch.amount * to_renew,
+        "clubs": [
+            {
+                "club_id": r["club_id"],
+                "club": f"{r['club__code'] or ''} {r['club__name'] or ''}".strip() or "Χωρίς όμιλο",
+                "athletes": r["athletes"],
+                "to_renew": r["to_renew"],
+                "amount": batch.amount * r["to_renew"],
+            }
+            for r in rows
+        ],
+    }
+
+
+# -----------------------------
+# πρόοδος
+# -----------------------------
+def _set_progress(batch_id: int, processed: int, total: int, phase: str) -> None:
+    cache.set(_progress_key(batch_id), {"processed": processed, "total": total, "phase": phase}, PROGRESS_TIMEOUT)
+
+
+def progress(batch: RenewalBatch) -> dict:
+    """Όσο τρέχει: από το cache (η συναλλαγή δεν έχει γίνει commit). Μετά: από τη βάση."""
+    if is_stale(batch):
+        data = {"processed": 0, "total": batch.total, "phase": "Διακόπηκε, μπορεί να ξαναξεκινήσει"}
+    elif batch.status in (RenewalBatch.Status.RUNNING, RenewalBatch.Status.QUEUED):
+        data = cache.get(_progress_key(batch.pk)) or {"processed": 0, "total": batch.total, "phase": ""}
+    else:
+        done = batch.created_subscriptions if batch.status == RenewalBatch.Status.DONE else 0
+        data = {"processed": done, "total": batch.total, "phase": ""}
+    data["percent"] = round(100 * data["processed"] / data["total"]) if data["total"] else (
+        100 if batch.status == RenewalBatch.Status.DONE else 0
+    )
+    return data
+
+
+# -----------------------------
+# εκτέλεση
+# -----------------------------
+def _renew(batch: RenewalBatch, user=None, on_progress=None) -> None:
+    def report(phase: str) -> None:
+        _set_progress(batch.pk, batch.created_subscriptions, batch.total, phase)
+        if on_progress is not None:
+            on_progress(batch.created_subscriptions, batch.total, phase)
+
+    valid_from, valid_until = batch.period
+    today = timezone.localdate()
+    status = AthleteSubscription.Status.PAID if batch.paid else AthleteSubscription.Status.PENDING
+    athletes = list(athletes_to_renew(batch).order_by("pk").values_list("pk", "club_id"))
+    batch.total = len(athletes)
+    batch.skipped = eligible_athletes(batch).count() - batch.total
+    report("Συνδρομές")
+
+    # (όμιλος, αθλητής χωρίς όμιλο) -> χρεώσεις που καλύπτει μία πληρωμή
+    charges_by_payer = defaultdict(list)
+    for i in range(0, len(athletes), CHUNK_SIZE):
+        chunk = athletes[i:i + CHUNK_SIZE]
+        subscriptions = AthleteSubscription.objects.bulk_create([
+            AthleteSubscription(
+                athlete_id=athlete_id,
+                season=batch.season,
+                valid_from=valid_from,
+                valid_until=valid_until,
+                amount=batch.amount,
+                status=status,
+                paid_at=today if batch.paid else None,
+            )
+            for athlete_id, _ in chunk
+        ])
+        if batch.amount:
+            charges = post([
+                LedgerEntry(
+                    kind=LedgerEntry.Kind.SUBSCRIPTION,
+                    athlete_id=athlete_id,
+                    club_id=club_id,
+                    season=batch.season,
+                    date=today,
+                    amount=batch.amount,
+                    description=f"Συνδρομή {batch.season}",
+                    reference=subscription_reference(batch.season, athlete_id),
+                    subscription=subscription,
+                )
+                for (athlete_id, club_id), subscription in zip(chunk, subscriptions)
+            ], user=user)
+            for charge in charges:
+                payer = (charge.club_id, None) if charge.club_id is not None else (None, charge.athlete_id)
+                charges_by_payer[payer].append(charge.pk)
+        if batch.paid:
+            # καταλληλότητα: ένας υπολογισμός στο commit για όλους (όχι signal ανά συνδρομή)
+            eligibility_changed([athlete_id for athlete_id, _ in chunk])
+        batch.created_subscriptions += len(subscriptions)
+        report("Συνδρομές")
+
+    if batch.paid and charges_by_payer:
+        # μία πληρωμή ανά όμιλο για το σύνολο των συνδρομών του· αθλητές χωρίς όμιλο πληρώνουν οι ίδιοι
+        report("Πληρωμές")
+        payments = post([
+            LedgerEntry(
+                kind=LedgerEntry.Kind.PAYMENT,
+                club_id=club_id,
+                athlete_id=athlete_id,
+                season=batch.season,
+                date=today,
+                amount=-batch.amount * len(charge_ids),
+                description=f"Πληρωμή συνδρομών {batch.season} (ανανέωση #{batch.pk})",
+                reference=f"RENEWAL-{batch.pk}",
+            )
+            for (club_id, athlete_id), charge_ids in charges_by_payer.items()
+        ], user=user)
+        settle_many({payment.pk: charges_by_payer[payment.club_id, payment.athlete_id] for payment in payments})
+    batch.total_amount = batch.amount * batch.created_subscriptions
+
+
+def run(batch_id: int, user=None, on_progress=None) -> RenewalBatch | None:
+    """
+    Τρέχει την ανανέωση αν είναι πρόχειρη / σε αναμονή / απέτυχε / "Σε εξέλιξη" χωρίς thread
+    (is_stale). None αν την έχει πάρει άλλος.
+    """
+    claimed = RenewalBatch.objects.filter(
+        Q(status__in=[*RESTARTABLE, RenewalBatch.Status.QUEUED]) | _stale(), pk=batch_id
+    ).update(status=RenewalBatch.Status.RUNNING, started_at=timezone.now(), finished_at=None, error="")
+    if not claimed:
+        return None
+    batch = RenewalBatch.objects.get(pk=batch_id)
+    user = user or batch.created_by
+    batch.created_subscriptions = 0
+    try:
+        with transaction.atomic():
+            _renew(batch, user=user, on_progress=on_progress)
+            batch.status = RenewalBatch.Status.DONE
+            batch.finished_at = timezone.now()
+            batch.save()
+    except Exception as e:
+        logger.exception("Renewal batch %s failed", batch_id)
+        RenewalBatch.objects.filter(pk=batch_id).update(
+            status=RenewalBatch.Status.FAILED,
+            error=str(e)[:2000] or e.__class__.__name__,
+            created_subscriptions=0,
+            total_amount=Decimal(0),
+            finished_at=timezone.now(),
+        )
+        batch.refresh_from_db()
+    finally:
+        cache.delete(_progress_key(batch_id))
+    return batch
+
+
+def _run_in_thread(batch_id: int) -> None:
+    close_old_connections()
+    try:
+        run(batch_id)
+    finally:
+        connection.close()
+
+
+def start(batch: RenewalBatch) -> bool:
+    """Σε αναμονή και εκκίνηση σε thread μόλις γίνει commit. False αν τρέχει ήδη / ολοκληρώθηκε."""
+    queued = RenewalBatch.objects.filter(Q(status__in=RESTARTABLE) | _stale(), pk=batch.pk).update(
+        status=RenewalBatch.Status.QUEUED, queued_at=timezone.now()
+    )
+    if not queued:
+        return False
+    _set_progress(batch.pk, 0, batch.total, "Σε αναμονή")
+    transaction.on_commit(
+        lambda: threading.Thread(target=_run_in_thread, args=(batch.pk,), name=f"renewal-{batch.pk}", daemon=True).start()
+    )
+    return True
@@ -0,0 +1,222 @@
+import io
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from registry.models import Athlete
+
+from . import bank, renewals
+from .bank import import_statement, parse_amount
+from .ledger import INCREMENT_LIMIT, post, reconcile, subscription_reference
+from .models import AthleteBalance, BankStatement, BankStatementLine, ClubBalance, LedgerEntry, RenewalBatch
+
+
+class RenewalReclaimTests(TestCase):
+    """Ανανέωση που έμεινε "Σε αναμονή" / "Σε εξέλιξη" μετά από restart ξαναξεκινά (finance/renewals.py)."""
+
+    def _batch(self, status, **times) -> RenewalBatch:
+        return RenewalBatch.objects.create(season=2026, amount=Decimal("50.00"), status=status, **times)
+
+    def _start(self, batch) -> bool:
+        # χωρίς thread: το on_commit δεν εκτελείται
+        with self.captureOnCommitCallbacks(execute=False):
+            return renewals.start(batch)
+
+    def test_fresh_queue_is_not_reclaimed(self):
+        batch = self._batch(RenewalBatch.Status.QUEUED, queued_at=timezone.now())
+        self.assertFalse(renewals.is_stale(batch))
+        self.assertFalse(self._start(batch))
+
+    def test_stale_queue_is_reclaimed(self):
+        old = timezone.now() - renewals.STALE_AFTER - timedelta(minutes=1)
+        batch = self._batch(RenewalBatch.Status.QUEUED, queued_at=old)
+        self.assertTrue(renewals.is_stale(batch))
+        self.assertEqual(renewals.progress(batch)["phase"], "Διακόπηκε, μπορεί να ξαναξεκινήσει")
+
+        self.assertTrue(self._start(batch))
+        batch.refresh_from_db()
+        self.assertEqual(batch.status, RenewalBatch.Status.QUEUED)
+        self.assertGreater(batch.queued_at, old)
+
+    def test_stale_run_is_reclaimed(self):
+        old = timezone.now() - renewals.STALE_AFTER - timedelta(minutes=1)
+        batch = self._batch(RenewalBatch.Status.RUNNING, started_at=old)
+        self.assertTrue(self._start(batch))
+        self.assertFalse(self._start(self._batch(RenewalBatch.Status.RUNNING, started_at=timezone.now())))
+
+
+class ParseAmountTests(SimpleTestCase):
+    def test_locales(self):
+        cases = {
+            "1.234,56": "1234.56",
+            "1,234.56": "1234.56",
+            "-50,00": "-50.00",
+            "50.00": "50.00",
+            "50 €": "50.00",
+            "12,5": "12.50",
+            "1.234": "1234.00",
+            "1.234.567": "1234567.00",
+            "1,234,567": "1234567.00",
+            50: "50.00",
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(parse_amount(raw), Decimal(expected))
+
+    def test_empty(self):
+        for raw in (None, "", "€", "abc"):
+            with self.subTest(raw=raw):
+                self.assertIsNone(parse_amount(raw))
+
+
+class BankImportTests(TestCase):
+    """Αντιστοίχιση κινήσεων τράπεζας με τις ανοιχτές χρεώσεις (finance/bank.py)."""
+
+    def setUp(self):
+        self.athlete = Athlete.objects.create(last_name="Παπαδόπουλος", first_name="Γιώργος")
+        self.reference = subscription_reference(2026, self.athlete.pk)
+        (self.charge,) = post([LedgerEntry(
+            kind=LedgerEntry.Kind.SUBSCRIPTION, athlete=self.athlete, season=2026, date=date(2026, 1, 10),
+            amount=Decimal("50.00"), reference=self.reference,
+        )])
+
+    def _import(self, *rows, dry_run=False, name="statement.csv"):
+        lines = ["Ημερομηνία;Αιτιολογία;Καταθέτης;Ποσό"]
+        lines += [f"15/01/2026;{reference};{payer};{amount}" for reference, payer, amount in rows]
+        f = io.BytesIO("\n".join(lines).encode("utf-8"))
+        return import_statement(f, name, dry_run=dry_run)
+
+    def _settled(self) -> bool:
+        self.charge.refresh_from_db()
+        return self.charge.status == LedgerEntry.Status.SETTLED
+
+    def _note(self) -> str:
+        return BankStatementLine.objects.get().match_note
+
+    def test_exact_reference(self):
+        stats = self._import((f"ΣΥΝΔΡΟΜΗ {self.reference}", "", "50,00"))
+        self.assertEqual((stats.matched, stats.unmatched, stats.settled_charges), (1, 0, 1))
+        self.assertTrue(self._settled())
+        self.assertEqual(self._note(), "Κωδικός πληρωμής")
+        balance = AthleteBalance.objects.get(athlete=self.athlete, season=2026)
+        self.assertEqual(balance.balance, Decimal("0.00"))
+        self.assertEqual(balance.postings, 2)
+
+    def test_fuzzy_reference(self):
+        # τυπογραφικό λάθος στα γράμματα, ίδια ψηφία
+        typo = self.reference.replace("SUB", "SVB")
+        stats = self._import((typo, "", "50,00"))
+        self.assertEqual(stats.matched, 1)
+        self.assertTrue(self._note().startswith("Παρόμοιος κωδικός"))
+
+    def test_fuzzy_rejects_other_check_digits(self):
+        # ένα ψηφίο διαφορετικό: μπορεί να είναι άλλος αθλητής
+        digit = self.reference[-1]
+        typo = self.reference[:-1] + ("1" if digit != "1" else "2")
+        stats = self._import((typo, "", "50,00"))
+        self.assertEqual((stats.matched, stats.unmatched), (0, 1))
+        self.assertFalse(self._settled())
+        self.assertEqual(self._note(), bank.NO_MATCH)
+
+    def test_payer_and_amount(self):
+        stats = self._import(("ΣΥΝΔΡΟΜΗ", "ΠΑΠΑΔΟΠΟΥΛΟΣ ΓΙΩΡΓΟΣ", "50,00"))
+        self.assertEqual(stats.matched, 1)
+        self.assertEqual(self._note(), "Καταθέτης και ποσό")
+
+    def test_payer_needs_same_amount(self):
+        stats = self._import(("ΣΥΝΔΡΟΜΗ", "ΠΑΠΑΔΟΠΟΥΛΟΣ ΓΙΩΡΓΟΣ", "40,00"))
+        self.assertEqual(stats.matched, 0)
+        self.assertFalse(self._settled())
+
+    def test_duplicate_lines(self):
+        # δεύτερη πληρωμή της ίδιας χρέωσης: μένει για έλεγχο, όχι δεύτερη εξόφληση
+        stats = self._import((self.reference, "", "50,00"), (self.reference, "", "50,00"))
+        self.assertEqual((stats.matched, stats.unmatched, stats.settled_charges), (1, 1, 1))
+        self.assertEqual(LedgerEntry.objects.filter(kind=LedgerEntry.Kind.PAYMENT).count(), 1)
+        # το ίδιο αρχείο δεύτερη φορά
+        with self.assertRaises(ValidationError):
+            self._import((self.reference, "", "50,00"), (self.reference, "", "50,00"), name="again.csv")
+
+    def test_debits_are_skipped(self):
+        stats = self._import((self.reference, "", "-50,00"))
+        self.assertEqual((stats.lines, stats.skipped_debits), (0, 1))
+        self.assertFalse(self._settled())
+
+    def test_dry_run(self):
+        stats = self._import((self.reference, "", "50,00"), dry_run=True)
+        self.assertEqual((stats.matched, stats.settled_charges, stats.matched_amount), (1, 1, Decimal("50.00")))
+        self.assertIsNone(stats.statement)
+        self.assertFalse(BankStatement.objects.exists())
+        self.assertFalse(LedgerEntry.objects.filter(kind=LedgerEntry.Kind.PAYMENT).exists())
+        self.assertFalse(self._settled())
+        # το dry run δεν "καίει" το αρχείο
+        self.assertEqual(self._import((self.reference, "", "50,00")).matched, 1)
+
+    def test_concurrent_settlement_rolls_back(self):
+        build = bank.OpenCharges
+
+        def stale_index(*args, **kwargs):
+            # η χρέωση εξοφλείται από αλλού αφού φορτώθηκε το ευρετήριο
+            index = build(*args, **kwargs)
+            LedgerEntry.objects.filter(pk=self.charge.pk).update(status=LedgerEntry.Status.SETTLED)
+            return index
+
+        with mock.patch.object(bank, "OpenCharges", stale_index), self.assertRaises(ValidationError):
+            self._import((self.reference, "", "50,00"))
+        self.assertFalse(BankStatement.objects.exists())
+        self.assertFalse(LedgerEntry.objects.filter(kind=LedgerEntry.Kind.PAYMENT).exists())
+        self.assertEqual(AthleteBalance.objects.get(athlete=self.athlete, season=2026).balance, Decimal("50.00"))
+
+
+class LedgerTests(TestCase):
+    """Υπόλοιπα αθλητή / ομίλου στην ίδια συναλλαγή με το καθολικό (finance/ledger.py)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=30, horses=5, competitions=1, clubs=3, stdout=io.StringIO())
+        cls.athletes = list(Athlete.objects.filter(club__isnull=False).order_by("pk")[:INCREMENT_LIMIT + 5])
+        cls.athlete = cls.athletes[0]
+
+    def _entry(self, athlete, amount, kind=LedgerEntry.Kind.SUBSCRIPTION) -> LedgerEntry:
+        return LedgerEntry(kind=kind, athlete=athlete, season=2030, date=date(2030, 1, 1), amount=Decimal(amount))
+
+    def _balance(self, model=AthleteBalance, **owner):
+        return model.objects.get(season=2030, **owner)
+
+    def test_post_updates_balances(self):
+        post([self._entry(self.athlete, "50.00"), self._entry(self.athlete, "-20.00", LedgerEntry.Kind.PAYMENT)])
+        balance = self._balance(athlete=self.athlete)
+        self.assertEqual((balance.debit, balance.credit, balance.balance, balance.postings),
+                         (Decimal("50.00"), Decimal("20.00"), Decimal("30.00"), 2))
+        # ο όμιλος συμπληρώνεται από τον αθλητή
+        self.assertEqual(self._balance(ClubBalance, club_id=self.athlete.club_id).balance, Decimal("30.00"))
+        self.assertEqual(reconcile(season=2030).drift, [])
+
+    def test_many_keys_match_reconcile(self):
+        # πάνω από INCREMENT_LIMIT κλειδιά: GROUP BY αντί για UPDATE ανά γραμμή
+        self.assertGreater(len(self.athletes), INCREMENT_LIMIT)
+        post([self._entry(athlete, "10.00") for athlete in self.athletes for _ in range(2)])
+        self.assertEqual(AthleteBalance.objects.filter(season=2030).count(), len(self.athletes))
+        self.assertEqual(self._balance(athlete=self.athlete).balance, Decimal("20.00"))
+        self.assertEqual(reconcile(season=2030).drift, [])
+
+    def test_invalid_entry_posts_nothing(self):
+        with self.assertRaises(ValidationError):
+            post([self._entry(self.athlete, "50.00"), self._entry(self.athlete, "-5.00")])
+        self.assertFalse(LedgerEntry.objects.filter(season=2030).exists())
+        self.assertFalse(AthleteBalance.objects.filter(season=2030).exists())
+
+    def test_reconcile_reports_and_fixes_drift(self):
+        post([self._entry(self.athlete, "50.00")])
+        AthleteBalance.objects.filter(athlete=self.athlete, season=2030).update(balance=Decimal("7.00"))
+        (drift,) = reconcile(season=2030).drift
+        self.assertEqual((drift.kind, drift.owner_id, drift.stored, drift.expected),
+                         ("athlete", self.athlete.pk, Decimal("7.00"), Decimal("50.00")))
+        self.assertTrue(reconcile(season=2030, fix=True).fixed)
+        self.assertEqual(self._balance(athlete=self.athlete).balance, Decimal("50.00"))
+        self.assertEqual(reconcile(season=2030).drift, [])
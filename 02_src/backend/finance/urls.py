@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+app_name = "finance"
+
+urlpatterns = [
+    path("clubs/<int:club_id>/balances/", views.club_balances, name="club_balances"),
+    path("renewals/<int:batch_id>/", views.renewal_progress, name="renewal_progress"),
+]
@@ -0,0 +1,44 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from accounts.scoping import get_scope
+from organizations.models import Club
+
+from .models import ClubBalance, RenewalBatch
+from .renewals import progress
+
+BALANCE_FIELDS = ("season", "debit", "credit", "balance", "postings", "last_posted_at")
+
+
+@require_GET
+def club_balances(request, club_id):
+    """GET /api/finance/clubs/<id>/balances/ — υπόλοιπο ομίλου ανά σεζόν (έτοιμο, χωρίς SUM στο καθολικό)."""
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("finance.view_clubbalance"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+    if not get_scope(request).filter(Club.objects.filter(pk=club_id), "").exists():
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    rows = list(ClubBalance.objects.filter(club_id=club_id).order_by("-season").values(*BALANCE_FIELDS))
+    return JsonResponse({"club": club_id, "results": rows})
+
+
+@require_GET
+def renewal_progress(request, batch_id):
+    """GET /api/finance/renewals/<id>/ — κατάσταση / πρόοδος μαζικής ανανέωσης (polling από το admin)."""
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("finance.view_renewalbatch"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+    batch = get_scope(request).filter(RenewalBatch.objects.filter(pk=batch_id)).first()
+    if batch is None:
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    return JsonResponse({
+        "id": batch.pk,
+        "status": batch.status,
+        "progress": progress(batch),
+        "created_subscriptions": batch.created_subscriptions,
+        "skipped": batch.skipped,
+        "total_amount": batch.total_amount,
+        "error": batch.error,
+    })
@@ -1,22 +1,27 @@
 # organizations/admin.py
 from django.contrib import admin
+
+from accounts.scoping import ScopedAdminMixin
+from audit.recorder import update as audit_update
+
 from .models import Region, Club
 
 
 @admin.action(description="✅ Ενεργοποίηση")
 def make_active(modeladmin, request, queryset):
     if hasattr(modeladmin.model, "is_active"):
-        queryset.update(is_active=True)
+        # ✅ με καταγραφή στο ιστορικό αλλαγών (το queryset.update() δεν στέλνει signals)
+        audit_update(queryset, is_active=True)
 
 
 @admin.action(description="⛔ Απενεργοποίηση")
 def make_inactive(modeladmin, request, queryset):
     if hasattr(modeladmin.model, "is_active"):
-        queryset.update(is_active=False)
+        audit_update(queryset, is_active=False)
 
 
 @admin.register(Region)
-class RegionAdmin(admin.ModelAdmin):
+class RegionAdmin(ScopedAdminMixin, admin.ModelAdmin):
     list_display = ("name", "is_active")
     list_filter = ("is_active",)
     search_fields = ("name",)
@@ -25,7 +30,9 @@ class RegionAdmin(admin.ModelAdmin):
 
 
 @admin.register(Club)
-class ClubAdmin(admin.ModelAdmin):
+class ClubAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = ""
+
     list_display = ("code", "name", "region", "email", "phone", "is_active")
     list_filter = ("is_active", "region")
     search_fields = ("code", "name", "email", "phone", "region__name")
@@ -0,0 +1,81 @@
+from django.contrib import admin, messages
+
+from .models import RankingRule, RankingSnapshot, RankingSnapshotRow, RankingTable
+from .standings import refresh_category, refresh_rule
+
+
+# -----------------------------
+# Actions
+# -----------------------------
+@admin.action(description="🔄 Ξαναϋπολογισμός (βαθμοί + νέα έκδοση αν άλλαξε)")
+def recompute_tables(modeladmin, request, queryset):
+    published = 0
+    for table in queryset:
+        if refresh_category(table.season, table.discipline, table.age_category, reason="Χειροκίνητος ξαναϋπολογισμός"):
+            published += 1
+    modeladmin.message_user(request, f"{published} νέες εκδόσεις ({queryset.count()} βαθμολογίες).", messages.SUCCESS)
+
+
+@admin.action(description="🔄 Εφαρμογή στις βαθμολογίες που καλύπτει")
+def apply_rules(modeladmin, request, queryset):
+    published = sum(len(refresh_rule(rule)) for rule in queryset)
+    modeladmin.message_user(request, f"{published} νέες εκδόσεις βαθμολογιών.", messages.SUCCESS)
+
+
+# -----------------------------
+# Inlines
+# -----------------------------
+class RankingSnapshotRowInline(admin.TabularInline):
+    model = RankingSnapshotRow
+    extra = 0
+    fields = ("position", "athlete_name", "club_name", "points", "results_counted", "wins")
+    readonly_fields = fields
+    ordering = ("position", "athlete_name")
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+# -----------------------------
+# Admins
+# -----------------------------
+@admin.register(RankingRule)
+class RankingRuleAdmin(admin.ModelAdmin):
+    list_display = ("name", "discipline", "age_category", "season_from", "season_until", "min_starters", "best_of", "updated_at")
+    list_filter = ("discipline", "age_category")
+    search_fields = ("name",)
+    ordering = ("discipline", "age_category", "-season_from")
+    actions = (apply_rules,)
+
+
+@admin.register(RankingTable)
+class RankingTableAdmin(admin.ModelAdmin):
+    list_display = ("season", "discipline", "age_category", "rule", "version", "current_snapshot", "computed_at")
+    list_filter = ("season", "discipline", "age_category")
+    list_select_related = ("rule", "current_snapshot__table")
+    ordering = ("-season", "discipline", "age_category")
+    readonly_fields = ("season", "discipline", "age_category", "rule", "version", "current_snapshot", "computed_at")
+    actions = (recompute_tables,)
+
+    def has_add_permission(self, request):
+        # ✅ οι βαθμολογίες δημιουργούνται από τα αποτελέσματα
+        return False
+
+
+@admin.register(RankingSnapshot)
+class RankingSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("table", "version", "published_at", "athletes", "reason")
+    list_filter = ("table__season", "table__discipline", "table__age_category")
+    list_select_related = ("table",)
+    ordering = ("-published_at",)
+    readonly_fields = ("table", "version", "published_at", "athletes", "reason")
+
+    inlines = (RankingSnapshotRowInline,)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        # ✅ ιστορικό: δεν σβήνεται
+        return False
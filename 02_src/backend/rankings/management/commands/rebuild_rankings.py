@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from rankings.standings import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Ξαναϋπολογίζει βαθμούς και βαθμολογίες από τα οριστικοποιημένα αποτελέσματα. "
+        "Νέα έκδοση δημοσιεύεται μόνο όπου άλλαξε η κατάταξη."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--season", type=int, default=None, help="Μόνο μία σεζόν (έτος). Default: όλες.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        snapshots = rebuild(options["season"])
+        for snapshot in snapshots:
+            self.stdout.write(f"  {snapshot.table} -> v{snapshot.version} ({snapshot.athletes} αθλητές)")
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. {len(snapshots)} νέες εκδόσεις, {(time.perf_counter() - started) * 1000:.0f} ms"
+        ))
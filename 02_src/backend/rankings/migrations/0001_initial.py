@@ -0,0 +1,124 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:03
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('competitions', '0004_dressage_sheets'),
+        ('registry', '0015_eligibility_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(verbose_name='Έκδοση')),
+                ('published_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Δημοσιεύθηκε')),
+                ('athletes', models.PositiveIntegerField(default=0, verbose_name='Αθλητές')),
+                ('reason', models.CharField(blank=True, max_length=200, verbose_name='Αιτία')),
+            ],
+            options={
+                'verbose_name': 'Έκδοση Βαθμολογίας',
+                'verbose_name_plural': 'Εκδόσεις Βαθμολογίας',
+                'ordering': ['table', '-version'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RankingRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, verbose_name='Κανονισμός')),
+                ('discipline', models.CharField(choices=[('SJ', 'Υπερπήδηση Εμποδίων'), ('DR', 'Ιππική Δεξιοτεχνία'), ('EN', 'Αντοχή'), ('EV', 'Σύνθετη Ιππασία')], max_length=2, verbose_name='Άθλημα')),
+                ('age_category', models.CharField(choices=[('CH', 'Παίδες'), ('JR', 'Έφηβοι'), ('YR', 'Νέοι'), ('SR', 'Ανδρών - Γυναικών'), ('VT', 'Βετεράνοι'), ('OP', 'Ανοιχτή')], max_length=2, verbose_name='Κατηγορία')),
+                ('season_from', models.PositiveSmallIntegerField(verbose_name='Από σεζόν')),
+                ('season_until', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Έως σεζόν')),
+                ('points_table', models.CharField(help_text='Χωρισμένοι με κόμμα, από την 1η θέση (π.χ. 25,20,16,13,11,10,9,8,7,6).', max_length=500, verbose_name='Βαθμοί ανά θέση')),
+                ('participation_points', models.DecimalField(decimal_places=2, default=0, help_text='Για όσους ολοκλήρωσαν χωρίς να πάρουν θέση με βαθμούς.', max_digits=6, verbose_name='Βαθμοί ολοκλήρωσης')),
+                ('min_starters', models.PositiveSmallIntegerField(default=3, verbose_name='Ελάχιστες εκκινήσεις αγωνίσματος')),
+                ('best_of', models.PositiveSmallIntegerField(default=0, help_text='0 = όλα.', verbose_name='Καλύτερα αποτελέσματα που μετράνε')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Ενημερώθηκε')),
+            ],
+            options={
+                'verbose_name': 'Κανονισμός Βαθμολογίας',
+                'verbose_name_plural': 'Κανονισμοί Βαθμολογίας',
+                'ordering': ['discipline', 'age_category', '-season_from'],
+                'indexes': [models.Index(fields=['discipline', 'age_category', 'season_from'], name='ranking_rule_lookup_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RankingTable',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField(verbose_name='Σεζόν')),
+                ('discipline', models.CharField(choices=[('SJ', 'Υπερπήδηση Εμποδίων'), ('DR', 'Ιππική Δεξιοτεχνία'), ('EN', 'Αντοχή'), ('EV', 'Σύνθετη Ιππασία')], max_length=2, verbose_name='Άθλημα')),
+                ('age_category', models.CharField(choices=[('CH', 'Παίδες'), ('JR', 'Έφηβοι'), ('YR', 'Νέοι'), ('SR', 'Ανδρών - Γυναικών'), ('VT', 'Βετεράνοι'), ('OP', 'Ανοιχτή')], max_length=2, verbose_name='Κατηγορία')),
+                ('version', models.PositiveIntegerField(default=0, editable=False, verbose_name='Έκδοση')),
+                ('computed_at', models.DateTimeField(blank=True, null=True, verbose_name='Υπολογίστηκε')),
+                ('current_snapshot', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='rankings.rankingsnapshot', verbose_name='Δημοσιευμένη έκδοση')),
+                ('rule', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='tables', to='rankings.rankingrule', verbose_name='Κανονισμός')),
+            ],
+            options={
+                'verbose_name': 'Βαθμολογία',
+                'verbose_name_plural': 'Βαθμολογίες',
+                'ordering': ['-season', 'discipline', 'age_category'],
+            },
+        ),
+        migrations.AddField(
+            model_name='rankingsnapshot',
+            name='table',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='rankings.rankingtable', verbose_name='Βαθμολογία'),
+        ),
+        migrations.CreateModel(
+            name='RankingPoints',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('points', models.DecimalField(decimal_places=2, default=0, max_digits=8, verbose_name='Βαθμοί')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ranking_points', to='registry.athlete', verbose_name='Αθλητής')),
+                ('record', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='ranking_points', to='competitions.competitionrecord', verbose_name='Αποτέλεσμα')),
+                ('table', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='points', to='rankings.rankingtable', verbose_name='Βαθμολογία')),
+            ],
+            options={
+                'verbose_name': 'Βαθμοί Αποτελέσματος',
+                'verbose_name_plural': 'Βαθμοί Αποτελεσμάτων',
+            },
+        ),
+        migrations.CreateModel(
+            name='RankingSnapshotRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(verbose_name='Θέση')),
+                ('athlete_name', models.CharField(max_length=250, verbose_name='Ονοματεπώνυμο')),
+                ('club_name', models.CharField(blank=True, max_length=200, verbose_name='Σωματείο')),
+                ('points', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Βαθμοί')),
+                ('results_counted', models.PositiveSmallIntegerField(default=0, verbose_name='Αποτελέσματα')),
+                ('wins', models.PositiveSmallIntegerField(default=0, verbose_name='Νίκες')),
+                ('athlete', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='registry.athlete', verbose_name='Αθλητής')),
+                ('snapshot', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rows', to='rankings.rankingsnapshot', verbose_name='Έκδοση')),
+            ],
+            options={
+                'verbose_name': 'Γραμμή Βαθμολογίας',
+                'verbose_name_plural': 'Γραμμές Βαθμολογίας',
+                'ordering': ['snapshot', 'position', 'athlete_name'],
+                'indexes': [models.Index(fields=['snapshot', 'position'], name='ranking_row_snapshot_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='rankingtable',
+            constraint=models.UniqueConstraint(fields=('season', 'discipline', 'age_category'), name='uniq_ranking_table'),
+        ),
+        migrations.AddConstraint(
+            model_name='rankingsnapshot',
+            constraint=models.UniqueConstraint(fields=('table', 'version'), name='uniq_ranking_snapshot_version'),
+        ),
+        migrations.AddIndex(
+            model_name='rankingpoints',
+            index=models.Index(fields=['table', 'athlete'], name='ranking_points_table_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rankings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='rankingtable',
+            name='rule',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tables', to='rankings.rankingrule', verbose_name='Κανονισμός'),
+        ),
+    ]
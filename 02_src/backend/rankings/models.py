@@ -0,0 +1,190 @@
+from decimal import Decimal, InvalidOperation
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils import timezone
+
+from competitions.models import CompetitionClass, CompetitionRecord
+
+
+class RankingRule(models.Model):
+    """Κανονισμός βαθμών για ένα άθλημα / κατηγορία, από μια σεζόν και μετά."""
+
+    name = models.CharField(max_length=200, verbose_name="Κανονισμός")
+    discipline = models.CharField(max_length=2, choices=CompetitionClass.Discipline.choices, verbose_name="Άθλημα")
+    age_category = models.CharField(max_length=2, choices=CompetitionClass.AgeCategory.choices, verbose_name="Κατηγορία")
+    season_from = models.PositiveSmallIntegerField(verbose_name="Από σεζόν")
+    season_until = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="Έως σεζόν")
+
+    points_table = models.CharField(
+        max_length=500,
+        verbose_name="Βαθμοί ανά θέση",
+        help_text="Χωρισμένοι με κόμμα, από την 1η θέση (π.χ. 25,20,16,13,11,10,9,8,7,6).",
+    )
+    participation_points = models.DecimalField(
+        max_digits=6, decimal_places=2, default=0, verbose_name="Βαθμοί ολοκλήρωσης",
+        help_text="Για όσους ολοκλήρωσαν χωρίς να πάρουν θέση με βαθμούς.",
+    )
+    min_starters = models.PositiveSmallIntegerField(default=3, verbose_name="Ελάχιστες εκκινήσεις αγωνίσματος")
+    best_of = models.PositiveSmallIntegerField(
+        default=0, verbose_name="Καλύτερα αποτελέσματα που μετράνε", help_text="0 = όλα."
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Κανονισμός Βαθμολογίας"
+        verbose_name_plural = "Κανονισμοί Βαθμολογίας"
+        ordering = ["discipline", "age_category", "-season_from"]
+        indexes = [
+            models.Index(fields=["discipline", "age_category", "season_from"], name="ranking_rule_lookup_idx"),
+        ]
+
+    def __str__(self):
+        until = self.season_until or "…"
+        return f"{self.name} ({self.get_discipline_display()} / {self.get_age_category_display()}, {self.season_from}-{until})"
+
+    @property
+    def points(self) -> list[Decimal]:
+        return [Decimal(p.strip()) for p in self.points_table.split(",") if p.strip()]
+
+    def clean(self):
+        try:
+            points = self.points
+        except InvalidOperation:
+            raise ValidationError({"points_table": "Μόνο αριθμοί χωρισμένοι με κόμμα."})
+        if not points:
+            raise ValidationError({"points_table": "Απαιτείται τουλάχιστον μία θέση."})
+        if self.season_until is not None and self.season_until < self.season_from:
+            raise ValidationError({"season_until": "Πριν από την αρχή."})
+
+
+class RankingTable(models.Model):
+    """Μία βαθμολογία ανά σεζόν / άθλημα / κατηγορία. Η δημοσιευμένη μορφή είναι το current_snapshot."""
+
+    season = models.PositiveSmallIntegerField(verbose_name="Σεζόν")
+    discipline = models.CharField(max_length=2, choices=CompetitionClass.Discipline.choices, verbose_name="Άθλημα")
+    age_category = models.CharField(max_length=2, choices=CompetitionClass.AgeCategory.choices, verbose_name="Κατηγορία")
+    rule = models.ForeignKey(
+        RankingRule,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="tables",
+        verbose_name="Κανονισμός",
+    )
+    version = models.PositiveIntegerField(default=0, editable=False, verbose_name="Έκδοση")
+    current_snapshot = models.ForeignKey(
+        "RankingSnapshot",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Δημοσιευμένη έκδοση",
+    )
+    computed_at = models.DateTimeField(null=True, blank=True, verbose_name="Υπολογίστηκε")
+
+    class Meta:
+        verbose_name = "Βαθμολογία"
+        verbose_name_plural = "Βαθμολογίες"
+        ordering = ["-season", "discipline", "age_category"]
+        constraints = [
+            models.UniqueConstraint(fields=["season", "discipline", "age_category"], name="uniq_ranking_table"),
+        ]
+
+    def __str__(self):
+        return f"{self.season} {self.get_discipline_display()} / {self.get_age_category_display()}"
+
+
+class RankingPoints(models.Model):
+    """Βαθμοί ενός οριστικοποιημένου αποτελέσματος (CompetitionRecord) στη βαθμολογία του."""
+
+    record = models.OneToOneField(
+        CompetitionRecord,
+        on_delete=models.CASCADE,
+        related_name="ranking_points",
+        verbose_name="Αποτέλεσμα",
+    )
+    table = models.ForeignKey(
+        RankingTable,
+        on_delete=models.CASCADE,
+        related_name="points",
+        verbose_name="Βαθμολογία",
+    )
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.CASCADE,
+        related_name="ranking_points",
+        verbose_name="Αθλητής",
+    )
+    points = models.DecimalField(max_digits=8, decimal_places=2, default=0, verbose_name="Βαθμοί")
+
+    class Meta:
+        verbose_name = "Βαθμοί Αποτελέσματος"
+        verbose_name_plural = "Βαθμοί Αποτελεσμάτων"
+        indexes = [
+            models.Index(fields=["table", "athlete"], name="ranking_points_table_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete_id}: {self.points}"
+
+
+class RankingSnapshot(models.Model):
+    """Δημοσιευμένη έκδοση βαθμολογίας. Οι παλιές μένουν (ιστορικό)."""
+
+    table = models.ForeignKey(
+        RankingTable,
+        on_delete=models.CASCADE,
+        related_name="snapshots",
+        verbose_name="Βαθμολογία",
+    )
+    version = models.PositiveIntegerField(verbose_name="Έκδοση")
+    published_at = models.DateTimeField(default=timezone.now, verbose_name="Δημοσιεύθηκε")
+    athletes = models.PositiveIntegerField(default=0, verbose_name="Αθλητές")
+    # τι την προκάλεσε (π.χ. "Αγώνισμα #12", "Αλλαγή κανονισμού")
+    reason = models.CharField(max_length=200, blank=True, verbose_name="Αιτία")
+
+    class Meta:
+        verbose_name = "Έκδοση Βαθμολογίας"
+        verbose_name_plural = "Εκδόσεις Βαθμολογίας"
+        ordering = ["table", "-version"]
+        constraints = [
+            models.UniqueConstraint(fields=["table", "version"], name="uniq_ranking_snapshot_version"),
+        ]
+
+    def __str__(self):
+        return f"{self.table} v{self.version}"
+
+
+class RankingSnapshotRow(models.Model):
+    snapshot = models.ForeignKey(
+        RankingSnapshot,
+        on_delete=models.CASCADE,
+        related_name="rows",
+        verbose_name="Έκδοση",
+    )
+    position = models.PositiveIntegerField(verbose_name="Θέση")
+    athlete = models.ForeignKey(
+        "registry.Athlete",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+        verbose_name="Αθλητής",
+    )
+    # αντίγραφα τη στιγμή της δημοσίευσης: η σελίδα δεν κάνει joins
+    athlete_name = models.CharField(max_length=250, verbose_name="Ονοματεπώνυμο")
+    club_name = models.CharField(max_length=200, blank=True, verbose_name="Σωματείο")
+    points = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Βαθμοί")
+    results_counted = models.PositiveSmallIntegerField(default=0, verbose_name="Αποτελέσματα")
+    wins = models.PositiveSmallIntegerField(default=0, verbose_name="Νίκες")
+
+    class Meta:
+        verbose_name = "Γραμμή Βαθμολογίας"
+        verbose_name_plural = "Γραμμές Βαθμολογίας"
+        ordering = ["snapshot", "position", "athlete_name"]
+        indexes = [
+            models.Index(fields=["snapshot", "position"], name="ranking_row_snapshot_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.position}. {self.athlete_name} ({self.points})"
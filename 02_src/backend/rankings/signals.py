@@ -0,0 +1,33 @@
+"""Ενημέρωση βαθμολογιών (rankings/standings.py) όταν οριστικοποιείται αγώνισμα ή αλλάζει κανονισμός."""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from competitions.scoring import results_frozen
+
+from .models import RankingRule
+from .standings import refresh_categories, refresh_class, refresh_rule, rule_categories
+
+
+@receiver(results_frozen)
+def _class_frozen(sender, competition_class_id, **kwargs):
+    refresh_class(competition_class_id)
+
+
+@receiver(post_save, sender=RankingRule)
+def _rule_saved(sender, instance, **kwargs):
+    transaction.on_commit(lambda: refresh_rule(instance))
+
+
+@receiver(pre_delete, sender=RankingRule)
+def _rule_deleting(sender, instance, **kwargs):
+    # μετά τη διαγραφή οι βαθμολογίες έχουν rule=None (SET_NULL): τις κρατάμε πριν
+    instance._ranking_categories = rule_categories(instance)
+
+
+@receiver(post_delete, sender=RankingRule)
+def _rule_deleted(sender, instance, **kwargs):
+    categories = getattr(instance, "_ranking_categories", set())
+    if categories:
+        reason = f"Διαγραφή κανονισμού: {instance.name}"
+        transaction.on_commit(lambda: refresh_categories(categories, reason))
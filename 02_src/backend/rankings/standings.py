@@ -0,0 +1,251 @@
+"""
+Βαθμολογίες σεζόν ανά άθλημα / κατηγορία από τα οριστικοποιημένα αποτελέσματα.
+
+    CompetitionRecord --(RankingRule)--> RankingPoints --> RankingTable --> RankingSnapshot (+ γραμμές)
+
+- freeze_class() (competitions/scoring.py) -> signal results_frozen -> refresh_class():
+  βαθμοί ΜΟΝΟ για τα αποτελέσματα του αγωνίσματος και νέα έκδοση ΜΟΝΟ των
+  βαθμολογιών που αγγίζουν (σεζόν = έτος αγωνίσματος).
+- Διόρθωση: reopen_class() -> events -> freeze_class() ξανά -> ίδια διαδρομή.
+- Αλλαγή κανονισμού: refresh_rule() για όσες σεζόν καλύπτει και όσες βαθμολογίες τον είχαν·
+  διαγραφή: οι βαθμολογίες του ξαναϋπολογίζονται με τον επόμενο κανονισμό (ή χωρίς).
+- Νέα έκδοση δημοσιεύεται μόνο αν άλλαξε η κατάταξη· οι παλιές μένουν ως ιστορικό,
+  οπότε η δημόσια σελίδα είναι ένα query στις γραμμές μιας έκδοσης.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import ExtractYear
+from django.utils import timezone
+
+from competitions.models import CompetitionClass, CompetitionRecord, Result
+from registry.models import Athlete
+
+from .models import RankingPoints, RankingRule, RankingSnapshot, RankingSnapshotRow, RankingTable
+
+ZERO = Decimal(0)
+
+
+# -----------------------------
+# κανονισμοί / βαθμοί
+# -----------------------------
+def rule_for(season: int, discipline: str, age_category: str) -> RankingRule | None:
+    return (
+        RankingRule.objects.filter(discipline=discipline, age_category=age_category, season_from__lte=season)
+        .filter(Q(season_until__isnull=True) | Q(season_until__gte=season))
+        .order_by("-season_from", "-pk")
+        .first()
+    )
+
+
+def points_for(table: list[Decimal], rule: RankingRule, status: str, rank: int | None, starters: int) -> Decimal:
+    if status != Result.Status.OK or starters < rule.min_starters:
+        return ZERO
+    if rank is not None and rank <= len(table):
+        return table[rank - 1]
+    return rule.participation_points
+
+
+def _get_table(season: int, discipline: str, age_category: str) -> RankingTable | None:
+    """None: δεν υπάρχει κανονισμός ούτε παλιότερη βαθμολογία (π.χ. κατηγορία χωρίς ranking)."""
+    rule = rule_for(season, discipline, age_category)
+    if rule is None:
+        table = RankingTable.objects.filter(season=season, discipline=discipline, age_category=age_category).first()
+        if table is None:
+            return None
+    else:
+        table, _ = RankingTable.objects.get_or_create(season=season, discipline=discipline, age_category=age_category)
+    if table.rule_id != (rule.pk if rule else None):
+        table.rule = rule
+        table.save(update_fields=["rule"])
+    return table
+
+
+def _score_records(table: RankingTable, records) -> None:
+    """records: queryset CompetitionRecord της ίδιας βαθμολογίας -> upsert RankingPoints."""
+    if table.rule is None:
+        RankingPoints.objects.filter(record__in=records).delete()
+        return
+    rule = table.rule
+    points_table = rule.points
+    objs = [
+        RankingPoints(
+            record_id=pk,
+            table=table,
+            athlete_id=athlete_id,
+            points=points_for(points_table, rule, status, rank, starters),
+        )
+        for pk, athlete_id, status, rank, starters in records.order_by().values_list(
+            "pk", "athlete_id", "status", "rank", "starters"
+        )
+    ]
+    RankingPoints.objects.bulk_create(
+        objs,
+        update_conflicts=True,
+        unique_fields=["record"],
+        update_fields=["table", "athlete", "points"],
+        batch_size=1000,
+    )
+
+
+def _category_records(season: int, discipline: str, age_category: str):
+    return CompetitionRecord.objects.filter(date__year=season, discipline=discipline, age_category=age_category)
+
+
+# -----------------------------
+# δημοσίευση
+# -----------------------------
+def publish(table: RankingTable, reason: str = "") -> RankingSnapshot | None:
+    """Κατάταξη από τα RankingPoints. Νέα έκδοση μόνο αν διαφέρει από τη δημοσιευμένη."""
+    with transaction.atomic():
+        table = RankingTable.objects.select_for_update().select_related("rule").get(pk=table.pk)
+        best_of = table.rule.best_of if table.rule else 0
+
+        per_athlete = defaultdict(list)
+        wins = defaultdict(int)
+        for athlete_id, points, rank, status in (
+            RankingPoints.objects.filter(table=table)
+            .order_by()
+            .values_list("athlete_id", "points", "record__rank", "record__status")
+        ):
+            per_athlete[athlete_id].append(points)
+            if rank == 1 and status == Result.Status.OK:
+                wins[athlete_id] += 1
+
+        totals = {}
+        for athlete_id, points in per_athlete.items():
+            counted = sorted(points, reverse=True)[:best_of] if best_of else points
+            total = sum(counted, ZERO)
+            if total > 0:
+                totals[athlete_id] = (total, len([p for p in counted if p > 0]))
+
+        names = {
+            pk: (f"{last} {first}".strip(), club or "")
+            for pk, last, first, club in Athlete.objects.filter(pk__in=totals).values_list(
+                "pk", "last_name", "first_name", "club__name"
+            )
+        }
+        ordered = sorted(totals, key=lambda a: (-totals[a][0], -wins[a], names.get(a, ("", ""))[0], a))
+        rows = []
+        position = 0
+        previous = None
+        for i, athlete_id in enumerate(ordered, start=1):
+            key = (totals[athlete_id][0], wins[athlete_id])
+            if key != previous:
+                position, previous = i, key
+            name, club = names.get(athlete_id, ("", ""))
+            rows.append(RankingSnapshotRow(
+                position=position,
+                athlete_id=athlete_id,
+                athlete_name=name,
+                club_name=club,
+                points=totals[athlete_id][0],
+                results_counted=totals[athlete_id][1],
+                wins=wins[athlete_id],
+            ))
+
+        table.computed_at = timezone.now()
+        current = []
+        if table.current_snapshot_id is not None:
+            current = list(
+                RankingSnapshotRow.objects.filter(snapshot_id=table.current_snapshot_id)
+                .order_by("position", "athlete_name", "athlete_id")
+                .values_list("athlete_id", "position", "points", "results_counted", "wins")
+            )
+        proposed = sorted(
+            ((r.athlete_id, r.position, r.points, r.results_counted, r.wins, r.athlete_name) for r in rows),
+            key=lambda r: (r[1], r[5], r[0]),
+        )
+        if table.current_snapshot_id is not None and current == [r[:5] for r in proposed]:
+            table.save(update_fields=["computed_at"])
+            return None
+
+        table.version += 1
+        snapshot = RankingSnapshot.objects.create(
+            table=table, version=table.version, athletes=len(rows), reason=reason[:200]
+        )
+        for row in rows:
+            row.snapshot = snapshot
+        RankingSnapshotRow.objects.bulk_create(rows, batch_size=1000)
+        table.current_snapshot = snapshot
+        table.save(update_fields=["version", "current_snapshot", "computed_at"])
+    return snapshot
+
+
+# -----------------------------
+# ξαναϋπολογισμός
+# -----------------------------
+def refresh_class(competition_class_id: int, reason: str = "") -> list[RankingSnapshot]:
+    """Μετά την (επαν)οριστικοποίηση ενός αγωνίσματος."""
+    cc = CompetitionClass.objects.filter(pk=competition_class_id).values("date", "discipline", "age_category").first()
+    if cc is None:
+        return []
+    records = CompetitionRecord.objects.filter(entry__competition_class_id=competition_class_id)
+    with transaction.atomic():
+        # αν άλλαξε ημερομηνία / κατηγορία, αγγίζει και την παλιά βαθμολογία
+        touched = set(RankingPoints.objects.filter(record__in=records).values_list("table_id", flat=True).distinct())
+        table = _get_table(cc["date"].year, cc["discipline"], cc["age_category"])
+        if table is None:
+            RankingPoints.objects.filter(record__in=records).delete()
+        else:
+            _score_records(table, records)
+            touched.add(table.pk)
+        reason = reason or f"Αγώνισμα #{competition_class_id}"
+        snapshots = [publish(t, reason) for t in RankingTable.objects.filter(pk__in=touched)]
+    return [s for s in snapshots if s is not None]
+
+
+def refresh_category(season: int, discipline: str, age_category: str, reason: str = "") -> RankingSnapshot | None:
+    with transaction.atomic():
+        table = _get_table(season, discipline, age_category)
+        if table is None:
+            return None
+        _score_records(table, _category_records(season, discipline, age_category))
+        return publish(table, reason)
+
+
+def refresh_categories(categories, reason: str = "") -> list[RankingSnapshot]:
+    """categories: {(season, discipline, age_category)}"""
+    snapshots = []
+    for category in sorted(categories):
+        snapshot = refresh_category(*category, reason=reason)
+        if snapshot is not None:
+            snapshots.append(snapshot)
+    return snapshots
+
+
+def rule_categories(rule: RankingRule) -> set[tuple[int, str, str]]:
+    """Οι βαθμολογίες που δείχνουν τώρα στον κανονισμό (π.χ. σεζόν που έπαψε να καλύπτει)."""
+    return set(RankingTable.objects.filter(rule=rule).values_list("season", "discipline", "age_category"))
+
+
+def refresh_rule(rule: RankingRule) -> list[RankingSnapshot]:
+    """Όσες βαθμολογίες έχουν τον κανονισμό + όλες οι σεζόν που καλύπτει (και υπάρχουν αποτελέσματα)."""
+    categories = rule_categories(rule)
+    seasons = (
+        CompetitionRecord.objects.filter(
+            discipline=rule.discipline, age_category=rule.age_category, date__year__gte=rule.season_from
+        )
+        .dates("date", "year")
+    )
+    for d in seasons:
+        if rule.season_until is None or d.year <= rule.season_until:
+            categories.add((d.year, rule.discipline, rule.age_category))
+    return refresh_categories(categories, f"Κανονισμός: {rule.name}")
+
+
+def rebuild(season: int | None = None) -> list[RankingSnapshot]:
+    records = CompetitionRecord.objects.all()
+    if season is not None:
+        records = records.filter(date__year=season)
+    categories = set(
+        records.order_by()
+        .annotate(season=ExtractYear("date"))
+        .values_list("season", "discipline", "age_category")
+        .distinct()
+    )
+    return refresh_categories(categories, "Πλήρης ξαναϋπολογισμός")
@@ -0,0 +1,111 @@
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from competitions.models import CompetitionClass, CompetitionRecord, Result
+from registry.models import Athlete, Horse
+
+from .models import RankingRule, RankingTable
+from .standings import refresh_category, refresh_rule
+
+SJ = CompetitionClass.Discipline.SHOW_JUMPING
+OPEN = CompetitionClass.AgeCategory.OPEN
+
+
+class StandingsTests(TestCase):
+    """Βαθμοί, best_of, ισοβαθμίες και εκδόσεις (rankings/standings.py)."""
+
+    def setUp(self):
+        self.horse = Horse.objects.create(registry_number="GR-T-1", name="Test")
+        self.alpha = Athlete.objects.create(last_name="Alpha")
+        self.beta = Athlete.objects.create(last_name="Beta")
+        self.gamma = Athlete.objects.create(last_name="Gamma")
+        self.rule = RankingRule.objects.create(
+            name="SJ Open", discipline=SJ, age_category=OPEN, season_from=2025, points_table="10,8,6", min_starters=1,
+        )
+
+    def _record(self, athlete, rank, season=2026, day=1):
+        return CompetitionRecord.objects.create(
+            athlete=athlete, horse=self.horse, date=date(season, 5, day), competition_name="Test",
+            class_name=f"#{day}", discipline=SJ, age_category=OPEN, status=Result.Status.OK, rank=rank, starters=3,
+        )
+
+    def _table(self, season=2026) -> RankingTable:
+        return RankingTable.objects.select_related("current_snapshot").get(
+            season=season, discipline=SJ, age_category=OPEN
+        )
+
+    def _rows(self, season=2026) -> list[tuple[str, int, Decimal]]:
+        return list(
+            self._table(season).current_snapshot.rows.order_by("position", "athlete_name")
+            .values_list("athlete_name", "position", "points")
+        )
+
+    def test_rule_change_rescores_and_versions(self):
+        self._record(self.alpha, 1)
+        self._record(self.beta, 2)
+        refresh_category(2026, SJ, OPEN)
+        self.assertEqual(self._rows(), [("Alpha", 1, Decimal(10)), ("Beta", 2, Decimal(8))])
+        self.assertEqual(self._table().version, 1)
+
+        # χωρίς αλλαγή: καμία νέα έκδοση
+        self.assertIsNone(refresh_category(2026, SJ, OPEN))
+        self.assertEqual(self._table().version, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rule.points_table = "25,20"
+            self.rule.save()
+        self.assertEqual(self._rows(), [("Alpha", 1, Decimal(25)), ("Beta", 2, Decimal(20))])
+        table = self._table()
+        self.assertEqual(table.version, 2)
+        self.assertEqual(table.snapshots.count(), 2)
+
+    def test_best_of_counts_top_results(self):
+        RankingRule.objects.filter(pk=self.rule.pk).update(best_of=2)
+        for day, rank in enumerate((3, 1, 2), start=1):
+            self._record(self.alpha, rank, day=day)
+        refresh_category(2026, SJ, OPEN)
+        self.assertEqual(self._rows(), [("Alpha", 1, Decimal(18))])
+        self.assertEqual(self._table().current_snapshot.rows.get().results_counted, 2)
+
+    def test_ties_share_position(self):
+        # ίσοι βαθμοί και νίκες: ίδια θέση, η επόμενη παραλείπεται
+        self._record(self.alpha, 1, day=1)
+        self._record(self.beta, 2, day=1)
+        self._record(self.beta, 1, day=2)
+        self._record(self.alpha, 2, day=2)
+        self._record(self.gamma, 3, day=2)
+        refresh_category(2026, SJ, OPEN)
+        self.assertEqual(
+            self._rows(), [("Alpha", 1, Decimal(18)), ("Beta", 1, Decimal(18)), ("Gamma", 3, Decimal(6))]
+        )
+
+    def test_narrowed_rule_releases_old_seasons(self):
+        self._record(self.alpha, 1, season=2025)
+        self._record(self.alpha, 1, season=2026)
+        refresh_rule(self.rule)
+        self.assertEqual(self._table(2025).rule, self.rule)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rule.season_from = 2026
+            self.rule.save()
+        table = self._table(2025)
+        self.assertIsNone(table.rule)
+        self.assertEqual(self._rows(2025), [])
+        self.assertEqual(self._rows(2026), [("Alpha", 1, Decimal(10))])
+
+    def test_deleted_rule_falls_back(self):
+        self._record(self.alpha, 1)
+        self._record(self.beta, 2)
+        older = RankingRule.objects.create(
+            name="SJ Open (παλιός)", discipline=SJ, age_category=OPEN, season_from=2020, points_table="5,4",
+            min_starters=1,
+        )
+        refresh_category(2026, SJ, OPEN)
+        self.assertEqual(self._table().rule, self.rule)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rule.delete()
+        self.assertEqual(self._table().rule, older)
+        self.assertEqual(self._rows(), [("Alpha", 1, Decimal(5)), ("Beta", 2, Decimal(4))])
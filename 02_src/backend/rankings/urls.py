@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import views
+
+app_name = "rankings"
+
+urlpatterns = [
+    path("<int:season>/<str:discipline>/<str:age_category>/", views.ranking_table, name="ranking_table"),
+]
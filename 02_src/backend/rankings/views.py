@@ -0,0 +1,57 @@
+from django.db.models import Subquery
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from competitions.models import CompetitionClass
+
+from .models import RankingSnapshotRow, RankingTable
+
+
+@require_GET
+def ranking_table(request, season, discipline, age_category):
+    """
+    GET /api/rankings/<σεζόν>/<άθλημα>/<κατηγορία>/   (δημόσιο)
+    ?version=<n> για παλιότερη έκδοση. Ένα query στις γραμμές της έκδοσης.
+    """
+    discipline, age_category = discipline.upper(), age_category.upper()
+    if discipline not in CompetitionClass.Discipline.values or age_category not in CompetitionClass.AgeCategory.values:
+        return JsonResponse({"error": "Άγνωστο άθλημα / κατηγορία"}, status=404)
+
+    rows = RankingSnapshotRow.objects.all()
+    table = {"snapshot__table__season": season, "snapshot__table__discipline": discipline, "snapshot__table__age_category": age_category}
+    if request.GET.get("version"):
+        try:
+            rows = rows.filter(snapshot__version=int(request.GET["version"]), **table)
+        except ValueError:
+            return JsonResponse({"error": "Μη έγκυρη έκδοση"}, status=400)
+    else:
+        current = RankingTable.objects.filter(season=season, discipline=discipline, age_category=age_category)
+        rows = rows.filter(snapshot=Subquery(current.values("current_snapshot")[:1]))
+
+    rows = list(
+        rows.order_by("position", "athlete_name").values(
+            "position", "athlete_id", "athlete_name", "club_name", "points", "results_counted", "wins",
+            "snapshot__version", "snapshot__published_at",
+        )
+    )
+    if not rows:
+        return JsonResponse({"error": "Δεν υπάρχει δημοσιευμένη βαθμολογία"}, status=404)
+    return JsonResponse({
+        "season": season,
+        "discipline": discipline,
+        "age_category": age_category,
+        "version": rows[0]["snapshot__version"],
+        "published_at": rows[0]["snapshot__published_at"],
+        "rows": [
+            {
+                "position": r["position"],
+                "athlete": r["athlete_id"],
+                "name": r["athlete_name"],
+                "club": r["club_name"],
+                "points": r["points"],
+                "results": r["results_counted"],
+                "wins": r["wins"],
+            }
+            for r in rows
+        ],
+    })
@@ -1,16 +1,32 @@
-from datetime import timedelta
+from datetime import date, timedelta
 
-from django.contrib import admin
-from django.db.models import Q
+from django import forms
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
+from django.db.models import OuterRef, Q, Subquery
+from django.template.response import TemplateResponse
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join
 
+from accounts.scoping import ScopedAdminMixin
+from audit.recorder import update as audit_update
+from competitions.models import AthleteSeasonStats, CompetitionRecord, HorseSeasonStats, Partnership
+
+from . import dedup, merge
+from .downloads import url_for
+from .eligibility import eligible_on, not_eligible_on
+from .pedigree import pedigree
 from .models import (
     Athlete,
     Horse,
     AthleteDocument,
     AthleteMedicalCertificate,
+    AthleteSubscription,
+    DuplicateCandidate,
     HorseDocument,
+    StoredBlob,
 )
 
 User = get_user_model()
@@ -22,13 +38,83 @@ User = get_user_model()
 @admin.action(description="✅ Ενεργοποίηση")
 def make_active(modeladmin, request, queryset):
     if hasattr(modeladmin.model, "is_active"):
-        queryset.update(is_active=True)
+        # ✅ με καταγραφή στο ιστορικό αλλαγών (το queryset.update() δεν στέλνει signals)
+        audit_update(queryset, is_active=True)
 
 
 @admin.action(description="⛔ Απενεργοποίηση")
 def make_inactive(modeladmin, request, queryset):
     if hasattr(modeladmin.model, "is_active"):
-        queryset.update(is_active=False)
+        audit_update(queryset, is_active=False)
+
+
+@admin.action(description="🔀 Συγχώνευση (2 επιλεγμένοι)", permissions=["delete"])
+def merge_selected(modeladmin, request, queryset):
+    """Σελίδα επιβεβαίωσης με dry-run (τι μεταφέρεται προς κάθε κατεύθυνση) και μετά registry/merge.py."""
+    objs = list(queryset.order_by("pk")[:3])
+    if len(objs) != 2:
+        modeladmin.message_user(request, "Επιλέξτε ακριβώς δύο εγγραφές.", messages.WARNING)
+        return None
+    if request.POST.get("post"):
+        by_pk = {str(o.pk): o for o in objs}
+        survivor = by_pk.pop(request.POST.get("survivor", ""), None)
+        if survivor is not None:
+            duplicate = by_pk.popitem()[1]
+            try:
+                result = merge.merge(survivor, duplicate, user=request.user)
+            except ValidationError as e:
+                modeladmin.message_user(request, " ".join(e.messages), messages.ERROR)
+                return None
+            summary = ", ".join(f"{name}: {count}" for name, count in result.counts().items()) or "χωρίς συνδεδεμένα"
+            modeladmin.message_user(request, f"Συγχωνεύτηκε στο {survivor} ({summary}).", messages.SUCCESS)
+            return None
+    context = {
+        **modeladmin.admin_site.each_context(request),
+        "title": f"Συγχώνευση: {modeladmin.model._meta.verbose_name_plural}",
+        "opts": modeladmin.model._meta,
+        "plans": [merge.plan(objs[0], objs[1]), merge.plan(objs[1], objs[0])],
+        "objects": objs,
+        "action_checkbox_name": admin.helpers.ACTION_CHECKBOX_NAME,
+    }
+    return TemplateResponse(request, "admin/registry/merge_confirmation.html", context)
+
+
+# -----------------------------
+# Φίλτρο καταλληλότητας (από το snapshot -> σύγκριση σε index, όχι υπολογισμός ανά γραμμή)
+# -----------------------------
+class EligibilityFilter(admin.SimpleListFilter):
+    title = "Δικαίωμα συμμετοχής"
+    parameter_name = "eligible"
+
+    def lookups(self, request, model_admin):
+        return (
+            ("today", "Σήμερα"),
+            ("30d", "Και σε 30 ημέρες"),
+            ("expiring", "Λήγει μέσα σε 30 ημέρες"),
+            ("no", "Όχι σήμερα"),
+        )
+
+    def queryset(self, request, queryset):
+        today = timezone.localdate()
+        in_30 = today + timedelta(days=30)
+        if self.value() == "today":
+            return eligible_on(queryset, today)
+        if self.value() == "30d":
+            return eligible_on(eligible_on(queryset, today), in_30)
+        if self.value() == "expiring":
+            return eligible_on(queryset, today).filter(eligibility__eligible_until__lt=in_30)
+        if self.value() == "no":
+            return not_eligible_on(queryset, today)
+        return queryset
+
+
+def _eligible_until(obj):
+    snapshot = getattr(obj, "eligibility", None)
+    if snapshot is None or snapshot.eligible_until is None:
+        return snapshot.get_blocking_requirement_display() if snapshot else "-"
+    if snapshot.eligible_until == date.max:
+        return "χωρίς λήξη"
+    return snapshot.eligible_until
 
 
 # -----------------------------
@@ -52,35 +138,115 @@ def make_inactive(modeladmin, request, queryset):
 # -----------------------------
 # Inlines
 # -----------------------------
-class AthleteMedicalInline(admin.TabularInline):
+class DownloadLinkMixin:
+    @admin.display(description="Λήψη")
+    def download_link(self, obj):
+        # ✅ μέσω registry/downloads.py (έλεγχος δικαιωμάτων), όχι απευθείας από το /media/
+        if obj is None or obj.pk is None or not obj.file:
+            return "-"
+        return format_html('<a href="{}">Άνοιγμα</a> | <a href="{}?download=1">Λήψη</a>', url_for(obj), url_for(obj))
+
+
+class AthleteMedicalInline(DownloadLinkMixin, admin.TabularInline):
     model = AthleteMedicalCertificate
     extra = 0
-    fields = ("issued_date", "valid_until", "uploaded_at", "file")
-    readonly_fields = ("uploaded_at",)
+    fields = ("issued_date", "valid_until", "uploaded_at", "file", "download_link")
+    readonly_fields = ("uploaded_at", "download_link")
     ordering = ("-uploaded_at",)
 
 
-class AthleteDocumentInline(admin.TabularInline):
+class AthleteDocumentInline(DownloadLinkMixin, admin.TabularInline):
     model = AthleteDocument
     extra = 0
-    fields = ("document_type", "title", "uploaded_at", "file")
-    readonly_fields = ("uploaded_at",)
+    fields = ("document_type", "title", "uploaded_at", "file", "download_link")
+    readonly_fields = ("uploaded_at", "download_link")
     ordering = ("-uploaded_at",)
 
 
-class HorseDocumentInline(admin.TabularInline):
+class AthleteSubscriptionInline(admin.TabularInline):
+    model = AthleteSubscription
+    extra = 0
+    fields = ("season", "valid_from", "valid_until", "amount", "status", "paid_at")
+    ordering = ("-season",)
+
+
+class HorseDocumentInline(DownloadLinkMixin, admin.TabularInline):
     model = HorseDocument
     extra = 0
-    fields = ("document_type", "title", "issued_date", "valid_until", "uploaded_at", "file")
-    readonly_fields = ("uploaded_at",)
+    fields = ("document_type", "title", "issued_date", "valid_until", "uploaded_at", "file", "download_link")
+    readonly_fields = ("uploaded_at", "download_link")
     ordering = ("-uploaded_at",)
 
 
+class _SeasonStatsInline(admin.TabularInline):
+    """Στατιστικά ανά σεζόν (competitions/history.py, ενημερώνονται στην οριστικοποίηση)."""
+
+    extra = 0
+    max_num = 0
+    can_delete = False
+    fields = ("season", "starts", "completed", "wins", "placings", "clear_rounds", "eliminations", "total_faults", "prize_money", "best_rank", "last_date")
+    readonly_fields = fields
+    ordering = ("-season",)
+
+
+class AthleteSeasonStatsInline(_SeasonStatsInline):
+    model = AthleteSeasonStats
+
+
+class HorseSeasonStatsInline(_SeasonStatsInline):
+    model = HorseSeasonStats
+
+
+class _PartnershipInline(admin.TabularInline):
+    """Ζεύγη αθλητή / ίππου (competitions/partnerships.py, ενημερώνονται αυτόματα)."""
+
+    model = Partnership
+    partner_field = ""
+    extra = 0
+    max_num = 0
+    can_delete = False
+    ordering = ("-last_entry_date", "-entries")
+
+    def get_fields(self, request, obj=None):
+        return (self.partner_field, "entries", "last_entry_date", "starts", "wins", "best_rank", "first_date", "last_date")
+
+    def get_readonly_fields(self, request, obj=None):
+        return self.get_fields(request, obj)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(self.partner_field)
+
+
+class AthletePartnershipInline(_PartnershipInline):
+    partner_field = "horse"
+    verbose_name_plural = "Ίπποι"
+
+
+class HorsePartnershipInline(_PartnershipInline):
+    partner_field = "athlete"
+    verbose_name_plural = "Αναβάτες"
+
+
+class CompetitionRecordInline(admin.TabularInline):
+    """Ιστορικό αγώνων (γράφεται στην οριστικοποίηση αποτελεσμάτων, μόνο ανάγνωση)."""
+
+    model = CompetitionRecord
+    extra = 0
+    max_num = 0
+    can_delete = False
+    fields = ("date", "competition_name", "class_name", "athlete", "horse", "status", "rank", "starters", "faults", "time_seconds", "score", "prize_money")
+    readonly_fields = fields
+    ordering = ("-date",)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("athlete", "horse")
+
+
 # -----------------------------
 # Athletes
 # -----------------------------
 @admin.register(Athlete)
-class AthleteAdmin(admin.ModelAdmin):
+class AthleteAdmin(ScopedAdminMixin, admin.ModelAdmin):
     list_display = (
         "eoi_registry_number",
         "last_name",
@@ -91,10 +257,13 @@ class AthleteAdmin(admin.ModelAdmin):
         "is_active",
         "latest_medical_valid_until",
         "latest_medical_uploaded_at",
+        "eligible_until",
     )
-    list_filter = ("is_active", "club")
+    # ✅ μόνο οι όμιλοι που εμφανίζονται (και όχι όλοι, αφού υπάρχει scoping)
+    list_filter = ("is_active", EligibilityFilter, ("club", admin.RelatedOnlyFieldListFilter))
+    list_select_related = ("club", "eligibility")
     ordering = ("last_name", "first_name", "eoi_registry_number")
-    actions = (make_active, make_inactive)
+    actions = (make_active, make_inactive, merge_selected)
 
     # ✅ Για autocomplete να δουλεύει σωστά, πρέπει να υπάρχουν search_fields
     search_fields = (
@@ -147,25 +316,42 @@ class AthleteAdmin(admin.ModelAdmin):
         ("Σύστημα", {"fields": ("created_at", "updated_at")}),
     )
 
-    inlines = (AthleteMedicalInline, AthleteDocumentInline)
+    inlines = (AthleteMedicalInline, AthleteSubscriptionInline, AthleteDocumentInline, AthleteSeasonStatsInline, AthletePartnershipInline, CompetitionRecordInline)
+
+    # ✅ Η τελευταία ιατρική έρχεται με subquery στο ίδιο SELECT
+    # (αλλιώς 3 queries ανά γραμμή στο changelist = N+1)
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        latest = AthleteMedicalCertificate.objects.filter(athlete=OuterRef("pk")).order_by("-uploaded_at")
+        return qs.annotate(
+            _medical_issued_date=Subquery(latest.values("issued_date")[:1]),
+            _medical_valid_until=Subquery(latest.values("valid_until")[:1]),
+            _medical_uploaded_at=Subquery(latest.values("uploaded_at")[:1]),
+        )
 
-    def _latest_medical(self, obj):
-        return obj.medical_certificates.order_by("-uploaded_at").first()
+    def _latest_medical_value(self, obj, field):
+        if hasattr(obj, f"_medical_{field}"):
+            value = getattr(obj, f"_medical_{field}")
+        else:
+            m = obj.medical_certificates.order_by("-uploaded_at").first()
+            value = getattr(m, field) if m else None
+        return value if value is not None else "-"
 
     @admin.display(description="Ιατρικό: Έκδοση")
     def latest_medical_issued_date(self, obj):
-        m = self._latest_medical(obj)
-        return m.issued_date if m else "-"
+        return self._latest_medical_value(obj, "issued_date")
 
-    @admin.display(description="Ιατρικό: Λήξη")
+    @admin.display(description="Ιατρικό: Λήξη", ordering="_medical_valid_until")
     def latest_medical_valid_until(self, obj):
-        m = self._latest_medical(obj)
-        return m.valid_until if m else "-"
+        return self._latest_medical_value(obj, "valid_until")
 
-    @admin.display(description="Ιατρικό: Καταχώρηση")
+    @admin.display(description="Ιατρικό: Καταχώρηση", ordering="_medical_uploaded_at")
     def latest_medical_uploaded_at(self, obj):
-        m = self._latest_medical(obj)
-        return m.uploaded_at if m else "-"
+        return self._latest_medical_value(obj, "uploaded_at")
+
+    @admin.display(description="Συμμετοχή έως", ordering="eligibility__eligible_until")
+    def eligible_until(self, obj):
+        return _eligible_until(obj)
 
     # ✅ Κάνει την αναζήτηση να δουλεύει σωστά με ελληνικά (γράφεις μικρά/κεφαλαία)
     def get_search_results(self, request, queryset, search_term):
@@ -189,10 +375,12 @@ class AthleteAdmin(admin.ModelAdmin):
 # Medical Certificates
 # -----------------------------
 @admin.register(AthleteMedicalCertificate)
-class AthleteMedicalCertificateAdmin(admin.ModelAdmin):
-    list_display = ("athlete", "issued_date", "valid_until", "uploaded_at", "is_valid", "notify_on")
+class AthleteMedicalCertificateAdmin(DownloadLinkMixin, ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = "athlete__club"
+
+    list_display = ("athlete", "issued_date", "valid_until", "uploaded_at", "is_valid", "notify_on", "download_link")
     list_filter = ("valid_until",)
-    readonly_fields = ("uploaded_at",)
+    readonly_fields = ("uploaded_at", "download_link")
     ordering = ("-uploaded_at",)
 
     # ✅ για autocomplete
@@ -200,13 +388,32 @@ class AthleteMedicalCertificateAdmin(admin.ModelAdmin):
     search_fields = ("athlete__eoi_registry_number", "athlete__last_name_uc", "athlete__first_name_uc")
 
 
+# -----------------------------
+# Subscriptions
+# -----------------------------
+@admin.register(AthleteSubscription)
+class AthleteSubscriptionAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = "athlete__club"
+
+    list_display = ("athlete", "season", "valid_from", "valid_until", "amount", "status", "paid_at")
+    list_filter = ("season", "status")
+    list_select_related = ("athlete",)
+    readonly_fields = ("created_at",)
+    ordering = ("-season",)
+
+    autocomplete_fields = ("athlete",)
+    search_fields = ("athlete__eoi_registry_number", "athlete__last_name_uc", "athlete__first_name_uc")
+
+
 # -----------------------------
 # Athlete Documents
 # -----------------------------
 @admin.register(AthleteDocument)
-class AthleteDocumentAdmin(admin.ModelAdmin):
-    list_display = ("athlete", "document_type", "title", "uploaded_at")
-    readonly_fields = ("uploaded_at",)
+class AthleteDocumentAdmin(DownloadLinkMixin, ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = "athlete__club"
+
+    list_display = ("athlete", "document_type", "title", "uploaded_at", "download_link")
+    readonly_fields = ("uploaded_at", "download_link")
     ordering = ("-uploaded_at",)
 
     # ✅ για autocomplete
@@ -218,25 +425,187 @@ class AthleteDocumentAdmin(admin.ModelAdmin):
 # Horses
 # -----------------------------
 @admin.register(Horse)
-class HorseAdmin(admin.ModelAdmin):
-    list_display = ("registry_number", "name", "passport_number", "birth_date", "is_active")
-    list_filter = ("is_active",)
+class HorseAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    list_display = ("registry_number", "name", "passport_number", "birth_date", "club", "is_active", "eligible_until")
+    list_filter = ("is_active", EligibilityFilter, ("club", admin.RelatedOnlyFieldListFilter))
+    list_select_related = ("club", "eligibility")
     search_fields = ("registry_number", "name", "passport_number")
     ordering = ("registry_number",)
-    actions = (make_active, make_inactive)
+    actions = (make_active, make_inactive, merge_selected)
+
+    autocomplete_fields = ("club", "sire", "dam")
+    readonly_fields = ("pedigree_display",)
+
+    inlines = (HorseDocumentInline, HorseSeasonStatsInline, HorsePartnershipInline, CompetitionRecordInline)
+
+    @admin.display(description="Συμμετοχή έως", ordering="eligibility__eligible_until")
+    def eligible_until(self, obj):
+        return _eligible_until(obj)
+
+    @admin.display(description="Γενεαλογία")
+    def pedigree_display(self, obj):
+        # ✅ ένα query στη closure table (registry/pedigree.py)
+        if obj is None or obj.pk is None:
+            return "-"
+        grid = pedigree(obj)
+        if not grid:
+            return "-"
+        # σειρά δέντρου: κάθε πρόγονος ακολουθείται από τους δικούς του προγόνους
+        paths = sorted(grid, key=lambda p: p.translate(_SIRE_FIRST))
+        return format_html_join("<br>", "{}{} {}", ((
+            "\u2003" * (len(path) - 1),
+            _pedigree_label(path),
+            _pedigree_name(grid[path]),
+        ) for path in paths))
+
+
+_SIRE_FIRST = str.maketrans("SD", "01")
+_PEDIGREE_WORDS = {"S": "Π", "D": "Μ"}
 
-    inlines = (HorseDocumentInline,)
+
+def _pedigree_label(path: str) -> str:
+    """"DS" -> "Μ.Π:" (πατέρας της μητέρας)."""
+    return ".".join(_PEDIGREE_WORDS[c] for c in path) + ":"
+
+
+def _pedigree_name(slot: dict) -> str:
+    return f"{slot['name']} ({slot['registry_number']})" if slot["registry_number"] else slot["name"]
 
 
 # -----------------------------
 # Horse Documents
 # -----------------------------
 @admin.register(HorseDocument)
-class HorseDocumentAdmin(admin.ModelAdmin):
-    list_display = ("horse", "document_type", "title", "issued_date", "valid_until", "uploaded_at")
-    readonly_fields = ("uploaded_at",)
+class HorseDocumentAdmin(DownloadLinkMixin, ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = "horse__club"
+
+    list_display = ("horse", "document_type", "title", "issued_date", "valid_until", "uploaded_at", "download_link")
+    readonly_fields = ("uploaded_at", "download_link")
     ordering = ("-uploaded_at",)
 
     # ✅ για autocomplete
     autocomplete_fields = ("horse",)
     search_fields = ("horse__registry_number", "horse__name", "title")
+
+
+# -----------------------------
+# Πιθανά διπλότυπα αθλητών (registry/dedup.py, registry/merge.py)
+# -----------------------------
+@admin.action(description="↔️ Διαφορετικά πρόσωπα (να μην ξαναπροταθούν)")
+def dismiss_duplicates(modeladmin, request, queryset):
+    count = dedup.dismiss(queryset.values_list("pk", flat=True), user=request.user)
+    modeladmin.message_user(request, f"{count} ζεύγη σημειώθηκαν ως διαφορετικά πρόσωπα.", messages.SUCCESS)
+
+
+class DuplicateCandidateForm(forms.ModelForm):
+    KEEP_ATHLETE, KEEP_OTHER, DISMISS = "athlete", "other", "dismiss"
+
+    decision = forms.ChoiceField(
+        label="Απόφαση",
+        required=False,
+        choices=(
+            ("", "---------"),
+            (KEEP_ATHLETE, "Συγχώνευση: μένει ο Αθλητής"),
+            (KEEP_OTHER, "Συγχώνευση: μένει το Πιθανό διπλότυπο"),
+            (DISMISS, "Διαφορετικά πρόσωπα"),
+        ),
+        help_text="Στη συγχώνευση όλα τα συνδεδεμένα (έγγραφα, βεβαιώσεις, δηλώσεις, αποτελέσματα, καθολικό) μεταφέρονται και ο άλλος αθλητής διαγράφεται.",
+    )
+
+    class Meta:
+        model = DuplicateCandidate
+        fields = ()
+
+    def merge_pair(self, decision=None):
+        """(survivor, duplicate) ή None."""
+        decision = decision or self.cleaned_data.get("decision")
+        if decision == self.KEEP_ATHLETE:
+            return self.instance.athlete, self.instance.other
+        if decision == self.KEEP_OTHER:
+            return self.instance.other, self.instance.athlete
+        return None
+
+    def clean_decision(self):
+        decision = self.cleaned_data["decision"]
+        pair = self.merge_pair(decision)
+        if pair is not None:
+            errors = merge.plan(*pair).errors
+            if errors:
+                raise forms.ValidationError(errors)
+        return decision
+
+
+@admin.register(DuplicateCandidate)
+class DuplicateCandidateAdmin(ScopedAdminMixin, admin.ModelAdmin):
+    scope_field = "athlete__club"
+
+    list_display = ("athlete", "other", "score", "reasons", "status", "found_at")
+    list_filter = ("status",)
+    list_select_related = ("athlete", "other")
+    search_fields = ("athlete__last_name_uc", "athlete__eoi_registry_number", "other__last_name_uc", "other__eoi_registry_number")
+    ordering = ("status", "-score")
+    actions = (dismiss_duplicates,)
+    form = DuplicateCandidateForm
+    readonly_fields = ("athlete", "other", "score", "reasons", "status", "found_at", "reviewed_at", "reviewed_by", "comparison")
+
+    def get_fields(self, request, obj=None):
+        if obj is not None and obj.status == DuplicateCandidate.Status.PENDING and request.user.has_perm("registry.delete_athlete"):
+            return self.readonly_fields + ("decision",)
+        return self.readonly_fields
+
+    def has_add_permission(self, request):
+        return False
+
+    # ✅ οθόνη σύγκρισης: τα στοιχεία και τα συνδεδεμένα των δύο αθλητών δίπλα-δίπλα
+    @admin.display(description="Σύγκριση")
+    def comparison(self, obj):
+        a, b = obj.athlete, obj.other
+        fields = ("eoi_registry_number", "amka", "last_name", "first_name", "father_name", "mother_name", "birth_date", "club", "email", "is_active")
+        rows = [
+            (Athlete._meta.get_field(f).verbose_name, getattr(a, f) or "-", getattr(b, f) or "-")
+            for f in fields
+        ]
+        # τι θα μεταφερθεί προς κάθε κατεύθυνση (dry-run)
+        counts_a, counts_b = merge.plan(b, a).counts(), merge.plan(a, b).counts()
+        rows += [(name, counts_a.get(name, 0), counts_b.get(name, 0)) for name in sorted(counts_a.keys() | counts_b.keys())]
+        return format_html_join(
+            "", "<div><b>{}</b>: {} | {}</div>", rows,
+        )
+
+    def save_model(self, request, obj, form, change):
+        pair = form.merge_pair()
+        if pair is not None:
+            survivor, duplicate = pair
+            result = merge.merge(survivor, duplicate, user=request.user)
+            summary = ", ".join(f"{name}: {count}" for name, count in result.counts().items())
+            self.message_user(request, f"Συγχωνεύτηκε στον {survivor} ({summary}).", messages.SUCCESS)
+            return
+        if form.cleaned_data.get("decision") == form.DISMISS:
+            dedup.dismiss([obj.pk], user=request.user)
+
+    def response_change(self, request, obj):
+        # μετά τη συγχώνευση το ζεύγος δεν υπάρχει πια (διαγράφηκε μαζί με το διπλότυπο)
+        if not DuplicateCandidate.objects.filter(pk=obj.pk).exists():
+            return self.response_post_save_change(request, obj)
+        return super().response_change(request, obj)
+
+
+# -----------------------------
+# Αποθηκευμένα αρχεία (registry/storage.py)
+# -----------------------------
+@admin.register(StoredBlob)
+class StoredBlobAdmin(admin.ModelAdmin):
+    list_display = ("name", "size", "refcount", "stored_at")
+    search_fields = ("=sha256", "name")
+    ordering = ("-stored_at",)
+    # ✅ μόνο προβολή: γράφονται από το storage, σβήνονται από το gc_blobs
+    readonly_fields = ("name", "sha256", "size", "refcount", "stored_at")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,323 @@
+"""
+Εντοπισμός διπλότυπων αθλητών (ίδιο πρόσωπο σε δύο εγγραφές: λάθος στον ΑΜ, χωρίς ΑΜΚΑ,
+όνομα με λατινικούς χαρακτήρες κ.λπ.).
+
+    scan(since=None, threshold)  -> upsert DuplicateCandidate (όσα σημειώθηκαν "διαφορετικά
+                                    πρόσωπα" μένουν ως έχουν)
+    candidates(rows, since)      -> [(id, id, score, reasons)] χωρίς εγγραφές στη βάση
+    similarity(a, b)             -> (score 0..1, reasons) για δύο Person
+
+Blocking: κάθε αθλητής μπαίνει σε λίγα blocks (ΑΜΚΑ, ημ. γέννησης, αρχή επωνύμου + αρχικό
+ονόματος και ανάποδα, πατρώνυμο + αρχικό επωνύμου) και συγκρίνεται μόνο με όσους μοιράζεται
+κάποιο block: ~N·k συγκρίσεις αντί για N²/2. Blocks μεγαλύτερα από MAX_BLOCK (π.χ.
+"PAPA" + "G") αγνοούνται· τα ζεύγη τους βρίσκονται από τα υπόλοιπα κλειδιά.
+
+Ονόματα: name_key() = φωνητική μορφή με λατινικούς χαρακτήρες, ίδια για ελληνικά και
+greeklish ("Χρήστος", "Christos", "Hristos" -> "HRISTOS"· "Παπαδόπουλος", "Papadopoulos"
+-> "PAPADOPULOS") και σύγκριση με Jaro-Winkler (βάρος στην αρχή του ονόματος).
+"""
+from __future__ import annotations
+
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import date
+from itertools import combinations
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Athlete, DuplicateCandidate
+
+try:  # προαιρετικά: ίδιο αποτέλεσμα, σε C
+    from jellyfish import jaro_winkler_similarity as _jaro_winkler
+except ImportError:  # pragma: no cover
+    _jaro_winkler = None
+
+THRESHOLD = 0.85
+MAX_BLOCK = 100
+CHUNK_SIZE = 2000
+PERSON_FIELDS = ("pk", "amka", "first_name", "last_name", "father_name", "birth_date", "updated_at")
+
+# βάρη (όσα λείπουν και από τους δύο δεν μετράνε)
+WEIGHTS = {"last_name": 0.35, "first_name": 0.25, "father_name": 0.15, "birth_date": 0.25}
+AMKA_BONUS = 0.15
+AMKA_PENALTY = 0.30
+NAME_ONLY_FACTOR = THRESHOLD
+NAME_MIN = 0.8
+
+
+# -----------------------------
+# κανονικοποίηση ονομάτων
+# -----------------------------
+_GREEK_DIGRAPHS = {
+    "ΟΥ": "U", "ΑΙ": "E", "ΕΙ": "I", "ΟΙ": "I", "ΥΙ": "I",
+    "ΜΠ": "B", "ΝΤ": "D", "ΓΚ": "G", "ΓΓ": "G", "ΑΥ": "AV", "ΕΥ": "EV",
+}
+_GREEK_LETTERS = str.maketrans({
+    "Α": "A", "Β": "V", "Γ": "G", "Δ": "D", "Ε": "E", "Ζ": "Z", "Η": "I", "Θ": "TH",
+    "Ι": "I", "Κ": "K", "Λ": "L", "Μ": "M", "Ν": "N", "Ξ": "X", "Ο": "O", "Π": "P",
+    "Ρ": "R", "Σ": "S", "Τ": "T", "Υ": "I", "Φ": "F", "Χ": "H", "Ψ": "PS", "Ω": "O",
+})
+# greeklish -> η ίδια φωνητική μορφή
+_LATIN = {
+    "CH": "H", "KH": "H", "PH": "F", "DH": "D", "OU": "U", "AI": "E", "EI": "I", "OI": "I",
+    "MP": "B", "NT": "D", "GK": "G", "NG": "G", "KS": "X", "AU": "AV", "EU": "EV",
+    "Y": "I", "W": "O", "C": "K", "Q": "K",
+}
+_GREEK_RE = re.compile("|".join(_GREEK_DIGRAPHS))
+_LATIN_RE = re.compile("|".join(sorted(_LATIN, key=len, reverse=True)))
+_NOT_LETTER_RE = re.compile(r"[^A-Z]")
+_REPEATED_RE = re.compile(r"(.)\1+")
+
+
+def fold(value) -> str:
+    """Κεφαλαία χωρίς τόνους / διαλυτικά: "Γεώργιος" -> "ΓΕΩΡΓΙΟΣ"."""
+    s = unicodedata.normalize("NFD", str(value or "").strip().upper())
+    return "".join(ch for ch in s if not unicodedata.combining(ch))
+
+
+def name_key(value) -> str:
+    s = _GREEK_RE.sub(lambda m: _GREEK_DIGRAPHS[m.group()], fold(value)).translate(_GREEK_LETTERS)
+    s = _LATIN_RE.sub(lambda m: _LATIN[m.group()], s)
+    return _REPEATED_RE.sub(r"\1", _NOT_LETTER_RE.sub("", s))
+
+
+def amka_key(value) -> str:
+    digits = "".join(ch for ch in str(value or "") if ch.isdigit())
+    return digits if len(digits) >= 9 else ""
+
+
+@lru_cache(maxsize=1 << 16)
+def jaro_winkler(a: str, b: str) -> float:
+    """Με cache: τα ίδια ονόματα ("ΓΙΩΡΓΟΣ", "ΜΑΡΙΑ") συγκρίνονται ξανά και ξανά."""
+    if _jaro_winkler is not None:
+        return _jaro_winkler(a, b)
+    if a == b:
+        return 1.0 if a else 0.0
+    la, lb = len(a), len(b)
+    if not la or not lb:
+        return 0.0
+    window = max(0, max(la, lb) // 2 - 1)
+    matched_b = [False] * lb
+    a_matches = []
+    for i, ch in enumerate(a):
+        for j in range(max(0, i - window), min(lb, i + window + 1)):
+            if not matched_b[j] and b[j] == ch:
+                matched_b[j] = True
+                a_matches.append(ch)
+                break
+    m = len(a_matches)
+    if not m:
+        return 0.0
+    b_matches = [b[j] for j in range(lb) if matched_b[j]]
+    transpositions = sum(x != y for x, y in zip(a_matches, b_matches)) / 2
+    jaro = (m / la + m / lb + (m - transpositions) / m) / 3
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1 - jaro)
+
+
+# -----------------------------
+# σύγκριση
+# -----------------------------
+@dataclass(frozen=True)
+class Person:
+    pk: int
+    amka: str
+    first: str
+    last: str
+    father: str
+    birth_date: date | None
+    updated_at: object = None
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Person":
+        return cls(
+            pk=row["pk"],
+            amka=amka_key(row["amka"]),
+            first=name_key(row["first_name"]),
+            last=name_key(row["last_name"]),
+            father=name_key(row["father_name"]),
+            birth_date=row["birth_date"],
+            updated_at=row.get("updated_at"),
+        )
+
+    def blocks(self) -> list[str]:
+        keys = []
+        if self.amka:
+            keys.append(f"a:{self.amka}")
+        if self.birth_date:
+            keys.append(f"b:{self.birth_date.isoformat()}")
+        if self.last:
+            keys.append(f"s:{self.last[:4]}:{self.first[:1]}")
+        if self.first:
+            # επώνυμο / όνομα ανάποδα στην εισαγωγή
+            keys.append(f"s:{self.first[:4]}:{self.last[:1]}")
+        if self.father and self.last:
+            keys.append(f"f:{self.father[:4]}:{self.last[:1]}")
+        return list(dict.fromkeys(keys))
+
+
+def _birth_similarity(a: date, b: date) -> float:
+    if a == b:
+        return 1.0
+    if a.year == b.year and (a.day, a.month) == (b.month, b.day):
+        return 0.8  # ημέρα / μήνας ανάποδα
+    if a.year == b.year and (a.month == b.month or a.day == b.day):
+        return 0.5  # ένα ψηφίο λάθος
+    return 0.0
+
+
+def _may_match(a: Person, b: Person, threshold: float) -> bool:
+    """Φθηνός έλεγχος πριν από τα ονόματα: άλλη ημ. γέννησης χωρίς κοινό ΑΜΚΑ δεν φτάνει το όριο."""
+    if a.amka and a.amka == b.amka:
+        return True
+    if a.birth_date and b.birth_date and not _birth_similarity(a.birth_date, b.birth_date):
+        return 1 - WEIGHTS["birth_date"] >= threshold
+    return True
+
+
+def similarity(a: Person, b: Person) -> tuple[float, str]:
+    parts: dict[str, float] = {}
+    straight = (jaro_winkler(a.last, b.last), jaro_winkler(a.first, b.first))
+    swapped = (jaro_winkler(a.last, b.first), jaro_winkler(a.first, b.last))
+    is_swapped = sum(swapped) > sum(straight)
+    last, first = swapped if is_swapped else straight
+    if a.last or b.last:
+        parts["last_name"] = last
+    if a.first or b.first:
+        parts["first_name"] = first
+    if a.father and b.father:
+        parts["father_name"] = jaro_winkler(a.father, b.father)
+    if a.birth_date and b.birth_date:
+        parts["birth_date"] = _birth_similarity(a.birth_date, b.birth_date)
+    if not parts:
+        return 0.0, ""
+    score = sum(WEIGHTS[k] * v for k, v in parts.items()) / sum(WEIGHTS[k] for k in parts)
+
+    reasons = []
+    same_amka = bool(a.amka) and a.amka == b.amka
+    names = [parts[k] for k in ("last_name", "first_name") if k in parts]
+    if not same_amka and names and min(names) < NAME_MIN:
+        # άλλο όνομα με ίδιο επώνυμο / ημ. γέννησης (αδέλφια, δίδυμα): όχι το ίδιο πρόσωπο
+        score = min(score, min(names))
+    if not (a.amka and b.amka) and parts.keys() <= {"last_name", "first_name"}:
+        # μόνο ονοματεπώνυμο: ίσα-ίσα το όριο για ίδια ονόματα (συνωνυμίες)
+        score *= NAME_ONLY_FACTOR
+        reasons.append("μόνο ονοματεπώνυμο")
+    if a.amka and b.amka:
+        if same_amka:
+            score = min(1.0, score + AMKA_BONUS)
+            reasons.append("ΑΜΚΑ")
+        else:
+            score = max(0.0, score - AMKA_PENALTY)
+            reasons.append("διαφορετικό ΑΜΚΑ")
+    labels = {"last_name": "επώνυμο", "first_name": "όνομα", "father_name": "πατρώνυμο", "birth_date": "γέννηση"}
+    reasons.extend(f"{labels[k]} {v:.2f}" for k, v in parts.items())
+    if is_swapped:
+        reasons.append("όνομα / επώνυμο ανάποδα")
+    return round(score, 4), ", ".join(reasons)
+
+
+# -----------------------------
+# blocking
+# -----------------------------
+@dataclass
+class Stats:
+    athletes: int = 0
+    blocks: int = 0
+    skipped_blocks: int = 0
+    comparisons: int = 0
+    candidates: int = 0
+    elapsed_ms: int = 0
+
+
+def people(queryset=None):
+    qs = Athlete.objects.all() if queryset is None else queryset
+    for row in qs.order_by().values(*PERSON_FIELDS).iterator(chunk_size=CHUNK_SIZE):
+        yield Person.from_row(row)
+
+
+def candidates(persons, since=None, threshold: float = THRESHOLD, stats: Stats | None = None):
+    """
+    persons: iterable από Person. since: μόνο ζεύγη όπου τουλάχιστον ένας άλλαξε μετά από
+    αυτή τη στιγμή (π.χ. μετά από εισαγωγή) — τα blocks φτιάχνονται πάντα από όλους.
+    """
+    stats = stats if stats is not None else Stats()
+    by_pk: dict[int, Person] = {}
+    blocks: dict[str, list[int]] = defaultdict(list)
+    for person in persons:
+        by_pk[person.pk] = person
+        for key in person.blocks():
+            blocks[key].append(person.pk)
+    stats.athletes = len(by_pk)
+
+    recent = None
+    if since is not None:
+        recent = {pk for pk, p in by_pk.items() if p.updated_at and p.updated_at >= since}
+
+    seen: set[tuple[int, int]] = set()
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        if len(members) > MAX_BLOCK:
+            stats.skipped_blocks += 1
+            continue
+        if recent is None:
+            pairs = combinations(sorted(members), 2)
+        else:
+            pairs = (
+                (min(x, y), max(x, y))
+                for x in members if x in recent
+                for y in members if y != x
+            )
+        stats.blocks += 1
+        for pair in pairs:
+            if pair in seen:
+                continue
+            seen.add(pair)
+            a, b = by_pk[pair[0]], by_pk[pair[1]]
+            if not _may_match(a, b, threshold):
+                continue
+            stats.comparisons += 1
+            score, reasons = similarity(a, b)
+            if score >= threshold:
+                yield a.pk, b.pk, score, reasons
+
+
+def scan(queryset=None, since=None, threshold: float = THRESHOLD) -> Stats:
+    """Όλοι οι αθλητές (ή το queryset) -> upsert των ζευγών πάνω από το threshold."""
+    started = time.perf_counter()
+    stats = Stats()
+    now = timezone.now()
+    found = [
+        DuplicateCandidate(athlete_id=a, other_id=b, score=score, reasons=reasons[:255], found_at=now)
+        for a, b, score, reasons in candidates(people(queryset), since=since, threshold=threshold, stats=stats)
+    ]
+    with transaction.atomic():
+        # η κατάσταση ("διαφορετικά πρόσωπα") δεν αλλάζει: δεν ξαναπροτείνονται
+        DuplicateCandidate.objects.bulk_create(
+            found,
+            update_conflicts=True,
+            unique_fields=["athlete", "other"],
+            update_fields=["score", "reasons", "found_at"],
+            batch_size=1000,
+        )
+    stats.candidates = len(found)
+    stats.elapsed_ms = round((time.perf_counter() - started) * 1000)
+    return stats
+
+
+def dismiss(candidate_ids, user=None) -> int:
+    return DuplicateCandidate.objects.filter(pk__in=candidate_ids).update(
+        status=DuplicateCandidate.Status.DISMISSED,
+        reviewed_at=timezone.now(),
+        reviewed_by=user,
+    )
@@ -0,0 +1,169 @@
+"""
+Λήψη εγγράφων αθλητών / ίππων και ιατρικών βεβαιώσεων, μετά τον έλεγχο δικαιωμάτων
+(registry/views.document_download).
+
+    serve(request, fieldfile, filename, as_attachment) -> η απάντηση με το αρχείο
+    url_for(obj)                                       -> /api/registry/documents/<kind>/<id>/
+
+settings.EOI_SENDFILE:
+    "nginx"  -> X-Accel-Redirect: EOI_SENDFILE_URL + όνομα (internal location με alias στο MEDIA_ROOT)
+    "apache" -> X-Sendfile: απόλυτο path (mod_xsendfile)
+    None     -> FileResponse από το Django σε chunks, με Range (ένα διάστημα), If-Range,
+                If-None-Match / If-Modified-Since (304)
+Με web server το Django απαντά μόνο με headers και ο worker ελευθερώνεται αμέσως· Range και
+caching τα χειρίζεται ο server.
+"""
+from __future__ import annotations
+
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+from .models import AthleteDocument, AthleteMedicalCertificate, HorseDocument
+from .storage import PREFIX
+
+# kind στο URL -> (μοντέλο, πεδίο ομίλου για το scope, FK για το όνομα του αρχείου)
+DOCUMENTS = {
+    "athlete-documents": (AthleteDocument, "athlete__club", "athlete"),
+    "medical-certificates": (AthleteMedicalCertificate, "athlete__club", "athlete"),
+    "horse-documents": (HorseDocument, "horse__club", "horse"),
+}
+_KINDS = {model: kind for kind, (model, _, _) in DOCUMENTS.items()}
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_UNSAFE = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+
+
+class DocumentResponse(FileResponse):
+    block_size = 64 * 1024
+
+
+class _Slice:
+    """Ένα διάστημα του αρχείου. Χωρίς fileno(): ο WSGI server δεν κάνει sendfile όλου του αρχείου."""
+
+    def __init__(self, file, start: int, length: int):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def url_for(obj) -> str:
+    return reverse("registry:document_download", args=(_KINDS[type(obj)], obj.pk))
+
+
+def download_name(obj, fieldfile) -> str:
+    """"Α123 - Παπαδόπουλος Χρήστος - Ιατρική (2026-05-01).pdf": χωρίς χαρακτήρες που δεν επιτρέπονται σε αρχεία."""
+    ext = os.path.splitext(fieldfile.name)[1]
+    return _UNSAFE.sub("_", str(obj)).strip() + ext
+
+
+def _etag(name: str, stat) -> str:
+    # blobs: το όνομα είναι ήδη το SHA-256 του περιεχομένου
+    stem = os.path.splitext(os.path.basename(name))[0]
+    if name.startswith(PREFIX) and len(stem) == 64:
+        return f'"{stem}"'
+    return f'"{int(stat.st_mtime):x}-{stat.st_size:x}"'
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    "bytes=0-99" -> (0, 99), "bytes=-500" -> τα τελευταία 500. None: όλο το αρχείο (χωρίς
+    header, άκυρο ή πολλά διαστήματα). ValueError: εκτός αρχείου (416).
+    """
+    match = _RANGE.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        if int(last) == 0:
+            raise ValueError(header)
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    return start, end
+
+
+def _if_range(request, etag: str, mtime: int) -> bool:
+    """Range μόνο αν το αντίγραφο του client είναι ακόμα το ίδιο (αλλιώς όλο το αρχείο)."""
+    value = request.headers.get("If-Range")
+    if not value:
+        return True
+    if value.startswith(('"', "W/")):
+        return value == etag
+    return parse_http_date_safe(value) == mtime
+
+
+def _file_response(request, path: str, stat, etag: str, filename: str, as_attachment: bool):
+    try:
+        byte_range = parse_range(request.headers.get("Range"), stat.st_size) if _if_range(request, etag, int(stat.st_mtime)) else None
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{stat.st_size}"
+        return response
+
+    file = open(path, "rb")
+    if byte_range is None:
+        response = DocumentResponse(file, as_attachment=as_attachment, filename=filename)
+        response["Content-Length"] = stat.st_size
+        return response
+    start, end = byte_range
+    response = DocumentResponse(_Slice(file, start, end - start + 1), as_attachment=as_attachment, filename=filename, status=206)
+    response["Content-Length"] = end - start + 1
+    response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+    return response
+
+
+def serve(request, fieldfile, filename: str, as_attachment: bool = False):
+    """Το αρχείο του fieldfile (ο έλεγχος δικαιωμάτων έχει γίνει ήδη). Http404 αν λείπει από τον δίσκο."""
+    if not fieldfile:
+        raise Http404
+    try:
+        path = fieldfile.storage.path(fieldfile.name)
+        stat = os.stat(path)
+    except (OSError, SuspiciousFileOperation):
+        raise Http404
+
+    etag = _etag(fieldfile.name, stat)
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        mode = getattr(settings, "EOI_SENDFILE", None)
+        if mode in ("nginx", "apache"):
+            response = HttpResponse(content_type=mimetypes.guess_type(filename)[0] or "application/octet-stream")
+            response["Content-Disposition"] = content_disposition_header(as_attachment, filename)
+            if mode == "nginx":
+                response["X-Accel-Redirect"] = settings.EOI_SENDFILE_URL + quote(fieldfile.name)
+            else:
+                response["X-Sendfile"] = path
+        else:
+            response = _file_response(request, path, stat, etag, filename, as_attachment)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(stat.st_mtime)
+    response["Accept-Ranges"] = "bytes"
+    # μόνο για τον συγκεκριμένο χρήστη: όχι σε κοινόχρηστα caches / proxies
+    response["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,350 @@
+"""
+Snapshot καταλληλότητας αθλητών / ίππων (AthleteEligibility, HorseEligibility).
+
+Για κάθε προϋπόθεση βγαίνουν όλα τα συνεχή διαστήματα ισχύος (επικαλυπτόμενες /
+διαδοχικές ιατρικές ή συνδρομές ενώνονται)· η τομή τους είναι τα διαστήματα με
+δικαίωμα συμμετοχής (AthleteEligibilityPeriod / HorseEligibilityPeriod), οπότε το
+"ποιοι μπορούν να αγωνιστούν στις Χ" είναι range scan σε index, και για παλιές ή
+μελλοντικές ημερομηνίες:
+
+    eligible_on(Athlete.objects.filter(club=...), date(2026, 5, 10))
+
+Το AthleteEligibility / HorseEligibility κρατά για προβολή το διάστημα που καλύπτει
+σήμερα (αλλιώς το επόμενο, αλλιώς το τελευταίο) και την προϋπόθεση που λήγει πρώτη.
+
+Ενημέρωση:
+- signals (registry/signals.py) -> schedule_athletes / schedule_horses:
+  μαζεύουν τα ids και τα ξαναϋπολογίζουν μία φορά στο commit
+- `manage.py rebuild_eligibility` για πλήρη αναδημιουργία
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.dispatch import Signal
+from django.utils import timezone
+
+from config.transactions import CommitQueue
+
+from .models import (
+    Athlete,
+    AthleteEligibility,
+    AthleteEligibilityPeriod,
+    AthleteMedicalCertificate,
+    AthleteSubscription,
+    Horse,
+    HorseDocument,
+    HorseEligibility,
+    HorseEligibilityPeriod,
+)
+
+# χωρίς αρχή / χωρίς λήξη (ώστε οι συγκρίσεις να μένουν απλές σε index)
+OPEN_START = date.min
+OPEN_END = date.max
+
+CHUNK_SIZE = 2000
+
+# μετά από κάθε ενημέρωση των διαστημάτων: sender=Athlete | Horse, ids=[...]
+# (π.χ. competitions.eligibility ακυρώνει το cache του)
+eligibility_refreshed = Signal()
+
+ATHLETE_FIELDS = [
+    "medical_valid_from",
+    "medical_valid_until",
+    "license_since",
+    "subscription_valid_from",
+    "subscription_valid_until",
+    "eligible_from",
+    "eligible_until",
+    "blocking_requirement",
+    "refreshed_at",
+]
+HORSE_FIELDS = [
+    "passport_valid_from",
+    "passport_valid_until",
+    "medical_valid_from",
+    "medical_valid_until",
+    "eligible_from",
+    "eligible_until",
+    "blocking_requirement",
+    "refreshed_at",
+]
+
+
+# -----------------------------
+# διαστήματα
+# -----------------------------
+def spans(periods) -> list[tuple[date, date]]:
+    """
+    Όλα τα συνεχή διαστήματα, ταξινομημένα (επικαλυπτόμενα ή διαδοχικά ενώνονται).
+    periods: [(start | None, end | None)], None = χωρίς αρχή / χωρίς λήξη.
+    """
+    merged: list[tuple[date, date]] = []
+    for start, end in sorted((s or OPEN_START, e or OPEN_END) for s, e in periods):
+        if start > end:
+            continue
+        # επικαλύπτεται ή κολλάει (την επόμενη μέρα) με το προηγούμενο
+        if merged and (merged[-1][1] == OPEN_END or merged[-1][1] + timedelta(days=1) >= start):
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def intersect(a: list, b: list) -> list[tuple[date, date]]:
+    """Τομή δύο ταξινομημένων λιστών διαστημάτων (ένα πέρασμα)."""
+    out = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start, end = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+        if start <= end:
+            out.append((start, end))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return out
+
+
+def current(spans_: list, today: date) -> tuple[date, date] | None:
+    """Το διάστημα που καλύπτει το today, αλλιώς το επόμενο, αλλιώς το τελευταίο."""
+    for span in spans_:
+        if span[1] >= today:
+            return span
+    return spans_[-1] if spans_ else None
+
+
+def combine(requirements: dict, today: date) -> tuple[list, tuple[date, date] | None, str]:
+    """
+    requirements: {κωδικός: [διαστήματα]}
+    Επιστρέφει (όλα τα διαστήματα συμμετοχής, το τρέχον, προϋπόθεση που λείπει / λήγει πρώτη).
+    """
+    windows = None
+    for periods in requirements.values():
+        windows = periods if windows is None else intersect(windows, periods)
+    windows = windows or []
+    window = current(windows, today)
+    on = window[0] if window and window[1] >= today else today
+
+    def ends(code):
+        span = current(requirements[code], on)
+        if span is None:
+            return 0, date.min
+        return int(span[1] >= on), span[1]
+
+    # πρώτα όποια λείπει ή έχει λήξει, αλλιώς αυτή που τελειώνει πρώτη
+    blocking = min(requirements, key=ends)
+    return windows, window, blocking
+
+
+def _nullable(value, sentinel):
+    return None if value == sentinel else value
+
+
+# -----------------------------
+# υπολογισμός (set-based, ανά chunk)
+# -----------------------------
+def _chunks(ids, size=CHUNK_SIZE):
+    ids = list(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def athlete_requirements(athlete_ids) -> dict[int, dict]:
+    """{athlete_id: {προϋπόθεση: [διαστήματα]}} για όσους υπάρχουν (τρία queries)."""
+    Req = AthleteEligibility.Requirement
+    licenses = dict(
+        Athlete.objects.filter(pk__in=athlete_ids).order_by().values_list("pk", "athlete_license_date")
+    )
+    medicals = defaultdict(list)
+    for athlete_id, issued, until in (
+        AthleteMedicalCertificate.objects.filter(athlete_id__in=athlete_ids, valid_until__isnull=False)
+        .order_by()
+        .values_list("athlete_id", "issued_date", "valid_until")
+    ):
+        medicals[athlete_id].append((issued, until))
+    subscriptions = defaultdict(list)
+    for athlete_id, start, until in (
+        AthleteSubscription.objects.filter(athlete_id__in=athlete_ids, status=AthleteSubscription.Status.PAID)
+        .order_by()
+        .values_list("athlete_id", "valid_from", "valid_until")
+    ):
+        subscriptions[athlete_id].append((start, until))
+    return {
+        pk: {
+            Req.MEDICAL: spans(medicals[pk]),
+            Req.LICENSE: [(license_date, OPEN_END)] if license_date else [],
+            Req.SUBSCRIPTION: spans(subscriptions[pk]),
+        }
+        for pk, license_date in licenses.items()
+    }
+
+
+def horse_requirements(horse_ids) -> dict[int, dict]:
+    """{horse_id: {προϋπόθεση: [διαστήματα]}} για όσους υπάρχουν (δύο queries)."""
+    Req = HorseEligibility.Requirement
+    existing = Horse.objects.filter(pk__in=horse_ids).order_by().values_list("pk", flat=True)
+    docs = defaultdict(lambda: defaultdict(list))
+    for horse_id, doc_type, issued, until in (
+        HorseDocument.objects.filter(
+            horse_id__in=horse_ids,
+            document_type__in=[HorseDocument.DocumentType.PASSPORT, HorseDocument.DocumentType.MEDICAL],
+        )
+        .order_by()
+        .values_list("horse_id", "document_type", "issued_date", "valid_until")
+    ):
+        # ιατρικό χωρίς λήξη δεν μετράει
+        if doc_type == HorseDocument.DocumentType.MEDICAL and until is None:
+            continue
+        docs[horse_id][doc_type].append((issued, until))
+    return {
+        pk: {
+            Req.PASSPORT: spans(docs[pk][HorseDocument.DocumentType.PASSPORT]),
+            Req.MEDICAL: spans(docs[pk][HorseDocument.DocumentType.MEDICAL]),
+        }
+        for pk in existing
+    }
+
+
+def covers(spans_: list, on_date: date) -> bool:
+    return any(start <= on_date <= end for start, end in spans_)
+
+
+def refresh_athletes(athlete_ids) -> int:
+    Req = AthleteEligibility.Requirement
+    now = timezone.now()
+    today = timezone.localdate()
+    count = 0
+    for chunk in _chunks(athlete_ids):
+        objs = []
+        periods = []
+        for pk, requirements in athlete_requirements(chunk).items():
+            windows, window, blocking = combine(requirements, today)
+            medical = current(requirements[Req.MEDICAL], today)
+            license_ = requirements[Req.LICENSE]
+            subscription = current(requirements[Req.SUBSCRIPTION], today)
+            objs.append(AthleteEligibility(
+                athlete_id=pk,
+                medical_valid_from=_nullable(medical[0], OPEN_START) if medical else None,
+                medical_valid_until=medical[1] if medical else None,
+                license_since=license_[0][0] if license_ else None,
+                subscription_valid_from=subscription[0] if subscription else None,
+                subscription_valid_until=subscription[1] if subscription else None,
+                eligible_from=window[0] if window else None,
+                eligible_until=window[1] if window else None,
+                blocking_requirement=blocking,
+                refreshed_at=now,
+            ))
+            periods += [AthleteEligibilityPeriod(athlete_id=pk, eligible_from=a, eligible_until=b) for a, b in windows]
+        # snapshot + διαστήματα μαζί: ποτέ ο αθλητής χωρίς διαστήματα για ταυτόχρονο eligible_on
+        with transaction.atomic():
+            AthleteEligibility.objects.bulk_create(
+                objs, update_conflicts=True, unique_fields=["athlete"], update_fields=ATHLETE_FIELDS
+            )
+            AthleteEligibilityPeriod.objects.filter(athlete_id__in=chunk).delete()
+            AthleteEligibilityPeriod.objects.bulk_create(periods)
+            eligibility_refreshed.send(sender=Athlete, ids=chunk)
+        count += len(objs)
+    return count
+
+
+def refresh_horses(horse_ids) -> int:
+    Req = HorseEligibility.Requirement
+    now = timezone.now()
+    today = timezone.localdate()
+    count = 0
+    for chunk in _chunks(horse_ids):
+        objs = []
+        periods = []
+        for pk, requirements in horse_requirements(chunk).items():
+            windows, window, blocking = combine(requirements, today)
+            passport = current(requirements[Req.PASSPORT], today)
+            medical = current(requirements[Req.MEDICAL], today)
+            objs.append(HorseEligibility(
+                horse_id=pk,
+                passport_valid_from=_nullable(passport[0], OPEN_START) if passport else None,
+                passport_valid_until=_nullable(passport[1], OPEN_END) if passport else None,
+                medical_valid_from=_nullable(medical[0], OPEN_START) if medical else None,
+                medical_valid_until=medical[1] if medical else None,
+                eligible_from=window[0] if window else None,
+                eligible_until=window[1] if window else None,
+                blocking_requirement=blocking,
+                refreshed_at=now,
+            ))
+            periods += [HorseEligibilityPeriod(horse_id=pk, eligible_from=a, eligible_until=b) for a, b in windows]
+        # snapshot + διαστήματα μαζί: ποτέ ο ίππος χωρίς διαστήματα για ταυτόχρονο eligible_on
+        with transaction.atomic():
+            HorseEligibility.objects.bulk_create(
+                objs, update_conflicts=True, unique_fields=["horse"], update_fields=HORSE_FIELDS
+            )
+            HorseEligibilityPeriod.objects.filter(horse_id__in=chunk).delete()
+            HorseEligibilityPeriod.objects.bulk_create(periods)
+            eligibility_refreshed.send(sender=Horse, ids=chunk)
+        count += len(objs)
+    return count
+
+
+def rebuild_all(chunk_size=CHUNK_SIZE) -> tuple[int, int]:
+    athletes = horses = 0
+    for chunk in _chunks(Athlete.objects.order_by("pk").values_list("pk", flat=True).iterator(), chunk_size):
+        athletes += refresh_athletes(chunk)
+    for chunk in _chunks(Horse.objects.order_by("pk").values_list("pk", flat=True).iterator(), chunk_size):
+        horses += refresh_horses(chunk)
+    return athletes, horses
+
+
+# -----------------------------
+# incremental ενημέρωση στο commit
+# -----------------------------
+def _process(athletes=(), horses=()) -> None:
+    if athletes:
+        refresh_athletes(athletes)
+    if horses:
+        refresh_horses(horses)
+
+
+# όσες αλλαγές κι αν γίνουν σε μια συναλλαγή, ένας υπολογισμός στο commit
+_pending = CommitQueue("eligibility", _process)
+
+
+def schedule_athletes(athlete_ids) -> None:
+    _pending.add(athletes=athlete_ids)
+
+
+def schedule_horses(horse_ids) -> None:
+    _pending.add(horses=horse_ids)
+
+
+# -----------------------------
+# queries
+# -----------------------------
+PERIODS = {Athlete: (AthleteEligibilityPeriod, "athlete"), Horse: (HorseEligibilityPeriod, "horse")}
+
+
+def _periods_on(model, on_date: date):
+    period_model, owner = PERIODS[model]
+    # range scan στο (eligible_until, eligible_from)
+    return period_model.objects.filter(eligible_from__lte=on_date, eligible_until__gte=on_date), owner
+
+
+def eligible_on(queryset, on_date: date):
+    """Athlete ή Horse queryset -> μόνο όσοι έχουν δικαίωμα συμμετοχής στις on_date."""
+    periods, owner = _periods_on(queryset.model, on_date)
+    return queryset.filter(is_active=True, pk__in=periods.values(owner))
+
+
+def not_eligible_on(queryset, on_date: date):
+    periods, owner = _periods_on(queryset.model, on_date)
+    return queryset.exclude(Q(is_active=True) & Q(pk__in=periods.values(owner)))
+
+
+def eligible_until_on(queryset, on_date: date):
+    """+ eligible_until: το τέλος του διαστήματος που καλύπτει την on_date (για λίστες)."""
+    periods, owner = _periods_on(queryset.model, on_date)
+    return queryset.annotate(
+        eligible_until=Subquery(periods.filter(**{owner: OuterRef("pk")}).values("eligible_until")[:1])
+    )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from registry import dedup
+from registry.models import DuplicateCandidate
+
+
+class Command(BaseCommand):
+    help = "Εντοπίζει πιθανά διπλότυπα αθλητών (blocking + ομοιότητα ονομάτων) για έλεγχο στο admin."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threshold", type=float, default=dedup.THRESHOLD, help="Ελάχιστη ομοιότητα (0..1)")
+        parser.add_argument("--days", type=int, help="Μόνο ζεύγη με αθλητή που άλλαξε τις τελευταίες N ημέρες")
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(days=options["days"]) if options["days"] else None
+        stats = dedup.scan(since=since, threshold=options["threshold"])
+        pending = DuplicateCandidate.objects.filter(status=DuplicateCandidate.Status.PENDING).count()
+        self.stdout.write(
+            f"Αθλητές: {stats.athletes} | blocks: {stats.blocks} (παραλείφθηκαν {stats.skipped_blocks}) | "
+            f"συγκρίσεις: {stats.comparisons} | ζεύγη: {stats.candidates}"
+        )
+        self.stdout.write(self.style.SUCCESS(f"OK. Προς έλεγχο: {pending}. {stats.elapsed_ms} ms"))
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+
+from registry import storage
+from registry.models import StoredBlob
+
+
+class Command(BaseCommand):
+    help = "Σβήνει τα αρχεία εγγράφων που δεν χρησιμοποιεί καμία εγγραφή (refcount=0) και τα ορφανά του blobs/."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=int(storage.GRACE.total_seconds() // 3600),
+            help="Μόνο όσα δεν έχουν αποθηκευτεί ξανά τις τελευταίες N ώρες",
+        )
+        parser.add_argument("--recount", action="store_true", help="Πρώτα υπολογισμός του refcount από τις εγγραφές")
+        parser.add_argument("--dry-run", action="store_true", help="Μόνο μέτρηση, χωρίς διαγραφές")
+
+    def handle(self, *args, **options):
+        if options["recount"]:
+            self.stdout.write(f"refcount: διορθώθηκαν {storage.recount()}")
+        stats = storage.collect(grace=timedelta(hours=options["grace_hours"]), dry_run=options["dry_run"])
+        totals = StoredBlob.objects.aggregate(blobs=Count("pk"), size=Sum("size"), uses=Sum("refcount"))
+        verb = "Θα σβηστούν" if options["dry_run"] else "Σβήστηκαν"
+        self.stdout.write(
+            f"{verb}: {stats.blobs} αχρησιμοποίητα, {stats.orphans} ορφανά, {stats.incoming} προσωρινά "
+            f"({stats.bytes / 1024 / 1024:.1f} MB)"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. Αρχεία: {totals['blobs']} ({(totals['size'] or 0) / 1024 / 1024:.1f} MB) για {totals['uses'] or 0} εγγραφές."
+        ))
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from competitions.models import Competition, CompetitionClass, Entry, Result
+from organizations.models import Region, Club
+from registry.eligibility import refresh_athletes, refresh_horses
+from registry.models import (
+    Athlete,
+    Horse,
+    AthleteDocument,
+    AthleteMedicalCertificate,
+    AthleteSubscription,
+    HorseDocument,
+)
+
+# Όλα τα συνθετικά δεδομένα έχουν αυτό το πρόθεμα (για --flush / να μη μπλέκονται με τα πραγματικά)
+PREFIX = "SYN"
+
+REGIONS = [
+    "Αττική", "Κεντρική Μακεδονία", "Δυτική Μακεδονία", "Ανατολική Μακεδονία και Θράκη",
+    "Ήπειρος", "Θεσσαλία", "Ιόνια Νησιά", "Δυτική Ελλάδα", "Στερεά Ελλάδα",
+    "Πελοπόννησος", "Βόρειο Αιγαίο", "Νότιο Αιγαίο", "Κρήτη",
+]
+
+CITIES = [
+    "Αθηνών", "Πειραιά", "Θεσσαλονίκης", "Πάτρας", "Ηρακλείου", "Λάρισας", "Βόλου",
+    "Ιωαννίνων", "Χανίων", "Καβάλας", "Σερρών", "Κατερίνης", "Τρικάλων", "Καλαμάτας",
+    "Ρόδου", "Κέρκυρας", "Μαραθώνα", "Βάρης", "Κηφισιάς", "Γλυφάδας", "Μαρκόπουλου",
+]
+
+MALE_FIRST = [
+    "Γεώργιος", "Ιωάννης", "Κωνσταντίνος", "Δημήτριος", "Νικόλαος", "Παναγιώτης",
+    "Βασίλειος", "Χρήστος", "Αθανάσιος", "Μιχαήλ", "Ευάγγελος", "Σπυρίδων",
+    "Αντώνιος", "Αναστάσιος", "Θεόδωρος", "Ανδρέας", "Χαράλαμπος", "Αλέξανδρος",
+    "Εμμανουήλ", "Ηλίας", "Σταύρος", "Πέτρος", "Στέφανος", "Άγγελος", "Φίλιππος",
+]
+
+FEMALE_FIRST = [
+    "Μαρία", "Ελένη", "Αικατερίνη", "Βασιλική", "Σοφία", "Αγγελική", "Γεωργία",
+    "Δήμητρα", "Κωνσταντίνα", "Παρασκευή", "Ευαγγελία", "Χριστίνα", "Ιωάννα",
+    "Αναστασία", "Ειρήνη", "Δέσποινα", "Θεοδώρα", "Αλεξάνδρα", "Φωτεινή", "Ζωή",
+    "Μυρτώ", "Δανάη", "Ναταλία", "Στέλλα", "Αριάδνη",
+]
+
+# (ανδρικό, γυναικείο)
+SURNAMES = [
+    ("Παπαδόπουλος", "Παπαδοπούλου"), ("Βλάχος", "Βλάχου"), ("Γεωργίου", "Γεωργίου"),
+    ("Οικονόμου", "Οικονόμου"), ("Παπαγεωργίου", "Παπαγεωργίου"), ("Νικολάου", "Νικολάου"),
+    ("Μακρής", "Μακρή"), ("Αντωνίου", "Αντωνίου"), ("Ιωαννίδης", "Ιωαννίδου"),
+    ("Καραγιάννης", "Καραγιάννη"), ("Παπανικολάου", "Παπανικολάου"), ("Δημητρίου", "Δημητρίου"),
+    ("Κωνσταντινίδης", "Κωνσταντινίδου"), ("Αθανασίου", "Αθανασίου"), ("Πετρόπουλος", "Πετροπούλου"),
+    ("Χριστοδούλου", "Χριστοδούλου"), ("Λαμπρόπουλος", "Λαμπροπούλου"), ("Σταματόπουλος", "Σταματοπούλου"),
+    ("Αλεξίου", "Αλεξίου"), ("Μιχαηλίδης", "Μιχαηλίδου"), ("Ζαχαρίου", "Ζαχαρίου"),
+    ("Κατσαρός", "Κατσαρού"), ("Σαββίδης", "Σαββίδου"), ("Τσιμπούκης", "Τσιμπούκη"),
+    ("Ραφαηλίδης", "Ραφαηλίδου"), ("Φραγκιαδάκης", "Φραγκιαδάκη"), ("Μαυρίδης", "Μαυρίδου"),
+    ("Ξενάκης", "Ξενάκη"), ("Λιάπης", "Λιάπη"), ("Πανταζής", "Πανταζή"),
+    ("Κουτσούκος", "Κουτσούκου"), ("Δρόσος", "Δρόσου"), ("Μπακογιάννης", "Μπακογιάννη"),
+    ("Χατζηδάκης", "Χατζηδάκη"), ("Τριανταφύλλου", "Τριανταφύλλου"), ("Σπυρόπουλος", "Σπυροπούλου"),
+    ("Καλογεράκης", "Καλογεράκη"), ("Αναγνώστου", "Αναγνώστου"), ("Βασιλείου", "Βασιλείου"),
+    ("Ευαγγέλου", "Ευαγγέλου"),
+]
+
+HORSE_NAMES = [
+    "Ζέφυρος", "Πήγασος", "Αστέρι", "Βοριάς", "Κεραυνός", "Αύρα", "Ίριδα", "Φλόγα",
+    "Θύελλα", "Ωκεανός", "Ήλιος", "Σελήνη", "Αετός", "Νίκη", "Λάμψη", "Ορφέας",
+    "Bucephalus", "Quick Star", "Silver Moon", "Dark Knight", "Golden Boy", "Cassini",
+    "Lord Jazz", "Chacco", "Diamant", "Cornet", "Quidam", "Balou", "Casall", "Lux",
+]
+
+NATIONALITIES = ["Ελληνική"] * 18 + ["Κυπριακή", "Αλβανική"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Γεμίζει τη βάση με συνθετική ομοσπονδία (περιφέρειες, όμιλοι, αθλητές, ίπποι, "
+        "έγγραφα, ιατρικές, συνδρομές, αγώνες, συμμετοχές, αποτελέσματα) με bulk inserts. "
+        "Ίδιο --seed = ίδια δεδομένα."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=42, help="Seed για αναπαραγώγιμα δεδομένα.")
+        parser.add_argument("--athletes", type=int, default=100_000)
+        parser.add_argument("--clubs", type=int, default=150)
+        parser.add_argument("--horses", type=int, default=25_000)
+        parser.add_argument("--competitions", type=int, default=300)
+        parser.add_argument("--max-medicals", type=int, default=4, help="Μέγιστο πλήθος ιατρικών ανά αθλητή (ιστορικό).")
+        parser.add_argument("--documents-ratio", type=float, default=0.6, help="Ποσοστό αθλητών/ίππων με έγγραφα.")
+        parser.add_argument(
+            "--as-of",
+            type=date.fromisoformat,
+            default=None,
+            help="Ημερομηνία αναφοράς YYYY-MM-DD (default: σήμερα). Ίδιο seed + as-of = ίδια δεδομένα.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--flush", action="store_true", help="Σβήνει πρώτα τα προηγούμενα συνθετικά δεδομένα.")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.today = options["as_of"] or timezone.localdate()
+
+        if options["athletes"] < 0 or options["horses"] < 0 or options["clubs"] < 1:
+            raise CommandError("Μη έγκυρα μεγέθη (clubs >= 1, athletes/horses >= 0).")
+
+        if options["flush"]:
+            self._flush()
+        elif Club.objects.filter(code__startswith=PREFIX).exists():
+            raise CommandError("Υπάρχουν ήδη συνθετικά δεδομένα. Τρέξε με --flush.")
+
+        with transaction.atomic():
+            regions = self._regions()
+            clubs = self._clubs(regions, options["clubs"])
+            athlete_ids = self._athletes(clubs, options["athletes"])
+            horse_ids = self._horses(clubs, options["horses"])
+            self._medicals(athlete_ids, options["max_medicals"])
+            self._athlete_documents(athlete_ids, options["documents_ratio"])
+            self._horse_documents(horse_ids, options["documents_ratio"])
+            competitions = self._competitions(clubs, options["competitions"])
+            self._entries_and_results(competitions, athlete_ids, horse_ids)
+            self._subscriptions(athlete_ids)
+            # bulk_create δεν στέλνει signals
+            refresh_athletes(athlete_ids)
+            refresh_horses(horse_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. Regions: {len(regions)}, Clubs: {len(clubs)}, "
+            f"Athletes: {len(athlete_ids)}, Horses: {len(horse_ids)}, Competitions: {len(competitions)}"
+        ))
+
+    # -----------------------------
+    # helpers
+    # -----------------------------
+    def _bulk(self, model, objs):
+        created = model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.stdout.write(f"  {model._meta.verbose_name_plural}: {len(created)}")
+        return created
+
+    def _random_date(self, start: date, end: date) -> date:
+        return start + timedelta(days=self.rng.randint(0, max((end - start).days, 0)))
+
+    def _flush(self):
+        self.stdout.write(self.style.NOTICE("Διαγραφή προηγούμενων συνθετικών δεδομένων..."))
+        with transaction.atomic():
+            Competition.objects.filter(name__startswith=f"{PREFIX} ").delete()
+            Athlete.objects.filter(eoi_registry_number__startswith=PREFIX).delete()
+            Horse.objects.filter(registry_number__startswith=PREFIX).delete()
+            Club.objects.filter(code__startswith=PREFIX).delete()
+            Region.objects.filter(name__startswith=f"{PREFIX} ").delete()
+
+    # -----------------------------
+    # generators
+    # -----------------------------
+    def _regions(self):
+        return self._bulk(Region, [Region(name=f"{PREFIX} {name}") for name in REGIONS])
+
+    def _clubs(self, regions, n):
+        clubs = []
+        for i in range(n):
+            city = self.rng.choice(CITIES)
+            clubs.append(Club(
+                code=f"{PREFIX}{i:04d}",
+                name=f"Ιππικός Όμιλος {city} {i}",
+                region=self.rng.choice(regions),
+                phone=f"210{self.rng.randint(1000000, 9999999)}",
+                email=f"club{i}@example.gr",
+            ))
+        return self._bulk(Club, clubs)
+
+    def _athletes(self, clubs, n):
+        # μερικοί μεγάλοι όμιλοι, πολλοί μικροί (όπως στην πράξη)
+        cum_weights = list(accumulate(1.0 / (rank + 1) ** 0.7 for rank in range(len(clubs))))
+        rng = self.rng
+        born_from, born_to = date(1950, 1, 1), self.today - timedelta(days=365 * 6)
+
+        ids = []
+        batch = []
+        for i in range(n):
+            female = rng.random() < 0.55
+            male_surname, female_surname = rng.choice(SURNAMES)
+            first = rng.choice(FEMALE_FIRST if female else MALE_FIRST)
+            last = female_surname if female else male_surname
+            father = rng.choice(MALE_FIRST)
+            mother = rng.choice(FEMALE_FIRST)
+            birth = self._random_date(born_from, born_to)
+
+            # bulk_create δεν καλεί το save(), άρα γεμίζουμε εδώ τα *_uc
+            batch.append(Athlete(
+                eoi_registry_number=f"{PREFIX}-{i + 1:06d}",
+                amka=f"{birth:%d%m%y}{rng.randint(10000, 99999)}" if rng.random() < 0.8 else None,
+                first_name=first,
+                last_name=last,
+                father_name=father,
+                mother_name=mother,
+                first_name_uc=first.upper(),
+                last_name_uc=last.upper(),
+                father_name_uc=father.upper(),
+                mother_name_uc=mother.upper(),
+                email=f"athlete{i + 1}@example.gr" if rng.random() < 0.5 else None,
+                birth_date=birth,
+                birth_place=rng.choice(CITIES),
+                nationality=rng.choice(NATIONALITIES),
+                athlete_license_date=self._random_date(birth + timedelta(days=365 * 6), self.today)
+                if rng.random() < 0.85 else None,
+                club=rng.choices(clubs, cum_weights=cum_weights)[0],
+                is_active=rng.random() < 0.9,
+            ))
+            if len(batch) >= self.batch_size:
+                ids += [a.pk for a in Athlete.objects.bulk_create(batch)]
+                batch = []
+        if batch:
+            ids += [a.pk for a in Athlete.objects.bulk_create(batch)]
+
+        self.stdout.write(f"  {Athlete._meta.verbose_name_plural}: {len(ids)}")
+        return ids
+
+    def _horses(self, clubs, n):
+        rng = self.rng
+        horses = [
+            Horse(
+                club=rng.choice(clubs),
+                registry_number=f"{PREFIX}-H{i + 1:06d}",
+                name=f"{rng.choice(HORSE_NAMES)} {rng.choice(['', 'II', 'III', 'Z', 'de Lys'])}".strip(),
+                passport_number=f"GRC{rng.randint(100000, 999999)}" if rng.random() < 0.9 else "",
+                birth_date=self._random_date(date(1998, 1, 1), self.today - timedelta(days=365 * 4)),
+                is_active=rng.random() < 0.92,
+            )
+            for i in range(n)
+        ]
+        return [h.pk for h in self._bulk(Horse, horses)]
+
+    def _medicals(self, athlete_ids, max_per_athlete):
+        rng = self.rng
+        objs = []
+        for athlete_id in athlete_ids:
+            # ιστορικό: ετήσιες βεβαιώσεις προς τα πίσω από μια τυχαία τελευταία έκδοση
+            last_issued = self._random_date(self.today - timedelta(days=500), self.today)
+            for k in range(rng.randint(0, max_per_athlete)):
+                issued = last_issued - timedelta(days=365 * k + rng.randint(0, 20))
+                objs.append(AthleteMedicalCertificate(
+                    athlete_id=athlete_id,
+                    issued_date=issued,
+                    valid_until=issued + timedelta(days=365),
+                    file=f"synthetic/medical_{athlete_id}_{k}.pdf",
+                    uploaded_at=timezone.make_aware(datetime.combine(issued, time.min)),
+                ))
+        self._bulk(AthleteMedicalCertificate, objs)
+
+    def _subscriptions(self, athlete_ids):
+        rng = self.rng
+        objs = []
+        for athlete_id in athlete_ids:
+            # περσινή + (συνήθως) φετινή συνδρομή
+            for season in (self.today.year - 1, self.today.year):
+                paid = rng.random() < 0.85
+                objs.append(AthleteSubscription(
+                    athlete_id=athlete_id,
+                    season=season,
+                    valid_from=date(season, 1, 1),
+                    valid_until=date(season, 12, 31),
+                    amount=30,
+                    status=AthleteSubscription.Status.PAID if paid else AthleteSubscription.Status.PENDING,
+                    paid_at=date(season, 1, 1) + timedelta(days=rng.randint(0, 90)) if paid else None,
+                ))
+        self._bulk(AthleteSubscription, objs)
+
+    def _athlete_documents(self, athlete_ids, ratio):
+        rng = self.rng
+        types = [c for c, _ in AthleteDocument.DocumentType.choices]
+        objs = [
+            AthleteDocument(
+                athlete_id=athlete_id,
+                document_type=rng.choice(types),
+                title="Συνθετικό έγγραφο",
+                file=f"synthetic/athlete_doc_{athlete_id}.pdf",
+            )
+            for athlete_id in athlete_ids
+            if rng.random() < ratio
+        ]
+        self._bulk(AthleteDocument, objs)
+
+    def _horse_documents(self, horse_ids, ratio):
+        rng = self.rng
+        objs = []
+        for horse_id in horse_ids:
+            objs.append(HorseDocument(
+                horse_id=horse_id,
+                document_type=HorseDocument.DocumentType.PASSPORT,
+                title="Διαβατήριο",
+                file=f"synthetic/horse_passport_{horse_id}.pdf",
+            ))
+            if rng.random() < ratio:
+                issued = self._random_date(self.today - timedelta(days=400), self.today)
+                objs.append(HorseDocument(
+                    horse_id=horse_id,
+                    document_type=HorseDocument.DocumentType.MEDICAL,
+                    title="Εμβόλια",
+                    issued_date=issued,
+                    valid_until=issued + timedelta(days=365),
+                    file=f"synthetic/horse_medical_{horse_id}.pdf",
+                ))
+        self._bulk(HorseDocument, objs)
+
+    def _competitions(self, clubs, n):
+        rng = self.rng
+        disciplines = [
+            (CompetitionClass.Discipline.SHOW_JUMPING, 0.6),
+            (CompetitionClass.Discipline.DRESSAGE, 0.3),
+            (CompetitionClass.Discipline.ENDURANCE, 0.1),
+        ]
+        categories = [c for c, _ in CompetitionClass.AgeCategory.choices]
+
+        competitions = []
+        for i in range(n):
+            start = self._random_date(self.today - timedelta(days=3 * 365), self.today + timedelta(days=120))
+            status = Competition.Status.FINISHED if start < self.today else Competition.Status.OPEN
+            competitions.append(Competition(
+                name=f"{PREFIX} Αγώνες {rng.choice(CITIES)} {start.year} #{i + 1}",
+                venue=rng.choice(CITIES),
+                start_date=start,
+                end_date=start + timedelta(days=rng.randint(0, 2)),
+                organizer=rng.choice(clubs),
+                status=status,
+            ))
+        competitions = self._bulk(Competition, competitions)
+
+        classes = []
+        for comp in competitions:
+            discipline = rng.choices([d for d, _ in disciplines], weights=[w for _, w in disciplines])[0]
+            for number in range(1, rng.randint(4, 8) + 1):
+                cc = CompetitionClass(
+                    competition=comp,
+                    number=number,
+                    discipline=discipline,
+                    date=comp.start_date + timedelta(days=rng.randint(0, (comp.end_date - comp.start_date).days)),
+                    age_category=rng.choice(categories),
+                    fee=rng.choice([20, 25, 30, 40, 50]),
+                )
+                if discipline == CompetitionClass.Discipline.SHOW_JUMPING:
+                    cc.height_cm = rng.choice([60, 80, 100, 110, 120, 130, 140])
+                    cc.name = f"Εμπόδια {cc.height_cm} cm"
+                elif discipline == CompetitionClass.Discipline.DRESSAGE:
+                    cc.dressage_test = rng.choice(["Preliminary A", "Novice B", "Elementary", "Medium", "St. Georg"])
+                    cc.name = f"Dressage {cc.dressage_test}"
+                else:
+                    cc.distance_km = rng.choice([20, 40, 80, 120])
+                    cc.name = f"Αντοχή {cc.distance_km} km"
+                classes.append(cc)
+        self._bulk(CompetitionClass, classes)
+        return competitions
+
+    def _entries_and_results(self, competitions, athlete_ids, horse_ids):
+        if not athlete_ids or not horse_ids:
+            return
+        rng = self.rng
+        athlete_club = dict(Athlete.objects.filter(pk__in=athlete_ids).values_list("pk", "club_id"))
+        # κάθε αθλητής έχει 1-3 "δικά του" άλογα, όπως στην πράξη
+        athlete_pool = rng.sample(athlete_ids, min(len(athlete_ids), max(len(athlete_ids) // 5, 1)))
+        rides = {a: rng.sample(horse_ids, min(len(horse_ids), rng.randint(1, 3))) for a in athlete_pool}
+        finished = {c.pk for c in competitions if c.status == Competition.Status.FINISHED}
+
+        entries = []
+        for cc in CompetitionClass.objects.filter(competition__in=competitions).only("pk", "competition_id"):
+            status = Entry.Status.FINAL if cc.competition_id in finished else Entry.Status.DRAFT
+            for athlete_id in rng.sample(athlete_pool, min(len(athlete_pool), rng.randint(10, 60))):
+                entries.append(Entry(
+                    competition_class=cc,
+                    athlete_id=athlete_id,
+                    horse_id=rng.choice(rides[athlete_id]),
+                    club_id=athlete_club.get(athlete_id),
+                    status=status,
+                ))
+        entries = self._bulk(Entry, entries)
+
+        results = []
+        by_class = {}
+        for e in entries:
+            if e.status == Entry.Status.FINAL:
+                by_class.setdefault(e.competition_class_id, []).append(e)
+        for class_entries in by_class.values():
+            rng.shuffle(class_entries)
+            for rank, e in enumerate(class_entries, start=1):
+                eliminated = rng.random() < 0.08
+                results.append(Result(
+                    entry=e,
+                    status=Result.Status.ELIMINATED if eliminated else Result.Status.OK,
+                    rank=None if eliminated else rank,
+                    faults=None if eliminated else rng.choice([0, 0, 0, 4, 4, 8, 12]),
+                    time_seconds=round(rng.uniform(55, 95), 2),
+                    prize_money=max(0, 200 - 40 * (rank - 1)) if not eliminated else 0,
+                    is_official=True,
+                ))
+        self._bulk(Result, results)
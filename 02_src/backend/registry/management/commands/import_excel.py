@@ -3,6 +3,8 @@ from pathlib import Path
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
+from audit.recorder import audit_context
+
 from .import_athletes import import_athletes_from_xlsx
 from .import_horses import import_horses_from_xlsx
 
@@ -66,7 +68,8 @@ class Command(BaseCommand):
             raise CommandError(f"File not found: {horses_file}")
 
         self.stdout.write(self.style.NOTICE(f"Importing: {athletes_file.name} + {horses_file.name}"))
-        a = import_athletes_from_xlsx(athletes_file, stdout=self.stdout)
-        h = import_horses_from_xlsx(horses_file, stdout=self.stdout)
+        with audit_context("import_excel"):
+            a = import_athletes_from_xlsx(athletes_file, stdout=self.stdout)
+            h = import_horses_from_xlsx(horses_file, stdout=self.stdout)
 
         self.stdout.write(self.style.SUCCESS(f"OK. Athletes upserted: {a}, Horses upserted: {h}"))
@@ -13,6 +13,7 @@ try:
 except ImportError:
     openpyxl = None
 
+from audit.recorder import audit_context
 from organizations.models import Region, Club
 from registry.models import Athlete, Horse
 
@@ -123,8 +124,13 @@ class Command(BaseCommand):
         parser.add_argument("--athletes-only", action="store_true", help="Import only athletes.xlsx")
         parser.add_argument("--horses-only", action="store_true", help="Import only horses.xlsx")
 
-    @transaction.atomic
     def handle(self, *args, **options):
+        # το ιστορικό αλλαγών γράφεται μία φορά, μετά το commit
+        with audit_context("import_excel_old"):
+            self._import(**options)
+
+    @transaction.atomic
+    def _import(self, **options):
         if openpyxl is None:
             raise CommandError("openpyxl is not installed. Run: py -m pip install openpyxl")
 
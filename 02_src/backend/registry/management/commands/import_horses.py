@@ -6,6 +6,7 @@ from openpyxl import load_workbook
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
+from audit.recorder import audit_context
 from registry.models import Horse
 
 
@@ -114,5 +115,6 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         p = Path(options["path"]).expanduser().resolve()
-        n = import_horses_from_xlsx(p, stdout=self.stdout)
+        with audit_context("import_horses"):
+            n = import_horses_from_xlsx(p, stdout=self.stdout)
         self.stdout.write(self.style.SUCCESS(f"OK. Horses upserted: {n}"))
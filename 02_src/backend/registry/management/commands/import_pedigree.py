@@ -0,0 +1,219 @@
+"""
+Μαζική εισαγωγή γενεαλογίας από τα exports του μητρώου ίππων (.xlsx ή .csv).
+
+Στήλες (πρώτη γραμμή με "ΑΜ"):
+    ΑΜ                                  ο ίππος (πρέπει να υπάρχει ήδη)
+    ΑΜ ΠΑΤΕΡΑ / SIRE_AM                 προαιρετικά, αλλιώς αναζήτηση με το όνομα
+    ΠΑΤΕΡΑΣ / SIRE
+    ΑΜ ΜΗΤΕΡΑΣ / DAM_AM
+    ΜΗΤΕΡΑ / DAM
+    ΠΑΤΕΡΑΣ ΜΗΤΕΡΑΣ / DAM_SIRE
+
+Ένα query για όλους τους ίππους, ένα upsert για όσους άλλαξαν και ένα
+refresh της closure table στο τέλος (όχι save() / signal ανά γραμμή).
+"""
+from __future__ import annotations
+
+import csv
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+from audit.recorder import audit_context, record_changes
+from registry.models import Horse
+from registry.pedigree import refresh
+
+COLUMNS = {
+    "horse": ("ΑΜ", "AM"),
+    "sire_number": ("ΑΜ ΠΑΤΕΡΑ", "SIRE_AM", "SIRE AM"),
+    "sire_name": ("ΠΑΤΕΡΑΣ", "SIRE"),
+    "dam_number": ("ΑΜ ΜΗΤΕΡΑΣ", "DAM_AM", "DAM AM"),
+    "dam_name": ("ΜΗΤΕΡΑ", "DAM"),
+    "dam_sire_name": ("ΠΑΤΕΡΑΣ ΜΗΤΕΡΑΣ", "DAM_SIRE", "DAM SIRE"),
+}
+PEDIGREE_FIELDS = ["sire", "dam", "sire_name", "dam_name", "dam_sire_name"]
+MAX_HEADER_SCAN = 25
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    missing: int = 0           # ΑΜ που δεν υπάρχει στο μητρώο
+    unresolved: int = 0        # γονέας που κρατήθηκε μόνο ως όνομα
+    ambiguous: int = 0         # όνομα γονέα που ταιριάζει σε περισσότερους ίππους
+    rejected: int = 0          # ίππος γονέας του εαυτού του
+    closure_rows: int = 0
+    cycles: int = 0
+
+
+def _clean(v: Any) -> str:
+    if v is None:
+        return ""
+    return str(v).strip()
+
+
+def _key(name: str) -> str:
+    return " ".join(name.upper().split())
+
+
+# -----------------------------
+# ανάγνωση
+# -----------------------------
+def _rows_xlsx(path: Path) -> Iterator[list]:
+    if load_workbook is None:
+        raise CommandError("Το openpyxl δεν είναι εγκατεστημένο. Τρέξε: py -m pip install openpyxl")
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from wb.active.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _rows_csv(path: Path) -> Iterator[list]:
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=";,\t")
+        except csv.Error:
+            dialect = csv.excel
+        yield from csv.reader(f, dialect)
+
+
+def read_pedigree(path: Path) -> Iterator[dict[str, str]]:
+    rows = _rows_xlsx(path) if path.suffix.lower() in (".xlsx", ".xlsm") else _rows_csv(path)
+    index = None
+    for n, row in enumerate(rows, start=1):
+        if index is None:
+            headers = [_key(_clean(c)) for c in row]
+            if "ΑΜ" in headers or "AM" in headers:
+                index = {
+                    field: next((headers.index(name) for name in names if name in headers), None)
+                    for field, names in COLUMNS.items()
+                }
+            elif n >= MAX_HEADER_SCAN:
+                raise CommandError("Δεν βρέθηκε στήλη 'ΑΜ' στο αρχείο.")
+            continue
+        values = {
+            field: _clean(row[i]) if i is not None and i < len(row) else ""
+            for field, i in index.items()
+        }
+        if values["horse"]:
+            yield values
+    if index is None:
+        raise CommandError("Δεν βρέθηκε στήλη 'ΑΜ' στο αρχείο.")
+
+
+# -----------------------------
+# εισαγωγή
+# -----------------------------
+def import_pedigree(path, dry_run: bool = False) -> ImportStats:
+    path = Path(path)
+    stats = ImportStats()
+
+    horses = {}
+    by_name = defaultdict(list)
+    for values in Horse.objects.values(
+        "pk", "registry_number", "name", "sire_id", "dam_id", "sire_name", "dam_name", "dam_sire_name"
+    ):
+        horses[values["registry_number"]] = values
+        by_name[_key(values["name"])].append(values["pk"])
+
+    def resolve(number: str, name: str) -> int | None:
+        if number and number in horses:
+            return horses[number]["pk"]
+        if name:
+            matches = by_name.get(_key(name), [])
+            if len(matches) == 1:
+                return matches[0]
+            if len(matches) > 1:
+                stats.ambiguous += 1
+            stats.unresolved += 1
+        return None
+
+    changed: dict[str, Horse] = {}
+    audit_rows = []
+    for row in read_pedigree(path):
+        stats.rows += 1
+        current = horses.get(row["horse"])
+        if current is None:
+            stats.missing += 1
+            continue
+        sire_id = resolve(row["sire_number"], row["sire_name"])
+        dam_id = resolve(row["dam_number"], row["dam_name"])
+        if current["pk"] in (sire_id, dam_id) or (sire_id is not None and sire_id == dam_id):
+            stats.rejected += 1
+            continue
+        new = {
+            "sire_id": sire_id,
+            "dam_id": dam_id,
+            "sire_name": row["sire_name"][:120],
+            "dam_name": row["dam_name"][:120],
+            "dam_sire_name": row["dam_sire_name"][:120],
+        }
+        if all(current[k] == v for k, v in new.items()):
+            stats.unchanged += 1
+            continue
+        audit_rows.append((current["pk"], {k: current[k] for k in new}, new))
+        current.update(new)
+        changed[row["horse"]] = Horse(pk=current["pk"], registry_number=row["horse"], name=current["name"], **new)
+
+    stats.updated = len(changed)
+    if dry_run or not changed:
+        return stats
+
+    with transaction.atomic():
+        Horse.objects.bulk_create(
+            list(changed.values()),
+            update_conflicts=True,
+            unique_fields=["registry_number"],
+            update_fields=PEDIGREE_FIELDS,
+            batch_size=1000,
+        )
+        closure = refresh({h.pk for h in changed.values()})
+        # bulk upsert χωρίς signals: οι αλλαγές στο ιστορικό με ένα bulk insert
+        record_changes(Horse, audit_rows)
+    stats.closure_rows = closure.rows
+    stats.cycles = len(closure.cycles)
+    return stats
+
+
+class Command(BaseCommand):
+    help = "Εισαγωγή γενεαλογίας ίππων (πατέρας / μητέρα / πατέρας μητέρας) από .xlsx ή .csv του μητρώου."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Αρχείο .xlsx ή .csv")
+        parser.add_argument("--dry-run", action="store_true", help="Μόνο έλεγχος, χωρίς αποθήκευση")
+
+    def handle(self, *args, **options):
+        p = Path(options["path"]).expanduser().resolve()
+        if not p.exists():
+            raise CommandError(f"Δεν βρέθηκε το αρχείο: {p}")
+        started = time.perf_counter()
+        with audit_context("import_pedigree"):
+            stats = import_pedigree(p, dry_run=options["dry_run"])
+        self.stdout.write(
+            f"Γραμμές: {stats.rows} | άγνωστοι ΑΜ: {stats.missing} | γονείς μόνο με όνομα: {stats.unresolved} "
+            f"(διφορούμενα: {stats.ambiguous}) | απορρίφθηκαν: {stats.rejected} | χωρίς αλλαγή: {stats.unchanged}"
+        )
+        if stats.cycles:
+            self.stdout.write(self.style.WARNING(
+                f"{stats.cycles} σύνδεσμοι γονέα κλείνουν κύκλο και αγνοήθηκαν (δες `manage.py rebuild_pedigree`)"
+            ))
+        label = "Θα ενημερωθούν" if options["dry_run"] else "Ενημερώθηκαν"
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. {label}: {stats.updated} ίπποι, {stats.closure_rows} γραμμές προγόνων, "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        ))
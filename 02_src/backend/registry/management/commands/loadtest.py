@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from html.parser import HTMLParser
+from http.client import HTTPException
+from http.cookiejar import CookieJar
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode, urljoin
+from urllib.request import HTTPCookieProcessor, Request, build_opener
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from registry.models import Athlete
+
+SEARCH_TERMS = ["ΠΑΠΑ", "ΓΕΩΡΓ", "ΝΙΚΟΛ", "ΜΑΡΙΑ", "ΒΛΑΧ", "ΙΩΑΝΝ", "ΚΩΝ", "SYN-00", "ΔΗΜ", "ΑΝΤ"]
+
+# Το "μείγμα" χρηστών: σενάριο -> βάρος (π.χ. γραμματέας ομίλου που κυρίως ψάχνει)
+DEFAULT_MIX = {
+    "changelist_search": 50,
+    "autocomplete": 30,
+    "change_form_save": 15,
+    "medical_changelist": 5,
+}
+# σενάριο -> endpoint στο report (το ίδιο κλειδί που επιστρέφει το σενάριο, και για τα network errors)
+ENDPOINTS = {
+    "changelist_search": "athlete_changelist_search",
+    "autocomplete": "athlete_autocomplete",
+    "change_form_save": "athlete_change_form_save",
+    "medical_changelist": "medical_changelist",
+}
+# αποτυχίες χωρίς HTTP status (σύνδεση, timeout, κομμένη απάντηση)
+NETWORK_ERRORS = (URLError, TimeoutError, ConnectionError, HTTPException)
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # nearest-rank: η μικρότερη τιμή με τουλάχιστον p% των δειγμάτων <= αυτής
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class _FormParser(HTMLParser):
+    """Μαζεύει τα πεδία μιας <form> (input/select/textarea) όπως θα τα έστελνε ο browser."""
+
+    def __init__(self, form_id: str):
+        super().__init__()
+        self.form_id = form_id
+        self.in_form = False
+        self.fields: list[tuple[str, str]] = []
+        self._select: str | None = None
+        self._select_value: str | None = None
+        self._textarea: str | None = None
+        self._textarea_value: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if tag == "form":
+            self.in_form = a.get("id") == self.form_id
+            return
+        if not self.in_form:
+            return
+        name = a.get("name")
+        if tag == "input" and name:
+            kind = (a.get("type") or "text").lower()
+            if kind in ("submit", "button", "file", "image"):
+                return
+            if kind in ("checkbox", "radio") and "checked" not in a:
+                return
+            self.fields.append((name, a.get("value") or ("on" if kind == "checkbox" else "")))
+        elif tag == "select" and name:
+            self._select, self._select_value = name, None
+        elif tag == "option" and self._select is not None:
+            # όπως ο browser: το selected, αλλιώς το πρώτο option
+            if "selected" in a or self._select_value is None:
+                self._select_value = a.get("value", "")
+        elif tag == "textarea" and name:
+            self._textarea, self._textarea_value = name, []
+
+    def handle_endtag(self, tag):
+        if tag == "form":
+            self.in_form = False
+        elif tag == "select" and self._select is not None:
+            self.fields.append((self._select, self._select_value or ""))
+            self._select = None
+        elif tag == "textarea" and self._textarea is not None:
+            self.fields.append((self._textarea, "".join(self._textarea_value)))
+            self._textarea = None
+
+    def handle_data(self, data):
+        if self._textarea is not None:
+            self._textarea_value.append(data)
+
+
+class Session:
+    """Ένας εικονικός χρήστης: δικό του cookie jar (session + csrftoken)."""
+
+    def __init__(self, base_url: str, timeout: float):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.cookies = CookieJar()
+        self.opener = build_opener(HTTPCookieProcessor(self.cookies))
+
+    def csrf(self) -> str:
+        for c in self.cookies:
+            if c.name == "csrftoken":
+                return c.value
+        return ""
+
+    def request(self, path: str, data: dict | list | None = None) -> tuple[int, str]:
+        url = urljoin(self.base_url, path)
+        body = None
+        headers = {"Referer": url}
+        if data is not None:
+            body = urlencode(data).encode("utf-8")
+            headers["X-CSRFToken"] = self.csrf()
+        req = Request(url, data=body, headers=headers)
+        try:
+            with self.opener.open(req, timeout=self.timeout) as resp:
+                return resp.status, resp.read().decode("utf-8", "replace")
+        except HTTPError as e:
+            return e.code, ""
+
+    def login(self, login_code: str, password: str) -> bool:
+        self.request("/admin/login/")
+        status, html = self.request(
+            "/admin/login/?next=/admin/",
+            {"csrfmiddlewaretoken": self.csrf(), "username": login_code, "password": password, "next": "/admin/"},
+        )
+        return status == 200 and 'id="login-form"' not in html
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test σε τρέχον instance (π.χ. runserver): N ταυτόχρονες συνεδρίες admin "
+        "με σενάρια χρηστών. Γράφει p50/p95/p99 και error rate ανά endpoint σε JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--login-code", required=True, help="login_code χρήστη staff.")
+        parser.add_argument("--password", required=True)
+        parser.add_argument("--users", type=int, default=50, help="Ταυτόχρονες συνεδρίες.")
+        parser.add_argument("--duration", type=float, default=60, help="Διάρκεια σε δευτερόλεπτα.")
+        parser.add_argument("--think-time", type=float, default=0.5, help="Μέση αναμονή μεταξύ κλικ (s).")
+        parser.add_argument("--timeout", type=float, default=30)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument(
+            "--mix",
+            default="",
+            help="Π.χ. changelist_search=60,autocomplete=40 (default: %s)" % ",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+        )
+        parser.add_argument("--label", default="", help="Όνομα build/run (π.χ. git commit).")
+        parser.add_argument("--out", default="", help="Φάκελος αποτελεσμάτων (default: BASE_DIR/loadtest_results).")
+        parser.add_argument("--compare", default="", help="Προηγούμενο JSON αποτελεσμάτων για σύγκριση.")
+
+    # -----------------------------
+    # scenarios
+    # -----------------------------
+    def _changelist_search(self, s: Session, rng: random.Random):
+        term = rng.choice(SEARCH_TERMS)
+        return "athlete_changelist_search", s.request(f"/admin/registry/athlete/?{urlencode({'q': term})}")
+
+    def _autocomplete(self, s: Session, rng: random.Random):
+        params = {
+            "term": rng.choice(SEARCH_TERMS)[:3],
+            "app_label": "registry",
+            "model_name": "athletemedicalcertificate",
+            "field_name": "athlete",
+        }
+        return "athlete_autocomplete", s.request(f"/admin/autocomplete/?{urlencode(params)}")
+
+    def _change_form_save(self, s: Session, rng: random.Random):
+        pk = rng.choice(self.athlete_ids)
+        path = f"/admin/registry/athlete/{pk}/change/"
+        status, html = s.request(path)
+        if status != 200:
+            return "athlete_change_form_save", (status, html)
+        parser = _FormParser("athlete_form")
+        parser.feed(html)
+        data = [(k, v) for k, v in parser.fields if k != "csrfmiddlewaretoken"]
+        data.append(("csrfmiddlewaretoken", s.csrf()))
+        data.append(("_continue", "1"))
+        status, html = s.request(path, data)
+        # σε αποτυχία validation το admin ξαναδείχνει τη φόρμα με errornote
+        if status == 200 and 'class="errornote"' in html:
+            status = 422
+        return "athlete_change_form_save", (status, html)
+
+    def _medical_changelist(self, s: Session, rng: random.Random):
+        return "medical_changelist", s.request("/admin/registry/athletemedicalcertificate/")
+
+    # -----------------------------
+    def handle(self, *args, **options):
+        self.athlete_ids = list(Athlete.objects.values_list("pk", flat=True)[:5000])
+        if not self.athlete_ids:
+            raise CommandError("Δεν υπάρχουν αθλητές. Τρέξε πρώτα generate_synthetic_data.")
+
+        mix = dict(DEFAULT_MIX)
+        if options["mix"]:
+            mix = {}
+            for part in options["mix"].split(","):
+                name, _, weight = part.partition("=")
+                mix[name.strip()] = float(weight or 1)
+        scenarios = {}
+        endpoints = {}
+        for name, weight in mix.items():
+            fn = getattr(self, f"_{name}", None)
+            if fn is None or name not in ENDPOINTS:
+                raise CommandError(f"Άγνωστο σενάριο: {name}")
+            scenarios[fn] = weight
+            endpoints[fn] = ENDPOINTS[name]
+
+        samples: dict[str, list[float]] = defaultdict(list)
+        errors: dict[str, int] = defaultdict(int)
+        lock = threading.Lock()
+        deadline = time.monotonic() + options["duration"]
+        login_failures = []
+
+        def worker(n: int):
+            rng = random.Random(options["seed"] * 1000 + n)
+            s = Session(options["base_url"], options["timeout"])
+            try:
+                if not s.login(options["login_code"], options["password"]):
+                    login_failures.append(n)
+                    return
+            except NETWORK_ERRORS as e:
+                login_failures.append(f"{n}: {e}")
+                return
+            fns, weights = list(scenarios), list(scenarios.values())
+            while time.monotonic() < deadline:
+                fn = rng.choices(fns, weights=weights)[0]
+                start = time.perf_counter()
+                try:
+                    endpoint, (status, _) = fn(s, rng)
+                except NETWORK_ERRORS:
+                    endpoint, status = endpoints[fn], 0
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    samples[endpoint].append(elapsed)
+                    if status == 0 or status >= 400:
+                        errors[endpoint] += 1
+                time.sleep(rng.expovariate(1 / options["think_time"]) if options["think_time"] > 0 else 0)
+
+        self.stdout.write(self.style.NOTICE(
+            f"Load test: {options['users']} users x {options['duration']}s -> {options['base_url']}"
+        ))
+        threads = [threading.Thread(target=worker, args=(n,), daemon=True) for n in range(options["users"])]
+        started = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.monotonic() - started
+
+        if len(login_failures) == options["users"]:
+            raise CommandError(f"Κανένα login δεν πέτυχε ({login_failures[:3]}...)")
+
+        report = {
+            "label": options["label"],
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "base_url": options["base_url"],
+            "users": options["users"],
+            "duration_s": round(wall, 1),
+            "mix": mix,
+            "login_failures": len(login_failures),
+            "endpoints": {},
+        }
+        for endpoint, values in sorted(samples.items()):
+            values.sort()
+            report["endpoints"][endpoint] = {
+                "requests": len(values),
+                "rps": round(len(values) / wall, 2) if wall else 0,
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "max_ms": round(values[-1], 1),
+                "error_rate": round(errors[endpoint] / len(values), 4),
+            }
+
+        self._print(report)
+        out_path = self._save(report, options["out"])
+        self.stdout.write(self.style.SUCCESS(f"Αποτελέσματα: {out_path}"))
+
+        if options["compare"]:
+            self._compare(report, Path(options["compare"]))
+
+    def _print(self, report: dict) -> None:
+        self.stdout.write(f"{'endpoint':32} {'reqs':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'err%':>6}")
+        for name, r in report["endpoints"].items():
+            self.stdout.write(
+                f"{name:32} {r['requests']:>6} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} "
+                f"{r['error_rate'] * 100:>6.2f}"
+            )
+
+    def _save(self, report: dict, out: str) -> Path:
+        out_dir = Path(out) if out else Path(settings.BASE_DIR) / "loadtest_results"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        label = f"_{report['label']}" if report["label"] else ""
+        path = out_dir / f"loadtest_{datetime.now():%Y%m%d_%H%M%S}{label}.json"
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        return path
+
+    def _compare(self, report: dict, previous_path: Path) -> None:
+        if not previous_path.exists():
+            raise CommandError(f"File not found: {previous_path}")
+        previous = json.loads(previous_path.read_text(encoding="utf-8"))
+        self.stdout.write(self.style.NOTICE(f"Σύγκριση με: {previous.get('label') or previous_path.name}"))
+        for name, r in report["endpoints"].items():
+            old = previous.get("endpoints", {}).get(name)
+            if not old:
+                self.stdout.write(f"{name:32} (νέο endpoint)")
+                continue
+            parts = []
+            for key in ("p50_ms", "p95_ms", "p99_ms"):
+                delta = (r[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+                parts.append(f"{key[:3]} {old[key]} -> {r[key]} ({delta:+.0f}%)")
+            parts.append(f"err {old['error_rate'] * 100:.2f}% -> {r['error_rate'] * 100:.2f}%")
+            self.stdout.write(f"{name:32} " + " | ".join(parts))
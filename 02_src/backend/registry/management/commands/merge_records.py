@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from registry import merge
+from registry.models import Athlete, Horse
+
+MODELS = {"athlete": Athlete, "horse": Horse}
+
+
+class Command(BaseCommand):
+    help = "Συγχωνεύει δύο αθλητές / ίππους: όλα τα συνδεδεμένα του διπλότυπου πάνε σε αυτόν που μένει."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(MODELS))
+        parser.add_argument("survivor", type=int, help="id της εγγραφής που μένει")
+        parser.add_argument("duplicate", type=int, help="id της εγγραφής που διαγράφεται")
+        parser.add_argument("--dry-run", action="store_true", help="Μόνο τα πλήθη ανά πίνακα, χωρίς αλλαγές")
+
+    def handle(self, *args, **options):
+        model = MODELS[options["kind"]]
+        try:
+            survivor = model.objects.get(pk=options["survivor"])
+            duplicate = model.objects.get(pk=options["duplicate"])
+        except model.DoesNotExist as e:
+            raise CommandError(str(e))
+
+        try:
+            result = merge.merge(survivor, duplicate, dry_run=options["dry_run"])
+        except ValidationError as e:
+            raise CommandError(" ".join(e.messages))
+
+        for relation in result.relations:
+            if relation.rows:
+                self.stdout.write(f"{relation.label}: {relation.rows}")
+        for note in result.notes:
+            self.stdout.write(self.style.WARNING(note))
+        for error in result.errors:
+            self.stdout.write(self.style.ERROR(error))
+        if result.applied:
+            self.stdout.write(self.style.SUCCESS(f"OK. {duplicate} -> {survivor} ({result.rows} γραμμές)"))
+        else:
+            self.stdout.write(self.style.WARNING(f"Dry-run: {result.rows} γραμμές θα μεταφερθούν."))
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from registry.eligibility import CHUNK_SIZE, rebuild_all
+
+
+class Command(BaseCommand):
+    help = (
+        "Ξαναϋπολογίζει από την αρχή το snapshot καταλληλότητας αθλητών και ίππων "
+        "(ιατρικές, άδειες, συνδρομές, έγγραφα ίππων). Κανονικά ενημερώνεται μόνο του· "
+        "χρειάζεται μετά από bulk imports ή αλλαγή κανόνων."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Αθλητές/ίπποι ανά γύρο.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        athletes, horses = rebuild_all(options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. Αθλητές: {athletes}, Ίπποι: {horses} ({time.perf_counter() - started:.1f}s)"
+        ))
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from registry.pedigree import rebuild_all
+
+
+class Command(BaseCommand):
+    help = "Αναδημιουργεί τη γενεαλογία ίππων (closure table HorseAncestry) από τα πεδία πατέρα / μητέρας."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        stats = rebuild_all()
+        for horse_id, letter in stats.cycles:
+            self.stdout.write(self.style.WARNING(
+                f"Κύκλος στη γενεαλογία: ίππος #{horse_id} ({'πατέρας' if letter == 'S' else 'μητέρα'}) αγνοήθηκε"
+            ))
+        self.stdout.write(self.style.SUCCESS(
+            f"OK. {stats.horses} ίπποι, {stats.rows} γραμμές προγόνων, "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        ))
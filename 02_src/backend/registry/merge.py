@@ -0,0 +1,292 @@
+"""
+Συγχώνευση δύο εγγραφών αθλητή ή ίππου που είναι το ίδιο (registry/dedup.py, actions του admin).
+
+    plan(survivor, duplicate)                  -> MergePlan: γραμμές ανά πίνακα, συγκρούσεις (dry-run)
+    merge(survivor, duplicate, user, dry_run)  -> ένα UPDATE ανά πίνακα + διαγραφή του διπλότυπου
+
+Κάθε ForeignKey προς το μοντέλο (έγγραφα, βεβαιώσεις, συνδρομές, δηλώσεις, αποτελέσματα,
+καθολικό, βαθμολογίες, γονείς ίππων κ.λπ.) βρίσκεται από το _meta, οπότε νέοι πίνακες
+καλύπτονται χωρίς αλλαγή εδώ. Οι παράγωγοι πίνακες (DERIVED) δεν μεταφέρονται: οι γραμμές
+του διπλότυπου φεύγουν μαζί του και του survivor ξαναϋπολογίζονται μόνο για τα κλειδιά
+που άλλαξαν. Όλα σε μία σύντομη συναλλαγή· στο ιστορικό αλλαγών μένει μία εγγραφή
+"Συγχώνευση" στον survivor και μία "Διαγραφή" για το διπλότυπο.
+
+Το plan ξαναϋπολογίζεται μέσα στη συναλλαγή, αφού κλειδωθούν οι δύο εγγραφές, και κάθε
+πίνακας μεταφέρεται ανεξάρτητα από το πλήθος του plan (γραμμές που προστέθηκαν στο μεταξύ
+δεν σβήνονται με CASCADE). Συγκρούσεις unique στους πίνακες του RESOLVERS δεν εμποδίζουν
+τη συγχώνευση: λύνονται πριν τη μεταφορά (π.χ. συνδρομή της ίδιας σεζόν και στους δύο).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from audit.models import AuditEvent
+from audit.recorder import audit_context, fields_of, record_changes, update as audit_update
+from competitions import history, partnerships
+from competitions.eligibility import invalidate as invalidate_eligibility
+from competitions.models import CompetitionRecord, Entry
+from finance.ledger import refresh_balances, reverse
+from finance.models import LedgerEntry
+from rankings.models import RankingPoints, RankingTable
+from rankings.standings import publish
+
+from . import pedigree
+from .eligibility import schedule_athletes, schedule_horses
+from .models import Athlete, AthleteSubscription, Horse
+
+# ξαναϋπολογίζονται (ή είναι ιστορικό του ίδιου του διπλότυπου): δεν μεταφέρονται
+DERIVED = {
+    "registry.athleteeligibility",
+    "registry.horseeligibility",
+    "registry.athleteeligibilityperiod",
+    "registry.horseeligibilityperiod",
+    "registry.horseancestry",
+    "registry.duplicatecandidate",
+    "competitions.athleteseasonstats",
+    "competitions.horseseasonstats",
+    "competitions.pairseasonstats",
+    "competitions.partnership",
+    "finance.athletebalance",
+    "audit.athleteversion",
+    "audit.horseversion",
+}
+MERGEABLE = (Athlete, Horse)
+
+
+@dataclass
+class Relation:
+    model: type
+    field: str
+    rows: int = 0
+    # γραμμές του διπλότυπου που θα παραβίαζαν unique μαζί με του survivor
+    conflicts: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.model._meta.verbose_name_plural} ({self.model._meta.get_field(self.field).verbose_name})"
+
+
+@dataclass
+class MergePlan:
+    survivor: Athlete | Horse
+    duplicate: Athlete | Horse
+    relations: list[Relation] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    # συγκρούσεις που λύνονται αυτόματα (RESOLVERS)
+    notes: list[str] = field(default_factory=list)
+    applied: bool = False
+
+    @property
+    def rows(self) -> int:
+        return sum(r.rows for r in self.relations)
+
+    def counts(self) -> dict[str, int]:
+        return {r.label: r.rows for r in self.relations if r.rows}
+
+
+def relations_of(model) -> list[Relation]:
+    """Όλα τα ForeignKey / OneToOne προς το model (και τα κρυφά, related_name="+") εκτός από τα DERIVED."""
+    return [
+        Relation(f.related_model, f.field.name)
+        for f in model._meta.get_fields(include_hidden=True)
+        if f.is_relation and f.auto_created and not f.concrete and not f.many_to_many
+        and f.related_model._meta.label_lower not in DERIVED
+    ]
+
+
+def _unique_sets(model, field_name: str) -> list[tuple[str, ...]]:
+    sets = [
+        tuple(c.fields) for c in model._meta.constraints
+        if getattr(c, "fields", None) and c.condition is None and field_name in c.fields
+    ]
+    sets += [tuple(u) for u in model._meta.unique_together if field_name in u]
+    if model._meta.get_field(field_name).unique:
+        sets.append((field_name,))
+    return sets
+
+
+def _conflicts(relation: Relation, survivor, duplicate) -> int:
+    total = 0
+    qs = relation.model._base_manager.filter(**{relation.field: duplicate})
+    for fields in _unique_sets(relation.model, relation.field):
+        same = relation.model._base_manager.filter(
+            **{relation.field: survivor},
+            **{f: OuterRef(f) for f in fields if f != relation.field},
+        )
+        total += qs.filter(Exists(same)).count()
+    return total
+
+
+# -----------------------------
+# συγκρούσεις που λύνονται αυτόματα
+# -----------------------------
+def _duplicate_subscriptions(survivor, duplicate, user=None) -> int:
+    """
+    Συνδρομή της ίδιας σεζόν και στους δύο: μένει του survivor. Η χρέωση της συνδρομής του
+    διπλότυπου αντιλογίζεται (το υπόλοιπο μένει σωστό) και η συνδρομή φεύγει μαζί του.
+    """
+    seasons = AthleteSubscription.objects.filter(athlete=survivor).values("season")
+    subscriptions = list(
+        AthleteSubscription.objects.filter(athlete=duplicate, season__in=seasons).values_list("pk", flat=True)
+    )
+    if not subscriptions:
+        return 0
+    charges = LedgerEntry.objects.filter(
+        subscription_id__in=subscriptions, kind=LedgerEntry.Kind.SUBSCRIPTION, reversed_by__isnull=True
+    ).exclude(status=LedgerEntry.Status.CANCELLED)
+    for charge in charges:
+        reverse(charge, user=user, description=f"Συγχώνευση: διπλή συνδρομή {charge.season}")
+    AthleteSubscription.objects.filter(pk__in=subscriptions).delete()
+    return len(subscriptions)
+
+
+# "app.model.πεδίο" -> (περιγραφή για το plan, resolver(survivor, duplicate, user) πριν τη μεταφορά)
+RESOLVERS = {
+    "registry.athletesubscription.athlete": (
+        "συνδρομές της ίδιας σεζόν: μένει του survivor, του διπλότυπου ακυρώνεται (αντιλογισμός της χρέωσης)",
+        _duplicate_subscriptions,
+    ),
+}
+
+
+def _key(relation: Relation) -> str:
+    return f"{relation.model._meta.label_lower}.{relation.field}"
+
+
+def plan(survivor, duplicate) -> MergePlan:
+    """Dry-run: τι θα μεταφερθεί και αν γίνεται. Ένα COUNT ανά πίνακα (+ έλεγχος unique)."""
+    result = MergePlan(survivor, duplicate)
+    if type(survivor) is not type(duplicate) or type(survivor) not in MERGEABLE:
+        result.errors.append("Συγχωνεύονται μόνο δύο αθλητές ή δύο ίπποι.")
+        return result
+    if survivor.pk == duplicate.pk:
+        result.errors.append("Η εγγραφή δεν μπορεί να συγχωνευτεί με τον εαυτό της.")
+        return result
+    for relation in relations_of(type(survivor)):
+        relation.rows = relation.model._base_manager.filter(**{relation.field: duplicate}).count()
+        if relation.rows:
+            relation.conflicts = _conflicts(relation, survivor, duplicate)
+            if relation.conflicts and _key(relation) in RESOLVERS:
+                result.notes.append(f"{relation.label}: {relation.conflicts} {RESOLVERS[_key(relation)][0]}.")
+            elif relation.conflicts:
+                result.errors.append(
+                    f"{relation.label}: {relation.conflicts} γραμμές υπάρχουν ήδη και στα δύο "
+                    "(π.χ. ίδια σεζόν / ίδιο αγώνισμα)."
+                )
+        result.relations.append(relation)
+    if type(survivor) is Horse and pedigree.is_descendant(survivor.pk, duplicate.pk):
+        result.errors.append("Ο ίππος που μένει είναι απόγονος του διπλότυπου.")
+    return result
+
+
+# -----------------------------
+# παράγωγα: κλειδιά πριν τη μεταφορά, ξαναϋπολογισμός μετά
+# -----------------------------
+def _affected(model, duplicate_pk) -> dict:
+    owner = "athlete_id" if model is Athlete else "horse_id"
+    records = list(
+        CompetitionRecord.objects.filter(**{owner: duplicate_pk}).order_by()
+        .values_list("athlete_id", "horse_id", "date__year").distinct()
+    )
+    keys = {
+        "pairs": set(Entry.objects.filter(**{owner: duplicate_pk}).order_by().values_list("athlete_id", "horse_id").distinct())
+        | {(a, h) for a, h, _ in records},
+        "records": records,
+        "children": [],
+        "seasons": [],
+        "tables": [],
+    }
+    if model is Athlete:
+        keys["seasons"] = list(
+            LedgerEntry.objects.filter(athlete_id=duplicate_pk).order_by().values_list("season", flat=True).distinct()
+        )
+        keys["tables"] = list(
+            RankingPoints.objects.filter(athlete_id=duplicate_pk).order_by().values_list("table_id", flat=True).distinct()
+        )
+    else:
+        keys["children"] = list(
+            Horse.objects.filter(Q(sire_id=duplicate_pk) | Q(dam_id=duplicate_pk)).values_list("pk", flat=True)
+        )
+    return keys
+
+
+def _refresh(model, survivor_pk, duplicate_pk, keys: dict) -> None:
+    is_athlete = model is Athlete
+
+    def moved(athlete_id, horse_id):
+        if is_athlete:
+            return (survivor_pk if athlete_id == duplicate_pk else athlete_id), horse_id
+        return athlete_id, (survivor_pk if horse_id == duplicate_pk else horse_id)
+
+    pairs = keys["pairs"]
+    partnerships.schedule(pairs | {moved(a, h) for a, h in pairs})
+    stats = {"athlete": set(), "horse": set(), "pair": set()}
+    for athlete_id, horse_id, season in keys["records"]:
+        athlete_id, horse_id = moved(athlete_id, horse_id)
+        stats["athlete"].add((athlete_id, season))
+        stats["horse"].add((horse_id, season))
+        stats["pair"].add((athlete_id, horse_id, season))
+    history.refresh_stats(stats)
+
+    if is_athlete:
+        schedule_athletes([survivor_pk])
+        invalidate_eligibility("a", survivor_pk)
+        if keys["seasons"]:
+            refresh_balances("athlete", {(survivor_pk, season) for season in keys["seasons"]})
+        for table in RankingTable.objects.filter(pk__in=keys["tables"]):
+            publish(table, reason="Συγχώνευση αθλητών")
+    else:
+        schedule_horses([survivor_pk])
+        invalidate_eligibility("h", survivor_pk)
+        if keys["children"]:
+            pedigree.schedule(keys["children"], force=True)
+
+
+# -----------------------------
+# εκτέλεση
+# -----------------------------
+def merge(survivor, duplicate, user=None, dry_run: bool = False) -> MergePlan:
+    """
+    Μεταφέρει όλα τα συνδεδεμένα του duplicate στον survivor και τον διαγράφει.
+    dry_run: μόνο το plan (πλήθη / συγκρούσεις). ValidationError αν δεν γίνεται.
+    """
+    if dry_run:
+        return plan(survivor, duplicate)
+
+    model = type(survivor)
+    duplicate_pk = duplicate.pk  # το delete() το κάνει None
+    with transaction.atomic(), audit_context("merge", user):
+        # και οι δύο κλειδωμένοι μέχρι το τέλος (όχι νέες δηλώσεις / έγγραφα στο μεταξύ)
+        list(model._base_manager.select_for_update().filter(pk__in=[survivor.pk, duplicate.pk]).values_list("pk"))
+        # plan μετά το κλείδωμα: ό,τι προστέθηκε πριν από αυτό μετράει και ελέγχεται
+        result = plan(survivor, duplicate)
+        if result.errors:
+            raise ValidationError(result.errors)
+        for relation in result.relations:
+            if relation.conflicts:
+                RESOLVERS[_key(relation)][1](survivor, duplicate, user)
+        keys = _affected(model, duplicate_pk)
+        moved = {}
+        for relation in result.relations:
+            # όλοι οι πίνακες, όχι μόνο όσοι είχαν γραμμές στο plan: ένα UPDATE χωρίς γραμμές κοστίζει ελάχιστα
+            qs = relation.model._base_manager.filter(**{relation.field: duplicate})
+            if fields_of(relation.model):
+                # με καταγραφή της αλλαγής στο ιστορικό κάθε εγγράφου / βεβαίωσης
+                relation.rows = audit_update(qs, **{relation.field: survivor})
+            else:
+                relation.rows = qs.update(**{relation.field: survivor})
+            if relation.rows:
+                moved[_key(relation)] = relation.rows
+        record_changes(
+            model,
+            [(survivor.pk, {"merged_from": None, "moved": None}, {"merged_from": duplicate_pk, "moved": moved})],
+            AuditEvent.Action.MERGE,
+        )
+        duplicate.delete()
+        _refresh(model, survivor.pk, duplicate_pk, keys)
+    result.applied = True
+    return result
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+        ('registry', '0012_alter_athlete_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='horse',
+            name='club',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='horses', to='organizations.club', verbose_name='Όμιλος'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:42
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registry', '0013_horse_club'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AthleteSubscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField(verbose_name='Έτος')),
+                ('valid_from', models.DateField(verbose_name='Ισχύει από')),
+                ('valid_until', models.DateField(verbose_name='Ισχύει μέχρι')),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=8, verbose_name='Ποσό (€)')),
+                ('status', models.CharField(choices=[('PENDING', 'Εκκρεμεί'), ('PAID', 'Εξοφλήθηκε'), ('CANCELLED', 'Ακυρώθηκε')], default='PENDING', max_length=20, verbose_name='Κατάσταση')),
+                ('paid_at', models.DateField(blank=True, null=True, verbose_name='Ημερ/νία Πληρωμής')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Καταχωρήθηκε')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subscriptions', to='registry.athlete', verbose_name='Αθλητής')),
+            ],
+            options={
+                'verbose_name': 'Συνδρομή Αθλητή',
+                'verbose_name_plural': 'Συνδρομές Αθλητών',
+                'ordering': ['-season'],
+                'indexes': [models.Index(fields=['athlete', 'valid_until'], name='subscription_athlete_until_idx')],
+                'constraints': [models.UniqueConstraint(fields=('athlete', 'season'), name='subscription_unique_season')],
+            },
+        ),
+    ]
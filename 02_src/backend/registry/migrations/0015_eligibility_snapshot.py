@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:46
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registry', '0014_athletesubscription'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AthleteEligibility',
+            fields=[
+                ('athlete', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='eligibility', serialize=False, to='registry.athlete', verbose_name='Αθλητής')),
+                ('medical_valid_from', models.DateField(blank=True, null=True, verbose_name='Ιατρική από')),
+                ('medical_valid_until', models.DateField(blank=True, null=True, verbose_name='Ιατρική έως')),
+                ('license_since', models.DateField(blank=True, null=True, verbose_name='Άδεια από')),
+                ('subscription_valid_from', models.DateField(blank=True, null=True, verbose_name='Συνδρομή από')),
+                ('subscription_valid_until', models.DateField(blank=True, null=True, verbose_name='Συνδρομή έως')),
+                ('eligible_from', models.DateField(blank=True, null=True, verbose_name='Δικαίωμα συμμετοχής από')),
+                ('eligible_until', models.DateField(blank=True, null=True, verbose_name='Δικαίωμα συμμετοχής έως')),
+                ('blocking_requirement', models.CharField(blank=True, choices=[('MEDICAL', 'Ιατρική βεβαίωση'), ('LICENSE', 'Άδεια αθλητή'), ('SUBSCRIPTION', 'Συνδρομή')], max_length=20, verbose_name='Λήγει πρώτη')),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Ενημερώθηκε')),
+            ],
+            options={
+                'verbose_name': 'Καταλληλότητα Αθλητή',
+                'verbose_name_plural': 'Καταλληλότητα Αθλητών',
+                'indexes': [models.Index(fields=['eligible_until', 'eligible_from'], name='athlete_elig_range_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='HorseEligibility',
+            fields=[
+                ('horse', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='eligibility', serialize=False, to='registry.horse', verbose_name='Ίππος')),
+                ('passport_valid_from', models.DateField(blank=True, null=True, verbose_name='Διαβατήριο από')),
+                ('passport_valid_until', models.DateField(blank=True, null=True, verbose_name='Διαβατήριο έως')),
+                ('medical_valid_from', models.DateField(blank=True, null=True, verbose_name='Ιατρικό από')),
+                ('medical_valid_until', models.DateField(blank=True, null=True, verbose_name='Ιατρικό έως')),
+                ('eligible_from', models.DateField(blank=True, null=True, verbose_name='Δικαίωμα συμμετοχής από')),
+                ('eligible_until', models.DateField(blank=True, null=True, verbose_name='Δικαίωμα συμμετοχής έως')),
+                ('blocking_requirement', models.CharField(blank=True, choices=[('PASSPORT', 'Διαβατήριο'), ('MEDICAL', 'Ιατρικό')], max_length=20, verbose_name='Λήγει πρώτη')),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Ενημερώθηκε')),
+            ],
+            options={
+                'verbose_name': 'Καταλληλότητα Ίππου',
+                'verbose_name_plural': 'Καταλληλότητα Ίππων',
+                'indexes': [models.Index(fields=['eligible_until', 'eligible_from'], name='horse_elig_range_idx')],
+            },
+        ),
+    ]
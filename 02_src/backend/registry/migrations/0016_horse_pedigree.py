@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registry', '0015_eligibility_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='horse',
+            name='dam',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='foals', to='registry.horse', verbose_name='Μητέρα'),
+        ),
+        migrations.AddField(
+            model_name='horse',
+            name='dam_name',
+            field=models.CharField(blank=True, max_length=120, verbose_name='Μητέρα (όνομα)'),
+        ),
+        migrations.AddField(
+            model_name='horse',
+            name='dam_sire_name',
+            field=models.CharField(blank=True, max_length=120, verbose_name='Πατέρας Μητέρας (όνομα)'),
+        ),
+        migrations.AddField(
+            model_name='horse',
+            name='sire',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sired', to='registry.horse', verbose_name='Πατέρας'),
+        ),
+        migrations.AddField(
+            model_name='horse',
+            name='sire_name',
+            field=models.CharField(blank=True, max_length=120, verbose_name='Πατέρας (όνομα)'),
+        ),
+        migrations.CreateModel(
+            name='HorseAncestry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField(verbose_name='Γενιά')),
+                ('path', models.CharField(max_length=16, verbose_name='Θέση')),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendancy', to='registry.horse', verbose_name='Πρόγονος')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestry', to='registry.horse', verbose_name='Ίππος')),
+            ],
+            options={
+                'verbose_name': 'Πρόγονος Ίππου',
+                'verbose_name_plural': 'Γενεαλογία Ίππων',
+                'indexes': [models.Index(fields=['descendant', 'depth'], name='horse_ancestry_desc_idx'), models.Index(fields=['ancestor', 'depth'], name='horse_ancestry_anc_idx')],
+                'constraints': [models.UniqueConstraint(fields=('descendant', 'path'), name='horse_ancestry_path_uniq')],
+            },
+        ),
+    ]
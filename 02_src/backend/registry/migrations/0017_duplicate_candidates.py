@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:41
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registry', '0016_horse_pedigree'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DuplicateCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(verbose_name='Ομοιότητα')),
+                ('reasons', models.CharField(blank=True, max_length=255, verbose_name='Κοινά στοιχεία')),
+                ('status', models.CharField(choices=[('PENDING', 'Προς έλεγχο'), ('DISMISSED', 'Διαφορετικά πρόσωπα')], default='PENDING', max_length=20, verbose_name='Κατάσταση')),
+                ('found_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Εντοπίστηκε')),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True, verbose_name='Ελέγχθηκε')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='registry.athlete', verbose_name='Αθλητής')),
+                ('other', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='registry.athlete', verbose_name='Πιθανό διπλότυπο')),
+                ('reviewed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Ελέγχθηκε από')),
+            ],
+            options={
+                'verbose_name': 'Πιθανό Διπλότυπο Αθλητή',
+                'verbose_name_plural': 'Πιθανά Διπλότυπα Αθλητών',
+                'ordering': ['-score'],
+                'indexes': [models.Index(fields=['status', '-score'], name='duplicate_queue_idx')],
+                'constraints': [models.UniqueConstraint(fields=('athlete', 'other'), name='duplicate_unique_pair'), models.CheckConstraint(condition=models.Q(('athlete__lt', models.F('other'))), name='duplicate_ordered_pair')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:59
+
+import django.utils.timezone
+import registry.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registry', '0017_duplicate_candidates'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='athletedocument',
+            name='file',
+            field=models.FileField(storage=registry.models.document_storage, upload_to='athlete_documents/%Y/%m/', verbose_name='Αρχείο'),
+        ),
+        migrations.AlterField(
+            model_name='athletemedicalcertificate',
+            name='file',
+            field=models.FileField(storage=registry.models.document_storage, upload_to='athlete_medicals/%Y/%m/', verbose_name='Αρχείο'),
+        ),
+        migrations.AlterField(
+            model_name='horsedocument',
+            name='file',
+            field=models.FileField(storage=registry.models.document_storage, upload_to='horse_documents/%Y/%m/', verbose_name='Αρχείο'),
+        ),
+        migrations.CreateModel(
+            name='StoredBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Αρχείο')),
+                ('sha256', models.CharField(max_length=64, verbose_name='SHA-256')),
+                ('size', models.PositiveBigIntegerField(verbose_name='Μέγεθος (bytes)')),
+                ('refcount', models.PositiveIntegerField(default=0, verbose_name='Χρήσεις')),
+                ('stored_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Τελευταία αποθήκευση')),
+            ],
+            options={
+                'verbose_name': 'Αποθηκευμένο Αρχείο',
+                'verbose_name_plural': 'Αποθηκευμένα Αρχεία',
+                'ordering': ['-stored_at'],
+                'indexes': [models.Index(fields=['refcount', 'stored_at'], name='blob_gc_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_current_windows(apps, schema_editor):
+    # μέχρι το επόμενο rebuild_eligibility: τουλάχιστον το διάστημα που ήδη υπήρχε
+    for owner, snapshot, period in (
+        ("athlete", "AthleteEligibility", "AthleteEligibilityPeriod"),
+        ("horse", "HorseEligibility", "HorseEligibilityPeriod"),
+    ):
+        Snapshot = apps.get_model("registry", snapshot)
+        Period = apps.get_model("registry", period)
+        rows = (
+            Snapshot.objects.filter(eligible_from__isnull=False, eligible_until__isnull=False)
+            .values_list(f"{owner}_id", "eligible_from", "eligible_until")
+            .iterator(chunk_size=2000)
+        )
+        batch = []
+        for pk, start, end in rows:
+            batch.append(Period(**{f"{owner}_id": pk}, eligible_from=start, eligible_until=end))
+            if len(batch) >= 2000:
+                Period.objects.bulk_create(batch)
+                batch = []
+        Period.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registry', '0018_stored_blobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AthleteEligibilityPeriod',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('eligible_from', models.DateField(verbose_name='Από')),
+                ('eligible_until', models.DateField(verbose_name='Έως')),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='eligibility_periods', to='registry.athlete', verbose_name='Αθλητής')),
+            ],
+            options={
+                'verbose_name': 'Διάστημα Καταλληλότητας Αθλητή',
+                'verbose_name_plural': 'Διαστήματα Καταλληλότητας Αθλητών',
+                'ordering': ['athlete', 'eligible_from'],
+                'indexes': [models.Index(fields=['eligible_until', 'eligible_from'], name='athlete_period_range_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='HorseEligibilityPeriod',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('eligible_from', models.DateField(verbose_name='Από')),
+                ('eligible_until', models.DateField(verbose_name='Έως')),
+                ('horse', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='eligibility_periods', to='registry.horse', verbose_name='Ίππος')),
+            ],
+            options={
+                'verbose_name': 'Διάστημα Καταλληλότητας Ίππου',
+                'verbose_name_plural': 'Διαστήματα Καταλληλότητας Ίππων',
+                'ordering': ['horse', 'eligible_from'],
+                'indexes': [models.Index(fields=['eligible_until', 'eligible_from'], name='horse_period_range_idx')],
+            },
+        ),
+        migrations.RunPython(copy_current_windows, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import date, timedelta
 
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.storage import storages
 from django.db import models
 from django.utils import timezone
 
@@ -78,8 +81,38 @@ class Horse(models.Model):
     name = models.CharField(max_length=120, verbose_name="Ίππος")
     passport_number = models.CharField(max_length=80, blank=True, verbose_name="Διαβατήριο")
     birth_date = models.DateField(null=True, blank=True, verbose_name="Ημερ/νια Γέννησης")
+    club = models.ForeignKey(
+        "organizations.Club",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="horses",
+        verbose_name="Όμιλος",
+    )
     is_active = models.BooleanField(default=True, verbose_name="Ενεργός")
 
+    # Γενεαλογία (registry/pedigree.py). Τα ονόματα κρατιούνται για προγόνους
+    # που δεν είναι στο μητρώο (π.χ. εισαγόμενοι επιβήτορες).
+    sire = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="sired",
+        verbose_name="Πατέρας",
+    )
+    dam = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="foals",
+        verbose_name="Μητέρα",
+    )
+    sire_name = models.CharField(max_length=120, blank=True, verbose_name="Πατέρας (όνομα)")
+    dam_name = models.CharField(max_length=120, blank=True, verbose_name="Μητέρα (όνομα)")
+    dam_sire_name = models.CharField(max_length=120, blank=True, verbose_name="Πατέρας Μητέρας (όνομα)")
+
     class Meta:
         verbose_name = "Ίππος"
         verbose_name_plural = "Ίπποι"
@@ -88,6 +121,64 @@ class Horse(models.Model):
     def __str__(self):
         return f"{self.registry_number} - {self.name}"
 
+    def clean(self):
+        from .pedigree import is_descendant
+
+        errors = {}
+        if self.sire_id is not None and self.sire_id == self.dam_id:
+            errors["dam"] = "Ο ίδιος ίππος δεν μπορεί να είναι πατέρας και μητέρα."
+        for field in ("sire", "dam"):
+            parent_id = getattr(self, f"{field}_id")
+            if parent_id is None or self.pk is None:
+                continue
+            if parent_id == self.pk or is_descendant(parent_id, self.pk):
+                errors[field] = "Ο γονέας δεν μπορεί να είναι ο ίδιος ο ίππος ή απόγονός του."
+        if errors:
+            raise ValidationError(errors)
+
+
+class HorseAncestry(models.Model):
+    """
+    Closure table της γενεαλογίας: μία γραμμή για κάθε (ίππος, πρόγονος, θέση).
+
+    path: η θέση στο γενεαλογικό δέντρο από τον ίππο προς τα πίσω
+    ("S" = πατέρας, "D" = μητέρα, "DS" = πατέρας της μητέρας, ...), depth = len(path).
+    Με αιμομιξία ο ίδιος πρόγονος εμφανίζεται σε περισσότερες θέσεις.
+    Ενημερώνεται αυτόματα (signals) ή με `manage.py rebuild_pedigree`.
+    """
+
+    descendant = models.ForeignKey(
+        Horse, on_delete=models.CASCADE, related_name="ancestry", verbose_name="Ίππος"
+    )
+    ancestor = models.ForeignKey(
+        Horse, on_delete=models.CASCADE, related_name="descendancy", verbose_name="Πρόγονος"
+    )
+    depth = models.PositiveSmallIntegerField(verbose_name="Γενιά")
+    path = models.CharField(max_length=16, verbose_name="Θέση")
+
+    class Meta:
+        verbose_name = "Πρόγονος Ίππου"
+        verbose_name_plural = "Γενεαλογία Ίππων"
+        constraints = [
+            models.UniqueConstraint(fields=["descendant", "path"], name="horse_ancestry_path_uniq"),
+        ]
+        indexes = [
+            # "γενεαλογία N γενεών του Υ"
+            models.Index(fields=["descendant", "depth"], name="horse_ancestry_desc_idx"),
+            # "όλοι οι απόγονοι του Χ"
+            models.Index(fields=["ancestor", "depth"], name="horse_ancestry_anc_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.descendant_id} <- {self.path} {self.ancestor_id}"
+
+
+# -----------------------------
+# Αρχεία εγγράφων: content-addressed, ένα αντίγραφο ανά περιεχόμενο (registry/storage.py)
+# -----------------------------
+def document_storage():
+    return storages["documents"]
+
 
 class AthleteDocument(models.Model):
     class DocumentType(models.TextChoices):
@@ -105,7 +196,7 @@ class AthleteDocument(models.Model):
         verbose_name="Τύπος Εγγράφου",
     )
     title = models.CharField(max_length=200, blank=True, verbose_name="Τίτλος")
-    file = models.FileField(upload_to="athlete_documents/%Y/%m/", verbose_name="Αρχείο")
+    file = models.FileField(upload_to="athlete_documents/%Y/%m/", storage=document_storage, verbose_name="Αρχείο")
     uploaded_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Καταχωρήθηκε")
 
     class Meta:
@@ -126,7 +217,7 @@ class AthleteMedicalCertificate(models.Model):
     )
     issued_date = models.DateField(null=True, blank=True, verbose_name="Ημερ/νία Έκδοσης")
     valid_until = models.DateField(null=True, blank=True, verbose_name="Ισχύει μέχρι")
-    file = models.FileField(upload_to="athlete_medicals/%Y/%m/", verbose_name="Αρχείο")
+    file = models.FileField(upload_to="athlete_medicals/%Y/%m/", storage=document_storage, verbose_name="Αρχείο")
     uploaded_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Καταχωρήθηκε")
 
     class Meta:
@@ -150,6 +241,48 @@ class AthleteMedicalCertificate(models.Model):
         return f"{self.athlete} - Ιατρική ({self.valid_until or '-'})"
 
 
+class AthleteSubscription(models.Model):
+    """Ετήσια συνδρομή αθλητή (μία ανά έτος)."""
+
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "Εκκρεμεί"
+        PAID = "PAID", "Εξοφλήθηκε"
+        CANCELLED = "CANCELLED", "Ακυρώθηκε"
+
+    athlete = models.ForeignKey(
+        Athlete,
+        on_delete=models.CASCADE,
+        related_name="subscriptions",
+        verbose_name="Αθλητής",
+    )
+    season = models.PositiveSmallIntegerField(verbose_name="Έτος")
+    valid_from = models.DateField(verbose_name="Ισχύει από")
+    valid_until = models.DateField(verbose_name="Ισχύει μέχρι")
+    amount = models.DecimalField(max_digits=8, decimal_places=2, default=0, verbose_name="Ποσό (€)")
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Κατάσταση",
+    )
+    paid_at = models.DateField(null=True, blank=True, verbose_name="Ημερ/νία Πληρωμής")
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Καταχωρήθηκε")
+
+    class Meta:
+        verbose_name = "Συνδρομή Αθλητή"
+        verbose_name_plural = "Συνδρομές Αθλητών"
+        ordering = ["-season"]
+        constraints = [
+            models.UniqueConstraint(fields=["athlete", "season"], name="subscription_unique_season"),
+        ]
+        indexes = [
+            models.Index(fields=["athlete", "valid_until"], name="subscription_athlete_until_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete} - {self.season} ({self.get_status_display()})"
+
+
 class HorseDocument(models.Model):
     class DocumentType(models.TextChoices):
         PASSPORT = "PASSPORT", "Διαβατήριο"
@@ -169,7 +302,7 @@ class HorseDocument(models.Model):
     issued_date = models.DateField(null=True, blank=True, verbose_name="Ημερ/νία Έκδοσης")
     valid_until = models.DateField(null=True, blank=True, verbose_name="Ισχύει μέχρι")
 
-    file = models.FileField(upload_to="horse_documents/%Y/%m/", verbose_name="Αρχείο")
+    file = models.FileField(upload_to="horse_documents/%Y/%m/", storage=document_storage, verbose_name="Αρχείο")
     uploaded_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Καταχωρήθηκε")
 
     class Meta:
@@ -179,3 +312,242 @@ class HorseDocument(models.Model):
 
     def __str__(self):
         return f"{self.horse} - {self.get_document_type_display()}"
+
+
+# -----------------------------
+# Snapshot καταλληλότητας (registry/eligibility.py)
+# -----------------------------
+class AthleteEligibility(models.Model):
+    """
+    Προϋπολογισμένη καταλληλότητα αθλητή: από πότε / μέχρι πότε ισχύει κάθε
+    προϋπόθεση και το συνολικό διάστημα [eligible_from, eligible_until] που καλύπτει
+    σήμερα (αλλιώς το επόμενο / το τελευταίο). Όλα τα διαστήματα: AthleteEligibilityPeriod.
+    Ενημερώνεται αυτόματα (signals) ή με `manage.py rebuild_eligibility`.
+    """
+
+    class Requirement(models.TextChoices):
+        MEDICAL = "MEDICAL", "Ιατρική βεβαίωση"
+        LICENSE = "LICENSE", "Άδεια αθλητή"
+        SUBSCRIPTION = "SUBSCRIPTION", "Συνδρομή"
+
+    athlete = models.OneToOneField(
+        Athlete,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="eligibility",
+        verbose_name="Αθλητής",
+    )
+    medical_valid_from = models.DateField(null=True, blank=True, verbose_name="Ιατρική από")
+    medical_valid_until = models.DateField(null=True, blank=True, verbose_name="Ιατρική έως")
+    license_since = models.DateField(null=True, blank=True, verbose_name="Άδεια από")
+    subscription_valid_from = models.DateField(null=True, blank=True, verbose_name="Συνδρομή από")
+    subscription_valid_until = models.DateField(null=True, blank=True, verbose_name="Συνδρομή έως")
+
+    # συνολικό διάστημα (null = λείπει κάποια προϋπόθεση)
+    eligible_from = models.DateField(null=True, blank=True, verbose_name="Δικαίωμα συμμετοχής από")
+    eligible_until = models.DateField(null=True, blank=True, verbose_name="Δικαίωμα συμμετοχής έως")
+    # η προϋπόθεση που λείπει ή λήγει πρώτη
+    blocking_requirement = models.CharField(
+        max_length=20,
+        choices=Requirement.choices,
+        blank=True,
+        verbose_name="Λήγει πρώτη",
+    )
+    refreshed_at = models.DateTimeField(default=timezone.now, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Καταλληλότητα Αθλητή"
+        verbose_name_plural = "Καταλληλότητα Αθλητών"
+        indexes = [
+            # "ποιοι μπορούν να αγωνιστούν στις Χ" = range scan
+            models.Index(fields=["eligible_until", "eligible_from"], name="athlete_elig_range_idx"),
+        ]
+
+    @property
+    def blocked_from(self):
+        """Πρώτη ημέρα χωρίς δικαίωμα συμμετοχής."""
+        if self.eligible_until is None or self.eligible_until == date.max:
+            return None
+        return self.eligible_until + timedelta(days=1)
+
+    def __str__(self):
+        return f"{self.athlete_id}: {self.eligible_from or '-'} – {self.eligible_until or '-'}"
+
+
+class HorseEligibility(models.Model):
+    """Όπως το AthleteEligibility, για διαβατήριο και ιατρικό (εμβόλια) ίππου."""
+
+    class Requirement(models.TextChoices):
+        PASSPORT = "PASSPORT", "Διαβατήριο"
+        MEDICAL = "MEDICAL", "Ιατρικό"
+
+    horse = models.OneToOneField(
+        Horse,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="eligibility",
+        verbose_name="Ίππος",
+    )
+    passport_valid_from = models.DateField(null=True, blank=True, verbose_name="Διαβατήριο από")
+    passport_valid_until = models.DateField(null=True, blank=True, verbose_name="Διαβατήριο έως")
+    medical_valid_from = models.DateField(null=True, blank=True, verbose_name="Ιατρικό από")
+    medical_valid_until = models.DateField(null=True, blank=True, verbose_name="Ιατρικό έως")
+
+    eligible_from = models.DateField(null=True, blank=True, verbose_name="Δικαίωμα συμμετοχής από")
+    eligible_until = models.DateField(null=True, blank=True, verbose_name="Δικαίωμα συμμετοχής έως")
+    blocking_requirement = models.CharField(
+        max_length=20,
+        choices=Requirement.choices,
+        blank=True,
+        verbose_name="Λήγει πρώτη",
+    )
+    refreshed_at = models.DateTimeField(default=timezone.now, verbose_name="Ενημερώθηκε")
+
+    class Meta:
+        verbose_name = "Καταλληλότητα Ίππου"
+        verbose_name_plural = "Καταλληλότητα Ίππων"
+        indexes = [
+            models.Index(fields=["eligible_until", "eligible_from"], name="horse_elig_range_idx"),
+        ]
+
+    @property
+    def blocked_from(self):
+        if self.eligible_until is None or self.eligible_until == date.max:
+            return None
+        return self.eligible_until + timedelta(days=1)
+
+    def __str__(self):
+        return f"{self.horse_id}: {self.eligible_from or '-'} – {self.eligible_until or '-'}"
+
+
+class AthleteEligibilityPeriod(models.Model):
+    """
+    Όλα τα διαστήματα με δικαίωμα συμμετοχής (τομή ιατρικών, άδειας και συνδρομών), όχι
+    μόνο το τρέχον: "ποιοι μπορούσαν να αγωνιστούν στις Χ" και για παλιές ημερομηνίες.
+    """
+
+    athlete = models.ForeignKey(
+        Athlete,
+        on_delete=models.CASCADE,
+        related_name="eligibility_periods",
+        verbose_name="Αθλητής",
+    )
+    eligible_from = models.DateField(verbose_name="Από")
+    eligible_until = models.DateField(verbose_name="Έως")
+
+    class Meta:
+        verbose_name = "Διάστημα Καταλληλότητας Αθλητή"
+        verbose_name_plural = "Διαστήματα Καταλληλότητας Αθλητών"
+        ordering = ["athlete", "eligible_from"]
+        indexes = [
+            models.Index(fields=["eligible_until", "eligible_from"], name="athlete_period_range_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete_id}: {self.eligible_from} – {self.eligible_until}"
+
+
+class HorseEligibilityPeriod(models.Model):
+    horse = models.ForeignKey(
+        Horse,
+        on_delete=models.CASCADE,
+        related_name="eligibility_periods",
+        verbose_name="Ίππος",
+    )
+    eligible_from = models.DateField(verbose_name="Από")
+    eligible_until = models.DateField(verbose_name="Έως")
+
+    class Meta:
+        verbose_name = "Διάστημα Καταλληλότητας Ίππου"
+        verbose_name_plural = "Διαστήματα Καταλληλότητας Ίππων"
+        ordering = ["horse", "eligible_from"]
+        indexes = [
+            models.Index(fields=["eligible_until", "eligible_from"], name="horse_period_range_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.horse_id}: {self.eligible_from} – {self.eligible_until}"
+
+
+# -----------------------------
+# Πιθανά διπλότυπα αθλητών (registry/dedup.py)
+# -----------------------------
+class DuplicateCandidate(models.Model):
+    """Ζεύγος αθλητών που μοιάζουν με το ίδιο πρόσωπο (athlete.id < other.id)."""
+
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "Προς έλεγχο"
+        DISMISSED = "DISMISSED", "Διαφορετικά πρόσωπα"
+
+    athlete = models.ForeignKey(
+        Athlete,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="Αθλητής",
+    )
+    other = models.ForeignKey(
+        Athlete,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="Πιθανό διπλότυπο",
+    )
+    score = models.FloatField(verbose_name="Ομοιότητα")
+    reasons = models.CharField(max_length=255, blank=True, verbose_name="Κοινά στοιχεία")
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Κατάσταση",
+    )
+    found_at = models.DateTimeField(default=timezone.now, verbose_name="Εντοπίστηκε")
+    reviewed_at = models.DateTimeField(null=True, blank=True, verbose_name="Ελέγχθηκε")
+    reviewed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Ελέγχθηκε από",
+    )
+
+    class Meta:
+        verbose_name = "Πιθανό Διπλότυπο Αθλητή"
+        verbose_name_plural = "Πιθανά Διπλότυπα Αθλητών"
+        ordering = ["-score"]
+        constraints = [
+            models.UniqueConstraint(fields=["athlete", "other"], name="duplicate_unique_pair"),
+            models.CheckConstraint(condition=models.Q(athlete__lt=models.F("other")), name="duplicate_ordered_pair"),
+        ]
+        indexes = [
+            # η ουρά ελέγχου: PENDING με τη μεγαλύτερη ομοιότητα πρώτα
+            models.Index(fields=["status", "-score"], name="duplicate_queue_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete_id} ~ {self.other_id} ({self.score:.2f})"
+
+
+# -----------------------------
+# Αρχεία (registry/storage.py)
+# -----------------------------
+class StoredBlob(models.Model):
+    """Ένα αρχείο στον δίσκο, όσες εγγραφές κι αν το χρησιμοποιούν (refcount)."""
+
+    name = models.CharField(max_length=100, unique=True, verbose_name="Αρχείο")
+    sha256 = models.CharField(max_length=64, verbose_name="SHA-256")
+    size = models.PositiveBigIntegerField(verbose_name="Μέγεθος (bytes)")
+    refcount = models.PositiveIntegerField(default=0, verbose_name="Χρήσεις")
+    # τελευταίο upload με αυτό το περιεχόμενο: το gc_blobs δεν αγγίζει πρόσφατα
+    stored_at = models.DateTimeField(default=timezone.now, verbose_name="Τελευταία αποθήκευση")
+
+    class Meta:
+        verbose_name = "Αποθηκευμένο Αρχείο"
+        verbose_name_plural = "Αποθηκευμένα Αρχεία"
+        ordering = ["-stored_at"]
+        indexes = [
+            # υποψήφια για διαγραφή: refcount=0 και παλιά
+            models.Index(fields=["refcount", "stored_at"], name="blob_gc_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} (x{self.refcount})"
@@ -0,0 +1,218 @@
+"""
+Γενεαλογία ίππων: Horse.sire / Horse.dam + closure table HorseAncestry.
+
+Κάθε ίππος έχει μία γραμμή ανά πρόγονο και θέση (path "S", "D", "SD", ...),
+μέχρι MAX_GENERATIONS γενιές πίσω. Έτσι:
+
+    pedigree(horse, 5)      -> ένα query στο index (descendant, depth)
+    descendants_of(sire)    -> ένα query στο index (ancestor, depth)
+
+χωρίς αναδρομή σε Python ούτε recursive CTE.
+
+Ενημέρωση:
+- signals (registry/signals.py) -> schedule(): αλλαγή πατέρα / μητέρας ξαναϋπολογίζει
+  τον ίππο και όλους τους απογόνους του, μία φορά στο commit
+- import_pedigree: μαζική ενημέρωση και ένα refresh() στο τέλος
+- `manage.py rebuild_pedigree` για πλήρη αναδημιουργία
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from config.transactions import CommitQueue
+
+from .models import Horse, HorseAncestry
+
+# 8 γενιές = το πολύ 2 + 4 + ... + 256 = 510 γραμμές ανά ίππο
+MAX_GENERATIONS = 8
+PEDIGREE_GENERATIONS = 5
+
+BATCH_SIZE = 2000
+
+
+@dataclass
+class PedigreeStats:
+    horses: int = 0
+    rows: int = 0
+    # (ίππος, "S" | "D"): γονέας που θα έκλεινε κύκλο, αγνοήθηκε
+    cycles: list[tuple[int, str]] = field(default_factory=list)
+
+
+# -----------------------------
+# υπολογισμός
+# -----------------------------
+def _closures(parents: dict[int, tuple[int | None, int | None]], external: dict[int, list[tuple[int, str]]], stats):
+    """
+    parents: {ίππος: (sire_id, dam_id)} για όσους ξαναϋπολογίζονται.
+    external: έτοιμοι πρόγονοι (από τη βάση) για γονείς εκτός του parents.
+    Επιστρέφει {ίππος: [(πρόγονος, path)]}.
+    """
+    done: dict[int, list[tuple[int, str]]] = {}
+    visiting: set[int] = set()
+
+    def closure(horse_id: int) -> list[tuple[int, str]]:
+        if horse_id in done:
+            return done[horse_id]
+        visiting.add(horse_id)
+        rows = []
+        for letter, parent_id in zip("SD", parents[horse_id]):
+            if parent_id is None:
+                continue
+            if parent_id in parents:
+                if parent_id in visiting:
+                    stats.cycles.append((horse_id, letter))
+                    continue
+                upper = closure(parent_id)
+            else:
+                upper = external.get(parent_id, ())
+            rows.append((parent_id, letter))
+            rows.extend((a, letter + path) for a, path in upper if len(path) < MAX_GENERATIONS)
+        visiting.discard(horse_id)
+        done[horse_id] = rows
+        return rows
+
+    for horse_id in parents:
+        closure(horse_id)
+    return done
+
+
+def _write(closures: dict[int, list[tuple[int, str]]], stats: PedigreeStats) -> None:
+    objs = [
+        HorseAncestry(descendant_id=horse_id, ancestor_id=ancestor_id, depth=len(path), path=path)
+        for horse_id, rows in closures.items()
+        for ancestor_id, path in rows
+    ]
+    HorseAncestry.objects.bulk_create(objs, batch_size=BATCH_SIZE)
+    stats.horses += len(closures)
+    stats.rows += len(objs)
+
+
+def _changed(horse_ids: set[int]) -> set[int]:
+    """Μόνο όσοι έχουν άλλους γονείς από αυτούς που γράφει η closure table."""
+    stored = defaultdict(lambda: [None, None])
+    for horse_id, ancestor_id, path in HorseAncestry.objects.filter(
+        descendant_id__in=horse_ids, depth=1
+    ).values_list("descendant_id", "ancestor_id", "path"):
+        stored[horse_id]["SD".index(path)] = ancestor_id
+    return {
+        pk
+        for pk, sire_id, dam_id in Horse.objects.filter(pk__in=horse_ids).values_list("pk", "sire_id", "dam_id")
+        if stored[pk] != [sire_id, dam_id]
+    }
+
+
+def refresh(horse_ids, only_changed: bool = True) -> PedigreeStats:
+    """
+    Ξαναϋπολογίζει τους ίππους και όλους τους απογόνους τους.
+    only_changed: παράλειψε όσους δεν άλλαξαν γονείς (π.χ. αποθήκευση μόνο του ονόματος).
+    """
+    stats = PedigreeStats()
+    roots = set(horse_ids)
+    if only_changed and roots:
+        roots = _changed(roots)
+    if not roots:
+        return stats
+
+    with transaction.atomic():
+        affected = roots | set(
+            HorseAncestry.objects.filter(ancestor_id__in=roots).values_list("descendant_id", flat=True).distinct()
+        )
+        parents = {
+            pk: (sire_id, dam_id)
+            for pk, sire_id, dam_id in Horse.objects.filter(pk__in=affected).values_list("pk", "sire_id", "dam_id")
+        }
+        outside = {p for pair in parents.values() for p in pair if p is not None and p not in parents}
+        external = defaultdict(list)
+        for horse_id, ancestor_id, path in HorseAncestry.objects.filter(
+            descendant_id__in=outside, depth__lt=MAX_GENERATIONS
+        ).values_list("descendant_id", "ancestor_id", "path"):
+            external[horse_id].append((ancestor_id, path))
+
+        closures = _closures(parents, external, stats)
+        HorseAncestry.objects.filter(descendant_id__in=affected).delete()
+        _write(closures, stats)
+    return stats
+
+
+def rebuild_all() -> PedigreeStats:
+    stats = PedigreeStats()
+    with transaction.atomic():
+        parents = {pk: (sire_id, dam_id) for pk, sire_id, dam_id in Horse.objects.values_list("pk", "sire_id", "dam_id")}
+        closures = _closures(parents, {}, stats)
+        HorseAncestry.objects.all().delete()
+        _write(closures, stats)
+    return stats
+
+
+# -----------------------------
+# incremental ενημέρωση στο commit
+# -----------------------------
+def _process(horses=(), forced=()) -> None:
+    if set(horses) - set(forced):
+        refresh(set(horses) - set(forced))
+    if forced:
+        refresh(forced, only_changed=False)
+
+
+# όσες αλλαγές κι αν γίνουν σε μια συναλλαγή, ένας υπολογισμός στο commit
+_pending = CommitQueue("pedigree", _process)
+
+
+def schedule(horse_ids, force: bool = False) -> None:
+    """force: ξαναϋπολογισμός ακόμη κι αν δεν φαίνεται αλλαγή γονέων (π.χ. διαγραφή προγόνου)."""
+    horse_ids = set(horse_ids)
+    _pending.add(horses=horse_ids, forced=horse_ids if force else ())
+
+
+# -----------------------------
+# queries
+# -----------------------------
+def is_descendant(horse_id: int, ancestor_id: int) -> bool:
+    return HorseAncestry.objects.filter(descendant_id=horse_id, ancestor_id=ancestor_id).exists()
+
+
+def descendants_of(horse_id: int, generations: int | None = None):
+    """Horse queryset με όλους τους απογόνους (ένα query, index (ancestor, depth))."""
+    links = HorseAncestry.objects.filter(ancestor_id=horse_id)
+    if generations is not None:
+        links = links.filter(depth__lte=generations)
+    return Horse.objects.filter(pk__in=links.values("descendant_id"))
+
+
+_SIRE_FIRST = str.maketrans("SD", "01")
+
+
+def _name_slot(name: str) -> dict:
+    return {"id": None, "registry_number": "", "name": name}
+
+
+def pedigree(horse: Horse, generations: int = PEDIGREE_GENERATIONS) -> dict[str, dict]:
+    """
+    {path: {"id", "registry_number", "name"}} για τις θέσεις που είναι γνωστές.
+    Ένα query. Πρόγονοι εκτός μητρώου συμπληρώνονται από τα sire_name / dam_name /
+    dam_sire_name του πλησιέστερου καταχωρημένου απογόνου τους.
+    """
+    generations = max(1, min(generations, MAX_GENERATIONS))
+    grid: dict[str, dict] = {}
+    named: list[tuple[str, str, str, str]] = [("", horse.sire_name, horse.dam_name, horse.dam_sire_name)]
+    for path, pk, number, name, sire_name, dam_name, dam_sire_name in (
+        HorseAncestry.objects.filter(descendant_id=horse.pk, depth__lte=generations)
+        .order_by()
+        .values_list(
+            "path", "ancestor_id", "ancestor__registry_number", "ancestor__name",
+            "ancestor__sire_name", "ancestor__dam_name", "ancestor__dam_sire_name",
+        )
+    ):
+        grid[path] = {"id": pk, "registry_number": number, "name": name}
+        named.append((path, sire_name, dam_name, dam_sire_name))
+
+    for path, sire_name, dam_name, dam_sire_name in named:
+        for suffix, name in (("S", sire_name), ("D", dam_name), ("DS", dam_sire_name)):
+            slot = path + suffix
+            if name and len(slot) <= generations and slot not in grid:
+                grid[slot] = _name_slot(name)
+    # πατέρας πριν από μητέρα σε κάθε γενιά, όπως στο χαρτί
+    return dict(sorted(grid.items(), key=lambda item: (len(item[0]), item[0].translate(_SIRE_FIRST))))
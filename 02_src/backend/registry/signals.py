@@ -0,0 +1,78 @@
+"""Ενημέρωση του snapshot καταλληλότητας (registry/eligibility.py) όταν αλλάζουν τα δεδομένα του."""
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import pedigree, storage
+from .eligibility import schedule_athletes, schedule_horses
+from .models import Athlete, AthleteDocument, AthleteMedicalCertificate, AthleteSubscription, Horse, HorseDocument
+
+
+@receiver(post_save, sender=Athlete)
+def _athlete_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or "athlete_license_date" in update_fields:
+        schedule_athletes([instance.pk])
+
+
+@receiver(post_save, sender=AthleteMedicalCertificate)
+@receiver(post_delete, sender=AthleteMedicalCertificate)
+@receiver(post_save, sender=AthleteSubscription)
+@receiver(post_delete, sender=AthleteSubscription)
+def _athlete_requirement_changed(sender, instance, **kwargs):
+    schedule_athletes([instance.athlete_id])
+
+
+@receiver(post_save, sender=Horse)
+def _horse_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        schedule_horses([instance.pk])
+    if update_fields is None or {"sire", "dam"} & set(update_fields):
+        if instance.sire_id is not None or instance.dam_id is not None or not created:
+            pedigree.schedule([instance.pk])
+
+
+@receiver(pre_delete, sender=Horse)
+def _horse_deleting(sender, instance, **kwargs):
+    # τα παιδιά χάνουν τον γονέα (SET_NULL χωρίς signals) και οι απόγονοι προγόνους μέσω αυτού
+    children = list(Horse.objects.filter(Q(sire=instance) | Q(dam=instance)).values_list("pk", flat=True))
+    if children:
+        pedigree.schedule(children, force=True)
+
+
+@receiver(post_save, sender=HorseDocument)
+@receiver(post_delete, sender=HorseDocument)
+def _horse_requirement_changed(sender, instance, **kwargs):
+    schedule_horses([instance.horse_id])
+
+
+# -----------------------------
+# refcount των αρχείων (registry/storage.py), στην ίδια συναλλαγή με την εγγραφή
+# -----------------------------
+@receiver(pre_save, sender=AthleteDocument)
+@receiver(pre_save, sender=AthleteMedicalCertificate)
+@receiver(pre_save, sender=HorseDocument)
+def _document_saving(sender, instance, update_fields=None, **kwargs):
+    instance._stored_file = None
+    if instance._state.adding or (update_fields is not None and "file" not in update_fields):
+        return
+    instance._stored_file = sender._base_manager.filter(pk=instance.pk).values_list("file", flat=True).first()
+
+
+@receiver(post_save, sender=AthleteDocument)
+@receiver(post_save, sender=AthleteMedicalCertificate)
+@receiver(post_save, sender=HorseDocument)
+def _document_saved(sender, instance, created, update_fields=None, **kwargs):
+    if not created and update_fields is not None and "file" not in update_fields:
+        return
+    old = getattr(instance, "_stored_file", None)
+    new = instance.file.name
+    if created or old != new:
+        storage.acquire([new])
+        storage.release([old])
+
+
+@receiver(post_delete, sender=AthleteDocument)
+@receiver(post_delete, sender=AthleteMedicalCertificate)
+@receiver(post_delete, sender=HorseDocument)
+def _document_deleted(sender, instance, **kwargs):
+    storage.release([instance.file.name])
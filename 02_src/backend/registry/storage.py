@@ -0,0 +1,234 @@
+"""
+Content-addressed αποθήκευση εγγράφων (STORAGES["documents"]).
+
+    BlobStorage                -> FileField(storage=models.document_storage): όνομα = SHA-256 του περιεχομένου
+    acquire(names) / release() -> refcount του StoredBlob (signals του registry, στην ίδια συναλλαγή)
+    recount()                  -> refcount από την αρχή, από τα FileField που χρησιμοποιούν το BlobStorage
+    collect(grace)             -> διαγραφή όσων δεν χρησιμοποιούνται (manage.py gc_blobs)
+
+Το upload γράφεται σε προσωρινό αρχείο και υπολογίζεται το hash ταυτόχρονα (ένα πέρασμα,
+σε chunks)· αν το ίδιο περιεχόμενο υπάρχει ήδη, το προσωρινό πετιέται και η εγγραφή δείχνει
+στο υπάρχον αρχείο. Ο δίσκος μεγαλώνει με τα μοναδικά έγγραφα, όχι με τα uploads.
+
+Τα αρχεία δεν σβήνονται ποτέ από delete() (μπορεί να τα χρησιμοποιεί κι άλλη εγγραφή), μόνο
+από το collect() όταν refcount=0 και δεν έχουν ξαναγίνει upload εδώ και `grace`.
+Παλιά αρχεία (φάκελοι με ημερομηνία) δεν έχουν StoredBlob και μένουν ως έχουν.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+from collections import Counter
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import transaction
+from django.db.models import Count, F, FileField, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+PREFIX = "blobs/"
+INCOMING = "blobs/.incoming"
+GRACE = timedelta(hours=24)
+CHUNK_SIZE = 1000
+FILE_MODE = 0o644
+
+_EXTENSION = re.compile(r"^\.[a-z0-9]{1,10}$")
+
+
+def blob_name(digest: str, original: str) -> str:
+    """"ab12…", "scan.PDF" -> "blobs/ab/12/ab12….pdf" (η κατάληξη μένει για Content-Type)."""
+    ext = os.path.splitext(original)[1].lower()
+    return f"{PREFIX}{digest[:2]}/{digest[2:4]}/{digest}{ext if _EXTENSION.match(ext) else ''}"
+
+
+class BlobStorage(FileSystemStorage):
+    def get_available_name(self, name, max_length=None):
+        # το τελικό όνομα το δίνει το περιεχόμενο (_save), όχι το upload_to
+        return name
+
+    def _save(self, name, content):
+        from .models import StoredBlob
+
+        incoming = self.path(INCOMING)
+        os.makedirs(incoming, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=incoming)
+        try:
+            digest = hashlib.sha256()
+            size = 0
+            with os.fdopen(fd, "wb") as out:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            sha256 = digest.hexdigest()
+            blob = blob_name(sha256, name)
+
+            # πρώτα η γραμμή (κλειδώνει απέναντι στο collect()), μετά ο έλεγχος στον δίσκο
+            StoredBlob.objects.bulk_create(
+                [StoredBlob(name=blob, sha256=sha256, size=size)],
+                update_conflicts=True,
+                unique_fields=["name"],
+                update_fields=["stored_at"],
+            )
+            target = self.path(blob)
+            if os.path.exists(target):
+                os.remove(tmp_path)
+                os.utime(target)  # νέο mtime: δεν είναι "παλιό ορφανό" για το collect()
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.chmod(tmp_path, self.file_permissions_mode if self.file_permissions_mode is not None else FILE_MODE)
+                os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return blob
+
+    def delete(self, name):
+        # κοινόχρηστα αρχεία: σβήνονται μόνο από το collect()
+        pass
+
+    def unlink(self, name) -> None:
+        super().delete(name)
+
+
+# -----------------------------
+# refcount
+# -----------------------------
+def _adjust(names, delta: int) -> None:
+    from .models import StoredBlob
+
+    counts = Counter(name for name in names if name and name.startswith(PREFIX))
+    for name, n in counts.items():
+        StoredBlob.objects.filter(name=name).update(refcount=Greatest(F("refcount") + delta * n, Value(0)))
+
+
+def acquire(names) -> None:
+    _adjust(names, 1)
+
+
+def release(names) -> None:
+    _adjust(names, -1)
+
+
+def references() -> list[tuple[type, str]]:
+    """(μοντέλο, πεδίο) για κάθε FileField με BlobStorage."""
+    return [
+        (model, f.name)
+        for model in apps.get_models()
+        for f in model._meta.concrete_fields
+        if isinstance(f, FileField) and isinstance(f.storage, BlobStorage)
+    ]
+
+
+def recount() -> int:
+    """Διορθώνει το refcount από τις εγγραφές (π.χ. μετά από bulk εισαγωγές). -> πόσα άλλαξαν."""
+    from .models import StoredBlob
+
+    used = Counter()
+    for model, field in references():
+        rows = (
+            model._base_manager.filter(**{f"{field}__startswith": PREFIX})
+            .order_by().values_list(field).annotate(n=Count("pk"))
+        )
+        used.update(dict(rows.iterator()))
+    changed = []
+    with transaction.atomic():
+        for blob in StoredBlob.objects.select_for_update().only("pk", "name", "refcount").iterator(chunk_size=CHUNK_SIZE):
+            if blob.refcount != used.get(blob.name, 0):
+                blob.refcount = used.get(blob.name, 0)
+                changed.append(blob)
+        StoredBlob.objects.bulk_update(changed, ["refcount"], batch_size=CHUNK_SIZE)
+    return len(changed)
+
+
+# -----------------------------
+# garbage collection
+# -----------------------------
+@dataclass
+class Stats:
+    blobs: int = 0
+    bytes: int = 0
+    orphans: int = 0
+    incoming: int = 0
+
+
+def _unused(storage: BlobStorage, cutoff, dry_run: bool, stats: Stats) -> None:
+    from .models import StoredBlob
+
+    candidates = StoredBlob.objects.filter(refcount=0, stored_at__lt=cutoff).order_by("pk")
+    last = 0
+    while True:
+        with transaction.atomic():
+            # skip_locked: ό,τι ξαναγίνεται upload αυτή τη στιγμή μένει για την επόμενη φορά
+            batch = list(
+                candidates.filter(pk__gt=last).select_for_update(skip_locked=True)
+                .values_list("pk", "name", "size")[:CHUNK_SIZE]
+            )
+            if not batch:
+                return
+            last = batch[-1][0]
+            stats.blobs += len(batch)
+            stats.bytes += sum(size for _, _, size in batch)
+            if dry_run:
+                continue
+            for _, name, _ in batch:
+                storage.unlink(name)
+            StoredBlob.objects.filter(pk__in=[pk for pk, _, _ in batch]).delete()
+
+
+def _orphans(storage: BlobStorage, cutoff, dry_run: bool, stats: Stats) -> None:
+    """Αρχεία στο blobs/ χωρίς StoredBlob (π.χ. upload που έγινε rollback)."""
+    from .models import StoredBlob
+
+    root = storage.path(PREFIX)
+    incoming = storage.path(INCOMING)
+    oldest = cutoff.timestamp()
+
+    def sweep(paths: dict[str, str]) -> None:
+        known = set(StoredBlob.objects.filter(name__in=paths).values_list("name", flat=True))
+        for name, path in paths.items():
+            if name not in known:
+                stats.orphans += 1
+                stats.bytes += os.path.getsize(path)
+                if not dry_run:
+                    os.remove(path)
+
+    batch = {}
+    for directory, dirs, files in os.walk(root):
+        if os.path.abspath(directory) == os.path.abspath(incoming):
+            for filename in files:
+                path = os.path.join(directory, filename)
+                if os.path.getmtime(path) < oldest:
+                    stats.incoming += 1
+                    if not dry_run:
+                        os.remove(path)
+            continue
+        for filename in files:
+            path = os.path.join(directory, filename)
+            if os.path.getmtime(path) >= oldest:
+                continue
+            batch[os.path.relpath(path, storage.location).replace(os.sep, "/")] = path
+            if len(batch) >= CHUNK_SIZE:
+                sweep(batch)
+                batch = {}
+    if batch:
+        sweep(batch)
+
+
+def collect(grace: timedelta = GRACE, dry_run: bool = False) -> Stats:
+    """Σβήνει blobs με refcount=0 και αρχεία χωρίς StoredBlob, παλαιότερα από `grace`."""
+    storage = storages["documents"]
+    cutoff = timezone.now() - grace
+    stats = Stats()
+    _unused(storage, cutoff, dry_run, stats)
+    if os.path.isdir(storage.path(PREFIX)):
+        _orphans(storage, cutoff, dry_run, stats)
+    return stats
@@ -1,3 +1,383 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import User
+from config.testing import QueryBudgetMixin
+
+from finance.ledger import post
+from finance.models import AthleteBalance, LedgerEntry
+
+from . import merge, storage
+from .downloads import parse_range, url_for
+from .dedup import name_key, scan
+from .eligibility import eligible_on, refresh_athletes, schedule_athletes
+from .models import (
+    Athlete, AthleteDocument, AthleteMedicalCertificate, AthleteSubscription, DuplicateCandidate, Horse, StoredBlob,
+)
+from .pedigree import MAX_GENERATIONS
+
+
+class AthleteChangelistBudgetTests(QueryBudgetMixin, TestCase):
+    """Το budget του changelist (settings.PERF_BUDGETS) δεν εξαρτάται από το πλήθος των αθλητών."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=300, horses=50, competitions=2, clubs=10, stdout=StringIO())
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "pw", login_code="admin")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_changelist_within_budget(self):
+        response = self.client.get(reverse("admin:registry_athlete_changelist"))
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinBudget(response, "admin:registry_athlete_changelist")
+
+    def test_search_within_budget(self):
+        response = self.client.get(reverse("admin:registry_athlete_changelist"), {"q": "SYN"})
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinBudget(response, "admin:registry_athlete_changelist")
+        self.assertNoDuplicateQueries(response)
+
+
+class ApiLimitTests(TestCase):
+    """Μη θετικό ?limit= κόβεται στο 1 (όπως στο history.timeline), όχι 500."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("generate_synthetic_data", athletes=20, horses=10, competitions=1, clubs=2, stdout=StringIO())
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "pw", login_code="admin")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_eligible_list_clamps_limit(self):
+        for limit in ("0", "-1"):
+            response = self.client.get(reverse("registry:eligible_athletes"), {"limit": limit})
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.json()["results"]), 1)
+
+    def test_descendants_clamps_limit(self):
+        horse = Horse.objects.first()
+        for limit in ("0", "-1"):
+            response = self.client.get(reverse("registry:horse_descendants", args=[horse.pk]), {"limit": limit})
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.json()["results"]), 1)
+
+    def test_pedigree_reports_clamped_generations(self):
+        horse = Horse.objects.first()
+        for generations, expected in (("-3", 1), ("0", 1), ("99", MAX_GENERATIONS)):
+            response = self.client.get(
+                reverse("registry:horse_pedigree", args=[horse.pk]), {"generations": generations}
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["generations"], expected)
+
+
+class EligibilityPeriodTests(TestCase):
+    """Όλα τα διαστήματα μετράνε, όχι μόνο το τελευταίο (registry/eligibility.py)."""
+
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.athlete = Athlete.objects.create(last_name="Test", athlete_license_date=date(2020, 1, 1))
+
+    def _period(self, start, end, season):
+        AthleteMedicalCertificate.objects.create(athlete=self.athlete, issued_date=start, valid_until=end, file="x.pdf")
+        AthleteSubscription.objects.create(
+            athlete=self.athlete, season=season, valid_from=start, valid_until=end,
+            status=AthleteSubscription.Status.PAID,
+        )
+
+    def _eligible(self, on_date) -> bool:
+        return eligible_on(Athlete.objects.filter(pk=self.athlete.pk), on_date).exists()
+
+    def test_past_span_is_kept(self):
+        self._period(date(2024, 1, 1), date(2024, 12, 31), 2024)
+        self._period(date(2026, 1, 1), date(2026, 12, 31), 2026)
+        refresh_athletes([self.athlete.pk])
+        self.assertTrue(self._eligible(date(2024, 6, 1)))
+        self.assertFalse(self._eligible(date(2025, 6, 1)))
+        self.assertTrue(self._eligible(date(2026, 6, 1)))
+
+    def test_future_span_does_not_hide_current(self):
+        self._period(self.today - timedelta(days=10), self.today + timedelta(days=100), self.today.year)
+        self._period(self.today + timedelta(days=200), self.today + timedelta(days=400), self.today.year + 1)
+        refresh_athletes([self.athlete.pk])
+        self.assertTrue(self._eligible(self.today))
+        self.assertFalse(self._eligible(self.today + timedelta(days=150)))
+        self.assertEqual(self.athlete.eligibility.eligible_until, self.today + timedelta(days=100))
+
+    def test_rolled_back_savepoint_keeps_queue(self):
+        # το callback του savepoint χάνεται στο rollback· το επόμενο schedule γράφει δικό του
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    schedule_athletes([self.athlete.pk])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self._period(self.today - timedelta(days=10), self.today + timedelta(days=100), self.today.year)
+        self.assertTrue(self._eligible(self.today))
+
+
+class MergeTests(TestCase):
+    def setUp(self):
+        self.survivor = Athlete.objects.create(last_name="Παπαδόπουλος")
+        self.duplicate = Athlete.objects.create(last_name="Παπαδοπουλος")
+
+    def _subscription(self, athlete, season, amount):
+        subscription = AthleteSubscription.objects.create(
+            athlete=athlete, season=season, valid_from=date(season, 1, 1), valid_until=date(season, 12, 31), amount=amount,
+        )
+        post([LedgerEntry(
+            kind=LedgerEntry.Kind.SUBSCRIPTION, athlete=athlete, season=season, date=date(season, 1, 1),
+            amount=amount, subscription=subscription,
+        )])
+        return subscription
+
+    def test_same_season_subscription_keeps_survivor(self):
+        kept = self._subscription(self.survivor, 2026, Decimal("50.00"))
+        dropped = self._subscription(self.duplicate, 2026, Decimal("40.00"))
+        self.assertFalse(merge.plan(self.survivor, self.duplicate).errors)
+
+        merge.merge(self.survivor, self.duplicate)
+        self.assertEqual(list(AthleteSubscription.objects.filter(athlete=self.survivor)), [kept])
+        self.assertFalse(AthleteSubscription.objects.filter(pk=dropped.pk).exists())
+        balance = AthleteBalance.objects.get(athlete=self.survivor, season=2026)
+        self.assertEqual(balance.balance, Decimal("50.00"))
+
+    def test_rows_added_after_plan_are_moved(self):
+        self.assertEqual(merge.plan(self.survivor, self.duplicate).rows, 0)
+        added = self._subscription(self.duplicate, 2025, Decimal("40.00"))
+
+        result = merge.merge(self.survivor, self.duplicate)
+        added.refresh_from_db()
+        self.assertEqual(added.athlete, self.survivor)
+        self.assertEqual(result.counts()[merge.Relation(AthleteSubscription, "athlete").label], 1)
+
+
+class NameKeyTests(SimpleTestCase):
+    def test_greek_and_greeklish_agree(self):
+        for names in (("Χρήστος", "Christos", "Hristos"), ("Παπαδόπουλος", "Papadopoulos"), ("Γεώργιος", "Georgios")):
+            with self.subTest(names=names):
+                self.assertEqual(len({name_key(n) for n in names}), 1)
+        self.assertNotEqual(name_key("Μαρία"), name_key("Ελένη"))
+
+
+class DuplicateScanTests(TestCase):
+    """Υποψήφια διπλότυπα με blocking και Jaro-Winkler (registry/dedup.py)."""
+
+    def setUp(self):
+        born = date(2005, 3, 14)
+        self.greek = Athlete.objects.create(last_name="Παπαδόπουλος", first_name="Χρήστος", birth_date=born)
+        self.latin = Athlete.objects.create(last_name="Papadopoulos", first_name="Christos", birth_date=born)
+        # δίδυμος: ίδιο επώνυμο και ημ. γέννησης, άλλο όνομα
+        self.twin = Athlete.objects.create(last_name="Παπαδόπουλος", first_name="Νικόλαος", birth_date=born)
+
+    def _pairs(self) -> set[tuple[int, int]]:
+        return set(DuplicateCandidate.objects.values_list("athlete_id", "other_id"))
+
+    def test_finds_transliterated_duplicate(self):
+        stats = scan()
+        self.assertEqual(self._pairs(), {(self.greek.pk, self.latin.pk)})
+        self.assertEqual(stats.candidates, 1)
+        self.assertGreaterEqual(DuplicateCandidate.objects.get().score, 0.85)
+
+    def test_swapped_names(self):
+        swapped = Athlete.objects.create(last_name="Christos", first_name="Papadopoulos", birth_date=date(2005, 3, 14))
+        scan()
+        candidate = DuplicateCandidate.objects.get(other=swapped, athlete=self.greek)
+        self.assertIn("ανάποδα", candidate.reasons)
+
+    def test_different_amka_is_not_a_duplicate(self):
+        Athlete.objects.filter(pk=self.greek.pk).update(amka="14030512345")
+        Athlete.objects.filter(pk=self.latin.pk).update(amka="14030554321")
+        scan()
+        self.assertEqual(self._pairs(), set())
+
+    def test_dismissed_pair_stays_dismissed(self):
+        scan()
+        DuplicateCandidate.objects.update(status=DuplicateCandidate.Status.DISMISSED)
+        scan()
+        self.assertEqual(DuplicateCandidate.objects.get().status, DuplicateCandidate.Status.DISMISSED)
+
+    def test_since_limits_to_recent_changes(self):
+        later = timezone.now() + timedelta(minutes=1)
+        self.assertEqual(scan(since=later).candidates, 0)
+        self.assertEqual(scan(since=timezone.now() - timedelta(minutes=1)).candidates, 1)
+
+
+class BlobStorageTests(TestCase):
+    """Ένα αρχείο ανά περιεχόμενο, refcount και gc (registry/storage.py)."""
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.storage = AthleteDocument._meta.get_field("file").storage
+        self.athlete = Athlete.objects.create(last_name="Blob")
+
+    def _upload(self, content=b"%PDF-1.4 scan", name="scan.PDF") -> AthleteDocument:
+        return AthleteDocument.objects.create(athlete=self.athlete, file=ContentFile(content, name=name))
+
+    def _blob(self, document) -> StoredBlob:
+        return StoredBlob.objects.get(name=document.file.name)
+
+    def test_same_content_is_stored_once(self):
+        first, second = self._upload(), self._upload(name="again.pdf")
+        self.assertEqual(first.file.name, second.file.name)
+        self.assertTrue(first.file.name.startswith(storage.PREFIX) and first.file.name.endswith(".pdf"))
+        self.assertEqual(self._blob(first).refcount, 2)
+        other = self._upload(b"other")
+        self.assertNotEqual(other.file.name, first.file.name)
+        self.assertEqual(StoredBlob.objects.count(), 2)
+
+    def test_refcount_follows_delete_and_replace(self):
+        first, second = self._upload(), self._upload()
+        name = first.file.name
+        first.delete()
+        self.assertEqual(StoredBlob.objects.get(name=name).refcount, 1)
+        second.file = ContentFile(b"new version", name="scan.pdf")
+        second.save()
+        self.assertEqual(StoredBlob.objects.get(name=name).refcount, 0)
+        self.assertEqual(self._blob(second).refcount, 1)
+        # κοινόχρηστο: το delete() δεν σβήνει από τον δίσκο
+        self.assertTrue(self.storage.exists(name))
+
+    def test_collect_removes_unused_after_grace(self):
+        document = self._upload()
+        name = document.file.name
+        document.delete()
+        self.assertEqual(storage.collect().blobs, 0)  # μέσα στο grace
+        self.assertEqual(storage.collect(grace=timedelta(0), dry_run=True).blobs, 1)
+        self.assertTrue(self.storage.exists(name))
+
+        stats = storage.collect(grace=timedelta(0))
+        self.assertEqual((stats.blobs, stats.bytes), (1, len(b"%PDF-1.4 scan")))
+        self.assertFalse(self.storage.exists(name))
+        self.assertFalse(StoredBlob.objects.filter(name=name).exists())
+
+    def test_collect_keeps_used_and_removes_orphans(self):
+        kept = self._upload()
+        orphan = f"{storage.PREFIX}00/00/{'0' * 64}.pdf"
+        # π.χ. upload που έγινε rollback: αρχείο χωρίς StoredBlob
+        os.makedirs(os.path.dirname(self.storage.path(orphan)))
+        with open(self.storage.path(orphan), "wb") as f:
+            f.write(b"orphan")
+        old = (timezone.now() - timedelta(days=2)).timestamp()
+        for name in (kept.file.name, orphan):
+            os.utime(self.storage.path(name), (old, old))
+
+        stats = storage.collect()
+        self.assertEqual((stats.blobs, stats.orphans), (0, 1))
+        self.assertTrue(self.storage.exists(kept.file.name))
+        self.assertFalse(self.storage.exists(orphan))
+
+    def test_recount(self):
+        document = self._upload()
+        StoredBlob.objects.update(refcount=5)
+        self.assertEqual(storage.recount(), 1)
+        self.assertEqual(self._blob(document).refcount, 1)
+        self.assertEqual(storage.recount(), 0)
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_ranges(self):
+        cases = {
+            "bytes=0-99": (0, 99),
+            "bytes=100-": (100, 999),
+            "bytes=-200": (800, 999),
+            "bytes=900-5000": (900, 999),
+            "bytes=-5000": (0, 999),
+            "bytes=0-9,20-29": None,  # πολλά διαστήματα: όλο το αρχείο
+            "bytes=50-10": None,
+            "items=0-9": None,
+            None: None,
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, 1000), expected)
+
+    def test_unsatisfiable(self):
+        for header in ("bytes=1000-", "bytes=-0"):
+            with self.subTest(header=header), self.assertRaises(ValueError):
+                parse_range(header, 1000)
+
+
+class DocumentDownloadTests(TestCase):
+    """Range / 304 / X-Accel-Redirect στη λήψη εγγράφων (registry/downloads.py)."""
+
+    CONTENT = bytes(range(256)) * 4
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media, EOI_SENDFILE=None)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        athlete = Athlete.objects.create(last_name="Download")
+        self.document = AthleteDocument.objects.create(athlete=athlete, file=ContentFile(self.CONTENT, name="scan.pdf"))
+        self.url = url_for(self.document)
+        user = User.objects.create_superuser("admin", "admin@example.com", "pw", login_code="admin")
+        self.client.force_login(user)
+
+    def _get(self, **headers):
+        return self.client.get(self.url, headers=headers)
+
+    def test_full_file(self):
+        response = self._get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.CONTENT)
+        self.assertEqual(response["Content-Length"], str(len(self.CONTENT)))
+        # blobs: ETag = το SHA-256 του περιεχομένου
+        self.assertEqual(response["ETag"], f'"{StoredBlob.objects.get().sha256}"')
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_range(self):
+        response = self._get(Range="bytes=10-19")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), self.CONTENT[10:20])
+        self.assertEqual(response["Content-Range"], f"bytes 10-19/{len(self.CONTENT)}")
+        self.assertEqual(response["Content-Length"], "10")
+
+        response = self._get(Range=f"bytes={len(self.CONTENT)}-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(self.CONTENT)}")
+
+    def test_if_range_with_stale_etag_sends_everything(self):
+        response = self._get(Range="bytes=10-19", **{"If-Range": '"stale"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.CONTENT)
+
+    def test_not_modified(self):
+        etag = self._get()["ETag"]
+        response = self._get(**{"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(self._get(**{"If-None-Match": '"other"'}).status_code, 200)
+
+    def test_nginx_sends_headers_only(self):
+        with override_settings(EOI_SENDFILE="nginx"):
+            response = self.client.get(self.url, {"download": "1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["X-Accel-Redirect"], "/protected-media/" + self.document.file.name)
+        self.assertTrue(response["Content-Disposition"].startswith("attachment"))
+
+    def test_requires_login(self):
+        self.client.logout()
+        self.assertEqual(self._get().status_code, 401)
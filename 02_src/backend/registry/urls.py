@@ -0,0 +1,17 @@
+from django.urls import path
+
+from . import views
+
+app_name = "registry"
+
+urlpatterns = [
+    path("athletes/eligible/", views.eligible_athletes, name="eligible_athletes"),
+    path("horses/eligible/", views.eligible_horses, name="eligible_horses"),
+    path("athletes/<int:pk>/history/", views.athlete_history, name="athlete_history"),
+    path("horses/<int:pk>/history/", views.horse_history, name="horse_history"),
+    path("athletes/<int:pk>/horses/", views.athlete_horses, name="athlete_horses"),
+    path("horses/<int:pk>/riders/", views.horse_riders, name="horse_riders"),
+    path("horses/<int:pk>/pedigree/", views.horse_pedigree, name="horse_pedigree"),
+    path("horses/<int:pk>/descendants/", views.horse_descendants, name="horse_descendants"),
+    path("documents/<slug:kind>/<int:pk>/", views.document_download, name="document_download"),
+]
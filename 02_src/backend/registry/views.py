@@ -1,3 +1,219 @@
-from django.shortcuts import render
+from datetime import date
 
-# Create your views here.
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET, require_safe
+
+from accounts.scoping import get_scope
+from competitions.history import parse_cursor, timeline
+from competitions.models import AthleteSeasonStats, CompetitionRecord, HorseSeasonStats
+from competitions.partnerships import riders_of, usual_horses
+
+from .downloads import DOCUMENTS, download_name, serve
+from .eligibility import eligible_on, eligible_until_on
+from .models import Athlete, Horse
+from .pedigree import MAX_GENERATIONS, PEDIGREE_GENERATIONS, descendants_of, pedigree
+
+MAX_PAGE_SIZE = 1000
+MAX_PARTNERS = 100
+
+
+def _eligible_list(request, model, fields, permission):
+    """
+    ?date=YYYY-MM-DD (default: σήμερα) &club=<id> &after=<id> &limit=<n>
+    Keyset σελιδοποίηση σε pk: "next" = το after της επόμενης σελίδας.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm(permission):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+
+    try:
+        on_date = date.fromisoformat(request.GET["date"]) if request.GET.get("date") else timezone.localdate()
+        after = int(request.GET.get("after", 0))
+        limit = max(1, min(int(request.GET.get("limit", 200)), MAX_PAGE_SIZE))
+        club_id = int(request.GET["club"]) if request.GET.get("club") else None
+    except ValueError:
+        return JsonResponse({"error": "Μη έγκυρες παράμετροι"}, status=400)
+
+    qs = eligible_until_on(eligible_on(get_scope(request).filter(model.objects.all(), "club"), on_date), on_date)
+    if club_id is not None:
+        qs = qs.filter(club_id=club_id)
+    rows = list(
+        qs.filter(pk__gt=after)
+        .order_by("pk")
+        .values("pk", *fields, "club_id", "eligible_until")[:limit]
+    )
+    for row in rows:
+        if row["eligible_until"] == date.max:
+            row["eligible_until"] = None
+    return JsonResponse({
+        "date": on_date,
+        "results": rows,
+        "next": rows[-1]["pk"] if len(rows) == limit else None,
+    })
+
+
+@require_GET
+def eligible_athletes(request):
+    """GET /api/registry/athletes/eligible/ — αθλητές με δικαίωμα συμμετοχής σε μια ημερομηνία."""
+    return _eligible_list(
+        request, Athlete, ("eoi_registry_number", "last_name", "first_name"), "registry.view_athlete"
+    )
+
+
+@require_GET
+def eligible_horses(request):
+    """GET /api/registry/horses/eligible/ — ίπποι με δικαίωμα συμμετοχής σε μια ημερομηνία."""
+    return _eligible_list(request, Horse, ("registry_number", "name"), "registry.view_horse")
+
+
+STAT_FIELDS = (
+    "season", "starts", "completed", "wins", "placings", "clear_rounds", "eliminations",
+    "total_faults", "prize_money", "best_rank", "last_date",
+)
+
+
+def _history(request, model, pk, stats_model, subject_field, permission):
+    """
+    ?before=<date>_<id> &limit=<n>
+    Keyset σελιδοποίηση σε (date, id): "next" = το before της επόμενης σελίδας.
+    Η πρώτη σελίδα φέρνει και τα στατιστικά ανά σεζόν (έτοιμα, χωρίς aggregate).
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm(permission):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+
+    try:
+        before = parse_cursor(request.GET.get("before"))
+        limit = int(request.GET.get("limit", 50))
+    except ValueError:
+        return JsonResponse({"error": "Μη έγκυρες παράμετροι"}, status=400)
+
+    if not get_scope(request).filter(model.objects.filter(pk=pk), "club").exists():
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+
+    rows, cursor = timeline(CompetitionRecord.objects.filter(**{subject_field: pk}), before, limit)
+    data = {"results": rows, "next": cursor}
+    if before is None:
+        data["seasons"] = list(
+            stats_model.objects.filter(**{subject_field: pk}).order_by("-season").values(*STAT_FIELDS)
+        )
+    return JsonResponse(data)
+
+
+@require_GET
+def athlete_history(request, pk):
+    """GET /api/registry/athletes/<id>/history/ — αγώνες (νεότεροι πρώτα) + στατιστικά σεζόν."""
+    return _history(request, Athlete, pk, AthleteSeasonStats, "athlete_id", "registry.view_athlete")
+
+
+@require_GET
+def horse_history(request, pk):
+    """GET /api/registry/horses/<id>/history/ — αγώνες (νεότεροι πρώτα) + στατιστικά σεζόν."""
+    return _history(request, Horse, pk, HorseSeasonStats, "horse_id", "registry.view_horse")
+
+
+def _partners(request, model, pk, permission, lookup):
+    """?limit=<n> — ζεύγη από τον πίνακα Partnership (έτοιμα, χωρίς GROUP BY)."""
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm(permission):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+    try:
+        limit = max(1, min(int(request.GET.get("limit", 10)), MAX_PARTNERS))
+    except ValueError:
+        return JsonResponse({"error": "Μη έγκυρες παράμετροι"}, status=400)
+    if not get_scope(request).filter(model.objects.filter(pk=pk), "club").exists():
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    return JsonResponse({"results": lookup(pk, limit=limit)})
+
+
+@require_GET
+def athlete_horses(request, pk):
+    """GET /api/registry/athletes/<id>/horses/ — τα (ενεργά) άλογα του αναβάτη, για τις φόρμες δηλώσεων."""
+    return _partners(request, Athlete, pk, "registry.view_athlete", usual_horses)
+
+
+@require_GET
+def horse_riders(request, pk):
+    """GET /api/registry/horses/<id>/riders/ — οι αναβάτες που έχουν δηλώσει / τρέξει τον ίππο."""
+    return _partners(request, Horse, pk, "registry.view_horse", riders_of)
+
+
+def _scoped_horse(request, pk):
+    """(horse | None, error response | None) με τους ίδιους ελέγχους με το ιστορικό."""
+    if not request.user.is_authenticated:
+        return None, JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm("registry.view_horse"):
+        return None, JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+    horse = (
+        get_scope(request).filter(Horse.objects.filter(pk=pk), "club")
+        .only("pk", "registry_number", "name", "sire_name", "dam_name", "dam_sire_name")
+        .first()
+    )
+    if horse is None:
+        return None, JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    return horse, None
+
+
+@require_GET
+def horse_pedigree(request, pk):
+    """GET /api/registry/horses/<id>/pedigree/?generations=5 — γενεαλογία {path: πρόγονος}."""
+    horse, error = _scoped_horse(request, pk)
+    if error is not None:
+        return error
+    try:
+        # ίδιο όριο με το pedigree(), ώστε η απάντηση να λέει όσες γενιές επιστρέφει
+        generations = max(1, min(int(request.GET.get("generations", PEDIGREE_GENERATIONS)), MAX_GENERATIONS))
+    except ValueError:
+        return JsonResponse({"error": "Μη έγκυρες παράμετροι"}, status=400)
+    return JsonResponse({
+        "horse": {"id": horse.pk, "registry_number": horse.registry_number, "name": horse.name},
+        "generations": generations,
+        "pedigree": pedigree(horse, generations),
+    })
+
+
+@require_GET
+def horse_descendants(request, pk):
+    """
+    GET /api/registry/horses/<id>/descendants/ ?generations=<n> &after=<id> &limit=<n>
+    Όλοι οι απόγονοι (closure table). Keyset σελιδοποίηση σε pk.
+    """
+    horse, error = _scoped_horse(request, pk)
+    if error is not None:
+        return error
+    try:
+        generations = max(1, int(request.GET["generations"])) if request.GET.get("generations") else None
+        after = int(request.GET.get("after", 0))
+        limit = max(1, min(int(request.GET.get("limit", 200)), MAX_PAGE_SIZE))
+    except ValueError:
+        return JsonResponse({"error": "Μη έγκυρες παράμετροι"}, status=400)
+    rows = list(
+        descendants_of(horse.pk, generations)
+        .filter(pk__gt=after)
+        .order_by("pk")
+        .values("pk", "registry_number", "name", "birth_date", "sire_id", "dam_id")[:limit]
+    )
+    return JsonResponse({"results": rows, "next": rows[-1]["pk"] if len(rows) == limit else None})
+
+
+@require_safe
+def document_download(request, kind, pk):
+    """
+    GET /api/registry/documents/<kind>/<id>/ [?download=1] — το αρχείο ενός εγγράφου / ιατρικής,
+    μόνο για όποιον βλέπει την εγγραφή (δικαίωμα + όμιλος/περιφέρεια).
+    """
+    if kind not in DOCUMENTS:
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    model, club_field, owner = DOCUMENTS[kind]
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Απαιτείται σύνδεση"}, status=401)
+    if not request.user.has_perm(f"registry.view_{model._meta.model_name}"):
+        return JsonResponse({"error": "Δεν έχετε δικαίωμα προβολής"}, status=403)
+    obj = get_scope(request).filter(model.objects.select_related(owner), club_field).filter(pk=pk).first()
+    if obj is None:
+        return JsonResponse({"error": "Δεν βρέθηκε"}, status=404)
+    return serve(request, obj.file, download_name(obj, obj.file), as_attachment=bool(request.GET.get("download")))